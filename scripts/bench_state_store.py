@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark LocalStateStore at scale (default 1M runs).
+
+Reports batched insert throughput, point-load latency and indexed
+status/product listing latency.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from shieldcraft.services.state_store import LocalStateStore  # noqa: E402
+
+STATUSES = ("completed", "completed", "completed", "failed", "running", "accepted")
+
+
+def _state(i: int) -> dict:
+    return {
+        "id": f"run-{i:08d}",
+        "status": STATUSES[i % len(STATUSES)],
+        "created_at": f"2025-01-01T00:00:{i:08d}Z",
+        "spec": {"metadata": {"product_id": f"product-{i % 500}"}},
+        "result": None
+    }
+
+
+def populate(store: LocalStateStore, runs: int, batch: int = 10_000) -> float:
+    start = time.perf_counter()
+    for lo in range(0, runs, batch):
+        store.save_run_states((f"run-{i:08d}", _state(i)) for i in range(lo, min(runs, lo + batch)))
+    return time.perf_counter() - start
+
+
+def run(runs: int, storage_dir: str) -> dict:
+    store = LocalStateStore(storage_dir)
+    insert_s = populate(store, runs)
+
+    sample = range(0, runs, max(1, runs // 1000))
+    start = time.perf_counter()
+    for i in sample:
+        store.load_run_state(f"run-{i:08d}")
+    load_us = (time.perf_counter() - start) / max(1, len(sample)) * 1e6
+
+    start = time.perf_counter()
+    running = store.list_runs("running")
+    status_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    product = store.list_runs(product_id="product-7")
+    product_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "runs": runs,
+        "insert_runs_per_s": runs / insert_s,
+        "load_us": load_us,
+        "list_running": len(running),
+        "list_running_s": status_s,
+        "list_product": len(product),
+        "list_product_ms": product_ms,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run(args.runs, tmp)
+    for key, value in report.items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Migrate file-based LocalStateStore / LocalArtifactStore directories to their SQLite indexes.
+
+Run states (`<state_dir>/<run_id>.json`) are imported in batched
+transactions. Legacy artifacts (`<artifact_dir>/<run_id>/<artifact_id>.bin`
+plus their metadata JSON or pre-blob manifest row) are hard-linked into the
+content-addressed blob layout and recorded in the run manifests.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from shieldcraft.services.artifact_store import LocalArtifactStore  # noqa: E402
+from shieldcraft.services.state_store import LocalStateStore  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--state-dir", default=".shieldcraft_state")
+    parser.add_argument("--artifact-dir", default=".shieldcraft_artifacts")
+    parser.add_argument("--remove", action="store_true", help="delete legacy files and rows after import")
+    args = parser.parse_args(argv)
+
+    if Path(args.state_dir).is_dir():
+        runs = LocalStateStore(args.state_dir).migrate_legacy_files(remove=args.remove)
+        print(f"state: imported {runs} runs from {args.state_dir}")
+    if Path(args.artifact_dir).is_dir():
+        artifacts = LocalArtifactStore(args.artifact_dir).migrate_legacy_files(remove=args.remove)
+        print(f"artifacts: imported {artifacts} artifacts from {args.artifact_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,17 +3,41 @@ ShieldCraft Engine API Server
 Local implementation of the manufacture API endpoints.
 """
 
-from flask import Flask, request, jsonify
-import json
-import uuid
-from datetime import datetime
-from pathlib import Path
+from flask import Flask, request, jsonify, Response
+import hashlib
 import os
+import threading
+
+from shieldcraft.services.job_runner import LocalJobRunner, QueueFullError
 
 app = Flask(__name__)
 
-# In-memory storage for demo (would be database in production)
-runs = {}
+# Runs execute on a bounded local worker pool; state and artifacts persist on
+# disk. Created on first use so importing the app touches no files.
+_jobs = None
+_jobs_lock = threading.Lock()
+
+
+def get_job_runner():
+    """Return the API's `LocalJobRunner`, creating it on first use."""
+    global _jobs
+    with _jobs_lock:
+        if _jobs is None:
+            _jobs = LocalJobRunner(
+                workers=int(os.getenv("SHIELDCRAFT_API_WORKERS", "2")),
+                max_queue=int(os.getenv("SHIELDCRAFT_API_QUEUE_SIZE", "16")),
+            )
+        return _jobs
+
+
+def _completed_run(run_id):
+    """Return (run, None) for a completed run, else (None, error response)."""
+    run = get_job_runner().get_run(run_id)
+    if run is None:
+        return None, (jsonify({"code": "RUN_NOT_FOUND", "message": "Run not found"}), 404)
+    if run["status"] != "completed":
+        return None, (jsonify({"code": "RUN_NOT_COMPLETED", "message": "Run not completed"}), 409)
+    return run, None
 
 @app.route('/api/v1/manufacture', methods=['POST'])
 def manufacture():
@@ -23,27 +47,16 @@ def manufacture():
         if not data or 'spec_source' not in data:
             return jsonify({"code": "INVALID_REQUEST", "message": "Missing spec_source"}), 400
 
-        # Generate run ID
-        run_id = str(uuid.uuid4())
-
-        # Store run data
-        runs[run_id] = {
-            "id": run_id,
-            "status": "accepted",
-            "created_at": datetime.utcnow().isoformat() + "Z",
-            "spec": data,
-            "result": None
-        }
-
-        # In real implementation, this would enqueue the job
-        # For demo, simulate immediate processing
-        if data.get('run_options', {}).get('dry_run', False):
-            # Simulate dry run
-            runs[run_id]["status"] = "completed"
-            runs[run_id]["result"] = {
-                "artifacts": ["preview.json"],
-                "evidence_bundle": "evidence_bundle.zip"
-            }
+        try:
+            run_id = get_job_runner().submit(data)
+        except QueueFullError as e:
+            response = jsonify({
+                "code": "QUEUE_FULL",
+                "message": "Run queue is full",
+                "retry_after": e.retry_after
+            })
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, 429
 
         response = {
             "code": "RUN_ACCEPTED",
@@ -60,52 +73,46 @@ def manufacture():
 @app.route('/api/v1/runs/<run_id>/status', methods=['GET'])
 def get_run_status(run_id):
     """Get run status."""
-    if run_id not in runs:
+    run = get_job_runner().get_run(run_id)
+    if run is None:
         return jsonify({"code": "RUN_NOT_FOUND", "message": "Run not found"}), 404
 
-    run = runs[run_id]
     return jsonify({
         "run_id": run_id,
         "status": run["status"],
         "created_at": run["created_at"],
         "completed_at": run.get("completed_at"),
-        "result": run.get("result")
+        "result": run.get("result"),
+        "error": run.get("error")
     })
 
 @app.route('/api/v1/runs/<run_id>/artifacts/<artifact_id>', methods=['GET'])
 def get_artifact(run_id, artifact_id):
     """Get specific artifact."""
-    if run_id not in runs:
-        return jsonify({"code": "RUN_NOT_FOUND", "message": "Run not found"}), 404
+    run, error = _completed_run(run_id)
+    if error:
+        return error
 
-    run = runs[run_id]
-    if run["status"] != "completed":
-        return jsonify({"code": "RUN_NOT_COMPLETED", "message": "Run not completed"}), 409
-
-    # In real implementation, serve the actual file
-    # For demo, return mock data
-    if artifact_id == "preview.json":
-        return jsonify({"mock": "artifact_data"}), 200
-    elif artifact_id == "evidence_bundle.zip":
-        return jsonify({"mock": "bundle_data"}), 200
-    else:
+    content = get_job_runner().artifact_store.retrieve_artifact(run_id, artifact_id)
+    if content is None:
         return jsonify({"code": "ARTIFACT_NOT_FOUND", "message": "Artifact not found"}), 404
 
+    metadata = get_job_runner().artifact_store.get_artifact_metadata(run_id, artifact_id) or {}
+    return Response(content, status=200, mimetype=metadata.get("type", "application/octet-stream"))
+
 @app.route('/api/v1/runs/<run_id>/evidence', methods=['GET'])
 def get_evidence(run_id):
     """Get evidence bundle."""
-    if run_id not in runs:
-        return jsonify({"code": "RUN_NOT_FOUND", "message": "Run not found"}), 404
-
-    run = runs[run_id]
-    if run["status"] != "completed":
-        return jsonify({"code": "RUN_NOT_COMPLETED", "message": "Run not completed"}), 409
+    run, error = _completed_run(run_id)
+    if error:
+        return error
 
-    # Mock evidence bundle
+    artifacts = sorted(get_job_runner().artifact_store.list_run_artifacts(run_id), key=lambda a: a["artifact_id"])
+    manifest = "\n".join(f"{a['artifact_id']}:{a['sha256_hash']}" for a in artifacts)
     return jsonify({
         "bundle_id": f"bundle_{run_id}",
-        "signature": "mock_signature",
-        "artifacts": ["preview.json"]
+        "manifest_sha256": hashlib.sha256(manifest.encode()).hexdigest(),
+        "artifacts": artifacts
     }), 200
 
 @app.route('/health', methods=['GET'])
@@ -114,4 +121,4 @@ def health():
     return jsonify({"status": "healthy", "version": "1.0.0"}), 200
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5001, debug=True)
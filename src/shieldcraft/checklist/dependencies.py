@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from typing import Dict, List, Set, Any
-import json
 import os
 
+from shieldcraft.util.graph import strongly_connected_components
+from shieldcraft.services.io.artifact_bus import write_json
+
 
 def _build_req_to_items_map(covers: List[Any]) -> Dict[str, List[str]]:
     m: Dict[str, List[str]] = {}
@@ -20,6 +23,7 @@ def infer_item_dependencies(requirements: List[Dict[str, Any]], covers: List[Any
     """
     req_to_items = _build_req_to_items_map(covers)
     item_deps: Dict[str, List[str]] = {}
+    seen: Dict[str, Set[str]] = {}
     # Build mapping of requirement id -> depends_on requirement ids
     for r in requirements:
         rid = r.get('id')
@@ -30,11 +34,13 @@ def infer_item_dependencies(requirements: List[Dict[str, Any]], covers: List[Any
         for d in deps:
             items_for_d = req_to_items.get(d, [])
             for it in items_for_r:
-                item_deps.setdefault(it, [])
-                # union deps
+                deps_for_it = item_deps.setdefault(it, [])
+                seen_for_it = seen.setdefault(it, set())
+                # union deps (first-seen order)
                 for dep_item in items_for_d:
-                    if dep_item not in item_deps[it]:
-                        item_deps[it].append(dep_item)
+                    if dep_item not in seen_for_it:
+                        seen_for_it.add(dep_item)
+                        deps_for_it.append(dep_item)
 
     return item_deps
 
@@ -56,59 +62,23 @@ def build_graph(items: List[Dict[str, Any]], inferred_deps: Dict[str, List[str]]
 
 
 def detect_cycles(graph: Dict[str, Set[str]]) -> List[List[str]]:
-    """Tarjan-like cycle detection returning list of cycles (each as list of node ids)."""
-    index = {}
-    lowlink = {}
-    stack = []
-    onstack = set()
-    cycles = []
-    idx = 0
-
-    def strongconnect(v):
-        nonlocal idx
-        index[v] = idx
-        lowlink[v] = idx
-        idx += 1
-        stack.append(v)
-        onstack.add(v)
-        for w in graph.get(v, []):
-            if w not in index:
-                strongconnect(w)
-                lowlink[v] = min(lowlink[v], lowlink[w])
-            elif w in onstack:
-                lowlink[v] = min(lowlink[v], index[w])
-        if lowlink[v] == index[v]:
-            # start a new SCC
-            comp = []
-            while True:
-                w = stack.pop()
-                onstack.remove(w)
-                comp.append(w)
-                if w == v:
-                    break
-            if len(comp) > 1:
-                cycles.append(comp)
-
-    for v in graph:
-        if v not in index:
-            strongconnect(v)
-
-    return cycles
+    """Tarjan cycle detection returning list of cycles (each as list of node ids).
+
+    Iterative, so long dependency chains do not hit the recursion limit.
+    """
+    return [comp for comp in strongly_connected_components(graph) if len(comp) > 1]
 
 
 def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
     # Kahn's algorithm
     indeg = {n: 0 for n in graph}
-    for n, deps in graph.items():
-        for d in deps:
-            indeg[d] = indeg.get(d, 0) + 0  # ensure key
     for n in graph:
         for d in graph[n]:
             indeg[d] = indeg.get(d, 0) + 1
-    q = [n for n, d in sorted(indeg.items()) if d == 0]
+    q = deque(n for n, d in sorted(indeg.items()) if d == 0)
     order = []
     while q:
-        n = q.pop(0)
+        n = q.popleft()
         order.append(n)
         for m in sorted(graph.get(n, [])):
             indeg[m] -= 1
@@ -118,6 +88,15 @@ def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
     return order
 
 
+def reverse_graph(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Return node -> set(nodes that depend on it)."""
+    rev: Dict[str, Set[str]] = {}
+    for n, deps in graph.items():
+        for d in deps:
+            rev.setdefault(d, set()).add(n)
+    return rev
+
+
 def build_sequence(
     items: List[Dict[str, Any]],
     inferred_deps: Dict[str, List[str]],
@@ -140,36 +119,37 @@ def build_sequence(
     for idx, nid in enumerate(order):
         execution_order[nid] = idx + 1
 
+    blocked_by = reverse_graph(graph)
+    cycle_of = {n: gid for gid, grp in cycle_groups.items() for n in grp}
+
     # Items in cycles have no execution_order
     sequence = []
     for it in sorted(items, key=lambda x: x.get('id') or ''):
         iid = it.get('id')
-        seq_entry = {
+        sequence.append({
             'id': iid,
-            'depends_on': sorted(list(graph.get(iid) or [])),
-            'blocks': sorted([n for n, deps in graph.items() if iid in deps]),
+            'depends_on': sorted(graph.get(iid) or []),
+            'blocks': sorted(blocked_by.get(iid) or []),
             'execution_order': execution_order.get(iid),
-            'in_cycle': None
-        }
-        for gid, grp in cycle_groups.items():
-            if iid in grp:
-                seq_entry['in_cycle'] = gid
-        sequence.append(seq_entry)
+            'in_cycle': cycle_of.get(iid)
+        })
 
     # compute longest chain (depth) on contracted_graph
     depth = {n: 1 for n in contracted_graph}
-    topo = topological_sort(contracted_graph)
-    for n in topo:
+    for n in order:
         for d in contracted_graph.get(n, []):
             depth[n] = max(depth[n], 1 + depth.get(d, 1))
     longest_chain = max(depth.values()) if depth else 0
 
     # orphan items: items with no depends_on, no blocks, and no evident requirement coverage
+    first_by_id: Dict[Any, Dict[str, Any]] = {}
+    for it in items:
+        first_by_id.setdefault(it.get('id'), it)
     orphan_count = 0
     for s in sequence:
         if not s.get('depends_on') and not s.get('blocks'):
             # heuristic: check for requirement_refs or evidence on original items
-            orig = next((it for it in items if it.get('id') == s.get('id')), {})
+            orig = first_by_id.get(s.get('id'), {})
             if not orig.get('requirement_refs') and not (
                 (orig.get('evidence') or {}).get('source_excerpt_hash') or (
                     orig.get('evidence') or {}).get(
@@ -179,13 +159,12 @@ def build_sequence(
     # persist
     os.makedirs(outdir, exist_ok=True)
     p = os.path.join(outdir, 'checklist_sequence.json')
-    with open(p, 'w', encoding='utf8') as f:
-        json.dump({
-            'sequence': sequence,
-            'cycle_groups': cycle_groups,
-            'longest_chain': longest_chain,
-            'orphan_count': orphan_count
-        }, f, indent=2, sort_keys=True)
+    write_json(p, {
+        'sequence': sequence,
+        'cycle_groups': cycle_groups,
+        'longest_chain': longest_chain,
+        'orphan_count': orphan_count
+    })
 
     return {
         'sequence': sequence,
@@ -6,6 +6,7 @@ import json
 import os
 
 from shieldcraft.requirements.completion import evaluate_completeness
+from shieldcraft.services.checklist.value_digest import ValueDigester
 
 
 def _norm_text(s: str) -> str:
@@ -14,13 +15,17 @@ def _norm_text(s: str) -> str:
     return ' '.join(str(s).lower().split())
 
 
-def _artifact_signature(item: Dict[str, Any]) -> str:
+def _artifact_signature(item: Dict[str, Any], digester: ValueDigester = None) -> str:
     parts = []
     # Prefer explicit obligation/value/claim
     for k in ('obligation', 'value', 'claim', 'action', 'text'):
         v = item.get(k)
         if v:
-            parts.append(_norm_text(v))
+            if isinstance(v, (dict, list)):
+                # Fixed-size stand-in for the normalized text of a spec subtree
+                parts.append((digester or ValueDigester(normalized=True)).hexdigest(v))
+            else:
+                parts.append(_norm_text(v))
             break
     # include explicit evidence pointers/hashes
     ev = item.get('evidence') or {}
@@ -39,9 +44,10 @@ def _artifact_signature(item: Dict[str, Any]) -> str:
 def group_equivalent_items(items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
     # Group by (requirement_refs, artifact_signature, risk_if_false, readiness_impact)
     groups = {}
+    digester = ValueDigester(normalized=True)
     for it in items:
         reqs = tuple(sorted(it.get('requirement_refs') or []))
-        sig = _artifact_signature(it)
+        sig = _artifact_signature(it, digester)
         risk = it.get('risk_if_false')
         readiness = it.get('readiness_impact') or it.get('readiness')
         key = (reqs, sig, str(risk), str(readiness))
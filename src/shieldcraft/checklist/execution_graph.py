@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-import json
 import os
 
-from shieldcraft.checklist.dependencies import detect_cycles, topological_sort
+from shieldcraft.checklist.dependencies import detect_cycles, reverse_graph, topological_sort
+from shieldcraft.services.io.artifact_bus import write_json
 
 
 def _priority_val(it: Dict[str, Any]) -> int:
@@ -106,14 +106,15 @@ def build_execution_plan(items: List[Dict[str, Any]], inferred_deps: Dict[str,
             else:
                 levels[nid] = 1 + max(levels[d] for d in deps)
         # group by level
-        max_lvl = max(levels.values()) if levels else -1
-        for level in range(0, max_lvl + 1):
-            group = [nid for nid, lvl in sorted(levels.items()) if lvl == level]
-            if group:
-                parallel_groups.append(sorted(group))
+        by_level: Dict[int, List[str]] = {}
+        for nid, lvl in levels.items():
+            by_level.setdefault(lvl, []).append(nid)
+        for level in sorted(by_level):
+            parallel_groups.append(sorted(by_level[level]))
 
     # blocking items mapping
-    blocks = {it.get('id'): sorted([n for n, deps in graph.items() if it.get('id') in deps]) for it in items}
+    blocked_by = reverse_graph(graph)
+    blocks = {it.get('id'): sorted(blocked_by.get(it.get('id')) or []) for it in items}
 
     plan = {
         'ordered_item_ids': order,
@@ -128,9 +129,7 @@ def build_execution_plan(items: List[Dict[str, Any]], inferred_deps: Dict[str,
     try:
         os.makedirs(outdir, exist_ok=True)
         p = os.path.join(outdir, 'checklist_execution_plan.json')
-        with open(p + '.tmp', 'w', encoding='utf8') as f:
-            json.dump(plan, f, indent=2, sort_keys=True)
-        os.replace(p + '.tmp', p)
+        write_json(p, plan)
     except Exception:
         pass
 
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Tuple
-import json
 import os
 import re
 import hashlib
 
+from shieldcraft.services.io.artifact_bus import write_json
+
 
 @dataclass
 class ItemQuality:
@@ -172,6 +173,5 @@ def write_quality_report(qualities: List[ItemQuality], summary: Dict[str, Any],
     os.makedirs(outdir, exist_ok=True)
     p = os.path.join(outdir, 'checklist_quality.json')
     data = {'items': [asdict(q) for q in qualities], 'summary': summary}
-    with open(p, 'w', encoding='utf8') as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    write_json(p, data)
     return p
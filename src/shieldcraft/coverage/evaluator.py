@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Dict, Any, List
-import json
 import os
 import hashlib
 
 from shieldcraft.coverage.units import build_units_from_spec
+from shieldcraft.services.io.artifact_bus import artifact_exists, read_json, write_json
 
 
 def _tokenize(s: str):
@@ -13,45 +14,97 @@ def _tokenize(s: str):
     return re.findall(r"[a-z0-9]+", s.lower())
 
 
+class _ItemIndex:
+    """Per-run lookups over checklist items used to bind spec units.
+
+    - item pointer -> items (sorted pointers, exact and subtree lookups)
+    - excerpt hash -> items with a quote
+    - token -> items over pre-tokenised evidence quotes
+    """
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.by_ptr: Dict[str, List[int]] = {}
+        self.by_hash: Dict[str, List[int]] = {}
+        self.by_token: Dict[str, List[int]] = {}
+        self.quote_tokens: List[frozenset] = []
+        ptr_keys = []
+        for pos, it in enumerate(items):
+            iptr = it.get('ptr') or ''
+            ev = it.get('evidence') or {}
+            quote = ev.get('quote') or ''
+            if iptr:
+                self.by_ptr.setdefault(iptr, []).append(pos)
+                ptr_keys.append((iptr, pos))
+            toks = frozenset(_tokenize(quote)) if quote else frozenset()
+            self.quote_tokens.append(toks)
+            if quote:
+                ihash = ev.get('source_excerpt_hash') or ''
+                if ihash:
+                    self.by_hash.setdefault(ihash, []).append(pos)
+                for t in toks:
+                    self.by_token.setdefault(t, []).append(pos)
+        ptr_keys.sort()
+        self._ptr_keys = ptr_keys
+
+    def pointer_matches(self, uptr: str) -> List[int]:
+        """Items whose pointer equals `uptr` or lies beneath it."""
+        out = list(self.by_ptr.get(uptr, ())) if uptr else []
+        prefix = uptr.rstrip('/') + '/'
+        keys = self._ptr_keys
+        lo = bisect_left(keys, (prefix, -1))
+        hi = bisect_left(keys, (prefix[:-1] + '0', -1))  # '0' sorts right after '/'
+        out.extend(pos for _, pos in keys[lo:hi])
+        return out
+
+    def overlap_matches(self, u_tokens: set, need: int) -> List[int]:
+        """Items whose quote shares at least `need` (>= 1) of `u_tokens`."""
+        # Prefix filter: an item missing every one of the (|set| - need + 1)
+        # rarest tokens shares at most need - 1 tokens, so cannot qualify.
+        postings = sorted((self.by_token.get(t, ()) for t in u_tokens), key=len)
+        if len(postings) < need:
+            return []
+        candidates = set()
+        for plist in postings[:len(postings) - need + 1]:
+            candidates.update(plist)
+        quote_tokens = self.quote_tokens
+        return [pos for pos in candidates if len(u_tokens & quote_tokens[pos]) >= need]
+
+
 def bind_units_to_items(units: List[Dict[str, Any]], items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    # Initialize covers_units
-    for it in items:
-        it['covers_units'] = sorted(list(set(it.get('covers_units') or [])))
+    """Annotate each item's `covers_units` with the ids of the units it covers.
+
+    An item covers a unit when its pointer equals or lies under the unit
+    pointer, its evidence quote shares enough tokens with the unit text, or
+    its excerpt hash equals the hash of the unit text. Items are indexed
+    once per call and each unit only scores candidates that can match.
+    """
+    index = _ItemIndex(items)
+    # Keyed by identity so an item listed twice accumulates once
+    covers = {id(it): set(it.get('covers_units') or []) for it in items}
 
     for u in units:
         uid = u.get('id')
         uptr = u.get('ptr') or ''
         utext = (u.get('text') or '')
         u_tokens = set(_tokenize(utext))
-        for it in items:
-            matched = False
-            # explicit ptr match
-            iptr = it.get('ptr') or ''
-            if iptr and (iptr == uptr or iptr.startswith(uptr.rstrip('/') + '/')):
-                matched = True
-            # evidence quote overlap
-            ev = it.get('evidence') or {}
-            quote = ev.get('quote') or ''
-            if not matched and quote:
-                overlap = len(u_tokens & set(_tokenize(quote)))
-                # requirements tend to be short; allow a smaller absolute overlap threshold
-                # but also require a reasonable fraction of the unit tokens to match to
-                # avoid accidental matches with JSON-like dumps.
-                if (u.get('kind') or '') == 'requirement':
-                    thresh = max(2, int(len(u_tokens) * 0.4))
-                else:
-                    thresh = 5
-                if overlap >= thresh:
-                    matched = True
-            # excerpt hash
-            if not matched and quote:
-                h = hashlib.sha256(utext.lower().encode()).hexdigest()[:12]
-                if h == (ev.get('source_excerpt_hash') or ''):
-                    matched = True
-            if matched:
-                lst = set(it.get('covers_units') or [])
-                lst.add(uid)
-                it['covers_units'] = sorted(lst)
+        matched = set(index.pointer_matches(uptr))
+        # evidence quote overlap
+        # requirements tend to be short; allow a smaller absolute overlap threshold
+        # but also require a reasonable fraction of the unit tokens to match to
+        # avoid accidental matches with JSON-like dumps.
+        if (u.get('kind') or '') == 'requirement':
+            thresh = max(2, int(len(u_tokens) * 0.4))
+        else:
+            thresh = 5
+        matched.update(index.overlap_matches(u_tokens, thresh))
+        # excerpt hash
+        h = hashlib.sha256(utext.lower().encode()).hexdigest()[:12]
+        matched.update(index.by_hash.get(h, ()))
+        for pos in matched:
+            covers[id(items[pos])].add(uid)
+
+    for it in items:
+        it['covers_units'] = sorted(covers[id(it)])
 
     return items
 
@@ -99,22 +152,18 @@ def evaluate_spec_coverage(spec: Dict[str, Any], items: List[Dict[str, Any]],
     try:
         os.makedirs(outdir, exist_ok=True)
         p = os.path.join(outdir, 'spec_coverage.json')
-        with open(p + '.tmp', 'w', encoding='utf8') as f:
-            json.dump(report, f, indent=2, sort_keys=True)
-        os.replace(p + '.tmp', p)
+        write_json(p, report)
     except (OSError, IOError, TypeError):
         pass
 
     # also persist annotated checklist for visibility
     try:
         clp = os.path.join(outdir, 'checklist.json')
-        if os.path.exists(clp):
-            cl = json.load(open(clp))
+        if artifact_exists(clp):
+            cl = dict(read_json(clp))
             items_out = items
             cl['items'] = items_out
-            with open(clp + '.tmp', 'w', encoding='utf8') as f:
-                json.dump(cl, f, indent=2, sort_keys=True)
-            os.replace(clp + '.tmp', clp)
+            write_json(clp, cl)
     except Exception:
         pass
 
@@ -5,7 +5,9 @@ Enforces deterministic JSON, validates schema, builds AST.
 import json
 import pathlib
 from datetime import datetime
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+
+from shieldcraft.services.spec.schema_registry import get_validator
 
 
 def canonicalize_json(data, float_precision=2):
@@ -116,8 +118,10 @@ def load_canonical_spec(path: str):
 
     if schema_path.exists():
         try:
-            schema = json.loads(schema_path.read_text())
-            validate(canonical_data, schema)
+            validator = get_validator(str(schema_path), check_schema=True)
+            error = best_match(validator.iter_errors(canonical_data))
+            if error is not None:
+                raise error
         except (json.JSONDecodeError, ImportError, AttributeError, TypeError, ValueError):
             # INTENTIONAL: Skip validation errors for canonical specs.
             # Canonical specs may have extended structure beyond base schema.
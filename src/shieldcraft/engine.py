@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import json
 import os
@@ -15,11 +16,13 @@ from shieldcraft.services.governance.verifier import ChecklistVerifier
 from shieldcraft.services.spec.schema_validator import validate_spec_against_schema
 from shieldcraft.services.spec.model import SpecModel
 from shieldcraft.services.spec.fingerprint import compute_spec_fingerprint
+from shieldcraft.services.spec.session import CompilationSession
 from shieldcraft.services.plan.execution_plan import from_ast
 from shieldcraft.services.io.canonical_writer import write_canonical_json
 from shieldcraft.services.artifacts.lineage import bundle
 from shieldcraft.services.io.manifest_writer import write_manifest_v2
 from shieldcraft.services.stability.stability import compare
+from shieldcraft.util.run_scope import run_scope
 
 
 def finalize_checklist(engine, partial_result=None, exception=None):
@@ -299,6 +302,14 @@ def finalize_checklist(engine, partial_result=None, exception=None):
     except Exception:
         pass
 
+    # Phase boundary: persist any buffered observability snapshots
+    try:
+        if engine is not None:
+            from shieldcraft.observability import flush as flush_observability
+            flush_observability(engine)
+    except Exception:
+        pass
+
     try:
         persona_events = list(getattr(engine, '_persona_events', []) or [])
         if persona_events:
@@ -403,6 +414,15 @@ def _assert_semantic_invariants(checklist_obj, primary, gate_outcomes=None):
                 'Semantic invariant violated: DIAGNOSTIC outcome must not contain BLOCKER or REFUSAL items')
 
 
+def _in_run_scope(method):
+    """Run an Engine entrypoint inside that engine's run scope."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.run_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Engine:
     """ShieldCraft Engine
 
@@ -414,10 +434,16 @@ class Engine:
 
     The sync verification gate is executed deterministically and non-bypassably before any
     instruction validation or side-effects (plan writing, codegen, evidence generation).
+
+    Each entrypoint runs inside the engine's run scope (`shieldcraft.util.run_scope`), so
+    several engines may run concurrently in one process without sharing gate events,
+    persona registrations or execution-state snapshots (pass `artifacts_dir` to give an
+    engine its own snapshot directory).
     """
 
-    def __init__(self, schema_path):
+    def __init__(self, schema_path, artifacts_dir=None):
         self.schema_path = schema_path
+        self.artifacts_dir = artifacts_dir
         self.ast = ASTBuilder()
         self.planner = Planner()
         self.checklist_gen = ChecklistGenerator()
@@ -465,7 +491,15 @@ class Engine:
         self.persona_enabled = is_persona_enabled()
 
         self.snapshot_enabled = os.getenv("SHIELDCRAFT_SNAPSHOT_ENABLED", "0") == "1"
+        self.last_session = None
+
+    def run_scope(self):
+        """Context manager binding this engine's run state to the current context."""
+        from shieldcraft.persona.persona_registry import snapshot_registry
+        return run_scope(engine=self, checklist_context=self.checklist_context,
+                         personas=snapshot_registry(), artifacts_dir=self.artifacts_dir)
 
+    @_in_run_scope
     def preflight(self, spec_or_path):
         """Run preflight validation (schema + instruction validation) without side-effects.
 
@@ -844,11 +878,27 @@ class Engine:
                 pass
             raise RuntimeError("validation_not_performed")
 
-    def run(self, spec_path):
+    def compile(self, spec_path):
+        """Create a `CompilationSession` for `spec_path`.
+
+        The session is loaded lazily by its consumers; pass it to `run`,
+        `generate_code` or `run_self_host` to reuse the loaded spec, AST,
+        fingerprint and schema validation result across entrypoints.
+        """
+        session = CompilationSession(spec_path)
+        self.last_session = session
+        return session
+
+    @_in_run_scope
+    def run(self, spec_path, session=None):
+
+        if session is None:
+            session = self.compile(spec_path)
+        self.last_session = session
 
         try:
 
-            raw = load_spec(spec_path)
+            session.load()
         except Exception as e:
             try:
                 if getattr(self, 'checklist_context', None):
@@ -866,47 +916,32 @@ class Engine:
                 pass
             return finalize_checklist(self, partial_result=None, exception=e)
 
-        if isinstance(raw, SpecModel):
-            spec_model = raw
-            normalized = spec_model.raw
-            ast = spec_model.ast
-            fingerprint = spec_model.fingerprint
-        else:
-
-            normalized = canonicalize(raw) if not isinstance(raw, dict) else raw
-            valid, errors = validate_spec_against_schema(normalized, self.schema_path)
-            if not valid:
-                try:
-                    if getattr(self, 'checklist_context', None):
-                        try:
-                            self.checklist_context.record_event(
-                                "G4_SCHEMA_VALIDATION",
-                                "preflight",
-                                "DIAGNOSTIC",
-                                message="schema validation failed",
-                                evidence={
-                                    "error_count": len(errors)})
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+        valid, errors = session.validate(self.schema_path, validator=validate_spec_against_schema)
+        if not valid:
+            try:
+                if getattr(self, 'checklist_context', None):
+                    try:
+                        self.checklist_context.record_event(
+                            "G4_SCHEMA_VALIDATION",
+                            "preflight",
+                            "DIAGNOSTIC",
+                            message="schema validation failed",
+                            evidence={
+                                "error_count": len(errors)})
+                    except Exception:
+                        pass
+            except Exception:
+                pass
 
-                return finalize_checklist(self, partial_result={"type": "schema_error", "details": errors})
-            # Adapt sections if it's a dict
-            if isinstance(normalized.get("sections"), dict):
-                from shieldcraft.services.spec.normalization import adapt_sections
-                normalized["sections"] = adapt_sections(normalized["sections"])
-            ast = self.ast.build(normalized)
-            fingerprint = compute_spec_fingerprint(normalized)
-            spec_model = SpecModel(normalized, ast, fingerprint)
+            return finalize_checklist(self, partial_result={"type": "schema_error", "details": errors})
+        ast = session.build(self.ast)
 
-        spec = normalized
+        spec = session.spec
 
         self._validate_spec(spec)
 
         if "instructions" in spec:
-            fp = compute_spec_fingerprint(spec)
-            if getattr(self, "_last_validated_spec_fp", None) != fp:
+            if getattr(self, "_last_validated_spec_fp", None) != session.fingerprint:
                 try:
                     if getattr(self, 'checklist_context', None):
                         try:
@@ -918,7 +953,8 @@ class Engine:
                     pass
                 raise RuntimeError("validation_not_performed")
 
-        plan = from_ast(ast)
+        with session.stage("plan"):
+            plan = from_ast(ast)
 
         product_id = spec.get("metadata", {}).get("product_id", "unknown")
         plan_dir = f"products/{product_id}"
@@ -932,7 +968,8 @@ class Engine:
             pass
 
         try:
-            checklist = self.checklist_gen.build(spec, ast=ast, engine=self)
+            with session.stage("checklist"):
+                checklist = self.checklist_gen.build(spec, ast=ast, engine=self)
         except Exception as e:
             try:
                 if getattr(self, 'checklist_context', None):
@@ -955,7 +992,8 @@ class Engine:
         try:
             from shieldcraft.verification.readiness_evaluator import evaluate_readiness
             from shieldcraft.verification.readiness_report import render_readiness
-            readiness = evaluate_readiness(self, spec, checklist)
+            with session.stage("readiness"):
+                readiness = evaluate_readiness(self, spec, checklist)
             checklist_readiness = readiness
             checklist["_readiness"] = checklist_readiness
             checklist["_readiness_report"] = render_readiness(readiness)
@@ -1002,13 +1040,17 @@ class Engine:
                 pass
             return finalize_checklist(self, partial_result=None, exception=e)
 
-    def generate_code(self, spec_path, dry_run=False):
-        result = self.run(spec_path)
+    @_in_run_scope
+    def generate_code(self, spec_path, dry_run=False, session=None):
+        if session is None:
+            session = self.compile(spec_path)
+        result = self.run(spec_path, session=session)
 
         if result.get("type") == "schema_error":
             return result
         try:
-            outputs = self.codegen.run(result["checklist"], dry_run=dry_run)
+            with session.stage("codegen"):
+                outputs = self.codegen.run(result["checklist"], dry_run=dry_run)
 
             outputs_list = outputs.get("outputs") if isinstance(outputs, dict) and "outputs" in outputs else outputs
 
@@ -1031,7 +1073,8 @@ class Engine:
     def verify_checklist(self, checklist):
         return self.verifier.verify(checklist)
 
-    def run_self_host(self, spec, dry_run=False, emit_preview=None):
+    @_in_run_scope
+    def run_self_host(self, spec, dry_run=False, emit_preview=None, session=None):
         """
         Self-host mode: filter bootstrap items, emit to .selfhost_outputs/{fingerprint}/,
         write bootstrap_manifest.json with lineage and evidence.
@@ -1040,6 +1083,7 @@ class Engine:
             spec: Product spec dict (should have self_host=true)
             dry_run: If True, return preview structure without writing files
             emit_preview: If provided, write preview JSON to this path
+            session: Optional `CompilationSession` for `spec`; its AST is reused
 
         Returns:
             dict with outputs, manifest, fingerprint
@@ -1094,8 +1138,12 @@ class Engine:
                     if not dry_run:
                         raise RuntimeError("validation_not_performed")
 
+            if session is None or session.spec is not spec:
+                session = CompilationSession.from_spec(spec)
+            self.last_session = session
+
             try:
-                ast = self.ast.build(spec)
+                ast = session.build(self.ast)
             except Exception as e:
                 if dry_run:
                     try:
@@ -1112,7 +1160,8 @@ class Engine:
                     raise
 
             try:
-                checklist = self.checklist_gen.build(spec, ast=ast, engine=self)
+                with session.stage("checklist"):
+                    checklist = self.checklist_gen.build(spec, ast=ast, engine=self)
             except Exception as e:
                 if dry_run:
                     checklist = {
@@ -1385,128 +1434,114 @@ class Engine:
                 pass
 
             try:
+                from shieldcraft.services.io.artifact_bus import artifact_bus, read_json, write_json
 
-                try:
-                    reqs = json.load(open(os.path.join(output_dir, 'requirements.json'))).get('requirements', [])
-                except Exception:
-                    try:
-                        reqs = json.load(
-                            open(
-                                os.path.join(
-                                    '.selfhost_outputs',
-                                    'requirements.json'))).get(
-                            'requirements',
-                            [])
-                    except Exception:
-                        from shieldcraft.interpretation.requirements import extract_requirements
-                        rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
-                            'raw_input') or json.dumps(spec, sort_keys=True)
-
-                        if not isinstance(rtxt, str):
-                            import json as _json
-                            rtxt = _json.dumps(rtxt, sort_keys=True)
-                        reqs = extract_requirements(rtxt)
-
-                items = checklist.get(
-                    'items',
-                    []) or json.load(
-                    open(
-                        os.path.join(
-                            '.selfhost_outputs',
-                            'checklist.json'))).get(
-                    'items',
-                    [])
-                valid_items = [it for it in items if it.get('quality_status') != 'INVALID']
-
-                from shieldcraft.checklist.equivalence import detect_and_collapse
-                pruned_items, minimality_report = detect_and_collapse(valid_items, reqs)
-                violations = [p for p in minimality_report.get('proof_of_minimality', []) if not p.get('necessary')]
-                if violations:
-                    manifest['checklist_minimality_summary'] = {
-                        'removed_count': minimality_report.get('removed_count', 0),
-                        'equivalence_groups': len(minimality_report.get('equivalence_groups', [])),
-                        'violations': violations,
-                    }
+                with artifact_bus():
                     try:
-                        if getattr(self, 'checklist_context', None):
-                            try:
-                                self.checklist_context.record_event(
-                                    "G16_MINIMALITY_INVARIANT_FAILED", "post_generation",
-                                    "REFUSAL", message="minimality invariant failed")
-                            except Exception:
-                                pass
+                        reqs = read_json(os.path.join(output_dir, 'requirements.json')).get('requirements', [])
                     except Exception:
-                        pass
-                    raise RuntimeError('minimality_invariant_failed')
+                        try:
+                            reqs = read_json(os.path.join('.selfhost_outputs', 'requirements.json')).get('requirements', [])
+                        except Exception:
+                            from shieldcraft.interpretation.requirements import extract_requirements
+                            rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
+                                'raw_input') or json.dumps(spec, sort_keys=True)
+
+                            if not isinstance(rtxt, str):
+                                import json as _json
+                                rtxt = _json.dumps(rtxt, sort_keys=True)
+                            reqs = extract_requirements(rtxt)
+
+                    items = checklist.get('items', []) or read_json(
+                        os.path.join('.selfhost_outputs', 'checklist.json')).get('items', [])
+                    valid_items = [it for it in items if it.get('quality_status') != 'INVALID']
+
+                    from shieldcraft.checklist.equivalence import detect_and_collapse
+                    pruned_items, minimality_report = detect_and_collapse(valid_items, reqs)
+                    violations = [p for p in minimality_report.get('proof_of_minimality', []) if not p.get('necessary')]
+                    if violations:
+                        manifest['checklist_minimality_summary'] = {
+                            'removed_count': minimality_report.get('removed_count', 0),
+                            'equivalence_groups': len(minimality_report.get('equivalence_groups', [])),
+                            'violations': violations,
+                        }
+                        try:
+                            if getattr(self, 'checklist_context', None):
+                                try:
+                                    self.checklist_context.record_event(
+                                        "G16_MINIMALITY_INVARIANT_FAILED", "post_generation",
+                                        "REFUSAL", message="minimality invariant failed")
+                                except Exception:
+                                    pass
+                        except Exception:
+                            pass
+                        raise RuntimeError('minimality_invariant_failed')
 
-                with open(os.path.join(output_dir, 'checklist.json'), 'w', encoding='utf8') as _cf:
-                    json.dump({'items': pruned_items}, _cf, indent=2, sort_keys=True)
-                with open(os.path.join('.selfhost_outputs', 'checklist.json'), 'w', encoding='utf8') as _cfroot:
-                    json.dump({'items': pruned_items}, _cfroot, indent=2, sort_keys=True)
+                    write_json(os.path.join(output_dir, 'checklist.json'), {'items': pruned_items})
+                    write_json(os.path.join('.selfhost_outputs', 'checklist.json'), {'items': pruned_items})
 
-                from shieldcraft.checklist.dependencies import infer_item_dependencies
-                from shieldcraft.checklist.execution_graph import build_execution_plan
-                from shieldcraft.requirements.coverage import compute_coverage
+                    from shieldcraft.checklist.dependencies import infer_item_dependencies
+                    from shieldcraft.checklist.execution_graph import build_execution_plan
+                    from shieldcraft.requirements.coverage import compute_coverage
 
-                covers = compute_coverage(reqs, pruned_items)
+                    covers = compute_coverage(reqs, pruned_items)
 
-                try:
-                    from shieldcraft.checklist.dependencies import build_sequence
-                    build_sequence(pruned_items, infer_item_dependencies(reqs, covers), outdir='.selfhost_outputs')
-                except Exception:
-                    pass
-                inferred = infer_item_dependencies(reqs, covers)
-                plan = build_execution_plan(pruned_items, inferred)
-                manifest['checklist_execution_plan'] = {
-                    'ordered_item_count': len(
-                        plan.get(
-                            'ordered_item_ids', [])), 'cycle_groups': plan.get(
-                        'cycles', {}), 'missing_artifacts': plan.get(
-                        'missing_artifacts', []), 'priority_violations': plan.get(
-                        'priority_violations', [])}
-
-                if plan.get('cycles'):
-                    try:
-                        if getattr(self, 'checklist_context', None):
-                            try:
-                                self.checklist_context.record_event(
-                                    "G17_EXECUTION_CYCLE_DETECTED", "post_generation",
-                                    "REFUSAL", message="execution cycle detected")
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                    raise RuntimeError('execution_cycle_detected')
-                if plan.get('missing_artifacts'):
-                    try:
-                        if getattr(self, 'checklist_context', None):
-                            try:
-                                self.checklist_context.record_event(
-                                    "G18_MISSING_ARTIFACT_PRODUCER", "post_generation",
-                                    "REFUSAL", message="missing artifact producer")
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                    raise RuntimeError('missing_artifact_producer')
-                if plan.get('priority_violations'):
+                    inferred = infer_item_dependencies(reqs, covers)
                     try:
-                        if getattr(self, 'checklist_context', None):
-                            try:
-                                self.checklist_context.record_event(
-                                    "G19_PRIORITY_VIOLATION_DETECTED", "post_generation",
-                                    "REFUSAL", message="priority violation detected")
-                            except Exception:
-                                pass
+                        from shieldcraft.checklist.dependencies import build_sequence
+                        build_sequence(pruned_items, inferred, outdir='.selfhost_outputs')
                     except Exception:
                         pass
-                    raise RuntimeError('priority_violation_detected')
+                    plan = build_execution_plan(pruned_items, inferred)
+                    manifest['checklist_execution_plan'] = {
+                        'ordered_item_count': len(
+                            plan.get(
+                                'ordered_item_ids', [])), 'cycle_groups': plan.get(
+                            'cycles', {}), 'missing_artifacts': plan.get(
+                            'missing_artifacts', []), 'priority_violations': plan.get(
+                            'priority_violations', [])}
+
+                    if plan.get('cycles'):
+                        try:
+                            if getattr(self, 'checklist_context', None):
+                                try:
+                                    self.checklist_context.record_event(
+                                        "G17_EXECUTION_CYCLE_DETECTED", "post_generation",
+                                        "REFUSAL", message="execution cycle detected")
+                                except Exception:
+                                    pass
+                        except Exception:
+                            pass
+                        raise RuntimeError('execution_cycle_detected')
+                    if plan.get('missing_artifacts'):
+                        try:
+                            if getattr(self, 'checklist_context', None):
+                                try:
+                                    self.checklist_context.record_event(
+                                        "G18_MISSING_ARTIFACT_PRODUCER", "post_generation",
+                                        "REFUSAL", message="missing artifact producer")
+                                except Exception:
+                                    pass
+                        except Exception:
+                            pass
+                        raise RuntimeError('missing_artifact_producer')
+                    if plan.get('priority_violations'):
+                        try:
+                            if getattr(self, 'checklist_context', None):
+                                try:
+                                    self.checklist_context.record_event(
+                                        "G19_PRIORITY_VIOLATION_DETECTED", "post_generation",
+                                        "REFUSAL", message="priority violation detected")
+                                except Exception:
+                                    pass
+                        except Exception:
+                            pass
+                        raise RuntimeError('priority_violation_detected')
 
-                order_map = {nid: idx + 1 for idx, nid in enumerate(plan.get('ordered_item_ids', []))}
-                for it in pruned_items:
-                    it['execution_order'] = order_map.get(it.get('id'))
-                with open(os.path.join(output_dir, 'checklist.json'), 'w', encoding='utf8') as _cf2:
-                    json.dump({'items': pruned_items}, _cf2, indent=2, sort_keys=True)
+                    order_map = {nid: idx + 1 for idx, nid in enumerate(plan.get('ordered_item_ids', []))}
+                    for it in pruned_items:
+                        it['execution_order'] = order_map.get(it.get('id'))
+                    write_json(os.path.join(output_dir, 'checklist.json'), {'items': pruned_items})
             except Exception:
 
                 raise
@@ -1546,6 +1581,7 @@ class Engine:
                 preview_path.parent.mkdir(parents=True, exist_ok=True)
                 preview_path.write_text(json_str)
 
+    @_in_run_scope
     def run_self_build(self, spec_path: str = "spec/se_dsl_v1.spec.json", dry_run: bool = False):
         """Run a self-build using the engine pipeline and emit a self-build bundle.
 
@@ -1687,6 +1723,7 @@ class Engine:
         if _current.get("tree_hash") != emitted.get("tree_hash"):
             raise RuntimeError("selfbuild_mismatch: emitted snapshot does not match _current repo snapshot")
 
+    @_in_run_scope
     def generate_evidence(self, spec_path, checklist):
         canonical = self.det.canonicalize(checklist)
         checklist_hash = self.det.hash(canonical)
@@ -1715,10 +1752,15 @@ class Engine:
             output_dir="evidence"
         )
 
-    def execute(self, spec_path):
+    @_in_run_scope
+    def execute(self, spec_path, session=None):
+        if session is None:
+            session = self.compile(spec_path)
+        self.last_session = session
+
         try:
 
-            raw = load_spec(spec_path)
+            session.load()
         except Exception as e:
             try:
                 if getattr(self, 'checklist_context', None):
@@ -1736,29 +1778,16 @@ class Engine:
                 pass
             return finalize_checklist(self, partial_result=None, exception=e)
 
-        if isinstance(raw, SpecModel):
-            spec_model = raw
-            spec = spec_model.raw
-            ast = spec_model.ast
-
-            self._validate_spec(spec)
-            if "instructions" in spec:
-                fp = compute_spec_fingerprint(spec)
-                if getattr(self, "_last_validated_spec_fp", None) != fp:
-                    raise RuntimeError("validation_not_performed")
-        else:
-
-            spec = canonicalize(raw) if not isinstance(raw, dict) else raw
-            valid, errors = validate_spec_against_schema(spec, self.schema_path)
-            if not valid:
-                return finalize_checklist(self, partial_result={"type": "schema_error", "details": errors})
+        valid, errors = session.validate(self.schema_path, validator=validate_spec_against_schema)
+        if not valid:
+            return finalize_checklist(self, partial_result={"type": "schema_error", "details": errors})
+        spec = session.spec
 
-            self._validate_spec(spec)
-            if "instructions" in spec:
-                fp = compute_spec_fingerprint(spec)
-                if getattr(self, "_last_validated_spec_fp", None) != fp:
-                    raise RuntimeError("validation_not_performed")
-            ast = self.ast.build(spec)
+        self._validate_spec(spec)
+        ast = session.build(self.ast)
+        if "instructions" in spec:
+            if getattr(self, "_last_validated_spec_fp", None) != session.fingerprint:
+                raise RuntimeError("validation_not_performed")
 
         product_id = spec.get("metadata", {}).get("product_id", "unknown")
         prev_spec_path = f"products/{product_id}/last_spec.json"
@@ -1770,13 +1799,14 @@ class Engine:
                 previous_spec = json.load(f)
             spec_evolution = compute_evolution(previous_spec, spec)
 
-        plan = from_ast(ast, spec)
+        with session.stage("plan"):
+            plan = from_ast(ast, spec)
         product_id = spec.get("metadata", {}).get("product_id", "unknown")
         plan_dir = f"products/{product_id}"
         os.makedirs(plan_dir, exist_ok=True)
         write_canonical_json(f"{plan_dir}/plan.json", plan)
 
-        result = self.run(spec_path)
+        result = self.run(spec_path, session=session)
         if result.get("type") == "schema_error":
             return result
 
@@ -1907,5 +1937,6 @@ class BootstrapModule:
             "lineage": lineage_bundle,
             "stable": stable,
             "spec_evolution": spec_evolution,
-            "spec_metrics": spec_metrics
+            "spec_metrics": spec_metrics,
+            "timings": session.timings_report()
         }
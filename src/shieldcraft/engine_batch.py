@@ -6,44 +6,142 @@ import hashlib
 import json
 from shieldcraft.engine import Engine
 
+# Engine attributes that accumulate over a run; cleared before each spec so a
+# summary never depends on which specs ran earlier on the same engine.
+_RUN_STATE_ATTRS = (
+    "_execution_state_entries",
+    "_persona_annotations",
+    "_persona_events",
+    "_persona_vetoes",
+    "_persona_decisions",
+    "_determinism_seeds",
+    "_observability_dirty",
+)
 
-def run_batch(spec_paths, schema_path):
+# Per-process engine used by pooled batches (see run_batch)
+_WORKER_ENGINE = None
+
+
+def _reset_run_state(engine):
+    for attr in _RUN_STATE_ATTRS:
+        if hasattr(engine, attr):
+            delattr(engine, attr)
+    if getattr(engine, "checklist_context", None) is not None:
+        from shieldcraft.services.checklist.context import ChecklistContext
+        engine.checklist_context = ChecklistContext()
+
+
+def _execute_one(engine, spec_path):
+    """Run one spec on `engine` and return its batch summary."""
+    _reset_run_state(engine)
+    try:
+        result = engine.execute(spec_path)
+
+        # Create summary
+        summary = {
+            "spec_path": spec_path,
+            "success": result.get("type") != "schema_error",
+            "checklist_count": len(result.get("checklist", {}).get("items", [])),
+            "stable": result.get("stable", False)
+        }
+
+        if result.get("type") == "schema_error":
+            summary["errors"] = result.get("details", [])
+
+        return summary
+
+    except Exception as e:
+        return {
+            "spec_path": spec_path,
+            "success": False,
+            "error": str(e)
+        }
+
+
+def _init_batch_worker(schema_path):
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = Engine(schema_path)
+    # Compile the schema once per worker rather than on its first spec
+    try:
+        import jsonschema
+        from shieldcraft.services.spec.schema_registry import get_validator
+        get_validator(schema_path, cls=jsonschema.Draft202012Validator)
+    except Exception:
+        pass
+
+
+def _execute_in_worker(spec_paths):
+    return [_execute_one(_WORKER_ENGINE, p) for p in spec_paths]
+
+
+def _product_id(spec_path):
+    """Product a spec's run writes under (`products/<product_id>/`)."""
+    from shieldcraft.services.spec.session import CompilationSession
+    try:
+        spec = CompilationSession(spec_path).load()
+    except Exception:
+        return "unknown"
+    metadata = spec.get("metadata") if isinstance(spec, dict) else None
+    return (metadata or {}).get("product_id", "unknown")
+
+
+def _run_pooled(ordered, schema_path, workers, on_result):
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # A run reads what the previous run of its product left in products/, so
+    # specs of one product go to one worker, in serial order
+    chains = {}
+    for i, p in enumerate(ordered):
+        chains.setdefault(_product_id(p), []).append(i)
+
+    slots = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(schema_path,)) as ex:
+        futures = {ex.submit(_execute_in_worker, [ordered[i] for i in chain]): chain
+                   for chain in chains.values()}
+        for fut in as_completed(futures):
+            chain = futures[fut]
+            try:
+                summaries = fut.result()
+            except Exception as e:
+                # Worker died (e.g. killed or unpicklable result); record like a spec failure
+                summaries = [{"spec_path": ordered[i], "success": False, "error": str(e)} for i in chain]
+            for i, summary in zip(chain, summaries):
+                slots[i] = summary
+                if on_result is not None:
+                    on_result(summary)
+    return [slots[i] for i in range(len(ordered))]
+
+
+def run_batch(spec_paths, schema_path, workers=None, on_result=None):
     """
     Process multiple specs in batch.
 
     Args:
         spec_paths: List of paths to spec files
         schema_path: Path to schema file
+        workers: Optional number of worker processes. Above 1, specs run on a
+            process pool whose workers each keep one warm Engine (schema
+            pre-compiled). Specs of the same product run on one worker in
+            order, so `results` and `batch_hash` are identical to serial.
+        on_result: Optional callback invoked with each spec summary as it
+            finishes (completion order when pooled)
 
     Returns:
         Dict with batch results
     """
-    engine = Engine(schema_path)
-    results = []
-
-    for spec_path in sorted(spec_paths):
-        try:
-            result = engine.execute(spec_path)
-
-            # Create summary
-            summary = {
-                "spec_path": spec_path,
-                "success": result.get("type") != "schema_error",
-                "checklist_count": len(result.get("checklist", {}).get("items", [])),
-                "stable": result.get("stable", False)
-            }
-
-            if result.get("type") == "schema_error":
-                summary["errors"] = result.get("details", [])
+    ordered = sorted(spec_paths)
 
+    if workers and workers > 1 and len(ordered) > 1:
+        results = _run_pooled(ordered, schema_path, min(workers, len(ordered)), on_result)
+    else:
+        engine = Engine(schema_path)
+        results = []
+        for spec_path in ordered:
+            summary = _execute_one(engine, spec_path)
             results.append(summary)
-
-        except Exception as e:
-            results.append({
-                "spec_path": spec_path,
-                "success": False,
-                "error": str(e)
-            })
+            if on_result is not None:
+                on_result(summary)
 
     # Compute batch hash for determinism
     batch_content = json.dumps(results, sort_keys=True)
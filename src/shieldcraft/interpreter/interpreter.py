@@ -3,6 +3,14 @@ import hashlib
 import re
 from typing import List
 from shieldcraft.checklist.item_v1 import ChecklistItemV1
+from shieldcraft.util.keywords import KeywordScanner
+
+# Claim confidence and risk keywords
+CLAIM_SCANNER = KeywordScanner({
+    "high": ("must", "must not", "never", "always", "refuse", "unsafe"),
+    "low": ("may", "might", "could", "possibly"),
+    "unsafe": ("refuse", "no-touch", "no touch", "unsafe", "no safe"),
+})
 
 
 def _det_hash(s: str) -> str:
@@ -76,18 +84,16 @@ def interpret_raw_spec(text: str) -> List[ChecklistItemV1]:
             body_sentences[0] if body_sentences else title)
         cid = _det_hash(f"{idx}:{claim}")
         # determine confidence
-        low_keywords = ("may", "might", "could", "possibly")
-        high_keywords = ("must", "must not", "never", "always", "refuse", "unsafe")
-        claim_lower = claim.lower()
-        if any(k in claim_lower for k in high_keywords):
+        found = CLAIM_SCANNER.classes(claim)
+        if "high" in found:
             conf = "HIGH"
-        elif any(k in claim_lower for k in low_keywords):
+        elif "low" in found:
             conf = "LOW"
         else:
             conf = "MEDIUM"
         # risk default
         risk = "unsafe or misleading change"
-        if any(k in claim_lower for k in ("refuse", "no-touch", "no touch", "unsafe", "no safe")):
+        if "unsafe" in found:
             risk = "unsafe_to_act"
         ev = {"ptr": "/interpreted", "excerpt_hash": _det_hash(claim)}
         items.append(
@@ -102,15 +108,15 @@ def interpret_raw_spec(text: str) -> List[ChecklistItemV1]:
         for sidx, sent in enumerate(body_sentences[1:]):
             sc = f"{title}: {sent}" if title else sent
             sid = _det_hash(f"{idx}:{sidx}:{sc}")
-            sl = sc.lower()
-            if any(k in sl for k in high_keywords):
+            found2 = CLAIM_SCANNER.classes(sc)
+            if "high" in found2:
                 conf2 = "HIGH"
-            elif any(k in sl for k in low_keywords):
+            elif "low" in found2:
                 conf2 = "LOW"
             else:
                 conf2 = "LOW"
             risk2 = "unsafe or misleading change"
-            if any(k in sl for k in ("refuse", "no-touch", "no touch", "unsafe", "no safe")):
+            if "unsafe" in found2:
                 risk2 = "unsafe_to_act"
             ev2 = {"ptr": "/interpreted", "excerpt_hash": _det_hash(sc)}
             items.append(
@@ -4,6 +4,9 @@ import json
 import os
 import shutil
 from shieldcraft.engine import Engine
+from shieldcraft.services.io.artifact_bus import artifact_bus, artifact_exists, copy_artifact, read_json, write_json
+from shieldcraft.services.spec.session import CompilationSession
+from shieldcraft.util.keywords import OBLIGATION_SCANNER
 from shieldcraft.output_contracts import VERSION as OUTPUT_CONTRACT_VERSION
 
 
@@ -121,8 +124,7 @@ def run_self_host(spec_file, schema_path, emit_preview=None, dry_run=False):
                     ptr = f"{base_ptr}/{i}"
                     items.extend(_scan(v, ptr))
             elif isinstance(node, str):
-                low = node.lower()
-                if any(w in low for w in ("must", "never", "requires", "should", "must not", "refuse")):
+                if OBLIGATION_SCANNER.matches(node):
                     text = node.strip()
                     hid = hashlib.sha256((base_ptr + ":" + text).encode()).hexdigest()[:12]
                     items.append({"id": hid, "ptr": base_ptr or "/", "text": text, "value": text})
@@ -178,7 +180,8 @@ def run_self_host(spec_file, schema_path, emit_preview=None, dry_run=False):
         # Keep a record of pre-scan signals for suppressed-signal analysis later
         pre_scan = pre_items
         dry_run = dry_run or bool(emit_preview)
-        result = engine.run_self_host(spec, dry_run=dry_run, emit_preview=emit_preview)
+        session = CompilationSession.from_spec(spec)
+        result = engine.run_self_host(spec, dry_run=dry_run, emit_preview=emit_preview, session=session)
         # If engine returned a finalized checklist indicating refusal or error,
         # write a refusal_report or errors.json so CLI consumers see the artifact
         try:
@@ -218,7 +221,8 @@ def run_self_host(spec_file, schema_path, emit_preview=None, dry_run=False):
             # Emit preview if requested
             if emit_preview:
                 try:
-                    result = engine.run_self_host(spec, dry_run=True, emit_preview=emit_preview)
+                    result = engine.run_self_host(spec, dry_run=True, emit_preview=emit_preview,
+                                                  session=engine.last_session)
                 except (ValueError, TypeError, AttributeError, ImportError):
                     pass
             # Also write a minimal deterministic summary including active policy
@@ -1096,206 +1100,206 @@ def run_self_host(spec_file, schema_path, emit_preview=None, dry_run=False):
             # Otherwise, swallow non-fatal quality evaluation errors
         with open(manifest_path, "w", encoding='utf-8') as f:
             json.dump(manifest_data, f, indent=2, sort_keys=True)
-        # Best-effort: compute and persist checklist quality from emitted checklist
+        # Post-generation reports hand their inputs to each other in memory;
+        # files are written behind and flushed when the block ends
         try:
-            from shieldcraft.checklist.quality import evaluate_quality, write_quality_report
-            cl_path = os.path.join(output_dir, 'checklist.json')
-            if os.path.exists(cl_path):
-                with open(cl_path, 'r', encoding='utf-8') as f:
-                    cl = json.load(f)
-                items = cl.get('items', [])
-            else:
-                items = manifest_data.get('checklist', []).get('items', []) if isinstance(
-                    manifest_data.get('checklist'), dict) else manifest_data.get('checklist', [])
-            qualities, qsummary = evaluate_quality(items)
-            write_quality_report(qualities, qsummary, outdir=output_dir)
-            # annotate manifest with summary for visibility
-            manifest_data['checklist_quality_summary'] = qsummary
-            # Enforce quality gates: fail if any P0 is low-signal or low-signal items > 5%
-            try:
-                total = qsummary.get('total_items', 0) or 0
-                low_count = qsummary.get('low_signal_count', 0) or 0
-                low_ids = set(qsummary.get('low_signal_item_ids') or [])
-                # map ids -> priorities
-                id_to_pr = {it.get('id'): it.get('priority') for it in (items or [])}
-                p0_violations = [iid for iid in low_ids if (id_to_pr.get(iid) or '').upper().startswith('P0')]
-                ratio = (low_count / total) if total else 0.0
-                if p0_violations:
+            with artifact_bus():
+                # Best-effort: compute and persist checklist quality from emitted checklist
+                try:
+                    from shieldcraft.checklist.quality import evaluate_quality, write_quality_report
+                    cl_path = os.path.join(output_dir, 'checklist.json')
+                    if artifact_exists(cl_path):
+                        items = read_json(cl_path).get('items', [])
+                    else:
+                        items = manifest_data.get('checklist', []).get('items', []) if isinstance(
+                            manifest_data.get('checklist'), dict) else manifest_data.get('checklist', [])
+                    qualities, qsummary = evaluate_quality(items)
+                    write_quality_report(qualities, qsummary, outdir=output_dir)
+                    # annotate manifest with summary for visibility
+                    manifest_data['checklist_quality_summary'] = qsummary
+                    # Enforce quality gates: fail if any P0 is low-signal or low-signal items > 5%
                     try:
-                        if getattr(engine, 'checklist_context', None):
+                        total = qsummary.get('total_items', 0) or 0
+                        low_count = qsummary.get('low_signal_count', 0) or 0
+                        low_ids = set(qsummary.get('low_signal_item_ids') or [])
+                        # map ids -> priorities
+                        id_to_pr = {it.get('id'): it.get('priority') for it in (items or [])}
+                        p0_violations = [iid for iid in low_ids if (id_to_pr.get(iid) or '').upper().startswith('P0')]
+                        ratio = (low_count / total) if total else 0.0
+                        if p0_violations:
                             try:
-                                engine.checklist_context.record_event(
-                                    "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: p0 violations")
-                            except (AttributeError, ValueError, TypeError):
+                                if getattr(engine, 'checklist_context', None):
+                                    try:
+                                        engine.checklist_context.record_event(
+                                            "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: p0 violations")
+                                    except (AttributeError, ValueError, TypeError):
+                                        pass
+                            except (AttributeError, TypeError):
                                 pass
-                    except (AttributeError, TypeError):
-                        pass
-                    raise RuntimeError('quality_gate_failed')
-                if total == 0:
-                    # No checklist items -> fail quality for prose-only specs
-                    try:
-                        if getattr(engine, 'checklist_context', None):
+                            raise RuntimeError('quality_gate_failed')
+                        if total == 0:
+                            # No checklist items -> fail quality for prose-only specs
                             try:
-                                engine.checklist_context.record_event(
-                                    "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: zero items")
-                            except (AttributeError, ValueError, TypeError):
+                                if getattr(engine, 'checklist_context', None):
+                                    try:
+                                        engine.checklist_context.record_event(
+                                            "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: zero items")
+                                    except (AttributeError, ValueError, TypeError):
+                                        pass
+                            except (AttributeError, TypeError):
                                 pass
-                    except (AttributeError, TypeError):
-                        pass
-                    raise RuntimeError('quality_gate_failed')
-                # Allow some low-signal noise; fail only if >10% of items
-                if ratio > 0.10:
-                    try:
-                        if getattr(engine, 'checklist_context', None):
+                            raise RuntimeError('quality_gate_failed')
+                        # Allow some low-signal noise; fail only if >10% of items
+                        if ratio > 0.10:
                             try:
-                                engine.checklist_context.record_event(
-                                    "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: low-signal ratio")
-                            except (AttributeError, ValueError, TypeError):
+                                if getattr(engine, 'checklist_context', None):
+                                    try:
+                                        engine.checklist_context.record_event(
+                                            "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: low-signal ratio")
+                                    except (AttributeError, ValueError, TypeError):
+                                        pass
+                            except (AttributeError, TypeError):
                                 pass
-                    except (AttributeError, TypeError):
-                        pass
-                    raise RuntimeError('quality_gate_failed')
-                # Fail if all items are inferred from prose (even if not low confidence)
-                inferred_all = sum(1 for it in (items or []) if it.get('inferred_from_prose'))
-                if total > 0 and inferred_all == total:
-                    try:
-                        if getattr(engine, 'checklist_context', None):
+                            raise RuntimeError('quality_gate_failed')
+                        # Fail if all items are inferred from prose (even if not low confidence)
+                        inferred_all = sum(1 for it in (items or []) if it.get('inferred_from_prose'))
+                        if total > 0 and inferred_all == total:
                             try:
-                                engine.checklist_context.record_event(
-                                    "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: all items inferred from prose")
-                            except (AttributeError, ValueError, TypeError):
+                                if getattr(engine, 'checklist_context', None):
+                                    try:
+                                        engine.checklist_context.record_event(
+                                            "G20_QUALITY_GATE_FAILED", "post_generation", "REFUSAL", message="quality gate failed: all items inferred from prose")
+                                    except (AttributeError, ValueError, TypeError):
+                                        pass
+                            except (AttributeError, TypeError):
                                 pass
-                    except (AttributeError, TypeError):
-                        pass
-                    raise RuntimeError('quality_gate_failed')
-            except RuntimeError:
-                # Persist quality summary before propagating
-                with open(manifest_path, "w", encoding='utf-8') as f:
-                    json.dump(manifest_data, f, indent=2, sort_keys=True)
-                raise
-            # persist updated manifest
-            with open(manifest_path, "w", encoding='utf-8') as f:
-                json.dump(manifest_data, f, indent=2, sort_keys=True)
-        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError, RuntimeError):
-            pass
-
-        # Best-effort: compute and persist checklist sequence (dependencies/order)
-        try:
-            from shieldcraft.checklist.dependencies import infer_item_dependencies, build_sequence
-            from shieldcraft.requirements.coverage import compute_coverage
-            cl_path = os.path.join(output_dir, 'checklist.json')
-            reqp = os.path.join(output_dir, 'requirements.json')
-            # If checklist exists, ensure requirements.json exists (extract if needed)
-            if os.path.exists(cl_path):
-                try:
-                    if not os.path.exists(reqp):
-                        from shieldcraft.interpretation.requirements import extract_requirements
-                        rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
-                            'raw_input') or json.dumps(spec, sort_keys=True)
-                        reqs_local = extract_requirements(rtxt)
-                        with open(reqp, 'w', encoding='utf8') as _rf:
-                            json.dump({'requirements': reqs_local}, _rf, indent=2, sort_keys=True)
-                except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
-                    pass
-                if os.path.exists(reqp):
-                    with open(cl_path, 'r', encoding='utf-8') as f:
-                        items = json.load(f).get('items', [])
-                    with open(reqp, 'r', encoding='utf-8') as f:
-                        reqs = json.load(f).get('requirements', [])
-                    covers = compute_coverage(reqs, items)
-                    inferred = infer_item_dependencies(reqs, covers)
-                seq = build_sequence(items, inferred, outdir=output_dir)
-                manifest_data['checklist_sequence_summary'] = {
-                    'total_items': len(seq.get('sequence', [])),
-                    'cycle_groups': len(seq.get('cycle_groups', {})),
-                }
-                with open(manifest_path, "w", encoding='utf-8') as f:
-                    json.dump(manifest_data, f, indent=2, sort_keys=True)
-                # Compute spec coverage now that checklist and requirements exist
-                try:
-                    from shieldcraft.coverage.evaluator import evaluate_spec_coverage
-                    # Load spec for units
-                    rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
-                        'raw_input') or json.dumps(spec, sort_keys=True)
-                    # If spec is a dict, pass the dict to evaluator for section/invariant extraction
-                    with open(cl_path, 'r', encoding='utf-8') as f:
-                        items = json.load(f).get('items', [])
-                    cov = evaluate_spec_coverage(spec if isinstance(spec, dict) else {},
-                                                 items, outdir=output_dir)
-                    # persist root copy
-                    try:
-                        shutil.copyfile(os.path.join(output_dir, 'spec_coverage.json'),
-                                        os.path.join('.selfhost_outputs', 'spec_coverage.json'))
-                    except (IOError, OSError):
-                        pass
-                    manifest_data['spec_coverage_summary'] = {'total_units': cov.get(
-                        'total_units'), 'covered_units': cov.get('covered_count')}
+                            raise RuntimeError('quality_gate_failed')
+                    except RuntimeError:
+                        # Persist quality summary before propagating
+                        with open(manifest_path, "w", encoding='utf-8') as f:
+                            json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        raise
+                    # persist updated manifest
                     with open(manifest_path, "w", encoding='utf-8') as f:
                         json.dump(manifest_data, f, indent=2, sort_keys=True)
-                except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
+                except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError, RuntimeError):
                     pass
-                # Best-effort: compute sufficiency now that sequence and coverage exist
+
+                # Best-effort: compute and persist checklist sequence (dependencies/order)
                 try:
-                    from shieldcraft.sufficiency.evaluator import evaluate_from_files, write_sufficiency_report
-                    suff = evaluate_from_files(output_dir)
-                    write_sufficiency_report(suff, outdir=output_dir)
-                    write_sufficiency_report(suff, outdir='.selfhost_outputs')
-                    manifest_data['checklist_sufficiency'] = suff
-                    manifest_data['checklist_sufficient'] = suff.get('sufficient', False)
-                    with open(manifest_path, "w", encoding='utf-8') as f:
-                        json.dump(manifest_data, f, indent=2, sort_keys=True)
+                    from shieldcraft.checklist.dependencies import infer_item_dependencies, build_sequence
+                    from shieldcraft.requirements.coverage import compute_coverage
+                    cl_path = os.path.join(output_dir, 'checklist.json')
+                    reqp = os.path.join(output_dir, 'requirements.json')
+                    # If checklist exists, ensure requirements.json exists (extract if needed)
+                    if artifact_exists(cl_path):
+                        try:
+                            if not artifact_exists(reqp):
+                                from shieldcraft.interpretation.requirements import extract_requirements
+                                rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
+                                    'raw_input') or json.dumps(spec, sort_keys=True)
+                                reqs_local = extract_requirements(rtxt)
+                                write_json(reqp, {'requirements': reqs_local})
+                        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
+                            pass
+                        if artifact_exists(reqp):
+                            items = read_json(cl_path).get('items', [])
+                            reqs = read_json(reqp).get('requirements', [])
+                            covers = compute_coverage(reqs, items)
+                            inferred = infer_item_dependencies(reqs, covers)
+                        seq = build_sequence(items, inferred, outdir=output_dir)
+                        manifest_data['checklist_sequence_summary'] = {
+                            'total_items': len(seq.get('sequence', [])),
+                            'cycle_groups': len(seq.get('cycle_groups', {})),
+                        }
+                        with open(manifest_path, "w", encoding='utf-8') as f:
+                            json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        # Compute spec coverage now that checklist and requirements exist
+                        try:
+                            from shieldcraft.coverage.evaluator import evaluate_spec_coverage
+                            # Load spec for units
+                            rtxt = spec.get('metadata', {}).get('source_material') or spec.get(
+                                'raw_input') or json.dumps(spec, sort_keys=True)
+                            # If spec is a dict, pass the dict to evaluator for section/invariant extraction
+                            # (copied: the evaluator annotates items in place)
+                            items = [dict(it) for it in read_json(cl_path).get('items', [])]
+                            cov = evaluate_spec_coverage(spec if isinstance(spec, dict) else {},
+                                                         items, outdir=output_dir)
+                            # persist root copy
+                            try:
+                                copy_artifact(os.path.join(output_dir, 'spec_coverage.json'),
+                                              os.path.join('.selfhost_outputs', 'spec_coverage.json'))
+                            except (IOError, OSError):
+                                pass
+                            manifest_data['spec_coverage_summary'] = {'total_units': cov.get(
+                                'total_units'), 'covered_units': cov.get('covered_count')}
+                            with open(manifest_path, "w", encoding='utf-8') as f:
+                                json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
+                            pass
+                        # Best-effort: compute sufficiency now that sequence and coverage exist
+                        try:
+                            from shieldcraft.sufficiency.evaluator import evaluate_from_files, write_sufficiency_report
+                            suff = evaluate_from_files(output_dir)
+                            write_sufficiency_report(suff, outdir=output_dir)
+                            write_sufficiency_report(suff, outdir='.selfhost_outputs')
+                            manifest_data['checklist_sufficiency'] = suff
+                            manifest_data['checklist_sufficient'] = suff.get('sufficient', False)
+                            with open(manifest_path, "w", encoding='utf-8') as f:
+                                json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
+                            pass
+                        # Compute implementability verdict (aggregate of proofs) after sufficiency
+                        try:
+                            from shieldcraft.verdict.aggregator import compute_implementability
+                            verdict = compute_implementability(output_dir)
+                            # persist root copy
+                            try:
+                                copy_artifact(os.path.join(output_dir, 'implementability_verdict.json'),
+                                              os.path.join('.selfhost_outputs', 'implementability_verdict.json'))
+                            except (IOError, OSError):
+                                pass
+                            manifest_data['implementability_verdict'] = verdict
+                            manifest_data['implementable'] = verdict.get('implementable', False)
+                            with open(manifest_path, "w", encoding='utf-8') as f:
+                                json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        except (IOError, OSError, TypeError):
+                            pass
                 except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
                     pass
-                # Compute implementability verdict (aggregate of proofs) after sufficiency
-                try:
-                    from shieldcraft.verdict.aggregator import compute_implementability
-                    verdict = compute_implementability(output_dir)
-                    # persist root copy
-                    try:
-                        shutil.copyfile(os.path.join(output_dir, 'implementability_verdict.json'),
-                                        os.path.join('.selfhost_outputs', 'implementability_verdict.json'))
-                    except (IOError, OSError):
-                        pass
-                    manifest_data['implementability_verdict'] = verdict
-                    manifest_data['implementable'] = verdict.get('implementable', False)
-                    with open(manifest_path, "w", encoding='utf-8') as f:
-                        json.dump(manifest_data, f, indent=2, sort_keys=True)
-                except (IOError, OSError, TypeError):
-                    pass
-        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
-            pass
 
-        # Best-effort: compute and persist requirement completeness
-        try:
-            from shieldcraft.requirements.completion import bind_dimensions_to_items, evaluate_completeness, write_completeness_report, is_implementable
-            cl_path = os.path.join(output_dir, 'checklist.json')
-            reqp = os.path.join(output_dir, 'requirements.json')
-            if os.path.exists(cl_path) and os.path.exists(reqp):
-                with open(cl_path, 'r', encoding='utf-8') as f:
-                    items = json.load(f).get('items', [])
-                with open(reqp, 'r', encoding='utf-8') as f:
-                    reqs = json.load(f).get('requirements', [])
-                items = bind_dimensions_to_items(reqs, items)
-                results, summary = evaluate_completeness(reqs, items)
-                write_completeness_report(results, summary, outdir=output_dir)
-                impl = is_implementable(summary, reqs)
-                manifest_data['implementability'] = {'implementable': impl, 'complete_pct': summary.get('complete_pct')}
-                with open(manifest_path, "w", encoding='utf-8') as f:
-                    json.dump(manifest_data, f, indent=2, sort_keys=True)
-                # Evaluate checklist sufficiency contract after completeness
+                # Best-effort: compute and persist requirement completeness
                 try:
-                    from shieldcraft.sufficiency.evaluator import evaluate_from_files, write_sufficiency_report
-                    suff = evaluate_from_files(output_dir)
-                    # persist both under fingerprinted output and top-level outputs for consumer expectations
-                    write_sufficiency_report(suff, outdir=output_dir)
-                    write_sufficiency_report(suff, outdir='.selfhost_outputs')
-                    manifest_data['checklist_sufficiency'] = suff
-                    manifest_data['checklist_sufficient'] = suff.get('sufficient', False)
-                    with open(manifest_path, "w", encoding='utf-8') as f:
-                        json.dump(manifest_data, f, indent=2, sort_keys=True)
-                except (IOError, OSError, TypeError):
+                    from shieldcraft.requirements.completion import bind_dimensions_to_items, evaluate_completeness, write_completeness_report, is_implementable
+                    cl_path = os.path.join(output_dir, 'checklist.json')
+                    reqp = os.path.join(output_dir, 'requirements.json')
+                    if artifact_exists(cl_path) and artifact_exists(reqp):
+                        # Copied: binding annotates items in place
+                        items = [dict(it) for it in read_json(cl_path).get('items', [])]
+                        reqs = read_json(reqp).get('requirements', [])
+                        items = bind_dimensions_to_items(reqs, items)
+                        results, summary = evaluate_completeness(reqs, items)
+                        write_completeness_report(results, summary, outdir=output_dir)
+                        impl = is_implementable(summary, reqs)
+                        manifest_data['implementability'] = {'implementable': impl, 'complete_pct': summary.get('complete_pct')}
+                        with open(manifest_path, "w", encoding='utf-8') as f:
+                            json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        # Evaluate checklist sufficiency contract after completeness
+                        try:
+                            from shieldcraft.sufficiency.evaluator import evaluate_from_files, write_sufficiency_report
+                            suff = evaluate_from_files(output_dir)
+                            # persist both under fingerprinted output and top-level outputs for consumer expectations
+                            write_sufficiency_report(suff, outdir=output_dir)
+                            write_sufficiency_report(suff, outdir='.selfhost_outputs')
+                            manifest_data['checklist_sufficiency'] = suff
+                            manifest_data['checklist_sufficient'] = suff.get('sufficient', False)
+                            with open(manifest_path, "w", encoding='utf-8') as f:
+                                json.dump(manifest_data, f, indent=2, sort_keys=True)
+                        except (IOError, OSError, TypeError):
+                            pass
+                except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
                     pass
-        except (ImportError, ValueError, TypeError, AttributeError, IOError, OSError):
+        except (IOError, OSError):
             pass
 
         # Write generated code
@@ -1,8 +1,12 @@
 import os
 import json
+import threading
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from typing import List, Optional
 
+from shieldcraft.util.run_scope import current_scope
+
 # Locked artifact location for execution state
 EXECUTION_STATE_DIR = "artifacts"
 EXECUTION_STATE_FILENAME = "execution_state_v1.json"
@@ -19,12 +23,84 @@ class ExecutionStateEntry:
     error_code: Optional[str] = None
 
 
+def _state_dir() -> str:
+    """Snapshot directory: the active run scope's, else the locked default."""
+    scope = current_scope()
+    if scope is not None and scope.artifacts_dir:
+        return scope.artifacts_dir
+    return EXECUTION_STATE_DIR
+
+
+def _write_json(path: str, data) -> None:
+    # Write-then-rename so concurrent readers never see a partial snapshot
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
 def _state_file_path() -> str:
-    d = EXECUTION_STATE_DIR
+    d = _state_dir()
     os.makedirs(d, exist_ok=True)
     return os.path.join(d, EXECUTION_STATE_FILENAME)
 
 
+# Buffered emission
+#
+# Outside a `buffered(engine)` scope every emit rewrites its snapshot file, as
+# readers expect. Inside a scope, entries accumulate on the engine and each
+# snapshot is written once when the outermost scope exits (a phase boundary)
+# or on `flush(engine)`. Snapshots are identical to unbuffered emission.
+
+def _writers():
+    return {
+        "state": _write_state,
+        "annotations": _write_annotations,
+        "events": _write_events_and_hash,
+    }
+
+
+def _persist(engine, kind: str) -> None:
+    if getattr(engine, "_observability_depth", 0) > 0:
+        dirty = getattr(engine, "_observability_dirty", None)
+        if dirty is None:
+            dirty = engine._observability_dirty = set()  # type: ignore
+        dirty.add(kind)
+        return
+    _writers()[kind](engine)
+
+
+def flush(engine) -> None:
+    """Write canonical snapshots for any entries buffered on `engine`."""
+    dirty = getattr(engine, "_observability_dirty", None)
+    if not dirty:
+        return
+    writers = _writers()
+    for kind in ("state", "annotations", "events"):
+        if kind in dirty:
+            writers[kind](engine)
+    dirty.clear()
+
+
+@contextmanager
+def buffered(engine):
+    """Defer snapshot writes for `engine` until the outermost scope exits."""
+    if engine is None:
+        yield
+        return
+    engine._observability_depth = getattr(engine, "_observability_depth", 0) + 1  # type: ignore
+    try:
+        yield
+    finally:
+        engine._observability_depth -= 1
+        if engine._observability_depth == 0:
+            flush(engine)
+
+
+def _write_state(engine) -> None:
+    _write_json(_state_file_path(), getattr(engine, "_execution_state_entries", []))
+
+
 def emit_state(engine, phase: str, gate: str, status: str, error_code: Optional[str] = None) -> None:
     """Append a state entry and persist deterministically (no timestamps).
 
@@ -37,9 +113,7 @@ def emit_state(engine, phase: str, gate: str, status: str, error_code: Optional[
     entry = ExecutionStateEntry(phase=phase, gate=gate, status=status, error_code=error_code)
     engine._execution_state_entries.append(asdict(entry))
     # Persist deterministically
-    path = _state_file_path()
-    with open(path, "w", encoding='utf-8') as f:
-        json.dump(engine._execution_state_entries, f, indent=2, sort_keys=True)
+    _persist(engine, "state")
 
 
 def read_state() -> List[dict]:
@@ -51,7 +125,7 @@ def read_state() -> List[dict]:
 
 
 def _annotations_path() -> str:
-    d = EXECUTION_STATE_DIR
+    d = _state_dir()
     os.makedirs(d, exist_ok=True)
     return os.path.join(d, ANNOTATIONS_FILENAME)
 
@@ -67,9 +141,11 @@ def emit_persona_annotation(engine, persona_id: str, phase: str, message: str, s
         "severity": severity,
     }
     engine._persona_annotations.append(entry)
-    p = _annotations_path()
-    with open(p, "w", encoding='utf-8') as f:
-        json.dump(engine._persona_annotations, f, indent=2, sort_keys=True)
+    _persist(engine, "annotations")
+
+
+def _write_annotations(engine) -> None:
+    _write_json(_annotations_path(), getattr(engine, "_persona_annotations", []))
 
 
 def read_persona_annotations() -> List[dict]:
@@ -81,29 +157,41 @@ def read_persona_annotations() -> List[dict]:
 
 
 def _events_path() -> str:
-    d = EXECUTION_STATE_DIR
+    d = _state_dir()
     os.makedirs(d, exist_ok=True)
     return os.path.join(d, EVENTS_FILENAME)
 
 
 def _events_hash_path() -> str:
-    d = EXECUTION_STATE_DIR
+    d = _state_dir()
     os.makedirs(d, exist_ok=True)
     return os.path.join(d, EVENTS_HASH_FILENAME)
 
 
+_EVENT_SCHEMA = None
+
+
+def _event_schema() -> dict:
+    """Load persona_event_v1.schema.json once per process."""
+    global _EVENT_SCHEMA
+    if _EVENT_SCHEMA is None:
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "persona", "persona_event_v1.schema.json")
+        try:
+            with open(schema_path, encoding='utf-8') as f:
+                _EVENT_SCHEMA = json.load(f)
+        except Exception:
+            # If schema missing, reject to be conservative
+            raise RuntimeError("persona_event_schema_missing")
+    return _EVENT_SCHEMA
+
+
 def _validate_event_schema(event: dict) -> None:
     """Lightweight, deterministic validation against persona_event_v1.schema.json.
 
     This enforces presence, types and forbids unknown fields without depending on
     an external JSON Schema runtime.
     """
-    schema_path = os.path.join(os.path.dirname(__file__), "..", "persona", "persona_event_v1.schema.json")
-    try:
-        schema = json.loads(open(schema_path).read())
-    except Exception:
-        # If schema missing, reject to be conservative
-        raise RuntimeError("persona_event_schema_missing")
+    schema = _event_schema()
 
     required = schema.get("required", [])
     for k in required:
@@ -129,9 +217,7 @@ def _validate_event_schema(event: dict) -> None:
 
 
 def _write_events_and_hash(engine) -> None:
-    path = _events_path()
-    with open(path, "w", encoding='utf-8') as f:
-        json.dump(getattr(engine, "_persona_events", []), f, indent=2, sort_keys=True)
+    _write_json(_events_path(), getattr(engine, "_persona_events", []))
 
     # Compute deterministic hash over canonical representation (no whitespace variance)
     from shieldcraft.util.json_canonicalizer import canonicalize
@@ -167,7 +253,7 @@ def emit_persona_event(
     _validate_event_schema(event)
 
     engine._persona_events.append(event)
-    _write_events_and_hash(engine)
+    _persist(engine, "events")
 
 
 def read_persona_events() -> List[dict]:
@@ -19,6 +19,78 @@ def _matches(item: Dict[str, Any], match: Dict[str, Any]) -> bool:
     return True
 
 
+class MatchIndex:
+    """Items hashed by the (key, value) pairs persona rules match on.
+
+    Postings for a key are built on first use, so only keys that some rule
+    matches on are indexed. `candidates(match)` narrows to the smallest
+    posting list among the rule's pairs and re-checks `_matches`, returning
+    positions in item order. Values that cannot be hashed (on either side)
+    fall back to scanning. Callers that mutate an indexed item must call
+    `refresh(pos, key)` for each key they change.
+    """
+
+    _UNHASHABLE = object()
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+        self._postings: Dict[str, Dict[Any, set]] = {}
+        self._bucket: Dict[str, Dict[int, Any]] = {}
+
+    @classmethod
+    def _bucket_key(cls, value: Any) -> Any:
+        try:
+            hash(value)
+        except TypeError:
+            return cls._UNHASHABLE
+        return value
+
+    def _key_postings(self, key: str) -> Dict[Any, set]:
+        postings = self._postings.get(key)
+        if postings is None:
+            postings, bucket = {}, {}
+            for pos, item in enumerate(self.items):
+                b = self._bucket_key(item.get(key))
+                postings.setdefault(b, set()).add(pos)
+                bucket[pos] = b
+            self._postings[key] = postings
+            self._bucket[key] = bucket
+        return postings
+
+    def refresh(self, pos: int, key: str) -> None:
+        """Re-bucket item `pos` after its value for `key` changed."""
+        postings = self._postings.get(key)
+        if postings is None:
+            return
+        bucket = self._bucket[key]
+        postings[bucket[pos]].discard(pos)
+        b = self._bucket_key(self.items[pos].get(key))
+        postings.setdefault(b, set()).add(pos)
+        bucket[pos] = b
+
+    def _pair_positions(self, key: str, value: Any):
+        """Superset of positions whose item has `key` == `value`, or None for all."""
+        b = self._bucket_key(value)
+        if b is self._UNHASHABLE:
+            return None
+        postings = self._key_postings(key)
+        hit = postings.get(b, ())
+        loose = postings.get(self._UNHASHABLE, ())
+        return hit | loose if loose else hit
+
+    def candidates(self, match: Dict[str, Any]) -> List[int]:
+        """Positions of items satisfying every pair of `match`, in item order."""
+        best = None
+        for k, v in (match or {}).items():
+            positions = self._pair_positions(k, v)
+            if positions is not None and (best is None or len(positions) < len(best)):
+                best = positions
+                if not best:
+                    return []
+        pool = range(len(self.items)) if best is None else sorted(best)
+        return [pos for pos in pool if _matches(self.items[pos], match)]
+
+
 def evaluate_personas(engine, personas: List[Any], items: List[Dict[str, Any]],
                       phase: str = "checklist") -> Dict[str, Any]:
     """Evaluate personas and apply constraints deterministically.
@@ -29,6 +101,7 @@ def evaluate_personas(engine, personas: List[Any], items: List[Dict[str, Any]],
     applied = 0
     # Do not mutate `items` in-place. Collect constraints to be applied by the caller.
     constraints_to_apply = []
+    index = MatchIndex(items)
 
     # Iterate deterministically by persona name
     for p in sorted(personas, key=lambda x: x.name):
@@ -46,12 +119,12 @@ def evaluate_personas(engine, personas: List[Any], items: List[Dict[str, Any]],
             match = rule.get("match", {})
             code = rule.get("code", "veto")
             explanation = rule.get("explanation", {"explanation_code": "unspecified", "details": ""})
-            for item in items:
-                if _matches(item, match):
-                    # Record veto via persona API (ensures auditability and deterministic recording)
-                    emit_veto(engine, ctx, phase, code, explanation, severity=rule.get("severity", "high"))
-                    vetoes.append({"persona": p.name, "code": code,
-                                  "item_id": item.get("id"), "explanation": explanation})
+            for pos in index.candidates(match):
+                item = items[pos]
+                # Record veto via persona API (ensures auditability and deterministic recording)
+                emit_veto(engine, ctx, phase, code, explanation, severity=rule.get("severity", "high"))
+                vetoes.append({"persona": p.name, "code": code,
+                              "item_id": item.get("id"), "explanation": explanation})
 
         # Evaluate constraint rules
         for rule in p.constraints.get("constraint", []):
@@ -60,22 +133,22 @@ def evaluate_personas(engine, personas: List[Any], items: List[Dict[str, Any]],
             # Sanity: prevent persona from changing identifiers, semantic outcome fields, or creating artifacts
             forbidden = set(["id", "ptr", "generated", "artifact", "severity", "refusal", "outcome"])
             disallowed = any(k in forbidden for k in setter.keys())
-            for item in items:
-                if _matches(item, match):
-                    # If the setter contains disallowed keys, record intent but do not raise;
-                    # the generator layer will surface this as a DIAGNOSTIC and will not apply the mutation.
-                    if disallowed:
-                        constraints_to_apply.append({"persona": p.name, "item_id": item.get(
-                            "id"), "item_ptr": item.get("ptr"), "set": setter, "disallowed": True, "match": match})
-                        # Record the decision for audit (non-mutating, disallowed)
-                        record_decision(
-                            engine, p.name, phase, {
-                                "action": "constraint_disallowed", "match": match, "attempt": setter})
-                    else:
-                        # Record the constraint for the caller to apply deterministically
-                        constraints_to_apply.append({"persona": p.name, "item_id": item.get(
-                            "id"), "item_ptr": item.get("ptr"), "set": setter, "match": match})
-                        # Record the decision for audit (non-mutating)
-                        record_decision(engine, p.name, phase, {"action": "constraint", "match": match, "set": setter})
+            for pos in index.candidates(match):
+                item = items[pos]
+                # If the setter contains disallowed keys, record intent but do not raise;
+                # the generator layer will surface this as a DIAGNOSTIC and will not apply the mutation.
+                if disallowed:
+                    constraints_to_apply.append({"persona": p.name, "item_id": item.get(
+                        "id"), "item_ptr": item.get("ptr"), "set": setter, "disallowed": True, "match": match})
+                    # Record the decision for audit (non-mutating, disallowed)
+                    record_decision(
+                        engine, p.name, phase, {
+                            "action": "constraint_disallowed", "match": match, "attempt": setter})
+                else:
+                    # Record the constraint for the caller to apply deterministically
+                    constraints_to_apply.append({"persona": p.name, "item_id": item.get(
+                        "id"), "item_ptr": item.get("ptr"), "set": setter, "match": match})
+                    # Record the decision for audit (non-mutating)
+                    record_decision(engine, p.name, phase, {"action": "constraint", "match": match, "set": setter})
 
     return {"vetoes": vetoes, "constraints_applied": applied, "constraints": constraints_to_apply}
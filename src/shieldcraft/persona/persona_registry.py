@@ -2,29 +2,56 @@
 
 This allows personas to be registered in-memory for deterministic evaluation
 without relying on filesystem persona files.
+
+An Engine run evaluates the registry as it was when the run started: the run
+scope (see shieldcraft.util.run_scope) holds a snapshot, and registrations made
+inside the scope only change that snapshot.
 """
 from typing import List
 from shieldcraft.persona import Persona
+from shieldcraft.util.run_scope import current_scope
 
 _REGISTRY: List[Persona] = []
 
 
+def _scoped_view():
+    scope = current_scope()
+    if scope is not None and scope.personas is not None:
+        return scope
+    return None
+
+
 def register_persona(persona: Persona) -> None:
     # Deduplicate by name deterministically
     global _REGISTRY
+    scope = _scoped_view()
     # Replace any existing persona with same name
+    if scope is not None:
+        scope.personas = [p for p in scope.personas if p.name != persona.name] + [persona]
+        return
     _REGISTRY = [p for p in _REGISTRY if p.name != persona.name]
     _REGISTRY.append(persona)
 
 
 def clear_registry() -> None:
     global _REGISTRY
+    scope = _scoped_view()
+    if scope is not None:
+        scope.personas = []
+        return
     _REGISTRY = []
 
 
+def snapshot_registry() -> List[Persona]:
+    """Return the personas registered process-wide, for seeding a run scope."""
+    return list(_REGISTRY)
+
+
 def list_personas() -> List[Persona]:
     # Return sorted copy for deterministic iteration
-    return sorted(list(_REGISTRY), key=lambda p: p.name)
+    scope = _scoped_view()
+    personas = scope.personas if scope is not None else _REGISTRY
+    return sorted(list(personas), key=lambda p: p.name)
 
 
 def find_personas_for_phase(phase: str) -> List[Persona]:
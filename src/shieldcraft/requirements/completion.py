@@ -3,9 +3,27 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Any, Tuple
-import json
 import os
 
+from shieldcraft.services.io.artifact_bus import write_json
+from shieldcraft.util.keywords import KeywordScanner
+
+# Dimensions an item covers, by keywords in its claim text and intent category
+_CLAIM_DIMENSIONS = KeywordScanner({
+    'refusal': ('refuse', 'refusal'),
+    'determinism': ('determin',),
+    'artifacts': ('produce', 'output', 'artifact'),
+    'constraints': ('constraint', 'limit'),
+    'behavior': ('implement', 'ensure'),
+})
+_INTENT_DIMENSIONS = KeywordScanner({
+    'refusal': ('refuse',),
+    'determinism': ('determin',),
+    'artifacts': ('artifact',),
+    'constraints': ('constraint',),
+    'behavior': ('implement', 'ensure'),
+})
+
 
 class RequirementState(Enum):
     UNBOUND = 'UNBOUND'
@@ -47,22 +65,11 @@ def _infer_item_dimensions(item: Dict[str, Any]) -> List[str]:
     # Prefer explicit covers_dimensions
     if item.get('covers_dimensions'):
         return sorted(item.get('covers_dimensions'))
-    # Infer conservatively from intent_category or claim text
-    res: List[str] = []
-    ic = (item.get('intent_category') or '').lower()
-    claim = (item.get('claim') or item.get('text') or '').lower()
-    if 'refuse' in ic or 'refuse' in claim or 'refusal' in claim:
-        res.append('refusal')
-    if 'determin' in ic or 'determin' in claim:
-        res.append('determinism')
-    if 'artifact' in ic or 'produce' in claim or 'output' in claim or 'artifact' in claim:
-        res.append('artifacts')
-    if 'constraint' in ic or 'constraint' in claim or 'limit' in claim:
-        res.append('constraints')
-    # behavior is default only when explicitly indicated by intent_category or small heuristics
-    if 'implement' in ic or 'implement' in claim or 'ensure' in claim or 'ensure' in ic:
-        res.append('behavior')
-    return sorted(set(res))
+    # Infer conservatively from intent_category or claim text; behavior is
+    # default only when explicitly indicated by intent_category or small heuristics
+    res = _INTENT_DIMENSIONS.classes(item.get('intent_category') or '')
+    res |= _CLAIM_DIMENSIONS.classes(item.get('claim') or item.get('text') or '')
+    return sorted(res)
 
 
 def bind_dimensions_to_items(requirements: List[Dict[str, Any]], items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -157,10 +164,7 @@ def write_completeness_report(results: List[RequirementCompleteness],
             'missing_dimensions': r.missing_dimensions
         })
     data = {'requirements': reqs, 'summary': summary}
-    tmp = p + '.tmp'
-    with open(tmp, 'w', encoding='utf8') as f:
-        json.dump(data, f, indent=2, sort_keys=True)
-    os.replace(tmp, p)
+    write_json(p, data)
     return p
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Any
 import json
+import math
 import os
 import re
 
@@ -34,45 +36,116 @@ def _overlap_ratio(req_text: str, quote: str) -> float:
     return overlap / len(req_toks)
 
 
+# Minimum token overlap ratio for a quote to cover a requirement
+OVERLAP_THRESHOLD = 0.6
+
+
+def _min_overlap(n_tokens: int) -> int:
+    """Smallest shared-token count k with k / n_tokens >= OVERLAP_THRESHOLD."""
+    k = math.ceil(OVERLAP_THRESHOLD * n_tokens)
+    while k > 0 and (k - 1) / n_tokens >= OVERLAP_THRESHOLD:
+        k -= 1
+    while k / n_tokens < OVERLAP_THRESHOLD:
+        k += 1
+    return k
+
+
+class _ItemIndex:
+    """Per-run lookups over checklist items used to match requirements.
+
+    - pointer -> items (sorted evidence pointers, exact and subtree lookups)
+    - excerpt hash -> items
+    - token -> items over pre-tokenised evidence quotes
+    """
+
+    def __init__(self, checklist_items: List[Dict[str, Any]]):
+        self.ids: List[Any] = []
+        self.strong: List[bool] = []
+        self.quote_tokens: List[frozenset] = []
+        self.by_ptr: Dict[str, List[int]] = {}
+        self.by_hash: Dict[str, List[int]] = {}
+        self.by_token: Dict[str, List[int]] = {}
+        ptr_keys = []
+        for pos, it in enumerate(checklist_items):
+            ev = it.get('evidence') or {}
+            src = ev.get('source') or {}
+            iptr = src.get('ptr') or ''
+            ihash = ev.get('source_excerpt_hash') or ''
+            quote = ev.get('quote') or ''
+            self.ids.append(it.get('id'))
+            # strong if priority is P0/P1 and confidence not low
+            self.strong.append((it.get('priority') in ('P0', 'P1'))
+                               and ((it.get('confidence') or '').lower() != 'low'))
+            if iptr:
+                self.by_ptr.setdefault(iptr, []).append(pos)
+                ptr_keys.append((iptr, pos))
+            if ihash:
+                self.by_hash.setdefault(ihash, []).append(pos)
+            toks = frozenset(_tokenize(quote)) if quote else frozenset()
+            self.quote_tokens.append(toks)
+            for t in toks:
+                self.by_token.setdefault(t, []).append(pos)
+        ptr_keys.sort()
+        self._ptr_keys = ptr_keys
+
+    def pointer_matches(self, req_ptr) -> List[int]:
+        """Items whose pointer equals `req_ptr` or lies beneath it."""
+        out = list(self.by_ptr.get(req_ptr, ())) if req_ptr else []
+        prefix = (req_ptr or '').rstrip('/') + '/'
+        keys = self._ptr_keys
+        lo = bisect_left(keys, (prefix, -1))
+        hi = bisect_left(keys, (prefix[:-1] + '0', -1))  # '0' sorts right after '/'
+        out.extend(pos for _, pos in keys[lo:hi])
+        return out
+
+    def overlap_matches(self, req_text: str) -> List[int]:
+        """Items whose quote shares at least OVERLAP_THRESHOLD of the requirement tokens."""
+        req_toks = _tokenize(req_text)
+        if not req_toks:
+            return []
+        n = len(req_toks)
+        req_set = set(req_toks)
+        need = _min_overlap(n)
+        # Prefix filter: an item missing every one of the (|set| - need + 1)
+        # rarest tokens shares at most need - 1 tokens, so cannot qualify.
+        postings = sorted((self.by_token.get(t, ()) for t in req_set), key=len)
+        if len(postings) < need:
+            return []
+        candidates = set()
+        for plist in postings[:len(postings) - need + 1]:
+            candidates.update(plist)
+        quote_tokens = self.quote_tokens
+        return [pos for pos in candidates
+                if len(req_set & quote_tokens[pos]) / n >= OVERLAP_THRESHOLD]
+
+
 def compute_coverage(requirements: List[Dict[str, Any]],
                      checklist_items: List[Dict[str, Any]]) -> List[RequirementCoverage]:
+    """Match each requirement to checklist items by pointer, excerpt hash or quote overlap.
+
+    An item covers a requirement when its evidence pointer equals or lies
+    under the requirement pointer, its excerpt hash equals the requirement
+    hash, or its quote shares at least 60% of the requirement's tokens.
+    Items are indexed once per call, so each requirement only scores
+    candidates that can reach the threshold.
+    """
     res: List[RequirementCoverage] = []
     # Build quick indices
+    index = _ItemIndex(checklist_items)
 
     for r in sorted(requirements, key=lambda x: x.get('id')):
         rid = r.get('id')
         req_text = r.get('text') or ''
         req_ptr = r.get('ptr') or r.get('source_ptr') or r.get('ptr')
-        matched_ids = []
-        strong = False
 
-        for it in checklist_items:
-            it_id = it.get('id')
-            ev = it.get('evidence') or {}
-            src = ev.get('source') or {}
-            iptr = src.get('ptr') or ''
-            ihash = ev.get('source_excerpt_hash') or ''
-            quote = ev.get('quote') or ''
-            # direct pointer relation
-            if iptr and (iptr == req_ptr or iptr.startswith((req_ptr or '').rstrip('/') + '/')):
-                matched_ids.append(it_id)
-                # consider as strong if priority is P0/P1 and confidence not low
-                if (it.get('priority') in ('P0', 'P1')) and ((it.get('confidence') or '').lower() != 'low'):
-                    strong = True
-                continue
-            # excerpt hash match
-            if ihash and ihash == r.get('hash'):
-                matched_ids.append(it_id)
-                if (it.get('priority') in ('P0', 'P1')) and ((it.get('confidence') or '').lower() != 'low'):
-                    strong = True
-                continue
-            # overlap check
-            if quote:
-                ratio = _overlap_ratio(req_text, quote)
-                if ratio >= 0.6:
-                    matched_ids.append(it_id)
-                    if (it.get('priority') in ('P0', 'P1')) and ((it.get('confidence') or '').lower() != 'low'):
-                        strong = True
+        matched = set(index.pointer_matches(req_ptr))
+        rhash = r.get('hash')
+        if rhash:
+            matched.update(index.by_hash.get(rhash, ()))
+        matched.update(index.overlap_matches(req_text))
+
+        matched_ids = [index.ids[pos] for pos in matched]
+        strong = any(index.strong[pos] for pos in matched)
 
         if not matched_ids:
             status = CoverageStatus.MISSING
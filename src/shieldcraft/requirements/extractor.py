@@ -14,11 +14,15 @@ import hashlib
 import re
 from typing import List, Dict
 
+from shieldcraft.util.keywords import KeywordScanner
+
 
 MUST_KEYWORDS = ["must", "shall", "requires", "mandatory", "enforced", "every run must"]
 SHOULD_KEYWORDS = ["should"]
 MAY_KEYWORDS = ["may"]
 
+_NORMATIVE = KeywordScanner({'MUST': MUST_KEYWORDS, 'SHOULD': SHOULD_KEYWORDS, 'MAY': MAY_KEYWORDS})
+
 
 def _normalize_text(s: str) -> str:
     s2 = s.lower()
@@ -56,16 +60,10 @@ def extract_requirements(spec_text: str) -> List[Dict]:
             current_section = m.group(1)
             continue
 
-        low = line.lower()
         # check for normative keywords (MUST > SHOULD > MAY)
-        kind = None
-        if any(low.find(k) != -1 for k in MUST_KEYWORDS):
-            kind = 'MUST'
-        elif any(low.find(k) != -1 for k in SHOULD_KEYWORDS):
-            kind = 'SHOULD'
-        elif any(low.find(k) != -1 for k in MAY_KEYWORDS):
-            kind = 'MAY'
-        else:
+        found = _NORMATIVE.classes(line)
+        kind = next((k for k in ('MUST', 'SHOULD', 'MAY') if k in found), None)
+        if kind is None:
             continue
 
         # skip short title-like lines
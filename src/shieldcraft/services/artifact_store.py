@@ -1,18 +1,68 @@
 """
 Local Artifact Store for ShieldCraft Engine.
-Simple file-based implementation (alternative to S3).
+Content-addressed blobs with SQLite-indexed manifests (alternative to S3).
 """
 
 import hashlib
+import io
 import json
 import os
+import shutil
+import time
+import uuid
 from typing import Dict, Any, Optional, BinaryIO
 from pathlib import Path
 
+from shieldcraft.services.sqlite_db import SQLiteDatabase
+
+CHUNK_SIZE = 1 << 20
+
+# PRAGMA user_version. 0: manifest rows without a sha256 column, content
+# in <run_id>/<artifact_id>.bin; 1: content-addressed blobs
+SCHEMA_VERSION = 1
+
+_ARTIFACTS_TABLE = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id TEXT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (run_id, artifact_id)
+)"""
+
+_SCHEMA = _ARTIFACTS_TABLE + """;
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    refcount INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_unreferenced ON blobs (refcount) WHERE refcount <= 0;
+"""
+
+_UPSERT = ("INSERT INTO artifacts (run_id, artifact_id, sha256, metadata) VALUES (?, ?, ?, ?) "
+           "ON CONFLICT(run_id, artifact_id) DO UPDATE SET sha256 = excluded.sha256, metadata = excluded.metadata")
+
+_ADD_REF = ("INSERT INTO blobs (sha256, size_bytes, refcount) VALUES (?, ?, 1) "
+            "ON CONFLICT(sha256) DO UPDATE SET refcount = refcount + 1")
+
+_DROP_REF = "UPDATE blobs SET refcount = refcount - 1 WHERE sha256 = ?"
+
+_LEGACY_KEYS = ("run_id", "artifact_id", "size_bytes", "sha256_hash", "stored_at", "storage_type")
+
 
 class LocalArtifactStore:
     """
-    Local file-based artifact store for generated artifacts.
+    Local artifact store for generated artifacts.
+
+    Content is stored once per distinct sha256 under
+    `blobs/<aa>/<bb>/<sha256>`; each run's manifest rows in
+    `metadata/artifacts.db` map (run_id, artifact_id) to a blob. Blobs are
+    reference counted: identical outputs across runs share one file, and
+    `collect_garbage` removes blobs no manifest points at.
+
+    Opening a database written before blobs existed moves its manifest
+    rows to a `legacy_artifacts` table and imports them (see
+    `migrate_legacy_files`).
     """
 
     def __init__(self, storage_dir: str = ".shieldcraft_artifacts"):
@@ -20,6 +70,32 @@ class LocalArtifactStore:
         self.storage_dir.mkdir(exist_ok=True)
         self.metadata_dir = self.storage_dir / "metadata"
         self.metadata_dir.mkdir(exist_ok=True)
+        self.blob_dir = self.storage_dir / "blobs"
+        self.tmp_dir = self.blob_dir / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.db = SQLiteDatabase(self.metadata_dir / "artifacts.db", _SCHEMA)
+        if self._upgrade_schema():
+            self._migrate_legacy_rows(remove=False)
+
+    def _upgrade_schema(self) -> bool:
+        """Bring the database to `SCHEMA_VERSION`; True if legacy rows were set aside."""
+        if self.db.connection().execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return False
+        with self.db.transaction() as conn:
+            # Re-check under the write lock; another store may have upgraded
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return False
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(artifacts)")}
+            legacy = "sha256" not in columns
+            if legacy:
+                conn.execute("ALTER TABLE artifacts RENAME TO legacy_artifacts")
+                conn.execute(_ARTIFACTS_TABLE)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return legacy
+
+    def blob_path(self, sha256_hash: str) -> Path:
+        """Path of the blob holding content with the given sha256."""
+        return self.blob_dir / sha256_hash[:2] / sha256_hash[2:4] / sha256_hash
 
     def store_artifact(self, run_id: str, artifact_id: str, content: bytes, metadata: Dict[str, Any]) -> bool:
         """
@@ -34,59 +110,114 @@ class LocalArtifactStore:
         Returns:
             Success status
         """
-        try:
-            # Create run directory
-            run_dir = self.storage_dir / run_id
-            run_dir.mkdir(exist_ok=True)
-
-            # Store content
-            content_file = run_dir / f"{artifact_id}.bin"
-            with open(content_file, 'wb') as f:
-                f.write(content)
-
-            # Calculate hash
-            sha256_hash = hashlib.sha256(content).hexdigest()
-
-            # Store metadata
-            metadata_file = self.metadata_dir / f"{run_id}_{artifact_id}.json"
-            full_metadata = {
-                **metadata,
-                "run_id": run_id,
-                "artifact_id": artifact_id,
-                "size_bytes": len(content),
-                "sha256_hash": sha256_hash,
-                "stored_at": "2025-12-23T00:00:00Z",
-                "storage_type": "local_file"
-            }
-
-            with open(metadata_file, 'w') as f:
-                json.dump(full_metadata, f, indent=2, default=str)
+        return self.store_artifact_stream(run_id, artifact_id, io.BytesIO(content), metadata)
+
+    def store_artifact_stream(self, run_id: str, artifact_id: str, stream: BinaryIO,
+                              metadata: Dict[str, Any], chunk_size: int = CHUNK_SIZE) -> bool:
+        """
+        Store artifact content read from a binary stream.
 
+        The stream is hashed chunk by chunk while it is spooled to a temp
+        file; if a blob with the same hash already exists the temp file is
+        discarded and the manifest row points at the existing blob.
+
+        Args:
+            run_id: Run identifier
+            artifact_id: Artifact identifier
+            stream: Readable binary stream
+            metadata: Artifact metadata
+            chunk_size: Read size in bytes
+
+        Returns:
+            Success status
+        """
+        tmp_file = self.tmp_dir / uuid.uuid4().hex
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            with open(tmp_file, 'wb') as f:
+                for chunk in iter(lambda: stream.read(chunk_size), b""):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            sha256_hash = digest.hexdigest()
+            self._commit_blob(run_id, artifact_id, sha256_hash, size, metadata, tmp_file)
             return True
         except Exception:
             return False
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
 
-    def retrieve_artifact(self, run_id: str, artifact_id: str) -> Optional[bytes]:
+    def _commit_blob(self, run_id: str, artifact_id: str, sha256_hash: str, size: int,
+                     metadata: Dict[str, Any], source: Path, link: bool = False) -> None:
+        full_metadata = {
+            **metadata,
+            "run_id": run_id,
+            "artifact_id": artifact_id,
+            "size_bytes": size,
+            "sha256_hash": sha256_hash,
+            "stored_at": "2025-12-23T00:00:00Z",
+            "storage_type": "content_addressed"
+        }
+        blob = self.blob_path(sha256_hash)
+        # The write lock serialises this against collect_garbage, so a blob
+        # seen here cannot be unlinked before its new reference is counted
+        with self.db.transaction() as conn:
+            previous = conn.execute("SELECT sha256 FROM artifacts WHERE run_id = ? AND artifact_id = ?",
+                                    (run_id, artifact_id)).fetchone()
+            if previous is not None:
+                conn.execute(_DROP_REF, (previous["sha256"],))
+            conn.execute(_ADD_REF, (sha256_hash, size))
+            conn.execute(_UPSERT, (run_id, artifact_id, sha256_hash, json.dumps(full_metadata, default=str)))
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                if link:
+                    try:
+                        os.link(source, blob)
+                    except OSError:
+                        shutil.copyfile(source, blob)
+                else:
+                    os.replace(source, blob)
+
+    def open_artifact(self, run_id: str, artifact_id: str) -> Optional[BinaryIO]:
         """
-        Retrieve artifact content.
+        Open artifact content for streaming reads.
 
         Args:
             run_id: Run identifier
             artifact_id: Artifact identifier
 
         Returns:
-            Binary content or None if not found
+            Binary file object (caller closes) or None if not found
         """
         try:
-            run_dir = self.storage_dir / run_id
-            content_file = run_dir / f"{artifact_id}.bin"
-            if content_file.exists():
-                with open(content_file, 'rb') as f:
-                    return f.read()
+            row = self.db.connection().execute(
+                "SELECT sha256 FROM artifacts WHERE run_id = ? AND artifact_id = ?",
+                (run_id, artifact_id)).fetchone()
+            if row is not None:
+                return open(self.blob_path(row["sha256"]), 'rb')
         except Exception:
             pass
         return None
 
+    def retrieve_artifact(self, run_id: str, artifact_id: str) -> Optional[bytes]:
+        """
+        Retrieve artifact content.
+
+        Args:
+            run_id: Run identifier
+            artifact_id: Artifact identifier
+
+        Returns:
+            Binary content or None if not found
+        """
+        f = self.open_artifact(run_id, artifact_id)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
     def get_artifact_metadata(self, run_id: str, artifact_id: str) -> Optional[Dict[str, Any]]:
         """
         Get artifact metadata.
@@ -99,10 +230,11 @@ class LocalArtifactStore:
             Metadata dict or None if not found
         """
         try:
-            metadata_file = self.metadata_dir / f"{run_id}_{artifact_id}.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    return json.load(f)
+            row = self.db.connection().execute(
+                "SELECT metadata FROM artifacts WHERE run_id = ? AND artifact_id = ?",
+                (run_id, artifact_id)).fetchone()
+            if row is not None:
+                return json.loads(row["metadata"])
         except Exception:
             pass
         return None
@@ -118,25 +250,28 @@ class LocalArtifactStore:
             List of artifact summaries
         """
         artifacts = []
-        metadata_pattern = f"{run_id}_*.json"
-        for metadata_file in self.metadata_dir.glob(metadata_pattern):
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    artifacts.append({
-                        "artifact_id": metadata["artifact_id"],
-                        "type": metadata.get("type", "unknown"),
-                        "size_bytes": metadata["size_bytes"],
-                        "sha256_hash": metadata["sha256_hash"],
-                        "stored_at": metadata["stored_at"]
-                    })
-            except Exception:
-                continue
+        try:
+            rows = self.db.connection().execute(
+                "SELECT metadata FROM artifacts WHERE run_id = ? ORDER BY artifact_id", (run_id,)).fetchall()
+        except Exception:
+            return artifacts
+        for row in rows:
+            metadata = json.loads(row["metadata"])
+            artifacts.append({
+                "artifact_id": metadata["artifact_id"],
+                "type": metadata.get("type", "unknown"),
+                "size_bytes": metadata["size_bytes"],
+                "sha256_hash": metadata["sha256_hash"],
+                "stored_at": metadata["stored_at"]
+            })
         return artifacts
 
     def delete_artifact(self, run_id: str, artifact_id: str) -> bool:
         """
-        Delete artifact and its metadata.
+        Delete an artifact from its run's manifest.
+
+        The blob itself is released by `collect_garbage` once no other
+        manifest references it.
 
         Args:
             run_id: Run identifier
@@ -146,17 +281,126 @@ class LocalArtifactStore:
             Success status
         """
         try:
-            # Delete content
-            run_dir = self.storage_dir / run_id
-            content_file = run_dir / f"{artifact_id}.bin"
-            if content_file.exists():
-                content_file.unlink()
-
-            # Delete metadata
-            metadata_file = self.metadata_dir / f"{run_id}_{artifact_id}.json"
-            if metadata_file.exists():
-                metadata_file.unlink()
-
+            with self.db.transaction() as conn:
+                row = conn.execute("SELECT sha256 FROM artifacts WHERE run_id = ? AND artifact_id = ?",
+                                   (run_id, artifact_id)).fetchone()
+                if row is not None:
+                    conn.execute(_DROP_REF, (row["sha256"],))
+                    conn.execute("DELETE FROM artifacts WHERE run_id = ? AND artifact_id = ?", (run_id, artifact_id))
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+    def collect_garbage(self, tmp_max_age: float = 3600.0) -> int:
+        """
+        Remove blobs that no manifest references, plus abandoned temp files.
+
+        Args:
+            tmp_max_age: Seconds after which an unfinished temp file counts as abandoned
+
+        Returns:
+            Number of blobs removed
+        """
+        with self.db.transaction() as conn:
+            rows = conn.execute("SELECT sha256 FROM blobs WHERE refcount <= 0").fetchall()
+            conn.execute("DELETE FROM blobs WHERE refcount <= 0")
+            for row in rows:
+                blob = self.blob_path(row["sha256"])
+                if blob.exists():
+                    blob.unlink()
+        cutoff = time.time() - tmp_max_age
+        for tmp_file in self.tmp_dir.iterdir():
+            try:
+                if tmp_file.stat().st_mtime < cutoff:
+                    tmp_file.unlink()
+            except OSError:
+                pass
+        return len(rows)
+
+    def migrate_legacy_files(self, remove: bool = False) -> int:
+        """
+        Import artifacts written before the blob layout: metadata in
+        `metadata/<run_id>_<artifact_id>.json` files or in the pre-blob
+        manifest rows (kept in `legacy_artifacts`), content in
+        `<run_id>/<artifact_id>.bin`.
+
+        Content is hard-linked into the blob directory where the filesystem
+        allows it, so migration does not copy bytes. Entries whose content
+        file is missing are left in place.
+
+        Args:
+            remove: Delete each legacy content file, metadata file and
+                manifest row once imported
+
+        Returns:
+            Number of artifacts imported
+        """
+        imported = 0
+        for metadata_file in sorted(self.metadata_dir.glob("*.json")):
+            try:
+                with open(metadata_file, 'r') as f:
+                    metadata = json.load(f)
+            except Exception:
+                continue
+            if self._import_legacy(metadata, remove):
+                imported += 1
+                if remove:
+                    metadata_file.unlink()
+        return imported + self._migrate_legacy_rows(remove)
+
+    def _migrate_legacy_rows(self, remove: bool) -> int:
+        conn = self.db.connection()
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'legacy_artifacts'").fetchone() is None:
+            return 0
+        imported = 0
+        rows = conn.execute("SELECT run_id, artifact_id, metadata FROM legacy_artifacts "
+                            "ORDER BY run_id, artifact_id").fetchall()
+        for row in rows:
+            try:
+                metadata = json.loads(row["metadata"])
+            except ValueError:
+                continue
+            if self._import_legacy({**metadata, "run_id": row["run_id"], "artifact_id": row["artifact_id"]}, remove):
+                imported += 1
+                if remove:
+                    with self.db.transaction() as tx:
+                        tx.execute("DELETE FROM legacy_artifacts WHERE run_id = ? AND artifact_id = ?",
+                                   (row["run_id"], row["artifact_id"]))
+        if remove:
+            with self.db.transaction() as tx:
+                if tx.execute("SELECT 1 FROM legacy_artifacts LIMIT 1").fetchone() is None:
+                    tx.execute("DROP TABLE legacy_artifacts")
+        return imported
+
+    def _import_legacy(self, metadata: Dict[str, Any], remove: bool) -> bool:
+        """
+        Import one legacy artifact from its `.bin` file, unless the manifest
+        already has it (an earlier import, or a newer write).
+
+        Returns:
+            False if the content file is missing
+        """
+        try:
+            run_id, artifact_id = metadata["run_id"], metadata["artifact_id"]
+        except (KeyError, TypeError):
+            return False
+        content_file = self.storage_dir / run_id / f"{artifact_id}.bin"
+        if not content_file.exists():
+            return False
+        current = self.db.connection().execute(
+            "SELECT 1 FROM artifacts WHERE run_id = ? AND artifact_id = ?", (run_id, artifact_id)).fetchone()
+        if current is None:
+            digest = hashlib.sha256()
+            with open(content_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            extra = {k: v for k, v in metadata.items() if k not in _LEGACY_KEYS}
+            self._commit_blob(run_id, artifact_id, digest.hexdigest(), content_file.stat().st_size,
+                              extra, content_file, link=True)
+        if remove:
+            content_file.unlink()
+            try:
+                content_file.parent.rmdir()
+            except OSError:
+                pass
+        return True
@@ -1,10 +1,24 @@
+import os
+
+from .compact import CompactAST
+from .index import ASTIndex
 from .node import Node
 
 
 class ASTBuilder:
-    def __init__(self):
+    def __init__(self, compact=None):
         self.line_map = {}  # Store source line numbers during build
         self.pointer_map = {}  # Deterministic pointer→node map
+        # Compact (array-backed) mode: opt-in via argument or SHIELDCRAFT_COMPACT_AST=1
+        if compact is None:
+            compact = self.compact_default()
+        self.compact = compact
+        self._compact_root = None
+
+    @staticmethod
+    def compact_default():
+        """Whether builders default to the compact AST (SHIELDCRAFT_COMPACT_AST=1)."""
+        return os.getenv("SHIELDCRAFT_COMPACT_AST", "0") == "1"
 
     @classmethod
     def from_spec(cls, spec_raw):
@@ -23,51 +37,73 @@ class ASTBuilder:
 
     def build(self, spec):
         """Build normalized AST with sorted keys, pointers, and parent refs."""
+        if self.compact:
+            self._compact_root = CompactAST(spec).root()
+            return self._compact_root
+
         root = Node("root", ptr="/")
         self._build_node(spec, root, "/")
 
+        # Freeze an O(1) pointer index onto the root for lookups
+        root.index = ASTIndex.from_root(root)
+
         # Attach lineage_id to every node and build pointer map
         self._attach_lineage(root)
 
         return root
 
     def _attach_lineage(self, node):
-        """Attach lineage_id to node and build pointer map."""
-        # Compute lineage_id for this node
-        node.compute_lineage_id()
-
-        # Add to pointer map
-        if node.ptr:
-            self.pointer_map[node.ptr] = node
+        """Attach lineage_id to node and its subtree and build pointer map."""
+        for n in node.walk():
+            # Compute lineage_id for this node
+            n.compute_lineage_id()
 
-        # Recursively process children
-        for child in node.children:
-            self._attach_lineage(child)
+            # Add to pointer map
+            if n.ptr:
+                self.pointer_map[n.ptr] = n
 
     def get_pointer_map(self):
         """Return deterministic pointer→node map."""
+        if self._compact_root is not None:
+            # Last node wins on duplicate pointers, as in `_attach_lineage`
+            return dict(sorted({n.ptr: n for n in self._compact_root.walk() if n.ptr}.items()))
         return dict(sorted(self.pointer_map.items()))
 
+    def build_entry(self, container, key, value, parent_ptr):
+        """Build the detached subtree for `container[key]` under `parent_ptr`, lineage attached.
+
+        `container` is the dict or list holding the entry; the result is the
+        same dict_entry/array_item subtree `build` would place there.
+        """
+        child = self.entry_node(container, key, value, parent_ptr)
+        self._build_node(value, child, child.ptr)
+        self._attach_lineage(child)
+        return child
+
+    def entry_node(self, container, key, value, ptr):
+        """Create the (childless) dict_entry/array_item node for `container[key]` under `ptr`."""
+        if isinstance(container, dict):
+            child_ptr = f"{ptr}/{key}" if ptr != "/" else f"/{key}"
+            child = Node("dict_entry", {"key": key, "value": value}, ptr=child_ptr)
+        else:
+            # Stable array with deterministic ordering
+            child = Node("array_item", {"index": key, "value": value}, ptr=f"{ptr}/{key}")
+        child.parent_ptr = ptr  # Non-cyclic parent reference
+        return child
+
     def _build_node(self, obj, parent, ptr):
         """Recursively build AST with normalization."""
         if isinstance(obj, dict):
             # Convert to sorted-key dictionary
             for key in sorted(obj.keys()):
                 value = obj[key]
-                child_ptr = f"{ptr}/{key}" if ptr != "/" else f"/{key}"
-                child = Node("dict_entry", {"key": key, "value": value}, ptr=child_ptr)
-                child.parent_ptr = ptr  # Non-cyclic parent reference
-                parent.add(child)
-                self._build_node(value, child, child_ptr)
+                child = parent.add(self.entry_node(obj, key, value, ptr))
+                self._build_node(value, child, child.ptr)
 
         elif isinstance(obj, list):
-            # Stable array with deterministic ordering
             for idx, item in enumerate(obj):
-                child_ptr = f"{ptr}/{idx}"
-                child = Node("array_item", {"index": idx, "value": item}, ptr=child_ptr)
-                child.parent_ptr = ptr
-                parent.add(child)
-                self._build_node(item, child, child_ptr)
+                child = parent.add(self.entry_node(obj, idx, item, ptr))
+                self._build_node(item, child, child.ptr)
 
         else:
             # Leaf node (scalar)
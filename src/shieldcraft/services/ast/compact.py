@@ -0,0 +1,298 @@
+"""
+Compact, array-backed AST representation.
+
+The default `Node` tree stores `{"key": key, "value": value}` on every
+dict_entry/array_item node and derives `clause_type` from `str(self.value)`,
+which costs O(subtree) per node. The compact representation stores per-node
+data in parallel arrays (type code, pointer, local key, parent, contiguous
+child range) and keeps only a reference to the raw spec sub-object; node
+values are materialized on access. Clause types are derived bottom-up in a
+single pass, so construction is linear in the number of nodes.
+
+Pointers, node order, `lineage_id` and `spec_id` are identical to the
+`Node` tree produced by `ASTBuilder.build`. `CompactNode` objects are
+lightweight views created on demand and expose the same query API as `Node`.
+"""
+import hashlib
+import json
+from array import array
+from enum import IntEnum
+
+from shieldcraft.util.json_canonicalizer import canonicalize
+
+
+class NodeType(IntEnum):
+    ROOT = 0
+    DICT_ENTRY = 1
+    ARRAY_ITEM = 2
+
+
+_TYPE_NAMES = {
+    NodeType.ROOT: "root",
+    NodeType.DICT_ENTRY: "dict_entry",
+    NodeType.ARRAY_ITEM: "array_item",
+}
+
+
+def _contains_forbid(obj):
+    """Return True if "forbid" occurs in `str(obj)`, without building the string.
+
+    "forbid" is purely alphabetic, so it cannot span the punctuation that
+    `repr` places between keys, values and elements; checking each scalar's
+    `repr` is therefore equivalent to checking the repr of the whole value.
+    """
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            for k, v in cur.items():
+                if "forbid" in repr(k):
+                    return True
+                stack.append(v)
+        elif isinstance(cur, list):
+            stack.extend(cur)
+        elif "forbid" in repr(cur):
+            return True
+    return False
+
+
+class CompactAST:
+    """
+    Array-backed AST container built breadth-first from a raw spec.
+
+    Also serves as the root's pointer index (same interface as `ASTIndex`).
+    """
+
+    __slots__ = ("raw", "_types", "_ptrs", "_keys", "_refs", "_parents",
+                 "_child_start", "_child_end", "_forbid", "_by_ptr", "_order")
+
+    def __init__(self, spec):
+        self.raw = spec
+        self._types = array("B", [NodeType.ROOT])
+        self._ptrs = ["/"]
+        self._keys = [None]
+        self._refs = [spec]
+        self._parents = array("i", [-1])
+        self._child_start = array("i")
+        self._child_end = array("i")
+        self._build()
+        self._forbid = self._compute_forbid()
+        self._order = None
+        self._by_ptr = None
+
+    def _build(self):
+        types, ptrs, keys, refs, parents = self._types, self._ptrs, self._keys, self._refs, self._parents
+        i = 0
+        while i < len(ptrs):
+            obj = refs[i]
+            ptr = ptrs[i]
+            start = len(ptrs)
+            if isinstance(obj, dict):
+                for key in sorted(obj.keys()):
+                    types.append(NodeType.DICT_ENTRY)
+                    ptrs.append(f"{ptr}/{key}" if ptr != "/" else f"/{key}")
+                    keys.append(key)
+                    refs.append(obj[key])
+                    parents.append(i)
+            elif isinstance(obj, list):
+                for idx, item in enumerate(obj):
+                    types.append(NodeType.ARRAY_ITEM)
+                    ptrs.append(f"{ptr}/{idx}")
+                    keys.append(idx)
+                    refs.append(item)
+                    parents.append(i)
+            self._child_start.append(start)
+            self._child_end.append(len(ptrs))
+            i += 1
+
+    def _compute_forbid(self):
+        """Per-node flag equal to `"forbid" in str(node.value)` on the Node tree."""
+        n = len(self._ptrs)
+        flags = bytearray(n)
+        for i in range(n - 1, 0, -1):
+            start, end = self._child_start[i], self._child_end[i]
+            if start == end:
+                sub = _contains_forbid(self._refs[i])
+            else:
+                sub = any(flags[c] for c in range(start, end))
+            if sub or (self._types[i] == NodeType.DICT_ENTRY and "forbid" in repr(self._keys[i])):
+                flags[i] = 1
+        return flags
+
+    # ASTIndex-compatible interface
+
+    def _preorder(self):
+        if self._order is None:
+            order = array("i")
+            stack = [0]
+            while stack:
+                i = stack.pop()
+                order.append(i)
+                stack.extend(range(self._child_end[i] - 1, self._child_start[i] - 1, -1))
+            self._order = order
+        return self._order
+
+    def _pointer_positions(self):
+        if self._by_ptr is None:
+            by_ptr = {}
+            for i in self._preorder():
+                ptr = self._ptrs[i]
+                if ptr and ptr not in by_ptr:
+                    by_ptr[ptr] = i
+            self._by_ptr = by_ptr
+        return self._by_ptr
+
+    @property
+    def nodes(self):
+        return tuple(CompactNode(self, i) for i in self._preorder())
+
+    @property
+    def by_pointer(self):
+        return {p: CompactNode(self, i) for p, i in self._pointer_positions().items()}
+
+    def get(self, pointer, default=None):
+        i = self._pointer_positions().get(pointer)
+        return default if i is None else CompactNode(self, i)
+
+    def pointers(self):
+        return frozenset(self._pointer_positions())
+
+    def __contains__(self, pointer):
+        return pointer in self._pointer_positions()
+
+    def __len__(self):
+        return len(self._ptrs)
+
+    def root(self):
+        return CompactNode(self, 0)
+
+
+class CompactNode:
+    """Read-only view of one node in a `CompactAST`."""
+
+    __slots__ = ("_ast", "_i")
+
+    def __init__(self, ast, i):
+        self._ast = ast
+        self._i = i
+
+    def __eq__(self, other):
+        return isinstance(other, CompactNode) and other._ast is self._ast and other._i == self._i
+
+    def __hash__(self):
+        return hash((id(self._ast), self._i))
+
+    @property
+    def index(self):
+        return self._ast if self._i == 0 else None
+
+    @property
+    def type(self):
+        return _TYPE_NAMES[self._ast._types[self._i]]
+
+    @property
+    def ptr(self):
+        return self._ast._ptrs[self._i]
+
+    @property
+    def parent_ptr(self):
+        p = self._ast._parents[self._i]
+        return None if p < 0 else self._ast._ptrs[p]
+
+    @property
+    def value(self):
+        a, i = self._ast, self._i
+        t = a._types[i]
+        if t == NodeType.DICT_ENTRY:
+            return {"key": a._keys[i], "value": a._refs[i]}
+        if t == NodeType.ARRAY_ITEM:
+            return {"index": a._keys[i], "value": a._refs[i]}
+        return None
+
+    @property
+    def children(self):
+        a = self._ast
+        return [CompactNode(a, c) for c in range(a._child_start[self._i], a._child_end[self._i])]
+
+    @property
+    def lineage_id(self):
+        return hashlib.sha256(f"{self.to_pointer()}:{self.type}".encode()).hexdigest()
+
+    @property
+    def spec_id(self):
+        # dict_entry/array_item values are {"key"|"index", "value"} wrappers and
+        # the root value is None, so the pointer alone forms the spec id base.
+        return hashlib.sha256(f"spec:{self.to_pointer()}".encode()).hexdigest()
+
+    @property
+    def clause_type(self):
+        return "forbid" if self._ast._forbid[self._i] else "clause"
+
+    def to_pointer(self):
+        ptr = self.ptr
+        return ptr if ptr else "/"
+
+    def find(self, pointer):
+        if self._i == 0:
+            return self._ast.get(pointer)
+        for node in self.walk():
+            if node.ptr == pointer:
+                return node
+        return None
+
+    def find_all(self, key):
+        return [n for n in self.walk() if isinstance(n.value, dict) and key in n.value]
+
+    def walk(self):
+        a = self._ast
+        if self._i == 0:
+            for i in a._preorder():
+                yield CompactNode(a, i)
+            return
+        stack = [self._i]
+        while stack:
+            i = stack.pop()
+            yield CompactNode(a, i)
+            stack.extend(range(a._child_end[i] - 1, a._child_start[i] - 1, -1))
+
+    def _local_json(self):
+        # Local-only value: key/index plus the scalar payload of leaf entries.
+        a, i = self._ast, self._i
+        t = a._types[i]
+        if t == NodeType.ROOT:
+            return None
+        local = {"key" if t == NodeType.DICT_ENTRY else "index": a._keys[i]}
+        ref = a._refs[i]
+        if not isinstance(ref, (dict, list)):
+            local["value"] = ref
+        return local
+
+    def to_json(self, canonical=True):
+        """Convert to JSON; values are local (no embedded subtrees)."""
+        result = {
+            "type": self.type,
+            "ptr": self.ptr,
+            "value": self._local_json(),
+            "children": [child.to_json(canonical=False) for child in self.children]
+        }
+        if self.parent_ptr:
+            result["parent_ptr"] = self.parent_ptr
+        if canonical:
+            return canonicalize(json.dumps(result))
+        return result
+
+    def deep_hash(self):
+        """SHA256 of the canonical subtree built from local values."""
+        def subtree(node):
+            return {
+                "type": node.type,
+                "ptr": node.ptr,
+                "value": node._local_json(),
+                "children": [subtree(c) for c in sorted(node.children, key=lambda c: c.ptr or "")]
+            }
+        canonical_json = json.dumps(subtree(self), sort_keys=True)
+        return hashlib.sha256(canonical_json.encode()).hexdigest()
+
+    def __repr__(self):
+        a = self._ast
+        return f"CompactNode(type={self.type}, children={a._child_end[self._i] - a._child_start[self._i]})"
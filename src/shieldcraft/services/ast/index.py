@@ -0,0 +1,66 @@
+"""
+Immutable pointer index over a built AST.
+
+Built once by `ASTBuilder.build` and owned by the root node. Provides O(1)
+pointer lookup and a flat pre-order node sequence so pointer-keyed queries
+(lineage maps, spec id maps, pointer audits) do not re-walk the tree.
+
+Indexing freezes the tree: `Node.add` on any indexed node raises, since the
+root's index would otherwise go stale.
+"""
+from types import MappingProxyType
+
+
+class ASTIndex:
+    """
+    Pointer → node index for one AST.
+
+    When several nodes share a pointer the first in pre-order wins, matching
+    the result of a depth-first `Node.find`.
+    """
+
+    __slots__ = ("_by_ptr", "_nodes", "_pointers")
+
+    def __init__(self, nodes):
+        by_ptr = {}
+        for node in nodes:
+            if node.ptr and node.ptr not in by_ptr:
+                by_ptr[node.ptr] = node
+        self._nodes = tuple(nodes)
+        self._by_ptr = MappingProxyType(by_ptr)
+        self._pointers = frozenset(by_ptr)
+
+    @classmethod
+    def from_root(cls, root):
+        """Index every node reachable from `root` in pre-order and freeze them."""
+        nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node.frozen = True
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+        return cls(nodes)
+
+    @property
+    def nodes(self):
+        """All indexed nodes in pre-order (tree order)."""
+        return self._nodes
+
+    @property
+    def by_pointer(self):
+        """Read-only pointer → node mapping."""
+        return self._by_ptr
+
+    def get(self, pointer, default=None):
+        return self._by_ptr.get(pointer, default)
+
+    def pointers(self):
+        """Frozen set of all indexed pointers."""
+        return self._pointers
+
+    def __contains__(self, pointer):
+        return pointer in self._by_ptr
+
+    def __len__(self):
+        return len(self._nodes)
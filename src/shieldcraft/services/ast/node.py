@@ -13,8 +13,13 @@ class Node:
         self.lineage_id = None  # SHA256 of pointer + type
         self.spec_id = None  # Stable spec identifier for clause-level tracing
         self.clause_type = None  # Semantic clause type (requirement/forbid/etc)
+        self.index = None  # ASTIndex attached to the root by ASTBuilder.build
+        self.frozen = False  # Set once the node is covered by an ASTIndex
 
     def add(self, child):
+        # An index on any ancestor would go stale; indexed trees are rebuilt, not edited
+        if self.frozen:
+            raise ValueError(f"cannot add children to indexed AST node {self.to_pointer()!r}")
         self.children.append(child)
         return child
 
@@ -63,6 +68,9 @@ class Node:
 
     def find(self, pointer):
         """Find node by JSON pointer."""
+        if self.index is not None:
+            return self.index.get(pointer)
+
         if self.ptr == pointer:
             return self
 
@@ -87,6 +95,9 @@ class Node:
 
     def walk(self):
         """Generator that yields all nodes in tree order."""
+        if self.index is not None:
+            yield from self.index.nodes
+            return
         yield self
         for child in self.children:
             yield from child.walk()
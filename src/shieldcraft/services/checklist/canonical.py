@@ -1,17 +1,28 @@
-def canonical_sort(items):
+from .value_digest import ValueDigester
+
+
+def canonical_sort(items, digester=None):
     """
     Canonically sort by:
     1) ptr (lexicographically)
     2) length of ptr
     3) text lexicographically
     4) stable value string
+
+    The value string is only built for ties on 1-3 whose value digests
+    differ; equal digests mean equal strings.
     """
-    return sorted(
-        items,
-        key=lambda it: (
-            it["ptr"],
-            len(it["ptr"]),
-            it["text"],
-            str(it.get("value"))
-        )
-    )
+    digester = digester or ValueDigester()
+    ordered = sorted(items, key=lambda it: (it["ptr"], len(it["ptr"]), it["text"]))
+    start = 0
+    while start < len(ordered):
+        head = ordered[start]
+        end = start + 1
+        while end < len(ordered) and ordered[end]["ptr"] == head["ptr"] and ordered[end]["text"] == head["text"]:
+            end += 1
+        if end - start > 1:
+            run = ordered[start:end]
+            if len({digester.digest(it.get("value")) for it in run}) > 1:
+                ordered[start:end] = sorted(run, key=lambda it: str(it.get("value")))
+        start = end
+    return ordered
@@ -1,4 +1,25 @@
-def collapse_items(items):
+from .value_digest import ValueDigester
+
+
+def _same_item(a, b, digester):
+    """`a == b`, comparing `value` by digest before falling back to deep equality."""
+    if a is b:
+        return True
+    if a.keys() != b.keys():
+        return False
+    for k in a:
+        if k != "value" and a[k] != b[k]:
+            return False
+    va, vb = a.get("value"), b.get("value")
+    if va is vb:
+        return True
+    if isinstance(va, (dict, list)) and digester.digest(va) == digester.digest(vb):
+        # Equal container digests mean identical structure
+        return True
+    return va == vb
+
+
+def collapse_items(items, digester=None):
     """
     Collapse items with same ptr and same 'prefix' semantics.
 
@@ -6,6 +27,7 @@ def collapse_items(items):
     - If two items share ptr AND one text starts with the other's text, keep shorter text.
     - Always deterministic.
     """
+    digester = digester or ValueDigester()
     by_ptr = {}
     for it in items:
         p = it["ptr"]
@@ -16,7 +38,7 @@ def collapse_items(items):
         group_sorted = sorted(group, key=lambda x: len(x["text"]))
         keep = []
         for g in group_sorted:
-            if not any(g["text"].startswith(k["text"]) for k in keep if k != g):
+            if not any(g["text"].startswith(k["text"]) for k in keep if not _same_item(k, g, digester)):
                 keep.append(g)
         out.extend(keep)
 
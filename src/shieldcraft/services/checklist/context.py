@@ -7,9 +7,12 @@ into checklist artifacts or logs.
 """
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
-from threading import Lock
-from typing import Any, Dict, List, Optional
+from threading import Lock, get_ident
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from shieldcraft.util.run_scope import current_scope
 
 
 @dataclass
@@ -29,6 +32,7 @@ class ChecklistContext:
 
     def __init__(self) -> None:
         self._events: List[ChecklistEvent] = []
+        self._captures: Dict[int, List[ChecklistEvent]] = {}
         self._lock = Lock()
 
     def record_event(self, gate_id: str, phase: str, outcome: str,
@@ -37,7 +41,28 @@ class ChecklistContext:
         does not modify control flow; callers should not rely on side-effects."""
         evt = ChecklistEvent(gate_id=gate_id, phase=phase, outcome=outcome, message=message, evidence=evidence)
         with self._lock:
-            self._events.append(evt)
+            self._captures.get(get_ident(), self._events).append(evt)
+
+    @contextmanager
+    def capture(self) -> Iterator[List[ChecklistEvent]]:
+        """Divert events recorded by the current thread into the yielded list.
+
+        Lets concurrent work be re-recorded later (`record_events`) in the
+        order a serial run would have produced.
+        """
+        captured: List[ChecklistEvent] = []
+        with self._lock:
+            self._captures[get_ident()] = captured
+        try:
+            yield captured
+        finally:
+            with self._lock:
+                self._captures.pop(get_ident(), None)
+
+    def record_events(self, events: Iterable[ChecklistEvent]) -> None:
+        """Append previously captured events."""
+        with self._lock:
+            self._events.extend(events)
 
     def get_events(self) -> List[Dict[str, Any]]:
         with self._lock:
@@ -51,16 +76,26 @@ class ChecklistContext:
         return {"events": self.get_events()}
 
 
-# Optional global context registration helpers (defensive; plumbing only)
+# Optional global context registration helpers (defensive; plumbing only).
+# Inside a run scope (see shieldcraft.util.run_scope) the context is the
+# scope's own, so concurrent engines record into separate contexts; outside
+# any scope the process-wide default below is used.
 _GLOBAL_CONTEXT: Optional[ChecklistContext] = None
 
 
 def set_global_context(ctx: Optional[ChecklistContext]) -> None:
     global _GLOBAL_CONTEXT
+    scope = current_scope()
+    if scope is not None:
+        scope.checklist_context = ctx
+        return
     _GLOBAL_CONTEXT = ctx
 
 
 def get_global_context() -> Optional[ChecklistContext]:
+    scope = current_scope()
+    if scope is not None:
+        return scope.checklist_context
     return _GLOBAL_CONTEXT
 
 
@@ -1,12 +1,16 @@
-def dedupe_items(items):
+from .value_digest import ValueDigester
+
+
+def dedupe_items(items, digester=None):
     """
-    Deduplicate by (ptr, text, canonical value json).
+    Deduplicate by (ptr, text, canonical value digest).
     Deterministic: keep first occurrence only.
     """
+    digester = digester or ValueDigester()
     seen = set()
     out = []
     for it in items:
-        key = (it["ptr"], it["text"], str(it.get("value")))
+        key = (it["ptr"], it["text"], digester.digest(it.get("value")))
         if key not in seen:
             seen.add(key)
             out.append(it)
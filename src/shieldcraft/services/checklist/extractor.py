@@ -1,6 +1,6 @@
 class SpecExtractor:
     """
-    Pure recursive extractor.
+    Pure pre-order extractor (iterative).
     Input: spec dict
     Output: list of {ptr, key, value, source_pointer, source_section, source_line}
     Also builds reverse index: pointer → list[item_ids]
@@ -11,18 +11,25 @@ class SpecExtractor:
 
     def extract(self, node, base_ptr="", line_map=None):
         """Extract items with full traceability."""
+        return list(self.iter_items(node, base_ptr, line_map))
+
+    def iter_items(self, node, base_ptr="", line_map=None):
+        """Yield extracted items lazily, in the same order as `extract`.
+
+        Traversal is iterative (no recursion-depth limit, no per-level list
+        copies). The reverse index is built once, when the stream is exhausted.
+        """
+        extracted = []
         # Backwards-compat: allow being called with an AST node and raw spec as
         # the second argument (extract(ast, raw_spec)). Detect AST-like objects
         # (have `walk`) and handle by traversing the AST.
         if hasattr(node, 'walk'):
             # If caller passed raw spec as second arg, treat it as a line_map lookup
             raw = base_ptr if isinstance(base_ptr, dict) else {}
-            items = []
             for nd in node.walk():
                 ptr = getattr(nd, 'ptr', None)
                 if not ptr:
                     continue
-                val = None
                 v = getattr(nd, 'value', None)
                 if isinstance(v, dict):
                     val = v.get('value')
@@ -30,92 +37,72 @@ class SpecExtractor:
                 else:
                     val = v
                     key = getattr(v, 'key', '') if hasattr(v, 'key') else ''
-
-                source_section = ptr.split("/")[1] if len(ptr.split("/")) > 1 else "root"
-                source_line = raw.get(
-                    ptr, self._compute_line(ptr)) if isinstance(
-                    raw, dict) else self._compute_line(ptr)
-
-                items.append({
-                    "ptr": ptr,
-                    "key": key,
-                    "value": val,
-                    "source_pointer": ptr,
-                    "source_section": source_section,
-                    "source_line": source_line
-                })
-
-            self._build_reverse_index(items)
-            return items
+                item = self._make_item(ptr, key, val, raw)
+                extracted.append(ptr)
+                yield item
+            self._index_pointers(extracted)
+            return
 
         if line_map is None:
             line_map = {}
 
-        items = []
+        if not isinstance(node, (dict, list)):
+            # Leaf node
+            if base_ptr:
+                extracted.append(base_ptr)
+                yield self._make_item(base_ptr, base_ptr.split("/")[-1], node, line_map)
+            self._index_pointers(extracted)
+            return
+
+        # Each frame iterates one container's children; a child's subtree is
+        # emitted right after the child itself (pre-order, as before).
+        stack = [self._children(node, base_ptr)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            ptr, key, v = child
+            extracted.append(ptr)
+            yield self._make_item(ptr, key, v, line_map)
+            if isinstance(v, (dict, list)):
+                stack.append(self._children(v, ptr))
+            else:
+                # Leaf node: scalars also yield an item keyed by pointer segment
+                extracted.append(ptr)
+                yield self._make_item(ptr, ptr.split("/")[-1], v, line_map)
+
+        self._index_pointers(extracted)
+
+    def _children(self, node, base_ptr):
+        """Yield (ptr, key, value) for the direct children of a container."""
         if isinstance(node, dict):
             for k, v in sorted(node.items()):  # Deterministic ordering
-                ptr = f"{base_ptr}/{k}" if base_ptr else f"/{k}"
-
-                # Determine source section (top-level key)
-                source_section = ptr.split("/")[1] if len(ptr.split("/")) > 1 else "root"
-
-                # Get line number from mapping (deterministic fallback)
-                source_line = line_map.get(ptr, self._compute_line(ptr))
-
-                items.append({
-                    "ptr": ptr,
-                    "key": k,
-                    "value": v,
-                    "source_pointer": ptr,
-                    "source_section": source_section,
-                    "source_line": source_line
-                })
-                items.extend(self.extract(v, ptr, line_map))
-        elif isinstance(node, list):
-            for idx, v in enumerate(node):
-                ptr = f"{base_ptr}/{idx}"
-                source_section = ptr.split("/")[1] if len(ptr.split("/")) > 1 else "root"
-                source_line = line_map.get(ptr, self._compute_line(ptr))
-
-                items.append({
-                    "ptr": ptr,
-                    "key": self._generate_semantic_key(v, f"item_{idx}"),
-                    "value": v,
-                    "source_pointer": ptr,
-                    "source_section": source_section,
-                    "source_line": source_line
-                })
-                items.extend(self.extract(v, ptr, line_map))
+                yield (f"{base_ptr}/{k}" if base_ptr else f"/{k}"), k, v
         else:
-            # Leaf node
-            if base_ptr:
-                source_section = base_ptr.split("/")[1] if len(base_ptr.split("/")) > 1 else "root"
-                source_line = line_map.get(base_ptr, self._compute_line(base_ptr))
-                items.append({
-                    "ptr": base_ptr,
-                    "key": base_ptr.split("/")[-1],
-                    "value": node,
-                    "source_pointer": base_ptr,
-                    "source_section": source_section,
-                    "source_line": source_line
-                })
-
-        # Build reverse index
-        self._build_reverse_index(items)
-
-        return items
-
-    def _build_reverse_index(self, items):
-        """Build pointer → item_ids reverse mapping."""
-        for item in items:
-            ptr = item.get("ptr")
-            item_id = item.get("id", ptr)  # Use ptr as fallback ID
-
-            if ptr not in self.reverse_index:
-                self.reverse_index[ptr] = []
-
-            if item_id not in self.reverse_index[ptr]:
-                self.reverse_index[ptr].append(item_id)
+            for idx, v in enumerate(node):
+                yield f"{base_ptr}/{idx}", self._generate_semantic_key(v, f"item_{idx}"), v
+
+    def _make_item(self, ptr, key, value, line_map):
+        # Source section is the top-level key; line numbers come from the
+        # mapping with a deterministic fallback
+        parts = ptr.split("/")
+        return {
+            "ptr": ptr,
+            "key": key,
+            "value": value,
+            "source_pointer": ptr,
+            "source_section": parts[1] if len(parts) > 1 else "root",
+            "source_line": line_map.get(ptr, self._compute_line(ptr)) if isinstance(
+                line_map, dict) else self._compute_line(ptr)
+        }
+
+    def _index_pointers(self, pointers):
+        """Record extracted pointers (items are keyed by pointer) in the reverse index."""
+        for ptr in pointers:
+            ids = self.reverse_index.setdefault(ptr, [])
+            if ptr not in ids:
+                ids.append(ptr)
 
     def get_reverse_index(self):
         """Return the pointer → item_ids mapping."""
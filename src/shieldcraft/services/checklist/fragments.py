@@ -0,0 +1,186 @@
+"""Per-section checklist fragments for incremental builds.
+
+A fragment is the AST subtree of one second-level spec entry (e.g.
+`/sections/<key>` or `/agents/0`) together with the raw checklist items
+extracted from it. Fragments are memoised by a fingerprint of the entry's
+pointer and canonical JSON content, so a build of a slightly mutated spec
+(as produced by the spec fuzzer) only rebuilds the entries that changed;
+top-level entries and every cross-item stage are still computed per build.
+
+Test-candidate expansion, which is a pure function of an item's pointer, id
+and the discovered test map, is memoised alongside.
+
+The cache is process-wide and bounded; it is only consulted by builds run
+with `incremental=True`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_FRAGMENTS = 4096
+MAX_EXPANSIONS = 65536
+
+
+class Fragment:
+    __slots__ = ("node", "items")
+
+    def __init__(self, node, items: List[Dict[str, Any]]):
+        self.node = node
+        self.items = items
+
+
+def fingerprint(ptr: str, value: Any) -> Optional[str]:
+    """Fingerprint of a spec subtree at `ptr`, or None if it is not JSON-shaped."""
+    try:
+        body = json.dumps(value, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(f"{ptr}\0{body}".encode()).hexdigest()
+
+
+class FragmentCache:
+    """Bounded LRU of fragments keyed by subtree fingerprint."""
+
+    def __init__(self, max_fragments: int = MAX_FRAGMENTS, max_expansions: int = MAX_EXPANSIONS):
+        self.max_fragments = max_fragments
+        self.max_expansions = max_expansions
+        self._fragments: "OrderedDict[str, Fragment]" = OrderedDict()
+        self._tests_key: Optional[Tuple] = None
+        self._expansions: Dict[Tuple[str, Any], List[str]] = {}
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, fragments=len(self._fragments))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self._expansions.clear()
+            self._tests_key = None
+            self._stats = {"hits": 0, "misses": 0}
+
+    def _get(self, key: str) -> Optional[Fragment]:
+        with self._lock:
+            frag = self._fragments.get(key)
+            if frag is not None:
+                self._fragments.move_to_end(key)
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            return frag
+
+    def _put(self, key: str, frag: Fragment) -> None:
+        with self._lock:
+            self._fragments[key] = frag
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+
+    def fragment(self, builder, container, key, value, parent_ptr: str,
+                 render: Callable[[Dict[str, Any]], str]) -> Fragment:
+        """Return the fragment for `container[key]`, building it on a miss."""
+        kind = "dict_entry" if isinstance(container, dict) else "array_item"
+        fp = fingerprint(f"{kind}:{parent_ptr}/{key}", value)
+        frag = self._get(fp) if fp is not None else None
+        if frag is None:
+            node = builder.build_entry(container, key, value, parent_ptr)
+            frag = Fragment(node, extract_items(node, render))
+            if fp is not None:
+                self._put(fp, frag)
+        return frag
+
+    def build(self, spec: Dict[str, Any], render: Callable[[Dict[str, Any]], str]):
+        """Build (ast, raw_items) for `spec`, reusing cached second-level fragments.
+
+        The AST and items are identical to `ASTBuilder().build(spec)` followed
+        by a pre-order extraction of its dict_entry nodes.
+        """
+        from shieldcraft.services.ast.builder import ASTBuilder
+        from shieldcraft.services.ast.index import ASTIndex
+        from shieldcraft.services.ast.node import Node
+
+        builder = ASTBuilder(compact=False)
+        root = Node("root", ptr="/")
+        items: List[Dict[str, Any]] = []
+        for key in sorted(spec.keys()):
+            value = spec[key]
+            top = root.add(builder.entry_node(spec, key, value, "/"))
+            top.compute_lineage_id()
+            items.append(_item(top, render))
+            if isinstance(value, dict):
+                keys = sorted(value.keys())
+            elif isinstance(value, list):
+                keys = range(len(value))
+            else:
+                continue
+            for k in keys:
+                frag = self.fragment(builder, value, k, value[k], top.ptr, render)
+                top.add(frag.node)
+                # Later pipeline stages annotate items in place
+                items.extend(dict(it) for it in frag.items)
+        root.compute_lineage_id()
+        root.index = ASTIndex.from_root(root)
+        return root, items
+
+    def expand_tests(self, items: List[Dict[str, Any]], test_map: Dict[str, str]) -> List[List[str]]:
+        """Candidate test refs per item, as `expand_tests_for_item` computes them.
+
+        An item whose expansion raises gets an empty list; the rest still expand.
+        """
+        from shieldcraft.verification.test_expander import expand_tests_for_item
+
+        tests_key = tuple(test_map.items())
+        with self._lock:
+            if tests_key != self._tests_key:
+                self._tests_key = tests_key
+                self._expansions = {}
+            memo = self._expansions
+        out = []
+        for it in items:
+            key = (it.get("ptr", ""), it.get("id"))
+            cands = memo.get(key)
+            if cands is None:
+                try:
+                    cands = expand_tests_for_item(it, test_map).get("candidates") or []
+                except Exception:
+                    # Like the full build: an item that fails to expand gets no candidates
+                    cands = []
+                else:
+                    if len(memo) < self.max_expansions:
+                        memo[key] = cands
+            out.append(list(cands))
+        return out
+
+
+def _item(node, render: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+    item = {
+        "ptr": node.ptr,
+        "key": node.value.get("key", ""),
+        "value": node.value.get("value"),
+    }
+    item["text"] = render(item)
+    return item
+
+
+def extract_items(node, render: Callable[[Dict[str, Any]], str]) -> List[Dict[str, Any]]:
+    """Raw checklist items for every dict_entry node in `node`'s subtree, in tree order."""
+    return [_item(n, render) for n in node.walk() if n.type == "dict_entry"]
+
+
+_CACHE: Optional[FragmentCache] = None
+_CACHE_LOCK = Lock()
+
+
+def get_fragment_cache() -> FragmentCache:
+    """Return the process-wide fragment cache."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = FragmentCache()
+        return _CACHE
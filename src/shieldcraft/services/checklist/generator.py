@@ -27,7 +27,7 @@ class ChecklistGenerator:
         return checklist
 
     def extract_items(self, spec):
-        raw_items = self.extractor.extract(spec)
+        raw_items = self.extractor.iter_items(spec)
 
         checklist = []
         for item in raw_items:
@@ -53,7 +53,15 @@ class ChecklistGenerator:
             run_fuzz: bool = False,
             run_test_gate: bool = False,
             engine=None,
-            interpreted_items=None):
+            interpreted_items=None,
+            incremental: bool = False):
+        """Build the checklist for `spec`.
+
+        With `incremental=True` the AST, raw item extraction and test-candidate
+        expansion are served per spec section from the process-wide fragment
+        cache (see `fragments`), so rebuilding a slightly changed spec only
+        recomputes the changed sections; the result is identical to a full build.
+        """
         # Trace entry
         logger.debug("ChecklistGenerator.build: ENTRY")
         import json
@@ -77,6 +85,8 @@ class ChecklistGenerator:
         from .dedupe import dedupe_items
         from .collapse import collapse_items
         from .canonical import canonical_sort
+        from .value_digest import ValueDigester
+        from .pointer_index import PointerIndex
         from .classify import classify_item
         from .severity import compute_severity
         from .idgen import synthesize_id
@@ -96,12 +106,18 @@ class ChecklistGenerator:
         from shieldcraft.services.ast.lineage import get_lineage_map
 
         # Build AST if not provided
+        from shieldcraft.services.ast.builder import ASTBuilder
+        raw_items = None
+        fragments = None
+        if incremental and not ast and isinstance(spec, dict) and not ASTBuilder.compact_default():
+            from .fragments import get_fragment_cache
+            fragments = get_fragment_cache()
+            ast, raw_items = fragments.build(spec, self.render_task)
         if not ast:
             try:
                 logger.debug("ChecklistGenerator.build: building AST")
             except Exception:
                 pass
-            from shieldcraft.services.ast.builder import ASTBuilder
             ast_builder = ASTBuilder()
             ast = ast_builder.build(spec)
             try:
@@ -281,7 +297,8 @@ class ChecklistGenerator:
         lineage_map = get_lineage_map(ast)
 
         # Extract items using AST traversal
-        raw_items = self._extract_from_ast(ast)
+        if raw_items is None:
+            raw_items = self._extract_from_ast(ast)
         try:
             logger.debug(f"ChecklistGenerator.build: raw_items extracted count={len(raw_items)}")
         except Exception:
@@ -436,19 +453,20 @@ class ChecklistGenerator:
         except Exception:
             pass
 
-        # Dedupe, collapse, and canonically sort
+        # Dedupe, collapse, and canonically sort (value subtrees hashed once for all three)
+        digester = ValueDigester()
         merged = enriched
-        merged = dedupe_items(merged)
+        merged = dedupe_items(merged, digester)
         try:
             logger.debug(f"ChecklistGenerator.build: after dedupe count={len(merged)}")
         except Exception:
             pass
-        merged = collapse_items(merged)
+        merged = collapse_items(merged, digester)
         try:
             logger.debug(f"ChecklistGenerator.build: after collapse count={len(merged)}")
         except Exception:
             pass
-        final_items = canonical_sort(merged)
+        final_items = canonical_sort(merged, digester)
         try:
             logger.debug(f"ChecklistGenerator.build: after canonical_sort final_items count={len(final_items)}")
         except Exception:
@@ -497,15 +515,16 @@ class ChecklistGenerator:
         # Merge AST and spec invariants
         all_invariants = spec_invariants + spec_level_invariants
 
+        # Pointer-prefix index over final items for invariant matching and evaluation
+        pointer_index = PointerIndex(final_items)
+
         # Attach spec invariants to items
         for item in final_items:
             item["invariants_from_spec"] = []
-            for inv in spec_level_invariants:
-                # Check if item relates to this invariant (same pointer prefix)
-                item_ptr = item.get("ptr", "")
-                inv_ptr = inv.get("spec_ptr", "")
-                if item_ptr.startswith(inv_ptr) or inv_ptr.startswith(item_ptr):
-                    item["invariants_from_spec"].append(inv)
+        for inv in spec_level_invariants:
+            # Items related to this invariant (same pointer prefix, either direction)
+            for item in pointer_index.related(inv.get("spec_ptr", "")):
+                item["invariants_from_spec"].append(inv)
 
         # Evaluate invariants using evaluate_invariant
         from .invariants import evaluate_invariant
@@ -519,7 +538,8 @@ class ChecklistGenerator:
             # Build evaluation context
             eval_context = {
                 "items": final_items,
-                "spec": spec
+                "spec": spec,
+                "pointer_index": pointer_index
             }
 
             # Evaluate invariant expression (if any)
@@ -556,23 +576,21 @@ class ChecklistGenerator:
                 }
 
             # Attach result to items that match this invariant
-            for item in list(final_items):
-                item_ptr = item.get("ptr", "")
-                if inv_ptr and (item_ptr.startswith(inv_ptr) or inv_ptr.startswith(item_ptr)):
-                    if "meta" not in item:
-                        item["meta"] = {}
-                    if "invariant_results" not in item["meta"]:
-                        item["meta"]["invariant_results"] = []
-                    # Always attach explainability metadata for invariants (evaluated or defaulted)
-                    inv_record = {"invariant_id": invariant.get("id"), "result": result}
-                    if explainability:
-                        inv_record["explainability"] = explainability
-                    else:
-                        inv_record["explainability"] = {
-                            "source": "evaluated_expr",
-                            "justification": "expr_evaluated",
-                            "inference_type": "structural"}
-                    item["meta"]["invariant_results"].append(inv_record)
+            for item in (pointer_index.related(inv_ptr) if inv_ptr else ()):
+                if "meta" not in item:
+                    item["meta"] = {}
+                if "invariant_results" not in item["meta"]:
+                    item["meta"]["invariant_results"] = []
+                # Always attach explainability metadata for invariants (evaluated or defaulted)
+                inv_record = {"invariant_id": invariant.get("id"), "result": result}
+                if explainability:
+                    inv_record["explainability"] = explainability
+                else:
+                    inv_record["explainability"] = {
+                        "source": "evaluated_expr",
+                        "justification": "expr_evaluated",
+                        "inference_type": "structural"}
+                item["meta"]["invariant_results"].append(inv_record)
 
             # If we prepared a diagnostic, append it once and record an event
             if pending_diag is not None:
@@ -586,6 +604,7 @@ class ChecklistGenerator:
                 except Exception:
                     pending_diag["ptr"] = "/_diagnostics/invariant/unknown"
                 final_items.append(pending_diag)
+                pointer_index.add(pending_diag)
                 try:
                     logger.debug(
                         f"ChecklistGenerator.build: appended invariant diag item id={pending_diag.get('id')} expr={expr}")
@@ -620,28 +639,27 @@ class ChecklistGenerator:
                 })
 
         # Legacy violation checking for backward compatibility
-        for invariant in all_invariants:
-            # Check each invariant against checklist items
-            for item in final_items:
-                # Verify constraints
-                if invariant["type"] == "must":
-                    # Must constraint: item must satisfy condition
-                    if not self._check_invariant_satisfied(item, invariant):
-                        invariant_violations.append({
-                            "item_id": item.get("id", "unknown"),
-                            "invariant_pointer": invariant["pointer"],
-                            "invariant_type": invariant["type"],
-                            "constraint": invariant["constraint"]
-                        })
-                elif invariant["type"] == "forbid":
-                    # Forbid constraint: item must not match condition
-                    if self._check_invariant_forbidden(item, invariant):
-                        invariant_violations.append({
-                            "item_id": item.get("id", "unknown"),
-                            "invariant_pointer": invariant["pointer"],
-                            "invariant_type": invariant["type"],
-                            "constraint": invariant["constraint"]
-                        })
+        # (string must/forbid constraints; items lowered once and shared by all invariants)
+        lowered = None
+        for invariant in (all_invariants if final_items else ()):
+            inv_type = invariant["type"]
+            if inv_type not in ("must", "forbid") or not isinstance(invariant["constraint"], str):
+                # Non-string constraints are satisfied / not forbidden
+                continue
+            if lowered is None:
+                lowered = [(item, item.get("text", "").lower(), item.get("ptr", "").lower())
+                           for item in pointer_index.items]
+            needle = invariant["constraint"].lower()
+            # Must: violated when absent from text and ptr; forbid: violated when present
+            violated_when_found = inv_type == "forbid"
+            for item, text_l, ptr_l in lowered:
+                if ((needle in text_l) or (needle in ptr_l)) == violated_when_found:
+                    invariant_violations.append({
+                        "item_id": item.get("id", "unknown"),
+                        "invariant_pointer": invariant["pointer"],
+                        "invariant_type": invariant["type"],
+                        "constraint": invariant["constraint"]
+                    })
 
         # Cycle detection pass - before derived tasks
         from .graph import build_graph, get_cycle_members
@@ -811,27 +829,63 @@ class ChecklistGenerator:
         try:
             if engine is not None and getattr(engine, "persona_enabled", False):
                 from shieldcraft.persona.persona_registry import find_personas_for_phase
-                from shieldcraft.persona.persona_evaluator import evaluate_personas
+                from shieldcraft.persona.persona_evaluator import MatchIndex, evaluate_personas
                 from shieldcraft.services.validator.persona_gate import enforce_persona_veto
 
+                from shieldcraft.observability import buffered
+
                 personas = find_personas_for_phase("checklist")
-                persona_res = evaluate_personas(engine, personas, decorated, phase="checklist")
-                # Apply persona constraints in the engine-controlled scope deterministically
+                # One persona-event snapshot for the whole evaluation phase
+                with buffered(engine):
+                    persona_res = evaluate_personas(engine, personas, decorated, phase="checklist")
+                # Apply persona constraints in the engine-controlled scope deterministically;
+                # items are looked up through a match index kept current as setters apply
+                match_index = MatchIndex(decorated)
                 for c in persona_res.get("constraints", []):
                     iid = c.get("item_id")
                     iptr = c.get("item_ptr")
                     setter = c.get("set", {})
+                    by_ref = set()
+                    if iid is not None:
+                        by_ref.update(match_index.candidates({"id": iid}))
+                    if iptr is not None:
+                        by_ref.update(match_index.candidates({"ptr": iptr}))
                     # Find matching item and apply permitted setters
                     # Try to match by id or ptr first; otherwise fall back to matching by the original rule match
                     matched = False
-                    for item in decorated:
-                        if (iid is not None and item.get("id") == iid) or (
-                                iptr is not None and item.get("ptr") == iptr):
-                            matched = True
-                            # If persona evaluator flagged this constraint as disallowed, surface it
+                    for pos in sorted(by_ref):
+                        item = decorated[pos]
+                        matched = True
+                        # If persona evaluator flagged this constraint as disallowed, surface it
+                        if c.get("disallowed"):
+                            item.setdefault("meta", {}).setdefault("persona_constraints_disallowed",
+                                                                   []).append({"persona": c.get("persona"), "attempt": setter})
+                            match_index.refresh(pos, "meta")
+                            try:
+                                if context:
+                                    try:
+                                        from shieldcraft.util.json_canonicalizer import canonicalize
+                                        context.record_event(
+                                            "G15_PERSONA_CONSTRAINT_DISALLOWED",
+                                            "generation",
+                                            "DIAGNOSTIC",
+                                            message="persona attempted disallowed mutation",
+                                            evidence={
+                                                "persona": c.get("persona"),
+                                                "attempt": canonicalize(setter)})
+                                    except Exception:
+                                        pass
+                            except Exception:
+                                pass
+                            break
+                    # If not matched by id/ptr, fall back to re-matching using the original match rule if present
+                    if not matched and c.get("match"):
+                        for pos in match_index.candidates(c.get("match", {})):
+                            item = decorated[pos]
                             if c.get("disallowed"):
-                                item.setdefault("meta", {}).setdefault("persona_constraints_disallowed",
-                                                                       []).append({"persona": c.get("persona"), "attempt": setter})
+                                item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
+                                    {"persona": c.get("persona"), "attempt": setter})
+                                match_index.refresh(pos, "meta")
                                 try:
                                     if context:
                                         try:
@@ -848,92 +902,71 @@ class ChecklistGenerator:
                                             pass
                                 except Exception:
                                     pass
-                                break
-                    # If not matched by id/ptr, fall back to re-matching using the original match rule if present
-                    if not matched and c.get("match"):
-                        for item in decorated:
-                            if all(item.get(k) == v for k, v in c.get("match", {}).items()):
-                                if c.get("disallowed"):
-                                    item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
-                                        {"persona": c.get("persona"), "attempt": setter})
-                                    try:
-                                        if context:
-                                            try:
-                                                from shieldcraft.util.json_canonicalizer import canonicalize
-                                                context.record_event(
-                                                    "G15_PERSONA_CONSTRAINT_DISALLOWED",
-                                                    "generation",
-                                                    "DIAGNOSTIC",
-                                                    message="persona attempted disallowed mutation",
-                                                    evidence={
-                                                        "persona": c.get("persona"),
-                                                        "attempt": canonicalize(setter)})
-                                            except Exception:
-                                                pass
-                                    except Exception:
-                                        pass
-                                continue
                     # If matched above we already processed; otherwise apply permitted setters normally
-                    for item in decorated:
-                        if (iid is not None and item.get("id") == iid) or (iptr is not None and item.get("ptr") == iptr) or (
-                                c.get("match") and all(item.get(k) == v for k, v in c.get("match", {}).items())):
-                            if c.get("disallowed"):
-                                # already handled
-                                continue
-                            for sk, sv in setter.items():
-                                # Forbid mutating identifiers and semantic fields that affect checklist outcomes
-                                forbidden = set(["id", "ptr", "generated", "artifact",
-                                                "severity", "refusal", "outcome"])
-                                if sk in forbidden:
-                                    item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
-                                        {"persona": c.get("persona"), "attempt": {sk: sv}})
-                                    # Record a DIAGNOSTIC to make the disallowed attempt visible
-                                    try:
-                                        from shieldcraft.util.json_canonicalizer import canonicalize
-                                        if context:
-                                            try:
-                                                context.record_event("G15_PERSONA_CONSTRAINT_DISALLOWED",
-                                                                     "generation",
-                                                                     "DIAGNOSTIC",
-                                                                     message=f"persona attempted disallowed mutation: {sk}",
-                                                                     evidence={"persona": c.get("persona"),
-                                                                               "attempt": canonicalize({sk: sv})})
-                                            except Exception:
-                                                pass
-                                    except Exception:
-                                        pass
-                                elif sk == "meta":
-                                    item.setdefault("meta", {}).setdefault("persona_constraints_applied",
-                                                                           []).append({"persona": c.get("persona"), "set": sv})
-                                else:
-                                    item[sk] = sv
-                            for sk, sv in setter.items():
-                                # Forbid mutating identifiers and semantic fields that affect checklist outcomes
-                                forbidden = set(["id", "ptr", "generated", "artifact",
-                                                "severity", "refusal", "outcome"])
-                                if sk in forbidden:
-                                    item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
-                                        {"persona": c.get("persona"), "attempt": {sk: sv}})
-                                    # Record a DIAGNOSTIC to make the disallowed attempt visible
-                                    try:
-                                        from shieldcraft.util.json_canonicalizer import canonicalize
-                                        if context:
-                                            try:
-                                                context.record_event("G15_PERSONA_CONSTRAINT_DISALLOWED",
-                                                                     "generation",
-                                                                     "DIAGNOSTIC",
-                                                                     message=f"persona attempted disallowed mutation: {sk}",
-                                                                     evidence={"persona": c.get("persona"),
-                                                                               "attempt": canonicalize({sk: sv})})
-                                            except Exception:
-                                                pass
-                                    except Exception:
-                                        pass
-                                elif sk == "meta":
-                                    item.setdefault("meta", {}).setdefault("persona_constraints_applied",
-                                                                           []).append({"persona": c.get("persona"), "set": sv})
-                                else:
-                                    item[sk] = sv
+                    targets = set(by_ref)
+                    if c.get("match"):
+                        targets.update(match_index.candidates(c.get("match", {})))
+                    for pos in sorted(targets):
+                        item = decorated[pos]
+                        if c.get("disallowed"):
+                            # already handled
+                            continue
+                        for sk, sv in setter.items():
+                            # Forbid mutating identifiers and semantic fields that affect checklist outcomes
+                            forbidden = set(["id", "ptr", "generated", "artifact",
+                                            "severity", "refusal", "outcome"])
+                            if sk in forbidden:
+                                item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
+                                    {"persona": c.get("persona"), "attempt": {sk: sv}})
+                                # Record a DIAGNOSTIC to make the disallowed attempt visible
+                                try:
+                                    from shieldcraft.util.json_canonicalizer import canonicalize
+                                    if context:
+                                        try:
+                                            context.record_event("G15_PERSONA_CONSTRAINT_DISALLOWED",
+                                                                 "generation",
+                                                                 "DIAGNOSTIC",
+                                                                 message=f"persona attempted disallowed mutation: {sk}",
+                                                                 evidence={"persona": c.get("persona"),
+                                                                           "attempt": canonicalize({sk: sv})})
+                                        except Exception:
+                                            pass
+                                except Exception:
+                                    pass
+                            elif sk == "meta":
+                                item.setdefault("meta", {}).setdefault("persona_constraints_applied",
+                                                                       []).append({"persona": c.get("persona"), "set": sv})
+                            else:
+                                item[sk] = sv
+                        for sk, sv in setter.items():
+                            # Forbid mutating identifiers and semantic fields that affect checklist outcomes
+                            forbidden = set(["id", "ptr", "generated", "artifact",
+                                            "severity", "refusal", "outcome"])
+                            if sk in forbidden:
+                                item.setdefault("meta", {}).setdefault("persona_constraints_disallowed", []).append(
+                                    {"persona": c.get("persona"), "attempt": {sk: sv}})
+                                # Record a DIAGNOSTIC to make the disallowed attempt visible
+                                try:
+                                    from shieldcraft.util.json_canonicalizer import canonicalize
+                                    if context:
+                                        try:
+                                            context.record_event("G15_PERSONA_CONSTRAINT_DISALLOWED",
+                                                                 "generation",
+                                                                 "DIAGNOSTIC",
+                                                                 message=f"persona attempted disallowed mutation: {sk}",
+                                                                 evidence={"persona": c.get("persona"),
+                                                                           "attempt": canonicalize({sk: sv})})
+                                        except Exception:
+                                            pass
+                                except Exception:
+                                    pass
+                            elif sk == "meta":
+                                item.setdefault("meta", {}).setdefault("persona_constraints_applied",
+                                                                       []).append({"persona": c.get("persona"), "set": sv})
+                            else:
+                                item[sk] = sv
+                        for sk in list(setter) + ["meta"]:
+                            match_index.refresh(pos, sk)
                 # Enforce vetoes if any persona emitted a veto (advisory-only under Phase 15)
                 sel = enforce_persona_veto(engine)
                 # If a veto was present, record advisory event in generation phase for visibility
@@ -985,13 +1018,18 @@ class ChecklistGenerator:
                 logger.debug("ChecklistGenerator.build: discover_tests returned")
             except Exception:
                 pass
-            for it in decorated:
-                try:
-                    exp = expand_tests_for_item(it, test_map)
-                    if exp.get("candidates"):
-                        it.setdefault("meta", {})["candidate_tests"] = exp.get("candidates")
-                except Exception:
-                    pass
+            if fragments is not None:
+                for it, candidates in zip(decorated, fragments.expand_tests(decorated, test_map)):
+                    if candidates:
+                        it.setdefault("meta", {})["candidate_tests"] = candidates
+            else:
+                for it in decorated:
+                    try:
+                        exp = expand_tests_for_item(it, test_map)
+                        if exp.get("candidates"):
+                            it.setdefault("meta", {})["candidate_tests"] = exp.get("candidates")
+                    except Exception:
+                        pass
         except Exception:
             pass
         # Determinism marker: if a run seed exists, attach a small per-item marker
@@ -1258,28 +1296,6 @@ class ChecklistGenerator:
             return f"Implement boolean at {ptr}: {v}"
         return f"Implement value at {ptr}"
 
-    def _check_invariant_satisfied(self, item, invariant):
-        """Check if item satisfies a 'must' invariant."""
-        constraint = invariant["constraint"]
-        # Simple string matching for now
-        if isinstance(constraint, str):
-            # Check if constraint appears in item text or ptr
-            item_text = item.get("text", "")
-            item_ptr = item.get("ptr", "")
-            return constraint.lower() in item_text.lower() or constraint.lower() in item_ptr.lower()
-        return True
-
-    def _check_invariant_forbidden(self, item, invariant):
-        """Check if item violates a 'forbid' invariant."""
-        constraint = invariant["constraint"]
-        # Simple string matching for now
-        if isinstance(constraint, str):
-            # Check if forbidden pattern appears in item
-            item_text = item.get("text", "")
-            item_ptr = item.get("ptr", "")
-            return constraint.lower() in item_text.lower() or constraint.lower() in item_ptr.lower()
-        return False
-
     def _extract_from_ast(self, ast):
         """Extract checklist items using AST traversal."""
         items = []
@@ -1,6 +1,7 @@
 """
 Dependency graph extraction and cycle detection for checklist tasks.
 """
+from shieldcraft.util.graph import iter_back_edges
 
 
 def build_graph(items):
@@ -35,40 +36,9 @@ def build_graph(items):
 
         graph[item_id] = depends_on
 
-    # Detect cycles using DFS
-    cycles = []
-    visited = set()
-    rec_stack = set()
-    path = []
-
-    def dfs(node):
-        """DFS with cycle detection."""
-        if node in rec_stack:
-            # Found a cycle - extract it from path
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            cycles.append(cycle)
-            return
-
-        if node in visited:
-            return
-
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        # Visit dependencies
-        for dep in graph.get(node, []):
-            if dep in item_ids:  # Only follow valid dependencies
-                dfs(dep)
-
-        path.pop()
-        rec_stack.remove(node)
-
-    # Run DFS from all nodes
-    for item_id in sorted(item_ids):  # Sort for determinism
-        if item_id not in visited:
-            dfs(item_id)
+    # Detect cycles using DFS (only follow valid dependencies; sorted for determinism)
+    cycles = [path + [node] for node, path in
+              iter_back_edges(graph, sorted(item_ids), follow=item_ids.__contains__)]
 
     # Deduplicate cycles (same cycle can be found from different starting points)
     unique_cycles = []
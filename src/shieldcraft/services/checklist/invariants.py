@@ -65,7 +65,9 @@ def evaluate_invariant(expr: str, context: dict) -> bool:
 
     Args:
         expr: invariant expression string
-        context: dict with 'items' list and 'spec' dict
+        context: dict with 'items' list and 'spec' dict, and optionally a
+            'pointer_index' (PointerIndex over the same items) to answer
+            pointer queries without scanning
 
     Returns:
         bool: True if invariant passes, False otherwise
@@ -73,14 +75,19 @@ def evaluate_invariant(expr: str, context: dict) -> bool:
     expr = expr.strip()
     items = context.get("items", [])
     spec = context.get("spec", {})
+    index = context.get("pointer_index")
 
     # exists(ptr) - check if pointer exists
     if expr.startswith("exists(") and expr.endswith(")"):
         ptr = expr[7:-1].strip().strip("'\"")
         # Check if any item has this pointer
-        for item in items:
-            if item.get("ptr") == ptr:
+        if index is not None:
+            if index.exists(ptr):
                 return True
+        else:
+            for item in items:
+                if item.get("ptr") == ptr:
+                    return True
         # Check if spec has this pointer
         return _resolve_ptr(spec, ptr) is not None
 
@@ -94,7 +101,10 @@ def evaluate_invariant(expr: str, context: dict) -> bool:
             threshold = int(match.group(3))
 
             # Count items with this pointer prefix
-            count = sum(1 for item in items if item.get("ptr", "").startswith(ptr))
+            if index is not None:
+                count = index.count(ptr)
+            else:
+                count = sum(1 for item in items if item.get("ptr", "").startswith(ptr))
 
             if op == ">":
                 return count > threshold
@@ -112,12 +122,13 @@ def evaluate_invariant(expr: str, context: dict) -> bool:
         ptr_pattern = expr[7:-1].strip().strip("'\"")
         # Collect values at pointer pattern
         values = []
-        for item in items:
-            if item.get("ptr", "").startswith(ptr_pattern):
-                # Get ID or value for uniqueness check
-                val = item.get("id") or item.get("ptr")
-                if val:
-                    values.append(val)
+        matched = index.descendants(ptr_pattern) if index is not None else (
+            item for item in items if item.get("ptr", "").startswith(ptr_pattern))
+        for item in matched:
+            # Get ID or value for uniqueness check
+            val = item.get("id") or item.get("ptr")
+            if val:
+                values.append(val)
         # Check if all unique
         return len(values) == len(set(values))
 
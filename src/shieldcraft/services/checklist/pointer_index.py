@@ -0,0 +1,105 @@
+"""
+Sorted pointer-prefix index over checklist items.
+
+Invariant attachment and evaluation relate items to spec pointers by plain
+string prefix (`item_ptr.startswith(ptr)` / `ptr.startswith(item_ptr)`).
+`PointerIndex` answers those queries without scanning every item:
+
+- descendants(prefix): items whose ptr starts with `prefix`
+  (bisect into the sorted pointers, then a contiguous run);
+- ancestors(ptr): items whose ptr is a prefix of `ptr`
+  (one dict lookup per prefix length of `ptr`);
+- count/exists: O(log n) from the sorted pointers.
+
+Results are returned in item order (the order items were added).
+"""
+from bisect import bisect_left, insort
+
+
+def _prefix_upper(prefix):
+    """Smallest string greater than every string starting with `prefix`, or None."""
+    last = prefix[-1]
+    if ord(last) >= 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(last) + 1)
+
+
+class PointerIndex:
+    """Prefix index over `items[i]["ptr"]`; items may be appended via `add`."""
+
+    def __init__(self, items=()):
+        self.items = []
+        self._keys = []      # sorted (ptr, position)
+        self._by_ptr = {}    # ptr -> [position, ...]
+        self._exact = set()  # ptr values as stored on items (missing ptr is not "")
+        for item in items:
+            self._register(item)
+        self._keys.sort()
+
+    @staticmethod
+    def _ptr(item):
+        return item.get("ptr", "") or ""
+
+    def _register(self, item):
+        pos = len(self.items)
+        self.items.append(item)
+        ptr = self._ptr(item)
+        self._keys.append((ptr, pos))
+        self._by_ptr.setdefault(ptr, []).append(pos)
+        self._exact.add(item.get("ptr"))
+
+    def add(self, item):
+        """Index one more item (kept sorted)."""
+        self._register(item)
+        key = self._keys.pop()
+        insort(self._keys, key)
+
+    def _range(self, prefix):
+        lo = bisect_left(self._keys, (prefix, -1))
+        if not prefix:
+            return lo, len(self._keys)
+        upper = _prefix_upper(prefix)
+        if upper is None:
+            hi = lo
+            while hi < len(self._keys) and self._keys[hi][0].startswith(prefix):
+                hi += 1
+            return lo, hi
+        return lo, bisect_left(self._keys, (upper, -1))
+
+    def _descendant_positions(self, prefix):
+        lo, hi = self._range(prefix)
+        return [pos for _, pos in self._keys[lo:hi]]
+
+    def _ancestor_positions(self, ptr):
+        out = []
+        by_ptr = self._by_ptr
+        for k in range(len(ptr) + 1):
+            hit = by_ptr.get(ptr[:k])
+            if hit:
+                out.extend(hit)
+        return out
+
+    def descendants(self, prefix):
+        """Items whose ptr starts with `prefix`, in item order."""
+        return [self.items[p] for p in sorted(self._descendant_positions(prefix))]
+
+    def ancestors(self, ptr):
+        """Items whose ptr is a prefix of `ptr` (including equal), in item order."""
+        return [self.items[p] for p in sorted(self._ancestor_positions(ptr))]
+
+    def related(self, ptr):
+        """Items whose ptr is a prefix of, or has prefix, `ptr`, in item order."""
+        positions = set(self._descendant_positions(ptr))
+        positions.update(self._ancestor_positions(ptr))
+        return [self.items[p] for p in sorted(positions)]
+
+    def count(self, prefix):
+        lo, hi = self._range(prefix)
+        return hi - lo
+
+    def exists(self, ptr):
+        """True if some item's ptr equals `ptr`."""
+        return ptr in self._exact
+
+    def __len__(self):
+        return len(self.items)
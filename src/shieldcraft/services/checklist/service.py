@@ -82,7 +82,6 @@ class UltimateChecklistService:
 
     def _generate_legacy_checklist(self, spec: Dict) -> Dict:
         """Generate checklist using legacy system for compatibility"""
-        raw_items = self.legacy_extractor.extract(spec)
         legacy_checklist = self.legacy_generator.extract_items(spec)
 
         return {
@@ -15,7 +15,7 @@ import hashlib
 import json
 import re
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Any, Union
+from typing import Iterable, List, Dict, Set, Optional, Any, Union
 from pathlib import Path
 from enum import Enum
 
@@ -264,8 +264,8 @@ class {Key}Collection(BaseModel):
         This transforms vague requirements into specific, actionable tasks
         that can be followed blindly by implementers.
         """
-        # Extract raw items using existing extractor
-        raw_items = self.extractor.extract(spec)
+        # Extract raw items using existing extractor (streamed into the filter)
+        raw_items = self.extractor.iter_items(spec)
 
         # Filter and deduplicate items to focus on meaningful structural elements
         meaningful_items = self._filter_meaningful_items(raw_items)
@@ -292,7 +292,7 @@ class {Key}Collection(BaseModel):
             metadata=metadata
         )
 
-    def _filter_meaningful_items(self, raw_items: List[Dict]) -> List[Dict]:
+    def _filter_meaningful_items(self, raw_items: Iterable[Dict]) -> List[Dict]:
         """Filter items to focus on meaningful structural elements"""
         # Remove duplicates
         seen = set()
@@ -0,0 +1,88 @@
+"""
+Fixed-size content digests for checklist item values.
+
+Items extracted from a spec carry the spec subtree at their pointer as
+`value`, so root- and section-level values are large. Comparing them via
+`str(value)` costs O(subtree) per item. `ValueDigester` instead hashes each
+container once, bottom-up (a Merkle hash over its children's digests), and
+memoises by object so shared subtrees are hashed once per spec.
+
+Digests follow `str(value)`: containers are encoded from the `repr` of their
+scalars in iteration order, and top-level scalars from `str(value)`. Two
+values therefore share a digest exactly when their strings are equal, except
+for a top-level string whose text is itself the repr of a list or dict.
+"""
+import hashlib
+import re
+
+_CONTAINERS = (dict, list)
+
+
+def _encode(text):
+    b = text.encode("utf-8", "surrogatepass")
+    return len(b).to_bytes(8, "big") + b
+
+
+_SPACE_RUN = re.compile(" {2,}")
+
+
+class ValueDigester:
+    """Memoised bottom-up digests of JSON-like values.
+
+    With `normalized=True` every scalar's repr is lower-cased and runs of
+    spaces are collapsed, matching `' '.join(str(v).lower().split())` on a
+    container. Memo entries hold a reference to their object, so a digester
+    should be scoped to one spec/build.
+    """
+
+    def __init__(self, normalized=False):
+        self.normalized = normalized
+        self._memo = {}
+
+    def _scalar(self, value):
+        text = repr(value)
+        if self.normalized:
+            text = _SPACE_RUN.sub(" ", text.lower())
+        return b"r" + _encode(text)
+
+    def _container(self, root):
+        memo = self._memo
+        hit = memo.get(id(root))
+        if hit is not None:
+            return hit[1]
+        # Iterative post-order: children are digested before their parent
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in memo:
+                continue
+            children = node.values() if isinstance(node, dict) else node
+            if not expanded:
+                stack.append((node, True))
+                for child in children:
+                    if isinstance(child, _CONTAINERS) and id(child) not in memo:
+                        stack.append((child, False))
+                continue
+            if isinstance(node, dict):
+                h = hashlib.sha256(b"d")
+                for k, v in node.items():
+                    h.update(self._scalar(k))
+                    h.update(b"c" + memo[id(v)][1] if isinstance(v, _CONTAINERS) else self._scalar(v))
+            else:
+                h = hashlib.sha256(b"l")
+                for v in node:
+                    h.update(b"c" + memo[id(v)][1] if isinstance(v, _CONTAINERS) else self._scalar(v))
+            memo[id(node)] = (node, h.digest())
+        return memo[id(root)][1]
+
+    def digest(self, value):
+        """Return a 32-byte digest of `value`."""
+        if isinstance(value, _CONTAINERS):
+            return self._container(value)
+        text = str(value)
+        if self.normalized:
+            text = " ".join(text.lower().split())
+        return hashlib.sha256(b"s" + _encode(text)).digest()
+
+    def hexdigest(self, value):
+        return self.digest(value).hex()
@@ -1,7 +1,10 @@
 import json
 import os
 
+from shieldcraft.util.side_effects import side_effect
 
+
+@side_effect()
 def write_warnings(product_id, warnings):
     path = f"products/{product_id}/checklist/warnings.json"
     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -1,13 +1,29 @@
 import pathlib
 from .template_engine import TemplateEngine
+from .template_registry import get_template_registry
 from .file_plan import FilePlan
 
 
+# Per-process generator used by pooled rendering (see CodeGenerator._render_entries)
+_WORKER_GENERATOR = None
+
+
+def _init_render_worker(template_dir):
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = CodeGenerator(template_dir)
+
+
+def _render_entry_in_worker(args):
+    entry, input_was_list = args
+    return _WORKER_GENERATOR._render_entry(entry, input_was_list)
+
+
 class CodeGenerator:
     def __init__(self, template_dir="src/shieldcraft/services/codegen/templates"):
         self.template_dir = pathlib.Path(template_dir)
         self.engine = TemplateEngine(template_dir)
         self.plan_builder = FilePlan()
+        self.templates = get_template_registry()
 
     def _inject_lineage_header(self, content, item):
         """Inject lineage provenance header into generated file."""
@@ -37,204 +53,202 @@ class CodeGenerator:
         # Ensure header is the first content (strip leading newlines)
         return header + content.lstrip("\n")
 
-    def run(self, checklist, dry_run=False):
-        import hashlib
-        # Preserve caller input shape to support legacy behavior
-        input_was_list = isinstance(checklist, list)
-        file_plan = self.plan_builder.build_file_plan(checklist)
-        outputs = []
-        content_hashes = []
-
-        for entry in file_plan:
-            # Check for module type
-            source_item = entry.get("source", {})
-            item_type = source_item.get("type", "")
-            item_category = source_item.get("category", "")
-
-            # If this source item contains model modules (spec-level model declaration),
-            # generate a module output for each module entry.
-            value = source_item.get("value")
-            if isinstance(value, dict) and "modules" in value and isinstance(value["modules"], list):
-                modules = value["modules"]
-                for module in modules:
-                    template_path = self.template_dir / "module.j2"
-                    if not template_path.exists():
-                        template_path = self.template_dir / (entry["template_name"] + ".txt")
-
-                    template = template_path.read_text()
-                    # Detect Jinja placeholders that use default(...) — record placeholder provenance on item meta
-                    try:
-                        if "| default(" in template:
-                            if "meta" not in source_item:
-                                source_item["meta"] = {}
-                            source_item["meta"]["template_placeholders"] = True
-                    except Exception:
-                        pass
-
-                    context = {
-                        "name": module.get("name", "UnknownModule"),
-                        "dependencies": module.get("dependencies", []),
-                        "invariants": module.get("invariants", []),
-                        "checklist_id": entry["id"]
-                    }
-
-                    rendered = self.engine.render(template, context)
-                    # Inject lineage header using the parent source item (spec/model)
-                    rendered = self._inject_lineage_header(rendered, source_item)
-
-                    module_name = module.get("name", "unknown")
-                    module_path = f"src/generated/modules/{module_name}.py"
-
-                    outputs.append({
-                        "path": module_path,
-                        "content": rendered
-                    })
-
-                    content_hash = hashlib.sha256(rendered.encode()).hexdigest()
-                    content_hashes.append((module_path, content_hash))
-                continue
+    def _render_entry(self, entry, input_was_list):
+        """Render one file-plan entry.
 
-            # Bootstrap module generation
-            if item_category == "bootstrap":
-                # Use bootstrap module template
-                template_path = self.template_dir / "bootstrap" / "module_bootstrap.j2"
-
-                if template_path.exists():
-                    # Read template and render with Jinja2
-                    template_content = template_path.read_text()
-
-                    context = {
-                        "name": source_item.get("name", source_item.get("ptr", "Unknown").split("/")[-1]),
-                        "checklist_id": entry["id"]
-                    }
-
-                    # Use Jinja2 directly for proper rendering
-                    from jinja2 import Template
-                    jinja_template = Template(template_content)
-                    rendered = jinja_template.render(context)
-
-                    # Bootstrap output path
-                    module_name = context["name"]
-                    bootstrap_path = f".selfhost_outputs/bootstrap/{module_name}.py"
-
-                    outputs.append({
-                        "path": bootstrap_path,
-                        "content": rendered
-                    })
-                    continue
-
-            if item_type == "module":
-                # Module generation
+        Returns (outputs, content_hashes, placeholders) for the entry;
+        `placeholders` is True when the source item's meta was marked with
+        `template_placeholders`. Entries are independent of one another.
+        """
+        import hashlib
+        entry_outputs = []
+        entry_hashes = []
+        placeholders = False
+        # Check for module type
+        source_item = entry.get("source", {})
+        item_type = source_item.get("type", "")
+        item_category = source_item.get("category", "")
+
+        # If this source item contains model modules (spec-level model declaration),
+        # generate a module output for each module entry.
+        value = source_item.get("value")
+        if isinstance(value, dict) and "modules" in value and isinstance(value["modules"], list):
+            modules = value["modules"]
+            for module in modules:
                 template_path = self.template_dir / "module.j2"
                 if not template_path.exists():
-                    # Fallback to basic template
                     template_path = self.template_dir / (entry["template_name"] + ".txt")
 
-                template = template_path.read_text()
+                template = self.templates.read(template_path)
+                # Detect Jinja placeholders that use default(...) — record placeholder provenance on item meta
+                try:
+                    if "| default(" in template:
+                        if "meta" not in source_item:
+                            source_item["meta"] = {}
+                        source_item["meta"]["template_placeholders"] = True
+                        placeholders = True
+                except Exception:
+                    pass
 
                 context = {
-                    "name": source_item.get("name", "UnknownModule"),
-                    "dependencies": source_item.get("dependencies", []),
-                    "invariants": source_item.get("invariants", []),
+                    "name": module.get("name", "UnknownModule"),
+                    "dependencies": module.get("dependencies", []),
+                    "invariants": module.get("invariants", []),
                     "checklist_id": entry["id"]
                 }
 
                 rendered = self.engine.render(template, context)
-
-                # Inject lineage header
+                # Inject lineage header using the parent source item (spec/model)
                 rendered = self._inject_lineage_header(rendered, source_item)
 
-                # Module output path
-                module_name = source_item.get("name", "unknown")
+                module_name = module.get("name", "unknown")
                 module_path = f"src/generated/modules/{module_name}.py"
 
-                outputs.append({
+                entry_outputs.append({
                     "path": module_path,
                     "content": rendered
                 })
 
-                # Compute content hash for dry-run and bundle hash
                 content_hash = hashlib.sha256(rendered.encode()).hexdigest()
-                content_hashes.append((module_path, content_hash))
-                continue
+                entry_hashes.append((module_path, content_hash))
+            return entry_outputs, entry_hashes, placeholders
 
-            # Route derived task types to templates. For legacy list-based callers
-            # prefer the simple text templates (basic_python.txt) to preserve
-            # backward-compatible output formatting.
-            template_map = {
-                "module": "module.j2",
-                "fix-dependency": "fix_invariant.j2",
-                "resolve-cycle": "resolve_cycle.j2",
-                "integration": "integration.j2"
-            }
-
-            if input_was_list:
-                template_name = entry.get("template_name", "basic_python") + ".txt"
-            else:
-                template_name = template_map.get(item_type, "module.j2")
-            template_path = self.template_dir / template_name
+        # Bootstrap module generation
+        if item_category == "bootstrap":
+            # Use bootstrap module template
+            template_path = self.template_dir / "bootstrap" / "module_bootstrap.j2"
 
             if template_path.exists():
-                template_content = template_path.read_text()
-
-                if input_was_list:
-                    # Simplified rendering for legacy list input: provide task-level
-                    # context so basic text templates contain task id/ptr/summary.
-                    context = {
-                        "task_id": entry.get("id"),
-                        "ptr": entry.get("source", {}).get("ptr", ""),
-                        "summary": entry.get("source", {}).get("text", "")
-                    }
-                    rendered = self.engine.render(template_content, context)
-                    rendered = self._inject_lineage_header(rendered, entry.get("source", {}))
-                    outputs.append({"path": entry["output_path"], "content": rendered})
-                    content_hash = hashlib.sha256(rendered.encode()).hexdigest()
-                    content_hashes.append((entry["output_path"], content_hash))
-                    continue
-
-                # Build context for template
                 context = {
-                    "lineage_id": source_item.get("lineage_id", "unknown"),
-                    "spec_ptr": source_item.get("source_pointer", source_item.get("ptr", "unknown")),
-                    "name": source_item.get("name", "unknown"),
-                    "invariant_id": source_item.get("invariant_id", ""),
-                    "constraint": source_item.get("invariant_constraint", ""),
-                    "cycle_items": source_item.get("cycle_items", []),
-                    "component_name": source_item.get("name", "component")
+                    "name": source_item.get("name", source_item.get("ptr", "Unknown").split("/")[-1]),
+                    "checklist_id": entry["id"]
                 }
 
-                from jinja2 import Template
-                jinja_template = Template(template_content)
+                # Use Jinja2 directly for proper rendering (compiled once per process)
+                jinja_template = self.templates.jinja(template_path)
                 rendered = jinja_template.render(context)
-                # Inject lineage header for provenance
-                rendered = self._inject_lineage_header(rendered, source_item)
-
-                # Route to output path based on type
-                output_map = {
-                    "module": f"src/generated/modules/{context['name']}.py",
-                    "fix-dependency": f"src/generated/fixes/{source_item.get('id', 'fix')}.py",
-                    "resolve-cycle": f"src/generated/cycles/{source_item.get('id', 'cycle')}.py",
-                    "integration": f"src/generated/integration/{source_item.get('id', 'test')}.py"
-                }
 
-                output_path = output_map.get(item_type, f"src/generated/unknown/{source_item.get('id', 'item')}.py")
+                # Bootstrap output path
+                module_name = context["name"]
+                bootstrap_path = f".selfhost_outputs/bootstrap/{module_name}.py"
 
-                outputs.append({
-                    "path": output_path,
+                entry_outputs.append({
+                    "path": bootstrap_path,
                     "content": rendered
                 })
+                return entry_outputs, entry_hashes, placeholders
+
+        if item_type == "module":
+            # Module generation
+            template_path = self.template_dir / "module.j2"
+            if not template_path.exists():
+                # Fallback to basic template
+                template_path = self.template_dir / (entry["template_name"] + ".txt")
+
+            template = self.templates.read(template_path)
+
+            context = {
+                "name": source_item.get("name", "UnknownModule"),
+                "dependencies": source_item.get("dependencies", []),
+                "invariants": source_item.get("invariants", []),
+                "checklist_id": entry["id"]
+            }
 
+            rendered = self.engine.render(template, context)
+
+            # Inject lineage header
+            rendered = self._inject_lineage_header(rendered, source_item)
+
+            # Module output path
+            module_name = source_item.get("name", "unknown")
+            module_path = f"src/generated/modules/{module_name}.py"
+
+            entry_outputs.append({
+                "path": module_path,
+                "content": rendered
+            })
+
+            # Compute content hash for dry-run and bundle hash
+            content_hash = hashlib.sha256(rendered.encode()).hexdigest()
+            entry_hashes.append((module_path, content_hash))
+            return entry_outputs, entry_hashes, placeholders
+
+        # Route derived task types to templates. For legacy list-based callers
+        # prefer the simple text templates (basic_python.txt) to preserve
+        # backward-compatible output formatting.
+        template_map = {
+            "module": "module.j2",
+            "fix-dependency": "fix_invariant.j2",
+            "resolve-cycle": "resolve_cycle.j2",
+            "integration": "integration.j2"
+        }
+
+        if input_was_list:
+            template_name = entry.get("template_name", "basic_python") + ".txt"
+        else:
+            template_name = template_map.get(item_type, "module.j2")
+        template_path = self.template_dir / template_name
+
+        if template_path.exists():
+            template_content = self.templates.read(template_path)
+
+            if input_was_list:
+                # Simplified rendering for legacy list input: provide task-level
+                # context so basic text templates contain task id/ptr/summary.
+                context = {
+                    "task_id": entry.get("id"),
+                    "ptr": entry.get("source", {}).get("ptr", ""),
+                    "summary": entry.get("source", {}).get("text", "")
+                }
+                rendered = self.engine.render(template_content, context)
+                rendered = self._inject_lineage_header(rendered, entry.get("source", {}))
+                entry_outputs.append({"path": entry["output_path"], "content": rendered})
                 content_hash = hashlib.sha256(rendered.encode()).hexdigest()
-                content_hashes.append((output_path, content_hash))
-                continue
+                entry_hashes.append((entry["output_path"], content_hash))
+                return entry_outputs, entry_hashes, placeholders
 
-            elif item_type == "fix-dependency":
-                # Fix-dependency task generation
-                item_id = source_item.get("id", "unknown")
-                dependency_ref = source_item.get("dependency_ref", "unknown")
+            # Build context for template
+            context = {
+                "lineage_id": source_item.get("lineage_id", "unknown"),
+                "spec_ptr": source_item.get("source_pointer", source_item.get("ptr", "unknown")),
+                "name": source_item.get("name", "unknown"),
+                "invariant_id": source_item.get("invariant_id", ""),
+                "constraint": source_item.get("invariant_constraint", ""),
+                "cycle_items": source_item.get("cycle_items", []),
+                "component_name": source_item.get("name", "component")
+            }
+
+            jinja_template = self.templates.jinja(template_path)
+            rendered = jinja_template.render(context)
+            # Inject lineage header for provenance
+            rendered = self._inject_lineage_header(rendered, source_item)
+
+            # Route to output path based on type
+            output_map = {
+                "module": f"src/generated/modules/{context['name']}.py",
+                "fix-dependency": f"src/generated/fixes/{source_item.get('id', 'fix')}.py",
+                "resolve-cycle": f"src/generated/cycles/{source_item.get('id', 'cycle')}.py",
+                "integration": f"src/generated/integration/{source_item.get('id', 'test')}.py"
+            }
 
-                # Generate deterministic patch file
-                content = f"""# Generated by ShieldCraft Engine
+            output_path = output_map.get(item_type, f"src/generated/unknown/{source_item.get('id', 'item')}.py")
+
+            entry_outputs.append({
+                "path": output_path,
+                "content": rendered
+            })
+
+            content_hash = hashlib.sha256(rendered.encode()).hexdigest()
+            entry_hashes.append((output_path, content_hash))
+            return entry_outputs, entry_hashes, placeholders
+
+        elif item_type == "fix-dependency":
+            # Fix-dependency task generation
+            item_id = source_item.get("id", "unknown")
+            dependency_ref = source_item.get("dependency_ref", "unknown")
+
+            # Generate deterministic patch file
+            content = f"""# Generated by ShieldCraft Engine
 # Fix missing dependency: {dependency_ref}
 # Lineage ID: {source_item.get('lineage_id', 'unknown')}
 # Source Pointer: {source_item.get('source_pointer', 'unknown')}
@@ -247,98 +261,144 @@ def fix_dependency():
     pass
 """
 
-                outputs.append({
+            entry_outputs.append({
+                "path": f"fixes/{item_id}.py",
+                "content": content
+            })
+        elif item_type == "resolve-invariant":
+            # Resolve-invariant task generation
+            template_path = self.template_dir / "fix_invariant.j2"
+
+            if template_path.exists():
+                template = self.templates.jinja(template_path)
+
+                context = {
+                    "lineage_id": source_item.get("lineage_id", "unknown"),
+                    "spec_ptr": source_item.get("source_pointer", "unknown"),
+                    "invariant_type": source_item.get("invariant_type", "unknown"),
+                    "constraint": source_item.get("invariant_constraint", "unknown")
+                }
+
+                rendered = template.render(context)
+
+                item_id = source_item.get("id", "unknown")
+                entry_outputs.append({
                     "path": f"fixes/{item_id}.py",
-                    "content": content
+                    "content": rendered
                 })
-            elif item_type == "resolve-invariant":
-                # Resolve-invariant task generation
-                template_path = self.template_dir / "fix_invariant.j2"
-
-                if template_path.exists():
-                    template_content = template_path.read_text()
-                    from jinja2 import Template
-                    template = Template(template_content)
-
-                    context = {
-                        "lineage_id": source_item.get("lineage_id", "unknown"),
-                        "spec_ptr": source_item.get("source_pointer", "unknown"),
-                        "invariant_type": source_item.get("invariant_type", "unknown"),
-                        "constraint": source_item.get("invariant_constraint", "unknown")
-                    }
-
-                    rendered = template.render(context)
-
-                    item_id = source_item.get("id", "unknown")
-                    outputs.append({
-                        "path": f"fixes/{item_id}.py",
-                        "content": rendered
-                    })
-            elif item_type == "resolve-cycle":
-                # Resolve-cycle task generation
-                template_path = self.template_dir / "resolve_cycle.j2"
-
-                if template_path.exists():
-                    template_content = template_path.read_text()
-                    from jinja2 import Template
-                    template = Template(template_content)
-
-                    cycle_items = source_item.get("cycle_items", [])
-                    context = {
-                        "lineage_id": source_item.get("lineage_id", "unknown"),
-                        "cycle_items": cycle_items,
-                        "cycle_length": len(cycle_items)
-                    }
-
-                    rendered = template.render(context)
-
-                    item_id = source_item.get("id", "unknown")
-                    outputs.append({
-                        "path": f"cycles/{item_id}.py",
-                        "content": rendered
-                    })
-            elif item_type == "integration":
-                # Integration task generation
-                template_path = self.template_dir / "integration.j2"
-
-                if template_path.exists():
-                    template_content = template_path.read_text()
-                    from jinja2 import Template
-                    template = Template(template_content)
-
-                    context = {
-                        "lineage_id": source_item.get("lineage_id", "unknown"),
-                        "spec_ptr": source_item.get("ptr", "unknown"),
-                        "item_id": source_item.get("id", "unknown")
-                    }
-
-                    rendered = template.render(context)
-
-                    item_id = source_item.get("id", "unknown")
-                    outputs.append({
-                        "path": f"integration/{item_id}.py",
-                        "content": rendered
-                    })
-            else:
-                # Regular generation
-                template_path = self.template_dir / (entry["template_name"] + ".txt")
-                template = template_path.read_text()
+        elif item_type == "resolve-cycle":
+            # Resolve-cycle task generation
+            template_path = self.template_dir / "resolve_cycle.j2"
 
+            if template_path.exists():
+                template = self.templates.jinja(template_path)
+
+                cycle_items = source_item.get("cycle_items", [])
                 context = {
-                    "task_id": entry["id"],
-                    "ptr": entry["source"]["ptr"],
-                    "summary": entry["source"]["text"]
+                    "lineage_id": source_item.get("lineage_id", "unknown"),
+                    "cycle_items": cycle_items,
+                    "cycle_length": len(cycle_items)
                 }
 
-                # render expects template content, not name
-                rendered = self.engine.render(template, context)
+                rendered = template.render(context)
 
-                # Inject lineage header
-                rendered = self._inject_lineage_header(rendered, source_item)
-                outputs.append({
-                    "path": entry["output_path"],
+                item_id = source_item.get("id", "unknown")
+                entry_outputs.append({
+                    "path": f"cycles/{item_id}.py",
+                    "content": rendered
+                })
+        elif item_type == "integration":
+            # Integration task generation
+            template_path = self.template_dir / "integration.j2"
+
+            if template_path.exists():
+                template = self.templates.jinja(template_path)
+
+                context = {
+                    "lineage_id": source_item.get("lineage_id", "unknown"),
+                    "spec_ptr": source_item.get("ptr", "unknown"),
+                    "item_id": source_item.get("id", "unknown")
+                }
+
+                rendered = template.render(context)
+
+                item_id = source_item.get("id", "unknown")
+                entry_outputs.append({
+                    "path": f"integration/{item_id}.py",
                     "content": rendered
                 })
+        else:
+            # Regular generation
+            template_path = self.template_dir / (entry["template_name"] + ".txt")
+            template = self.templates.read(template_path)
+
+            context = {
+                "task_id": entry["id"],
+                "ptr": entry["source"]["ptr"],
+                "summary": entry["source"]["text"]
+            }
+
+            # render expects template content, not name
+            rendered = self.engine.render(template, context)
+
+            # Inject lineage header
+            rendered = self._inject_lineage_header(rendered, source_item)
+            entry_outputs.append({
+                "path": entry["output_path"],
+                "content": rendered
+            })
+
+        return entry_outputs, entry_hashes, placeholders
+
+    def _render_entries(self, file_plan, input_was_list, workers=None, pool="process"):
+        """Render every file-plan entry, in plan order.
+
+        With `workers` > 1 entries are rendered across a process (default) or
+        thread pool. Results are collected in plan order, so outputs, content
+        hashes and the bundle hash are identical to the serial path.
+        """
+        if not workers or workers <= 1 or len(file_plan) <= 1:
+            return [self._render_entry(entry, input_was_list) for entry in file_plan]
+
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        workers = min(workers, len(file_plan))
+        if pool == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(lambda e: self._render_entry(e, input_was_list), file_plan))
+        if pool != "process":
+            raise ValueError(f"unknown codegen pool: {pool!r}")
+
+        chunksize = max(1, len(file_plan) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(str(self.template_dir),)) as ex:
+            results = list(ex.map(_render_entry_in_worker,
+                                  ((entry, input_was_list) for entry in file_plan),
+                                  chunksize=chunksize))
+        # Workers render copies of the plan; mirror placeholder provenance
+        # back onto the caller's items as the serial path does.
+        for entry, (_, _, placeholders) in zip(file_plan, results):
+            if placeholders:
+                source_item = entry.get("source", {})
+                source_item.setdefault("meta", {})["template_placeholders"] = True
+        return results
+
+    def run(self, checklist, dry_run=False, workers=None, pool="process"):
+        """Render the file plan for `checklist`.
+
+        `workers` > 1 opts in to pooled rendering (`pool` is "process" or
+        "thread"); the result is identical to the serial run.
+        """
+        import hashlib
+        # Preserve caller input shape to support legacy behavior
+        input_was_list = isinstance(checklist, list)
+        file_plan = self.plan_builder.build_file_plan(checklist)
+        outputs = []
+        content_hashes = []
+
+        for entry_outputs, entry_hashes, _ in self._render_entries(file_plan, input_was_list, workers, pool):
+            outputs.extend(entry_outputs)
+            content_hashes.extend(entry_hashes)
 
         # Auto-generate __init__.py for module directories
         module_dirs = set()
@@ -2,6 +2,10 @@ import json
 import re
 from pathlib import Path
 
+# Compiled once at import; render() is called per checklist item
+_BLOCK_RE = re.compile(r'\{\{block:(\w+)\}\}(.*?)\{\{endblock\}\}', re.DOTALL)
+_COND_RE = re.compile(r'\{\{if\s+(\w+)\}\}(.*?)\{\{endif\}\}', re.DOTALL)
+
 
 class TemplateEngine:
     def __init__(self, template_dir=None):
@@ -21,8 +25,8 @@ class TemplateEngine:
                 path = alt
             else:
                 raise FileNotFoundError(f"Template not found: {name}")
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        from .template_registry import get_template_registry
+        return get_template_registry().read(path)
 
     def render(self, template, context):
         """
@@ -62,19 +66,21 @@ class TemplateEngine:
     def _process_blocks(self, template, context):
         """Process {{block:name}}...{{endblock}} constructs."""
         # Simple block extraction - no nesting support for now
-        block_pattern = r'\{\{block:(\w+)\}\}(.*?)\{\{endblock\}\}'
+        if "{{block:" not in template:
+            return template
 
         def replace_block(match):
             block_content = match.group(2)
             # Blocks are always included for now
             return block_content
 
-        return re.sub(block_pattern, replace_block, template, flags=re.DOTALL)
+        return _BLOCK_RE.sub(replace_block, template)
 
     def _process_conditionals(self, template, context):
         """Process {{if var}}...{{endif}} constructs."""
         # Simple conditional pattern
-        cond_pattern = r'\{\{if\s+(\w+)\}\}(.*?)\{\{endif\}\}'
+        if "{{if" not in template:
+            return template
 
         def replace_conditional(match):
             var_name = match.group(1)
@@ -84,7 +90,7 @@ class TemplateEngine:
                 return cond_content
             return ""
 
-        return re.sub(cond_pattern, replace_conditional, template, flags=re.DOTALL)
+        return _COND_RE.sub(replace_conditional, template)
 
     def _normalize_whitespace(self, text):
         """
@@ -0,0 +1,160 @@
+"""Process-wide template registry for code generation.
+
+Template sources are read once per process and re-read only when the file's
+(mtime_ns, size) changes; compiled Jinja templates are keyed by path and
+content hash, so an edited template is recompiled while an untouched one is
+reused across checklist items and `CodeGenerator` instances. Compilation goes
+through a single Jinja `Environment` with an in-memory bytecode cache; at
+most `MAX_COMPILED` compiled templates are kept, least recently used first
+out.
+
+jinja2 remains an optional dependency: it is imported on first compile.
+"""
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+
+MAX_COMPILED = 256
+
+
+class _SourceEntry:
+    __slots__ = ("stat_key", "text", "digest")
+
+    def __init__(self, stat_key, text, digest):
+        self.stat_key = stat_key
+        self.text = text
+        self.digest = digest
+
+
+class TemplateRegistry:
+    """Cache of template sources and compiled Jinja templates."""
+
+    def __init__(self, max_compiled=MAX_COMPILED):
+        self.max_compiled = max_compiled
+        self._sources = {}
+        self._compiled = OrderedDict()
+        self._env = None
+        self._lock = Lock()
+        # Serialises compiles; `_loading` hands the entry's text to the loader
+        self._compile_lock = Lock()
+        self._loading = None
+        self._stats = {"source_hits": 0, "source_reads": 0, "compile_hits": 0, "compiles": 0}
+
+    def _entry(self, path):
+        key = os.path.abspath(str(path))
+        st = os.stat(key)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._sources.get(key)
+            if entry is not None and entry.stat_key == stat_key:
+                self._stats["source_hits"] += 1
+                return key, entry
+        with open(key, "rb") as f:
+            data = f.read()
+        # Universal newlines, as with text-mode reads
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        entry = _SourceEntry(stat_key, text, hashlib.sha256(data).hexdigest())
+        with self._lock:
+            self._sources[key] = entry
+            self._stats["source_reads"] += 1
+        return key, entry
+
+    def read(self, path):
+        """Return template source text for `path` (cached)."""
+        return self._entry(path)[1].text
+
+    def content_hash(self, path):
+        return self._entry(path)[1].digest
+
+    def jinja(self, path):
+        """Return a compiled `jinja2.Template` for `path` (cached by path and content hash)."""
+        key, entry = self._entry(path)
+        ckey = (key, entry.digest)
+        with self._lock:
+            tmpl = self._compiled.get(ckey)
+            if tmpl is not None:
+                self._compiled.move_to_end(ckey)
+                self._stats["compile_hits"] += 1
+                return tmpl
+        env = self.environment()
+        name = f"{entry.digest}:{key}"
+        # Compile the source read above, even if the file has changed since
+        with self._compile_lock:
+            self._loading = (name, entry.text)
+            try:
+                tmpl = env.get_template(name)
+            finally:
+                self._loading = None
+        with self._lock:
+            self._compiled[ckey] = tmpl
+            self._compiled.move_to_end(ckey)
+            while len(self._compiled) > self.max_compiled:
+                self._compiled.popitem(last=False)
+            self._stats["compiles"] += 1
+        return tmpl
+
+    def environment(self):
+        """Shared Jinja environment (defaults match `jinja2.Template(source)`)."""
+        with self._lock:
+            if self._env is None:
+                self._env = self._new_environment()
+            return self._env
+
+    def _new_environment(self):
+        from jinja2 import Environment, FunctionLoader
+        from jinja2.bccache import BytecodeCache
+
+        max_entries = self.max_compiled
+
+        class _MemoryBytecodeCache(BytecodeCache):
+            def __init__(self):
+                self._store = OrderedDict()
+
+            def load_bytecode(self, bucket):
+                code = self._store.get(bucket.key)
+                if code is not None:
+                    bucket.bytecode_from_string(code)
+
+            def dump_bytecode(self, bucket):
+                self._store[bucket.key] = bucket.bytecode_to_string()
+                while len(self._store) > max_entries:
+                    self._store.popitem(last=False)
+
+            def clear(self):
+                self._store.clear()
+
+        def _load(name):
+            # Only called from `jinja`, which hands over the source it read
+            loading = self._loading
+            if loading is None or loading[0] != name:
+                return None
+            path = name.partition(":")[2]
+            return loading[1], path, lambda: True
+
+        return Environment(loader=FunctionLoader(_load),
+                           bytecode_cache=_MemoryBytecodeCache(),
+                           cache_size=max_entries,
+                           auto_reload=False)
+
+    def stats(self):
+        with self._lock:
+            out = dict(self._stats)
+            out["templates"] = len(self._compiled)
+            return out
+
+    def clear(self):
+        with self._lock:
+            self._sources.clear()
+            self._compiled.clear()
+            for k in self._stats:
+                self._stats[k] = 0
+            self._env = None
+
+
+_REGISTRY = TemplateRegistry()
+
+
+def get_template_registry():
+    """Return the process-wide `TemplateRegistry`."""
+    return _REGISTRY
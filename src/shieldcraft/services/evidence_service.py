@@ -11,6 +11,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 
+from shieldcraft.snapshot.hash_cache import get_hash_cache
+
 
 class EvidenceService:
     """
@@ -118,18 +120,16 @@ class EvidenceService:
         """Collect artifact metadata."""
         artifacts = []
         if os.path.exists(artifacts_dir):
-            for root, dirs, files in os.walk(artifacts_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, artifacts_dir)
-                    with open(file_path, 'rb') as f:
-                        file_hash = hashlib.sha256(f.read()).hexdigest()
-
-                    artifacts.append({
-                        "path": rel_path,
-                        "hash": file_hash,
-                        "size": os.path.getsize(file_path)
-                    })
+            file_paths = [os.path.join(root, file)
+                          for root, dirs, files in os.walk(artifacts_dir) for file in files]
+            cache = get_hash_cache()
+            for file_path, (file_hash, size) in zip(file_paths, cache.hash_files(file_paths)):
+                artifacts.append({
+                    "path": os.path.relpath(file_path, artifacts_dir),
+                    "hash": file_hash,
+                    "size": size
+                })
+            cache.save()
         return artifacts
 
     def _collect_logs(self, run_data: Dict) -> List[Dict]:
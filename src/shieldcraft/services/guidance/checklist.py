@@ -7,6 +7,23 @@ from __future__ import annotations
 
 from typing import List, Dict
 
+from shieldcraft.util.keywords import OBLIGATION_SCANNER, KeywordScanner
+
+# Keyword-driven intent mapping; the first keyword present decides
+_INTENT_MAP = {
+    "must": "safety",
+    "must not": "refusal",
+    "never": "refusal",
+    "requires": "governance",
+    "refuse": "refusal",
+    "determin": "determinism",
+    "artifact": "output_contract",
+    "output": "output_contract",
+    "policy": "governance",
+    "governance": "governance",
+    "safe": "safety",
+}
+_INTENT_KEYWORDS = KeywordScanner({k: (k,) for k in _INTENT_MAP})
 
 # Static mapping by classification keywords to relevance and applicable states.
 # Deterministic and code-defined; can be extended as needed.
@@ -104,21 +121,6 @@ def enrich_with_confidence_and_evidence(items: List[Dict], spec: Dict | None = N
     from ..checklist.extractor import SpecExtractor
     extractor = SpecExtractor()
 
-    # Keyword-driven intent mapping
-    intent_map = {
-        "must": "safety",
-        "must not": "refusal",
-        "never": "refusal",
-        "requires": "governance",
-        "refuse": "refusal",
-        "determin": "determinism",
-        "artifact": "output_contract",
-        "output": "output_contract",
-        "policy": "governance",
-        "governance": "governance",
-        "safe": "safety",
-    }
-
     for it in items:
         ptr = it.get("ptr")
         value = it.get("value")
@@ -145,7 +147,7 @@ def enrich_with_confidence_and_evidence(items: List[Dict], spec: Dict | None = N
             lowtxt = ""
         if "/sections" in (ptr or ""):
             is_prose = True
-        if any(p in (lowv or lowtxt) for p in ("must", "never", "requires", "should", "must not", "refuse")):
+        if OBLIGATION_SCANNER.matches(lowv or lowtxt):
             is_prose = True
 
         # Confidence assignment
@@ -184,12 +186,8 @@ def enrich_with_confidence_and_evidence(items: List[Dict], spec: Dict | None = N
                 it["confidence_meta"] = {"source": "derived", "justification": "explicit_fields"}
 
         # Intent category detection (keyword-based)
-        lowtxt = (_text or "").lower()
-        cat = "misc"
-        for k, v in intent_map.items():
-            if k in lowtxt:
-                cat = v
-                break
+        found = _INTENT_KEYWORDS.classes(_text or "")
+        cat = next((v for k, v in _INTENT_MAP.items() if k in found), "misc")
         # If pointer indicates governance
         if "/governance" in (ptr or ""):
             cat = "governance"
@@ -0,0 +1,221 @@
+"""
+Run-scoped in-memory bus for self-host JSON artifacts.
+
+Self-host stages hand results to each other through `.selfhost_outputs`:
+one stage writes `requirements.json`, `spec_coverage.json`, ... and the next
+reads them back. Inside `artifact_bus()` those handoffs stay in memory:
+
+- `write_json` serializes the object at once (with the same `json.dump`
+  arguments the stages always used, so file bytes are unchanged), keeps the
+  object for readers and queues the file write on a background thread.
+- `read_json`, `artifact_exists` and `artifact_sha256` answer from the bus
+  first and fall back to the filesystem; files read from disk are kept,
+  keyed by (mtime, size), so a second read does not parse them again.
+- Leaving the block flushes every pending write; repeated writes to one path
+  are coalesced into the last one.
+
+Objects returned by `read_json` are shared with other readers and must not
+be mutated; copy them first. Outside a bus every helper reads and writes
+files directly, as before.
+
+The active bus lives in a context variable, so it follows the run into
+threads started through `shieldcraft.util.run_scope.bind`.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Artifact(NamedTuple):
+    obj: Any
+    # Serialized file content; None for entries read from disk
+    text: Optional[str]
+    # (mtime_ns, size) of the file an entry was read from
+    stat: Optional[Tuple[int, int]] = None
+
+
+def _stat(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class ArtifactBus:
+    """In-memory artifacts keyed by absolute path, with write-behind to disk."""
+
+    def __init__(self):
+        self._artifacts: Dict[str, Artifact] = {}
+        self._pending: Dict[str, str] = {}
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-bus")
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def _publish(self, key: str, artifact: Artifact) -> None:
+        with self._lock:
+            self._artifacts[key] = artifact
+            self._pending[key] = artifact.text
+            self._futures.append(self._executor.submit(self._write, key))
+
+    def write_json(self, path: str, obj: Any, indent: Optional[int] = 2, sort_keys: bool = True) -> str:
+        """Publish `obj` as the content of `path` and queue the file write."""
+        self._publish(self._key(path), Artifact(obj, json.dumps(obj, indent=indent, sort_keys=sort_keys)))
+        return path
+
+    def _write(self, key: str) -> None:
+        with self._lock:
+            text = self._pending.pop(key, None)
+        if text is None:
+            # A later write of the same path already landed
+            return
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        tmp = key + '.tmp'
+        with open(tmp, 'w', encoding='utf8') as f:
+            f.write(text)
+        os.replace(tmp, key)
+
+    def published(self, path: str) -> Optional[Artifact]:
+        """The artifact written to `path` on this bus, if any."""
+        with self._lock:
+            artifact = self._artifacts.get(self._key(path))
+        return artifact if artifact is not None and artifact.text is not None else None
+
+    def read_json(self, path: str) -> Any:
+        """Return the artifact at `path`.
+
+        Files read from disk are kept while their (mtime, size) is unchanged,
+        so files other code rewrites directly are re-read.
+        """
+        key = self._key(path)
+        with self._lock:
+            artifact = self._artifacts.get(key)
+        if artifact is not None and artifact.text is not None:
+            return artifact.obj
+        stat = _stat(path)
+        if artifact is not None and artifact.stat == stat:
+            return artifact.obj
+        with open(path, encoding='utf-8') as f:
+            obj = json.load(f)
+        with self._lock:
+            current = self._artifacts.get(key)
+            if current is None or current.text is None:
+                self._artifacts[key] = Artifact(obj, None, stat)
+                return obj
+            return current.obj
+
+    def copy(self, src: str, dst: str) -> bool:
+        """Publish the artifact written to `src` at `dst`; False if `src` was not written here."""
+        artifact = self.published(src)
+        if artifact is None:
+            return False
+        if self._key(src) == self._key(dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        self._publish(self._key(dst), artifact)
+        return True
+
+    def flush(self) -> None:
+        """Wait for queued writes; re-raise the first write error."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        error = None
+        for fut in futures:
+            exc = fut.exception()
+            if exc is not None and error is None:
+                error = exc
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+_BUS: ContextVar[Optional[ArtifactBus]] = ContextVar("shieldcraft_artifact_bus", default=None)
+
+
+def current_bus() -> Optional[ArtifactBus]:
+    """Return the active artifact bus, or None outside `artifact_bus()`."""
+    return _BUS.get()
+
+
+@contextmanager
+def artifact_bus() -> Iterator[ArtifactBus]:
+    """Route artifact reads and writes in the block through a bus; flush on exit.
+
+    Nested use joins the active bus. A write error is raised on exit unless
+    the block itself is already raising.
+    """
+    active = _BUS.get()
+    if active is not None:
+        yield active
+        return
+    bus = ArtifactBus()
+    token = _BUS.set(bus)
+    try:
+        yield bus
+    except BaseException:
+        _BUS.reset(token)
+        try:
+            bus.close()
+        except Exception:
+            pass
+        raise
+    _BUS.reset(token)
+    bus.close()
+
+
+def write_json(path: str, obj: Any, indent: Optional[int] = 2, sort_keys: bool = True) -> str:
+    """Write `obj` to `path` as JSON, through the active bus if there is one."""
+    bus = _BUS.get()
+    if bus is not None:
+        return bus.write_json(path, obj, indent=indent, sort_keys=sort_keys)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf8') as f:
+        json.dump(obj, f, indent=indent, sort_keys=sort_keys)
+    os.replace(tmp, path)
+    return path
+
+
+def read_json(path: str) -> Any:
+    """Load the JSON artifact at `path`; raises like `json.load(open(path))` when absent or invalid."""
+    bus = _BUS.get()
+    if bus is not None:
+        return bus.read_json(path)
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def artifact_exists(path: str) -> bool:
+    bus = _BUS.get()
+    return (bus is not None and bus.published(path) is not None) or os.path.exists(path)
+
+
+def artifact_sha256(path: str) -> str:
+    """SHA-256 of the artifact's file content (pending content if written on the bus)."""
+    bus = _BUS.get()
+    artifact = bus.published(path) if bus is not None else None
+    if artifact is not None:
+        return hashlib.sha256(artifact.text.encode('utf8')).hexdigest()
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(8192), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def copy_artifact(src: str, dst: str) -> None:
+    """Copy the artifact at `src` to `dst`, like `shutil.copyfile`."""
+    bus = _BUS.get()
+    if bus is None or not bus.copy(src, dst):
+        shutil.copyfile(src, dst)
@@ -0,0 +1,260 @@
+"""
+Local Job Runner for ShieldCraft Engine.
+Bounded queue and worker thread pool for manufacture runs (alternative to SQS + Lambda).
+"""
+
+import json
+import math
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from shieldcraft.services.artifact_store import LocalArtifactStore
+from shieldcraft.services.state_store import LocalStateStore
+
+DEFAULT_SCHEMA_PATH = str(Path(__file__).resolve().parent.parent / "dsl" / "schema" / "se_dsl.schema.json")
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def _product_id(session) -> str:
+    """Product id the engine will write under; load errors are left to the run itself."""
+    try:
+        spec = session.load()
+    except Exception:
+        return "unknown"
+    metadata = spec.get("metadata") if isinstance(spec, dict) else None
+    return (metadata or {}).get("product_id", "unknown")
+
+
+class QueueFullError(RuntimeError):
+    """Raised by `LocalJobRunner.submit` when the run queue is at capacity."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"run queue full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class LocalJobRunner:
+    """
+    Executes submitted runs on a fixed pool of worker threads.
+
+    Each worker keeps one warm Engine and resets its per-run state between
+    jobs. Engines write to CWD-relative paths (`products/<product_id>/`, and
+    `.selfhost_outputs/` in self-host mode), so runs of the same product are
+    serialised, as are self-host runs; other runs execute concurrently.
+    Status transitions (accepted -> running -> completed/failed) are
+    persisted through `LocalStateStore`; run outputs are written to
+    `LocalArtifactStore`. Status reads are served from an in-memory mirror of
+    the persisted state and fall back to the state store for runs that are no
+    longer retained in memory.
+    """
+
+    def __init__(self, schema_path: str = DEFAULT_SCHEMA_PATH,
+                 state_store: Optional[LocalStateStore] = None,
+                 artifact_store: Optional[LocalArtifactStore] = None,
+                 workers: int = 2, max_queue: int = 16, retain: int = 1024):
+        self.schema_path = schema_path
+        self.state_store = state_store if state_store is not None else LocalStateStore()
+        self.artifact_store = artifact_store if artifact_store is not None else LocalArtifactStore()
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.retain = retain
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        self._runs = OrderedDict()
+        self._done = {}
+        self._lock = threading.Lock()
+        self._durations = deque(maxlen=32)
+        self._threads = []
+        self._output_locks: Dict[str, threading.Lock] = {}
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent; `submit` calls this)."""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f"shieldcraft-job-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once the queued runs have drained."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for t in threads:
+                t.join()
+
+    def submit(self, request: Dict[str, Any]) -> str:
+        """
+        Queue a manufacture request.
+
+        Args:
+            request: Request body with `spec_source` (spec path or inline spec
+                dict) and optional `run_options` (`dry_run`, `mode`)
+
+        Returns:
+            Run identifier
+
+        Raises:
+            QueueFullError: The queue is at capacity
+        """
+        self.start()
+        run_id = str(uuid.uuid4())
+        state = {
+            "id": run_id,
+            "status": "accepted",
+            "created_at": _now(),
+            "spec": request,
+            "result": None
+        }
+        # Persist before enqueueing so a worker's "running" write always lands last
+        self._record(run_id, state)
+        try:
+            self._queue.put_nowait((run_id, request))
+        except queue.Full:
+            with self._lock:
+                self._runs.pop(run_id, None)
+                self._done.pop(run_id, None)
+            self.state_store.delete_run_state(run_id)
+            raise QueueFullError(self.retry_after())
+        return run_id
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return the current state of a run, or None if unknown."""
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is not None:
+                return dict(state)
+        return self.state_store.load_run_state(run_id)
+
+    def wait(self, run_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until a run reaches a terminal status (or `timeout` elapses)."""
+        with self._lock:
+            done = self._done.get(run_id)
+        if done is not None:
+            done.wait(timeout)
+        return self.get_run(run_id)
+
+    def retry_after(self) -> int:
+        """Estimated seconds until a queue slot frees up."""
+        with self._lock:
+            avg = sum(self._durations) / len(self._durations) if self._durations else 1.0
+        return max(1, math.ceil(avg * (self._queue.qsize() + 1) / self.workers))
+
+    def _record(self, run_id: str, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self._runs[run_id] = state
+            if run_id not in self._done:
+                self._done[run_id] = threading.Event()
+            if state["status"] in TERMINAL_STATUSES:
+                self._done[run_id].set()
+                self._evict()
+        self.state_store.save_run_state(run_id, state)
+
+    def _evict(self) -> None:
+        # Drop the oldest finished runs from memory; the state store keeps them
+        excess = len(self._runs) - self.retain
+        if excess <= 0:
+            return
+        for run_id in [r for r, s in self._runs.items() if s["status"] in TERMINAL_STATUSES][:excess]:
+            del self._runs[run_id]
+            self._done.pop(run_id, None)
+
+    def _worker(self) -> None:
+        from shieldcraft.engine import Engine
+        engine = Engine(self.schema_path)
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._run_job(engine, *job)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, engine, run_id: str, request: Dict[str, Any]) -> None:
+        with self._lock:
+            state = dict(self._runs.get(run_id) or {})
+        state.update(status="running", started_at=_now())
+        self._record(run_id, state)
+
+        start = time.perf_counter()
+        state = dict(state)
+        try:
+            result = self._execute(engine, request)
+            state["result"] = self._store_outputs(run_id, request, result)
+            state["status"] = "completed"
+        except Exception as e:
+            state["status"] = "failed"
+            state["error"] = str(e)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._durations.append(elapsed)
+        state["completed_at"] = _now()
+        self._record(run_id, state)
+
+    def _execute(self, engine, request: Dict[str, Any]) -> Dict[str, Any]:
+        from shieldcraft.engine_batch import _reset_run_state
+        from shieldcraft.services.spec.session import CompilationSession
+
+        _reset_run_state(engine)
+        source = request["spec_source"]
+        options = request.get("run_options") or {}
+        dry_run = bool(options.get("dry_run", False))
+        mode = options.get("mode") or ("self_host" if dry_run else "execute")
+
+        if isinstance(source, dict):
+            spec_path, session = None, CompilationSession.from_spec(source)
+        else:
+            spec_path = str(source)
+            session = engine.compile(spec_path)
+        if mode not in ("self_host", "execute"):
+            raise ValueError(f"unknown run mode: {mode}")
+
+        keys = [f"product:{_product_id(session)}"] + (["self_host"] if mode == "self_host" else [])
+        locks = self._locks_for(keys)
+        for lock in locks:
+            lock.acquire()
+        try:
+            if mode == "self_host":
+                return engine.run_self_host(session.load(), dry_run=dry_run, session=session)
+            return engine.execute(spec_path, session=session)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _locks_for(self, keys):
+        # Sorted, so two runs needing the same locks take them in the same order
+        with self._lock:
+            return [self._output_locks.setdefault(k, threading.Lock()) for k in sorted(keys)]
+
+    def _store_outputs(self, run_id: str, request: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        dry_run = bool((request.get("run_options") or {}).get("dry_run", False))
+        outputs = {"preview.json" if dry_run else "result.json": result}
+        if isinstance(result.get("checklist"), (dict, list)):
+            outputs["checklist.json"] = result["checklist"]
+
+        artifacts = []
+        for artifact_id, payload in outputs.items():
+            content = json.dumps(payload, indent=2, sort_keys=True, default=str).encode("utf-8")
+            if self.artifact_store.store_artifact(run_id, artifact_id, content,
+                                                  {"type": "application/json"}):
+                artifacts.append(artifact_id)
+        return {
+            "artifacts": artifacts,
+            "primary_outcome": result.get("primary_outcome"),
+            "refusal": result.get("refusal")
+        }
@@ -2,6 +2,7 @@
 Builds dependency graph from rules_contract.rules.
 Assumes each rule may declare: depends_on: [rule_ids]
 """
+from shieldcraft.util.graph import iter_back_edges
 
 
 def build_graph(rules):
@@ -26,25 +27,8 @@ def build_graph(rules):
 
 
 def detect_cycles(graph):
-    visited = set()
-    stack = set()
-    cycles = []
-
-    def dfs(node):
-        if node in stack:
-            cycles.append(node)
-            return
-        if node in visited:
-            return
-        visited.add(node)
-        stack.add(node)
-        for nxt in graph.get(node, []):
-            dfs(nxt)
-        stack.remove(node)
-
-    for n in graph:
-        dfs(n)
-    return cycles
+    """Return each node reached again while still on the DFS path, in discovery order."""
+    return [node for node, _ in iter_back_edges(graph, graph)]
 
 
 def compute_hash(graph):
@@ -132,8 +132,12 @@ class SpecModel:
         """
         entity_map = {}
 
-        # Walk AST and map top-level entities
-        for node in self.ast.walk():
+        # Use the AST pointer index when present; otherwise walk the tree
+        index = getattr(self.ast, "index", None)
+        nodes = index.by_pointer.values() if index is not None else self.ast.walk()
+
+        # Map top-level entities
+        for node in nodes:
             if node.ptr and node.ptr.count('/') == 2:  # Top-level: /section/entity
                 entity_map[node.ptr] = {
                     "node_id": id(node),
@@ -8,6 +8,30 @@ def extract_json_pointers(spec, base=""):
     return canonical_extract(spec, base)
 
 
+def _ast_pointers(ast):
+    """
+    Return the set of pointers present in an AST.
+    Uses the root's pointer index when available; falls back to a walk
+    (AST nodes) or the legacy `{"nodes": [...]}` dict shape.
+    """
+    index = getattr(ast, 'index', None)
+    if index is not None:
+        return set(index.pointers())
+
+    ast_pointers = set()
+    if hasattr(ast, 'walk'):
+        for node in ast.walk():
+            if getattr(node, 'ptr', None):
+                ast_pointers.add(node.ptr)
+    elif isinstance(ast, dict):
+        for node in ast.get("nodes", []):
+            if isinstance(node, dict) and node.get("ptr"):
+                ast_pointers.add(node["ptr"])
+            elif getattr(node, 'ptr', None):
+                ast_pointers.add(node.ptr)
+    return ast_pointers
+
+
 def ensure_full_pointer_coverage(a, b):
     """
     Dual-mode pointer coverage utility.
@@ -31,15 +55,7 @@ def ensure_full_pointer_coverage(a, b):
         ast = b
         raw_pointers = extract_json_pointers(raw)
 
-        ast_pointers = set()
-        if hasattr(ast, 'walk'):
-            for node in ast.walk():
-                if node.ptr:
-                    ast_pointers.add(node.ptr)
-        elif isinstance(ast, dict):
-            for node in ast.get('nodes', []):
-                if isinstance(node, dict) and node.get('ptr'):
-                    ast_pointers.add(node['ptr'])
+        ast_pointers = _ast_pointers(ast)
 
         # Return list of AST pointers not in raw spec (legacy behavior)
         uncovered_ast_pointers = sorted(list(ast_pointers - raw_pointers))
@@ -47,18 +63,7 @@ def ensure_full_pointer_coverage(a, b):
 
     all_pointers = extract_json_pointers(raw)
 
-    ast_pointers = set()
-    if hasattr(ast, 'walk'):
-        for node in ast.walk():
-            if node.ptr:
-                ast_pointers.add(node.ptr)
-    elif isinstance(ast, dict):
-        ast_nodes = ast.get("nodes", [])
-        for node in ast_nodes:
-            if isinstance(node, dict) and node.get("ptr"):
-                ast_pointers.add(node["ptr"])
-            elif hasattr(node, 'ptr') and node.ptr:
-                ast_pointers.add(node.ptr)
+    ast_pointers = _ast_pointers(ast)
 
     # Determine missing and ok
     missing = sorted(list(all_pointers - ast_pointers))
@@ -101,11 +106,7 @@ def check_unreachable_pointers(ast, raw):
     raw_pointers = extract_json_pointers(raw)
 
     # Extract all pointers from AST
-    ast_pointers = set()
-    if hasattr(ast, 'walk'):
-        for node in ast.walk():
-            if hasattr(node, 'ptr') and node.ptr:
-                ast_pointers.add(node.ptr)
+    ast_pointers = _ast_pointers(ast)
 
     # Canonical specs may have additional _metadata keys - filter them out
     if isinstance(raw, dict):
@@ -132,18 +133,7 @@ def ensure_full_pointer_coverage_old(raw, ast):
     raw_pointers = extract_json_pointers(raw)
 
     # Extract all pointers from AST
-    ast_pointers = set()
-    if hasattr(ast, 'walk'):
-        for node in ast.walk():
-            if node.ptr:
-                ast_pointers.add(node.ptr)
-    elif isinstance(ast, dict):
-        ast_nodes = ast.get("nodes", [])
-        for node in ast_nodes:
-            if isinstance(node, dict) and node.get("ptr"):
-                ast_pointers.add(node["ptr"])
-            elif hasattr(node, 'ptr') and node.ptr:
-                ast_pointers.add(node.ptr)
+    ast_pointers = _ast_pointers(ast)
 
     # Find pointers in AST but not in raw
     uncovered_ast_pointers = ast_pointers - raw_pointers
@@ -0,0 +1,115 @@
+"""Process-wide registry of compiled JSON Schema validators.
+
+Schemas are loaded, parsed and compiled once per process and reused by the
+engine, the canonical loader, DSL section analysis and preflight. Entries are
+keyed by resolved schema path and validator class; a cached entry is reused
+while the file's (mtime_ns, size) is unchanged. When the stat changes the file
+is re-hashed and only recompiled if its content actually changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+import jsonschema
+
+
+class _Entry:
+    __slots__ = ("stat_key", "digest", "schema", "validator", "checked")
+
+    def __init__(self, stat_key, digest, schema, validator):
+        self.stat_key = stat_key
+        self.digest = digest
+        self.schema = schema
+        self.validator = validator
+        self.checked = False
+
+
+class SchemaValidatorRegistry:
+    """Thread-safe cache of compiled validators with hit/miss counters."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, Any], _Entry] = {}
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get_validator(self, schema_path: str, cls: Optional[type] = None, check_schema: bool = False):
+        """Return a compiled validator for the schema file at `schema_path`.
+
+        `cls` selects the validator class; when omitted it is derived from the
+        schema's `$schema` keyword (defaulting to Draft 2020-12). With
+        `check_schema=True` the schema itself is checked once per compiled
+        entry, raising `jsonschema.SchemaError` if it is invalid.
+
+        Raises FileNotFoundError if the schema path does not exist.
+        """
+        path = os.path.abspath(str(schema_path))
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema path not found: {schema_path}")
+        stat_key = (st.st_mtime_ns, st.st_size)
+        key = (path, cls)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stat_key == stat_key:
+                self._stats["hits"] += 1
+                return self._checked(entry, check_schema)
+
+            with open(path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged: keep the compiled validator.
+                entry.stat_key = stat_key
+                self._stats["hits"] += 1
+                return self._checked(entry, check_schema)
+
+            if entry is not None:
+                self._stats["invalidations"] += 1
+            self._stats["misses"] += 1
+            schema = json.loads(content.decode("utf-8"))
+            vcls = cls or jsonschema.validators.validator_for(schema, default=jsonschema.Draft202012Validator)
+            entry = _Entry(stat_key, digest, schema, vcls(schema))
+            self._entries[key] = entry
+            return self._checked(entry, check_schema)
+
+    @staticmethod
+    def _checked(entry: _Entry, check_schema: bool):
+        if check_schema and not entry.checked:
+            type(entry.validator).check_schema(entry.schema)
+            entry.checked = True
+        return entry.validator
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["entries"] = len(self._entries)
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for k in self._stats:
+                self._stats[k] = 0
+
+
+_REGISTRY = SchemaValidatorRegistry()
+
+
+def get_validator(schema_path: str, cls: Optional[type] = None, check_schema: bool = False):
+    """Return the process-wide compiled validator for `schema_path`."""
+    return _REGISTRY.get_validator(schema_path, cls=cls, check_schema=check_schema)
+
+
+def validator_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/invalidation counters and the number of cached entries."""
+    return _REGISTRY.stats()
+
+
+def clear_validator_cache() -> None:
+    _REGISTRY.clear()
@@ -1,6 +1,7 @@
-import json
 import jsonschema
 
+from shieldcraft.services.spec.schema_registry import get_validator
+
 
 def normalize_spec(spec):
     """
@@ -41,18 +42,14 @@ def validate_spec_against_schema(spec, schema):
     """
     Validate spec dict using provided JSON Schema.
     Returns (valid: bool, errors: list[str]).
+
+    Schema paths are compiled once per process through the shared validator
+    registry (see `schema_registry`); schema dicts are compiled per call.
     """
-    # If schema is a file path, load it
     if isinstance(schema, str):
-        from pathlib import Path
-        schema_path = Path(schema)
-        if schema_path.exists():
-            with open(schema_path, encoding='utf-8') as f:
-                schema = json.load(f)
-        else:
-            raise FileNotFoundError(f"Schema path not found: {schema}")
-
-    validator = jsonschema.Draft202012Validator(schema)
+        validator = get_validator(schema, cls=jsonschema.Draft202012Validator)
+    else:
+        validator = jsonschema.Draft202012Validator(schema)
     errors = sorted(validator.iter_errors(spec), key=lambda e: e.path)
     if errors:
         return False, [f"{'.'.join([str(p) for p in e.path])}: {e.message}" for e in errors]
@@ -0,0 +1,141 @@
+"""
+Spec compilation session.
+
+A `CompilationSession` owns the artifacts produced while compiling a single
+spec (loaded `SpecModel`, normalized spec dict, fingerprint, AST and schema
+validation result) so that engine entrypoints chaining into each other
+(`execute` -> `run`, `generate_code` -> `run`, self-host re-entry) reuse them
+instead of re-reading, re-validating and rebuilding from scratch.
+
+Each stage is idempotent: calling it a second time returns the cached result.
+Per-stage wall times are recorded in `timings` (seconds, insertion ordered).
+"""
+import time
+from contextlib import contextmanager
+
+
+class CompilationSession:
+    """
+    Run-scoped cache of spec compilation artifacts with per-stage timings.
+    """
+
+    def __init__(self, spec_path=None, spec=None):
+        self.spec_path = spec_path
+        self.spec = spec
+        self.spec_model = None
+        self.ast = None
+        self.fingerprint = None
+        self.valid = None
+        self.errors = []
+        self.timings = {}
+        self._loaded = spec is not None
+        self._canonical = False
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Create a session for an already-loaded spec dict."""
+        return cls(spec_path=None, spec=spec)
+
+    @contextmanager
+    def stage(self, name):
+        """Time a named stage; repeated stages accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def load(self):
+        """
+        Load the spec from `spec_path` via the canonical DSL loader.
+
+        Canonical specs yield a `SpecModel` whose AST and fingerprint are
+        adopted directly; legacy payloads are canonicalized into a dict.
+        Loader exceptions propagate to the caller.
+        """
+        if self._loaded:
+            return self.spec
+        from shieldcraft.dsl.loader import load_spec
+        from shieldcraft.services.spec.model import SpecModel
+        from shieldcraft.util.json_canonicalizer import canonicalize
+
+        with self.stage("load"):
+            raw = load_spec(self.spec_path)
+            if isinstance(raw, SpecModel):
+                self.spec_model = raw
+                self.spec = raw.raw
+                self.ast = raw.ast
+                self.fingerprint = raw.fingerprint
+                self._canonical = True
+            else:
+                self.spec = canonicalize(raw) if not isinstance(raw, dict) else raw
+        self._loaded = True
+        return self.spec
+
+    def validate(self, schema_path, validator=None):
+        """
+        Validate the loaded spec against `schema_path`.
+
+        Specs loaded as `SpecModel` were validated by the canonical loader and
+        are accepted as-is. On success, dict-shaped sections are adapted to the
+        canonical list form. `validator` defaults to
+        `validate_spec_against_schema`. Returns `(valid, errors)`.
+        """
+        if self.valid is not None:
+            return self.valid, self.errors
+        self.load()
+        if self._canonical:
+            self.valid, self.errors = True, []
+            return self.valid, self.errors
+
+        if validator is None:
+            from shieldcraft.services.spec.schema_validator import validate_spec_against_schema
+            validator = validate_spec_against_schema
+
+        with self.stage("validate"):
+            valid, errors = validator(self.spec, schema_path)
+        self.valid, self.errors = valid, errors
+        if valid and isinstance(self.spec.get("sections"), dict):
+            from shieldcraft.services.spec.normalization import adapt_sections
+            self.spec["sections"] = adapt_sections(self.spec["sections"])
+        return self.valid, self.errors
+
+    def build(self, ast_builder=None):
+        """
+        Build (once) the AST, fingerprint and `SpecModel` for the loaded spec.
+        """
+        if self.ast is not None and self.spec_model is not None:
+            return self.ast
+        self.load()
+        from shieldcraft.services.spec.fingerprint import compute_spec_fingerprint
+        from shieldcraft.services.spec.model import SpecModel
+
+        if self.ast is None:
+            if ast_builder is None:
+                from shieldcraft.services.ast.builder import ASTBuilder
+                ast_builder = ASTBuilder()
+            with self.stage("ast"):
+                self.ast = ast_builder.build(self.spec)
+        if self.fingerprint is None:
+            with self.stage("fingerprint"):
+                self.fingerprint = compute_spec_fingerprint(self.spec)
+        if self.spec_model is None:
+            self.spec_model = SpecModel(self.spec, self.ast, self.fingerprint)
+        return self.ast
+
+    def compile(self, schema_path, ast_builder=None, validator=None):
+        """Run load, validate and (when valid) build. Returns `self`."""
+        self.load()
+        valid, _ = self.validate(schema_path, validator=validator)
+        if valid:
+            self.build(ast_builder)
+        return self
+
+    def timings_report(self):
+        """Return the per-stage timing summary in milliseconds."""
+        stages = {name: round(secs * 1000.0, 3) for name, secs in self.timings.items()}
+        return {
+            "stages": stages,
+            "total_ms": round(sum(self.timings.values()) * 1000.0, 3),
+        }
@@ -2,6 +2,8 @@ import hashlib
 import json
 import os
 
+from shieldcraft.util.side_effects import side_effect
+
 
 def compute_run_signature(result):
     """
@@ -20,6 +22,7 @@ def compute_run_signature(result):
     return hashlib.sha256(json.dumps(base, sort_keys=True).encode("utf-8")).hexdigest()
 
 
+@side_effect(default=False)
 def compare_to_previous(product_id, signature):
     """
     Compare signature to previous run stored at:
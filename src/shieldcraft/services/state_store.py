@@ -1,26 +1,62 @@
 """
 Local State Store for ShieldCraft Engine.
-Simple file-based implementation (alternative to DynamoDB).
+SQLite-backed implementation (alternative to DynamoDB).
 """
 
 import json
-import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
 
+from shieldcraft.services.sqlite_db import SQLiteDatabase
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    status TEXT,
+    product_id TEXT,
+    created_at TEXT,
+    state TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, created_at);
+CREATE INDEX IF NOT EXISTS runs_product ON runs (product_id, created_at);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created_at);
+"""
+
+_UPSERT = ("INSERT INTO runs (run_id, status, product_id, created_at, state) VALUES (?, ?, ?, ?, ?) "
+           "ON CONFLICT(run_id) DO UPDATE SET status = excluded.status, product_id = excluded.product_id, "
+           "created_at = excluded.created_at, state = excluded.state")
+
+
+def _product_id(state: Dict[str, Any]) -> Optional[str]:
+    spec = state.get("spec")
+    if not isinstance(spec, dict):
+        return None
+    source = spec.get("spec_source")
+    metadata = spec.get("metadata") or (source.get("metadata") if isinstance(source, dict) else None)
+    return metadata.get("product_id") if isinstance(metadata, dict) else None
+
+
+def _row(run_id: str, state: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (run_id, state.get("status"), _product_id(state), state.get("created_at"),
+            json.dumps(state, default=str))
+
 
 class LocalStateStore:
     """
-    Local file-based state store for run state persistence.
+    Local state store for run state persistence.
+
+    Run states live in `<storage_dir>/state.db` with indexed status,
+    product_id and created_at columns. Each save is a single atomic upsert.
     """
 
     def __init__(self, storage_dir: str = ".shieldcraft_state"):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
+        self.db = SQLiteDatabase(self.storage_dir / "state.db", _SCHEMA)
 
     def save_run_state(self, run_id: str, state: Dict[str, Any]) -> bool:
         """
-        Save run state to local file.
+        Save run state.
 
         Args:
             run_id: Unique run identifier
@@ -30,16 +66,35 @@ class LocalStateStore:
             Success status
         """
         try:
-            state_file = self.storage_dir / f"{run_id}.json"
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2, default=str)
+            with self.db.transaction() as conn:
+                conn.execute(_UPSERT, _row(run_id, state))
             return True
         except Exception:
             return False
 
+    def save_run_states(self, states: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Save many run states in one transaction.
+
+        Args:
+            states: (run_id, state) pairs
+
+        Returns:
+            Number of states written (0 on failure)
+        """
+        try:
+            return self._write_rows([_row(run_id, state) for run_id, state in states])
+        except Exception:
+            return 0
+
+    def _write_rows(self, rows: list) -> int:
+        with self.db.transaction() as conn:
+            conn.executemany(_UPSERT, rows)
+        return len(rows)
+
     def load_run_state(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
-        Load run state from local file.
+        Load run state.
 
         Args:
             run_id: Unique run identifier
@@ -48,43 +103,55 @@ class LocalStateStore:
             State data or None if not found
         """
         try:
-            state_file = self.storage_dir / f"{run_id}.json"
-            if state_file.exists():
-                with open(state_file, 'r') as f:
-                    return json.load(f)
+            row = self.db.connection().execute(
+                "SELECT state FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is not None:
+                return json.loads(row["state"])
         except Exception:
             pass
         return None
 
-    def list_runs(self, status_filter: Optional[str] = None) -> list:
+    def list_runs(self, status_filter: Optional[str] = None, product_id: Optional[str] = None,
+                  limit: Optional[int] = None) -> list:
         """
-        List all runs, optionally filtered by status.
+        List runs in creation order, optionally filtered by status and product.
 
         Args:
             status_filter: Optional status to filter by
+            product_id: Optional product id to filter by
+            limit: Optional maximum number of runs to return
 
         Returns:
             List of run summaries
         """
-        runs = []
-        for state_file in self.storage_dir.glob("*.json"):
-            try:
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
-                    if status_filter is None or state.get("status") == status_filter:
-                        runs.append({
-                            "run_id": state_file.stem,
-                            "status": state.get("status"),
-                            "created_at": state.get("created_at"),
-                            "spec_id": state.get("spec", {}).get("metadata", {}).get("product_id")
-                        })
-            except Exception:
-                continue
-        return runs
+        clauses, params = [], []
+        if status_filter is not None:
+            clauses.append("status = ?")
+            params.append(status_filter)
+        if product_id is not None:
+            clauses.append("product_id = ?")
+            params.append(product_id)
+        sql = "SELECT run_id, status, created_at, product_id FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at, run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        try:
+            rows = self.db.connection().execute(sql, params).fetchall()
+        except Exception:
+            return []
+        return [{
+            "run_id": row["run_id"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "spec_id": row["product_id"]
+        } for row in rows]
 
     def delete_run_state(self, run_id: str) -> bool:
         """
-        Delete run state file.
+        Delete run state.
 
         Args:
             run_id: Unique run identifier
@@ -93,9 +160,40 @@ class LocalStateStore:
             Success status
         """
         try:
-            state_file = self.storage_dir / f"{run_id}.json"
-            if state_file.exists():
-                state_file.unlink()
+            with self.db.transaction() as conn:
+                conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+    def migrate_legacy_files(self, remove: bool = False, batch_size: int = 1000) -> int:
+        """
+        Import `<run_id>.json` files written by the file-based store.
+
+        Args:
+            remove: Delete each file once its batch is committed
+            batch_size: Files per insert transaction
+
+        Returns:
+            Number of runs imported
+        """
+        imported = 0
+        files = sorted(self.storage_dir.glob("*.json"))
+        for i in range(0, len(files), batch_size):
+            batch = []
+            for state_file in files[i:i + batch_size]:
+                # A file that cannot be read or turned into a row stays on disk
+                try:
+                    with open(state_file, 'r') as f:
+                        batch.append((state_file, _row(state_file.stem, json.load(f))))
+                except Exception:
+                    continue
+            try:
+                written = self._write_rows([row for _, row in batch])
+            except Exception:
+                written = 0
+            imported += written
+            if remove and written:
+                for state_file, _ in batch:
+                    state_file.unlink()
+        return imported
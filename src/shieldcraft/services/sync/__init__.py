@@ -196,19 +196,17 @@ def verify_repo_state_authoritative(repo_root: str = ".") -> Dict[str, str]:
 
     if authority == "snapshot":
         # Validate snapshot exists and matches
-        validate_snapshot(snapshot_path, repo_root)
+        checked = validate_snapshot(snapshot_path, repo_root)
         # Return a synthetic response for compatibility
-        manifest = generate_snapshot(repo_root)
-        return {"ok": True, "authority": "snapshot", "sha256": manifest.get("tree_hash"), "artifact": snapshot_path}
+        return {"ok": True, "authority": "snapshot", "sha256": checked.get("tree_hash"), "artifact": snapshot_path}
 
     if authority == "snapshot_mandatory":
         # Same as snapshot but treat missing snapshot as fatal (validate_snapshot will raise)
-        validate_snapshot(snapshot_path, repo_root)
-        manifest = generate_snapshot(repo_root)
+        checked = validate_snapshot(snapshot_path, repo_root)
         return {
             "ok": True,
             "authority": "snapshot_mandatory",
-            "sha256": manifest.get("tree_hash"),
+            "sha256": checked.get("tree_hash"),
             "artifact": snapshot_path}
 
     if authority == "compare":
@@ -1,27 +1,90 @@
 """Spec gating utilities to enforce fuzz stability before generation."""
+import os
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+
 from shieldcraft.verification.spec_fuzzer import generate_mutations, classify_mutation
 from shieldcraft.verification.failure_classes import SPEC_CONTRADICTORY, SPEC_INCOMPLETE
+from shieldcraft.verification.test_registry import tests_root
+
+
+def _item_shape(result) -> set:
+    items = result.get("items") or result.get("checklist", {}).get("items", []) or []
+    return {it.get("ptr") for it in items}
+
+
+def build_mutation_shape(generator, mutated_spec, tests_dir):
+    """Build `mutated_spec` (dry run); return (item ptr shape, gate events, side effects).
+
+    Runs under a private checklist context with side effects deferred, and
+    discovers candidate tests under `tests_dir`, so it can execute in a
+    worker process whatever that process's working directory; the caller
+    re-records the events and applies the side effects in mutation order.
+    """
+    from shieldcraft.services.checklist.context import ChecklistContext
+    from shieldcraft.util.run_scope import run_scope
+    from shieldcraft.util.side_effects import deferred
+
+    ctx = ChecklistContext()
+    with run_scope(checklist_context=ctx, tests_root=tests_dir), deferred() as calls:
+        res = generator.build(mutated_spec, dry_run=True, run_fuzz=False, run_test_gate=False,
+                              incremental=True)
+    return _item_shape(res), ctx.get_events(), calls
 
 
-def enforce_spec_fuzz_stability(spec: dict, generator, max_variants: int = 5) -> None:
+def enforce_spec_fuzz_stability(spec: dict, generator, max_variants: int = 5,
+                                baseline=None, executor=None) -> None:
     """Run spec mutations and ensure checklist shape is stable and no critical failures.
 
+    `baseline` may be a checklist already built from `spec`; it is used as the
+    reference shape instead of rebuilding. With an `executor` (e.g. a process
+    pool) the mutation builds run concurrently; results, gate events and
+    build side effects are still taken in mutation order, and only for the
+    mutations a serial run would have built, so the outcome is the same.
+    A process pool that breaks raises BrokenProcessPool before any event or
+    side effect is applied, so the caller can rerun without one.
+
     Raises RuntimeError on detected classified failures or checklist drift.
     """
-    # Build baseline checklist (dry run to avoid artifact emission)
-    baseline = generator.build(spec, dry_run=True, run_fuzz=False, run_test_gate=False)
-    base_items = baseline.get("items") or baseline.get("checklist", {}).get("items", []) or []
-    base_shape = {it.get("ptr") for it in base_items}
-
-    muts = generate_mutations(spec)
-    for mutated_spec, kind, desc in muts[:max_variants]:
-        cls = classify_mutation(spec, mutated_spec, kind)
-        if cls in (SPEC_CONTRADICTORY, SPEC_INCOMPLETE):
-            raise RuntimeError(f"{cls}:{desc}")
-
-        # For stable classification, ensure checklist shape unchanged (disable nested fuzzing)
-        mutated_res = generator.build(mutated_spec, dry_run=True, run_fuzz=False, run_test_gate=False)
-        mut_items = mutated_res.get("items") or mutated_res.get("checklist", {}).get("items", []) or []
-        mut_shape = {it.get("ptr") for it in mut_items}
-        if base_shape != mut_shape:
-            raise RuntimeError(f"SPEC_DRIFT:{kind}:{desc}")
+    if baseline is None:
+        # Build baseline checklist (dry run to avoid artifact emission)
+        baseline = generator.build(spec, dry_run=True, run_fuzz=False, run_test_gate=False,
+                                   incremental=True)
+    base_shape = _item_shape(baseline)
+
+    muts = generate_mutations(spec)[:max_variants]
+    classes = [classify_mutation(spec, mutated_spec, kind) for mutated_spec, kind, _ in muts]
+    # Mutations after the first critical classification are never built
+    limit = next((i for i, cls in enumerate(classes) if cls in (SPEC_CONTRADICTORY, SPEC_INCOMPLETE)), len(muts))
+    futures = None
+    if executor is not None:
+        root = os.path.abspath(tests_root())
+        futures = [executor.submit(build_mutation_shape, generator, m[0], root) for m in muts[:limit]]
+        wait(futures)
+        for fut in futures:
+            if isinstance(fut.exception(), BrokenProcessPool):
+                raise fut.exception()
+
+    try:
+        for i, (mutated_spec, kind, desc) in enumerate(muts):
+            if i == limit:
+                raise RuntimeError(f"{classes[i]}:{desc}")
+
+            if futures is None:
+                # For stable classification, ensure checklist shape unchanged (disable nested fuzzing)
+                mutated_res = generator.build(mutated_spec, dry_run=True, run_fuzz=False,
+                                              run_test_gate=False, incremental=True)
+                mut_shape = _item_shape(mutated_res)
+            else:
+                mut_shape, events, calls = futures[i].result()
+                from shieldcraft.services.checklist.context import record_event_global
+                from shieldcraft.util.side_effects import apply
+                for evt in events:
+                    record_event_global(evt["gate_id"], evt["phase"], evt["outcome"],
+                                        message=evt.get("message"), evidence=evt.get("evidence"))
+                apply(calls)
+            if base_shape != mut_shape:
+                raise RuntimeError(f"SPEC_DRIFT:{kind}:{desc}")
+    finally:
+        for fut in futures or []:
+            fut.cancel()
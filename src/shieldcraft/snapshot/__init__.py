@@ -12,7 +12,10 @@ Snapshot contract (v1):
 This module provides:
 - `generate_snapshot(repo_root='.')` -> manifest dict
 - `write_snapshot(manifest, path=None)` -> writes canonical JSON to `artifacts/repo_snapshot.json` by default
-- `validate_snapshot(path, repo_root='.')` -> compares manifest to current repo and returns dict with `ok` or raises `SnapshotError`
+- `validate_snapshot(path, repo_root='.')` -> compares manifest to current repo and returns dict with `ok`
+  and the current `tree_hash`, or raises `SnapshotError`
+
+File digests are served from the stat-keyed cache in `shieldcraft.snapshot.hash_cache`.
 
 Determinism: manifest entries are sorted and canonicalized. No network access.
 """
@@ -23,6 +26,7 @@ import json
 import os
 from typing import Dict, List
 
+from shieldcraft.snapshot.hash_cache import get_hash_cache
 
 # Frozen include/exclude constants (do not modify lightly)
 SNAPSHOT_EXCLUDES = frozenset({".git", ".venv", "node_modules", "artifacts", ".selfhost_outputs", "dist", "build"})
@@ -76,7 +80,7 @@ def generate_snapshot(repo_root: str = ".", excludes: List[str] = None) -> Dict:
     else:
         excludes = set(excludes) | set(DEFAULT_EXCLUDES)
 
-    files = []
+    candidates = []
     # canonical traversal: walk sorted dirs and filenames, normalize paths
     for root, dirs, filenames in os.walk(repo_root, topdown=True):
         dirs[:] = [d for d in sorted(dirs) if d not in excludes]
@@ -90,9 +94,14 @@ def generate_snapshot(repo_root: str = ".", excludes: List[str] = None) -> Dict:
             # skip snapshot artifact by default to avoid self-inclusion
             if rel_path == DEFAULT_SNAPSHOT_PATH or rel_path.endswith("/" + os.path.basename(DEFAULT_SNAPSHOT_PATH)):
                 continue
-            sha = _compute_sha256(full)
-            size = os.path.getsize(full)
-            files.append({"path": rel_path, "sha256": sha, "size": size})
+            candidates.append((rel_path, full))
+
+    # content hashes come from the shared stat-keyed cache
+    cache = get_hash_cache()
+    hashed = cache.hash_files(full for _, full in candidates)
+    cache.save()
+    files = [{"path": rel_path, "sha256": sha, "size": size}
+             for (rel_path, _), (sha, size) in zip(candidates, hashed)]
 
     # sort files deterministically by path
     files.sort(key=lambda x: x["path"])
@@ -145,7 +154,7 @@ def validate_snapshot(path: str, repo_root: str = ".") -> Dict:
         raise SnapshotError(SNAPSHOT_MISMATCH, "repo tree does not match snapshot", {
                             "expected": manifest.get("tree_hash"), "actual": current.get("tree_hash")})
 
-    return {"ok": True}
+    return {"ok": True, "tree_hash": current.get("tree_hash")}
 
 
 def _validate_manifest_structure(manifest: Dict) -> None:
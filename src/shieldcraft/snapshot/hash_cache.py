@@ -0,0 +1,145 @@
+"""Stat-keyed SHA-256 cache for repository files.
+
+Entries are keyed by absolute path and validated against the file's
+(size, mtime_ns, inode); content is re-hashed only when one of those changes.
+Misses are hashed on a thread pool when there are enough of them (file reads
+and hashlib both release the GIL), which mainly helps cold starts.
+
+The process-wide cache is persisted to the file named by
+`SHIELDCRAFT_HASH_CACHE` when that variable is set; otherwise it lives in
+memory for the life of the process.
+
+Entries whose mtime is too close to the time they were hashed are not
+trusted on later lookups: a write landing in the same mtime tick as the hash
+would otherwise go unnoticed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CACHE_VERSION = 1
+# Below this many misses hashing stays on the calling thread
+PARALLEL_THRESHOLD = 64
+# Entries hashed within this window of their mtime are re-hashed on next use
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class FileHashCache:
+    """Cache of file digests keyed by (path, size, mtime_ns, inode)."""
+
+    def __init__(self, path: Optional[str] = None, workers: Optional[int] = None):
+        self.path = path
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 2)
+        self._entries: Dict[str, list] = {}
+        self._lock = Lock()
+        self._loaded = False
+        self._dirty = False
+        self._stats = {"hits": 0, "misses": 0}
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+            self._entries = data["entries"]
+
+    def save(self) -> None:
+        """Persist the cache (no-op without a path or pending changes)."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            payload = {"version": CACHE_VERSION, "entries": self._entries}
+            self._dirty = False
+        d = os.path.dirname(self.path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def hash_files(self, paths: Iterable[str]) -> List[Tuple[str, int]]:
+        """Return (sha256, size) for each path, in input order."""
+        with self._lock:
+            self._load()
+        paths = list(paths)
+        results: List[Optional[Tuple[str, int]]] = [None] * len(paths)
+        misses = []
+        with self._lock:
+            for i, p in enumerate(paths):
+                key = os.path.abspath(p)
+                st = os.stat(key)
+                stamp = [st.st_size, st.st_mtime_ns, st.st_ino]
+                entry = self._entries.get(key)
+                if entry is not None and entry[:3] == stamp and entry[4]:
+                    results[i] = (entry[3], st.st_size)
+                    self._stats["hits"] += 1
+                else:
+                    misses.append((i, key, stamp))
+            self._stats["misses"] += len(misses)
+
+        if len(misses) >= PARALLEL_THRESHOLD and self.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=self.workers) as ex:
+                digests = list(ex.map(_sha256_file, [key for _, key, _ in misses]))
+        else:
+            digests = [_sha256_file(key) for _, key, _ in misses]
+
+        now = time.time_ns()
+        with self._lock:
+            for (i, key, stamp), digest in zip(misses, digests):
+                trusted = now - stamp[1] > RACY_WINDOW_NS
+                self._entries[key] = stamp + [digest, trusted]
+                results[i] = (digest, stamp[0])
+            if misses:
+                self._dirty = True
+        return results
+
+    def sha256(self, path: str) -> str:
+        return self.hash_files([path])[0][0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["entries"] = len(self._entries)
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = {"hits": 0, "misses": 0}
+            self._dirty = bool(self.path)
+
+
+_CACHE: Optional[FileHashCache] = None
+_CACHE_LOCK = Lock()
+
+
+def get_hash_cache() -> FileHashCache:
+    """Return the process-wide cache, persisted at `SHIELDCRAFT_HASH_CACHE` if set."""
+    global _CACHE
+    path = os.getenv("SHIELDCRAFT_HASH_CACHE") or None
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.path != path:
+            _CACHE = FileHashCache(path)
+        return _CACHE
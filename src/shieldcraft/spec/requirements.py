@@ -5,10 +5,11 @@ Provides deterministic extraction wrapper and item binding utilities.
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 from typing import List, Dict, Any
 
+from shieldcraft.services.io.artifact_bus import write_json
+
 try:
     from shieldcraft.interpretation.requirements import extract_requirements as _interp_extract
 except Exception:
@@ -44,8 +45,7 @@ def extract_requirements(spec_text: str) -> List[Dict[str, Any]]:
 def persist_requirements(reqs: List[Dict[str, Any]], outdir: str = '.selfhost_outputs') -> str:
     os.makedirs(outdir, exist_ok=True)
     p = os.path.join(outdir, 'requirements.json')
-    with open(p, 'w', encoding='utf8') as f:
-        json.dump({'requirements': reqs}, f, indent=2, sort_keys=True)
+    write_json(p, {'requirements': reqs})
     return p
 
 
@@ -5,11 +5,12 @@ import json
 import os
 
 from shieldcraft.sufficiency.contract import SufficiencyContract, is_priority_p0_or_p1
+from shieldcraft.services.io.artifact_bus import read_json, write_json
 
 
 def _load_json(path: str) -> Any:
     try:
-        return json.load(open(path))
+        return read_json(path)
     except Exception:
         return None
 
@@ -160,9 +161,7 @@ def evaluate_from_files(outdir: str = '.selfhost_outputs') -> Dict[str, Any]:
     try:
         os.makedirs(outdir, exist_ok=True)
         p = os.path.join(outdir, 'checklist_sufficiency.json')
-        with open(p + '.tmp', 'w', encoding='utf8') as f:
-            json.dump(report, f, indent=2, sort_keys=True)
-        os.replace(p + '.tmp', p)
+        write_json(p, report)
     except Exception:
         pass
 
@@ -173,9 +172,7 @@ def write_sufficiency_report(report: Dict[str, Any], outdir: str = '.selfhost_ou
     os.makedirs(outdir, exist_ok=True)
     p = os.path.join(outdir, 'checklist_sufficiency.json')
     try:
-        with open(p + '.tmp', 'w', encoding='utf8') as f:
-            json.dump(report, f, indent=2, sort_keys=True)
-        os.replace(p + '.tmp', p)
+        write_json(p, report)
     except Exception:
         with open(p, 'w', encoding='utf8') as f:
             json.dump(report, f, indent=2, sort_keys=True)
@@ -0,0 +1,100 @@
+"""
+Iterative graph traversal shared by the dependency and rule graphs.
+
+Graphs are adjacency maps `{node: iterable of successor nodes}`; nodes that
+are referenced but have no entry are treated as leaves. Both traversals keep
+an explicit work stack of successor iterators instead of recursing, so chain
+depth is bounded by memory rather than the interpreter recursion limit, and
+they visit nodes in exactly the order the equivalent recursive DFS would.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def strongly_connected_components(graph: Dict[Any, Iterable[Any]]) -> List[List[Any]]:
+    """Tarjan's algorithm; returns every SCC in completion order.
+
+    Each component lists its nodes in stack-pop order (the root last).
+    """
+    index: Dict[Any, int] = {}
+    lowlink: Dict[Any, int] = {}
+    stack: List[Any] = []
+    onstack = set()
+    components: List[List[Any]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        onstack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            v, successors = work[-1]
+            for w in successors:
+                if w not in index:
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    onstack.add(w)
+                    work.append((w, iter(graph.get(w, ()))))
+                    break
+                if w in onstack and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                work.pop()
+                if lowlink[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        onstack.remove(w)
+                        comp.append(w)
+                        if w == v:
+                            break
+                    components.append(comp)
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[v] < lowlink[parent]:
+                        lowlink[parent] = lowlink[v]
+
+    return components
+
+
+def iter_back_edges(
+    graph: Dict[Any, Iterable[Any]],
+    roots: Iterable[Any],
+    follow: Optional[Callable[[Any], bool]] = None,
+) -> Iterator[Tuple[Any, List[Any]]]:
+    """Depth-first search from each unvisited root, yielding back edges.
+
+    For every edge into a node already on the current DFS path, yields
+    `(node, path)` where `path` runs from that node to the edge's tail.
+    `follow`, when given, filters which successors are traversed.
+    """
+    visited = set()
+    on_path: Dict[Any, int] = {}
+    path: List[Any] = []
+
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        on_path[root] = 0
+        path.append(root)
+        work = [iter(graph.get(root, ()))]
+        while work:
+            for nxt in work[-1]:
+                if follow is not None and not follow(nxt):
+                    continue
+                if nxt in on_path:
+                    yield nxt, path[on_path[nxt]:]
+                elif nxt not in visited:
+                    visited.add(nxt)
+                    on_path[nxt] = len(path)
+                    path.append(nxt)
+                    work.append(iter(graph.get(nxt, ())))
+                    break
+            else:
+                work.pop()
+                del on_path[path.pop()]
@@ -0,0 +1,95 @@
+"""
+Single-pass normative keyword scanning.
+
+Keyword checks used to be written as `any(k in low for k in (...))`: one
+substring search of the text per keyword, repeated for every keyword class.
+A `KeywordScanner` compiles the keywords of all its classes into one regex
+and finds every hit, with its classes, in one pass over the text.
+
+Matching keeps the substring semantics of those checks. Text is
+lower-cased, and a keyword hits wherever it occurs, including inside longer
+words ("may" in "mayor") and inside other keywords ("must" in "must not").
+The regex reports the longest keyword at each match. Keywords that occur
+inside a matched keyword are implied by it, so they are not searched for
+separately. A keyword that starts inside a match and runs past its end
+(e.g. "never" then "refuse" in "neverefuse") is skipped by a plain
+alternation; texts where that can happen are rescanned with a lookahead
+pattern that tries every position.
+
+Callers build one scanner per keyword vocabulary at import time; the
+obligation vocabulary shared by guidance and the self-host pre-scan lives
+here.
+"""
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Tuple
+
+
+class KeywordHit(NamedTuple):
+    start: int
+    keyword: str
+    classes: FrozenSet[str]
+
+
+class KeywordScanner:
+    """Find keywords of several classes in one pass over a text.
+
+    Args:
+        classes: Mapping of class name to its keywords. A keyword may
+            belong to several classes.
+    """
+
+    def __init__(self, classes: Mapping[str, Iterable[str]]):
+        owners: Dict[str, set] = {}
+        for cls, words in classes.items():
+            for w in words:
+                w = w.lower()
+                if not w:
+                    raise ValueError(f"empty keyword in class {cls!r}")
+                owners.setdefault(w, set()).add(cls)
+        self.keyword_classes: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in owners.items()}
+        # Longest first, so each match is the longest keyword starting there
+        ordered = sorted(owners, key=lambda k: (-len(k), k))
+        alternation = "|".join(map(re.escape, ordered))
+        self._pattern = re.compile(f"({alternation})")
+        self._every_position = re.compile(f"(?=({alternation}))")
+        # Keywords whose proper suffix is a proper prefix of a keyword; a
+        # match on one of them may hide a hit that starts inside it
+        prefixes = {k[:i] for k in ordered for i in range(1, len(k))}
+        self._straddling = frozenset(k for k in ordered if any(k[i:] in prefixes for i in range(1, len(k))))
+        # Every keyword occurrence inside each keyword, as (offset, keyword)
+        self._inner: Dict[str, Tuple[Tuple[int, str], ...]] = {}
+        self._implied: Dict[str, FrozenSet[str]] = {}
+        for k in ordered:
+            inner = sorted((i, w) for w in ordered for i in range(len(k) - len(w) + 1)
+                           if k.startswith(w, i))
+            self._inner[k] = tuple(inner)
+            self._implied[k] = frozenset().union(*(owners[w] for _, w in inner))
+
+    def scan(self, text: str) -> List[KeywordHit]:
+        """Return every keyword occurrence in `text`, ordered by position then keyword."""
+        hits = set()
+        for m in self._every_position.finditer((text or "").lower()):
+            start = m.start()
+            for offset, kw in self._inner[m.group(1)]:
+                hits.add((start + offset, kw))
+        return [KeywordHit(start, kw, self.keyword_classes[kw]) for start, kw in sorted(hits)]
+
+    def classes(self, text: str) -> FrozenSet[str]:
+        """Return the classes with at least one keyword in `text`."""
+        low = (text or "").lower()
+        found = set(self._pattern.findall(low))
+        if not found:
+            return frozenset()
+        if not found.isdisjoint(self._straddling):
+            found = set(self._every_position.findall(low))
+        return frozenset().union(*(self._implied[k] for k in found))
+
+    def matches(self, text: str) -> bool:
+        """True if any keyword occurs in `text`."""
+        return self._pattern.search((text or "").lower()) is not None
+
+
+# Obligation-like prose (guidance enrichment, self-host pre-scan)
+OBLIGATION_SCANNER = KeywordScanner({
+    "obligation": ("must", "never", "requires", "should", "must not", "refuse"),
+})
@@ -0,0 +1,79 @@
+"""
+Run-scoped state carried in a context variable.
+
+A run scope holds the state that used to live in module globals while an
+Engine run is in progress: the checklist context that gate events are
+recorded into, the view of the persona registry the run evaluates, the
+directory execution-state snapshots are written to, and the test tree
+candidate tests are discovered in. Because the scope is a
+`contextvars` value, concurrent runs in separate threads or asyncio tasks each
+see only their own state.
+
+Outside any scope, callers fall back to the process-wide defaults, which keeps
+single-engine scripts and tests working unchanged.
+
+New threads start with an empty context; use `bind` to carry the current
+scope into work submitted to a thread pool.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional
+
+
+@dataclass
+class RunScope:
+    engine: Any = None
+    checklist_context: Any = None
+    # Persona registry view; None means use the process registry
+    personas: Optional[List[Any]] = None
+    # Directory for execution-state snapshots; None means the locked default
+    artifacts_dir: Optional[str] = None
+    # Root that test discovery scans; None means ./tests
+    tests_root: Optional[str] = None
+
+
+_CURRENT: ContextVar[Optional[RunScope]] = ContextVar("shieldcraft_run_scope", default=None)
+
+
+def current_scope() -> Optional[RunScope]:
+    """Return the active run scope, or None outside any run."""
+    return _CURRENT.get()
+
+
+@contextmanager
+def run_scope(engine: Any = None, checklist_context: Any = None,
+              personas: Optional[List[Any]] = None,
+              artifacts_dir: Optional[str] = None,
+              tests_root: Optional[str] = None) -> Iterator[RunScope]:
+    """Activate a run scope for the duration of the block.
+
+    Re-entering with the engine that owns the active scope reuses it, so
+    nested Engine entrypoints share one scope.
+    """
+    active = _CURRENT.get()
+    if engine is not None and active is not None and active.engine is engine:
+        yield active
+        return
+    scope = RunScope(
+        engine=engine,
+        checklist_context=checklist_context,
+        personas=list(personas) if personas is not None else None,
+        artifacts_dir=artifacts_dir,
+        tests_root=tests_root,
+    )
+    token = _CURRENT.set(scope)
+    try:
+        yield scope
+    finally:
+        _CURRENT.reset(token)
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap `fn` to run in a copy of the caller's context (including its run scope)."""
+    ctx = copy_context()
+
+    def _bound(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return _bound
@@ -0,0 +1,80 @@
+"""
+Ordering of run-visible filesystem side effects.
+
+A few checklist build steps read and write files under `products/` (the
+manifest signature comparison, warnings output). When builds run
+concurrently those effects must still land in the order a serial run would
+produce them, because later builds read what earlier ones wrote.
+
+Functions decorated with `side_effect` consult a context-local handler:
+
+- `deferred()` records calls instead of performing them (e.g. in a worker
+  process); the caller later performs them in order with `apply`.
+- `after(ready)` holds calls until `ready` is set, letting a concurrent build
+  run up to its first side effect while an earlier stage finishes.
+
+Outside either context the decorated function runs normally.
+"""
+import functools
+import importlib
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+Call = Tuple[str, str, tuple, dict]
+
+_HANDLER: ContextVar[Optional[Callable[..., Any]]] = ContextVar("shieldcraft_side_effect_handler", default=None)
+
+
+def side_effect(default: Any = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Mark a module-level function as a side effect; `default` is returned when deferred."""
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            handler = _HANDLER.get()
+            if handler is None:
+                return fn(*args, **kwargs)
+            return handler(fn, default, args, kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def _handled(handler: Callable[..., Any]) -> Iterator[None]:
+    token = _HANDLER.set(handler)
+    try:
+        yield
+    finally:
+        _HANDLER.reset(token)
+
+
+@contextmanager
+def deferred() -> Iterator[List[Call]]:
+    """Record side-effect calls made in the block into the yielded list."""
+    calls: List[Call] = []
+
+    def _record(fn, default, args, kwargs):
+        calls.append((fn.__module__, fn.__qualname__, args, kwargs))
+        return default
+
+    with _handled(_record):
+        yield calls
+
+
+@contextmanager
+def after(ready: threading.Event) -> Iterator[None]:
+    """Hold side-effect calls made in the block until `ready` is set."""
+    def _wait(fn, default, args, kwargs):
+        ready.wait()
+        return fn(*args, **kwargs)
+
+    with _handled(_wait):
+        yield
+
+
+def apply(calls: Iterable[Call]) -> None:
+    """Perform recorded side-effect calls in order."""
+    for module, qualname, args, kwargs in calls:
+        fn = getattr(importlib.import_module(module), qualname)
+        getattr(fn, "__wrapped__", fn)(*args, **kwargs)
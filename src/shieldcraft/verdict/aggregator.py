@@ -1,17 +1,9 @@
 from __future__ import annotations
 
-import json
 import os
-import hashlib
 from typing import Dict, Any, List
 
-
-def _sha256_of_file(path: str) -> str:
-    h = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            h.update(chunk)
-    return h.hexdigest()
+from shieldcraft.services.io.artifact_bus import artifact_exists, artifact_sha256, read_json, write_json
 
 
 def compute_implementability(outdir: str = '.selfhost_outputs') -> Dict[str, Any]:
@@ -28,9 +20,9 @@ def compute_implementability(outdir: str = '.selfhost_outputs') -> Dict[str, Any
 
     def load_json(name: str) -> Any:
         p = os.path.join(outdir, name)
-        if os.path.exists(p):
+        if artifact_exists(p):
             try:
-                return json.load(open(p))
+                return read_json(p)
             except Exception:
                 return None
         return None
@@ -93,9 +85,9 @@ def compute_implementability(outdir: str = '.selfhost_outputs') -> Dict[str, Any
         'checklist_execution_plan.json',
             'requirement_completeness.json'):
         p = os.path.join(outdir, name)
-        if os.path.exists(p):
+        if artifact_exists(p):
             try:
-                proof_refs[name] = _sha256_of_file(p)
+                proof_refs[name] = artifact_sha256(p)
             except Exception:
                 proof_refs[name] = 'unhashable'
 
@@ -109,9 +101,7 @@ def compute_implementability(outdir: str = '.selfhost_outputs') -> Dict[str, Any
     try:
         os.makedirs(outdir, exist_ok=True)
         p = os.path.join(outdir, 'implementability_verdict.json')
-        with open(p + '.tmp', 'w', encoding='utf8') as f:
-            json.dump(verdict, f, indent=2, sort_keys=True)
-        os.replace(p + '.tmp', p)
+        write_json(p, verdict)
     except Exception:
         pass
 
@@ -13,12 +13,91 @@ Contract notes:
     will short-circuit with a stable, deterministic response when `validity_passed`
     is False.
 """
-from typing import Dict, Any
+import atexit
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Optional, Tuple
 from shieldcraft.services.validator.spec_gate import enforce_spec_fuzz_stability
 from shieldcraft.services.validator.test_gate import enforce_tests_attached
 from shieldcraft.services.validator.persona_gate import enforce_persona_veto
 from shieldcraft.verification.replay_engine import replay_and_compare
 
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _mutation_pool(generator):
+    """Shared process pool for fuzz mutation builds, or None to build in-process.
+
+    Sized by SHIELDCRAFT_READINESS_WORKERS (default min(4, cpus); <= 1 disables).
+    Only the stock ChecklistGenerator is shipped to workers.
+    """
+    global _POOL
+    from shieldcraft.services.checklist.generator import ChecklistGenerator
+    if type(generator) is not ChecklistGenerator:
+        return None
+    workers = int(os.getenv("SHIELDCRAFT_READINESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+    if workers <= 1:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn: the caller may hold locks in other threads (e.g. the API job runner)
+            _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _POOL
+
+
+def _discard_pool(pool=None, wait: bool = False) -> None:
+    """Shut down the shared pool (only if it is still `pool`, when given); the next use starts a new one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None or (pool is not None and _POOL is not pool):
+            return
+        pool, _POOL = _POOL, None
+    pool.shutdown(wait=wait, cancel_futures=True)
+
+
+atexit.register(_discard_pool, wait=True)
+
+
+@contextmanager
+def _no_capture():
+    yield []
+
+
+def _gate(name: str, check: Callable[[], Any], timings: Dict[str, float]) -> Tuple[bool, Any]:
+    """Run a RuntimeError-raising gate check; return (ok, reason) and record its wall time."""
+    start = time.perf_counter()
+    try:
+        check()
+        return True, None
+    except RuntimeError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"gate_error:{e}"
+    finally:
+        timings[name] = time.perf_counter() - start
+
+
+def _replay(engine, det: Optional[Dict[str, Any]], timings: Dict[str, float]) -> Tuple[bool, Any]:
+    start = time.perf_counter()
+    try:
+        if not det:
+            # Missing determinism info is a failure
+            return False, "missing_determinism_snapshot"
+        r = replay_and_compare(engine, det)
+        if r.get("match"):
+            return True, None
+        return False, r.get("explanation")
+    except Exception as e:
+        return False, f"gate_error:{e}"
+    finally:
+        timings["determinism_replay"] = time.perf_counter() - start
+
 
 def evaluate_readiness(engine, spec: Dict[str, Any], checklist_result: Dict[str,
                        Any], validity_passed: bool = True) -> Dict[str, Any]:
@@ -30,186 +109,105 @@ def evaluate_readiness(engine, spec: Dict[str, Any], checklist_result: Dict[str,
       to False when the spec failed validation to avoid noisy/ambiguous
       readiness results.
 
-    Report shape: {"ok": bool, "status": "pass"|"fail"|"not_evaluated", "results": {...}, "reason": str?}
+    `checklist_result` (the checklist already built for `spec`) is the fuzz
+    baseline and the replay reference; the fuzz mutation builds run on a
+    process pool while the determinism replay runs on a thread. The persona
+    gate is evaluated first so it sees only the run's own vetoes. Gate events
+    are captured and re-recorded in serial gate order, so verdicts and the
+    recorded event sequence match a sequential evaluation.
+
+    Report shape: {"ok": bool, "status": "pass"|"fail"|"not_evaluated", "results": {...},
+    "readiness_summary": {...}, "timings": {gate: seconds}, "reason": str?}
     """
 
     # Short-circuit when spec validity has not been established
     if not validity_passed:
         return {"ok": False, "status": "not_evaluated", "reason": "blocked_by_invalid_spec", "results": {}}
 
-    results: Dict[str, Any] = {}
-    overall_ok = True
-    blocking_count = 0
-    non_blocking_count = 0
+    from shieldcraft.services.guidance.readiness import is_blocking, grade_from_counts
+    from shieldcraft.util.run_scope import bind
+    from shieldcraft.util.side_effects import after
 
-    # Gate: spec fuzz stability (non-fatal if gate unavailable)
-    try:
-        try:
-            enforce_spec_fuzz_stability(spec, engine.checklist_gen, max_variants=3)
-            gov = None
-            try:
-                from shieldcraft.services.governance.map import get_governance_for
-                gov = get_governance_for("spec_fuzz_stability")
-            except Exception:
-                gov = None
-            from shieldcraft.services.guidance.readiness import is_blocking
-            results["spec_fuzz_stability"] = {"ok": True, "governance": gov,
-                                              "blocking": is_blocking("spec_fuzz_stability")}
-        except RuntimeError as e:
-            gov = None
-            try:
-                from shieldcraft.services.governance.map import get_governance_for
-                gov = get_governance_for("spec_fuzz_stability")
-            except Exception:
-                gov = None
-            from shieldcraft.services.guidance.readiness import is_blocking
-            b = is_blocking("spec_fuzz_stability")
-            results["spec_fuzz_stability"] = {"ok": False, "reason": str(e), "governance": gov, "blocking": b}
-            overall_ok = False
-            if b:
-                blocking_count += 1
-            else:
-                non_blocking_count += 1
-    except Exception as e:
-        gov = None
-        try:
-            from shieldcraft.services.governance.map import get_governance_for
-            gov = get_governance_for("spec_fuzz_stability")
-        except Exception:
-            gov = None
-        from shieldcraft.services.guidance.readiness import is_blocking
-        b = is_blocking("spec_fuzz_stability")
-        results["spec_fuzz_stability"] = {"ok": False, "reason": f"gate_error:{e}", "governance": gov, "blocking": b}
-        overall_ok = False
-        if b:
-            blocking_count += 1
-        else:
-            non_blocking_count += 1
+    timings: Dict[str, float] = {}
+    outcomes: Dict[str, Tuple[bool, Any]] = {}
+    ctx = getattr(engine, "checklist_context", None)
+    capture = ctx.capture if hasattr(ctx, "capture") else _no_capture
 
-    # Gate: tests attached
-    try:
-        enforce_tests_attached(checklist_result.get("items", []))
-        gov = None
-        try:
-            from shieldcraft.services.governance.map import get_governance_for
-            gov = get_governance_for("tests_attached")
-        except Exception:
-            gov = None
-        from shieldcraft.services.guidance.readiness import is_blocking
-        results["tests_attached"] = {"ok": True, "governance": gov, "blocking": is_blocking("tests_attached")}
-    except RuntimeError as e:
-        gov = None
-        try:
-            from shieldcraft.services.governance.map import get_governance_for
-            gov = get_governance_for("tests_attached")
-        except Exception:
-            gov = None
-        from shieldcraft.services.guidance.readiness import is_blocking
-        b = is_blocking("tests_attached")
-        results["tests_attached"] = {"ok": False, "reason": str(e), "governance": gov, "blocking": b}
-        overall_ok = False
-        if b:
-            blocking_count += 1
-        else:
-            non_blocking_count += 1
-    except Exception as e:
-        gov = None
+    # Persona vetoes come from the run's build; read them before the replay adds its own
+    with capture() as persona_events:
+        outcomes["persona_no_veto"] = _gate("persona_no_veto", lambda: enforce_persona_veto(engine), timings)
+
+    # Gate: determinism replay (if snapshot exists), concurrently with the gates below
+    # The replay build reads the stability files the fuzz builds write, so its
+    # file side effects wait until the fuzz gate has finished
+    det = checklist_result.get("_determinism")
+    replay_events = []
+    fuzz_done = threading.Event()
+
+    def _run_replay():
+        with capture() as captured, after(fuzz_done):
+            outcomes["determinism_replay"] = _replay(engine, det, timings)
+        replay_events.extend(captured)
+
+    replay_thread = threading.Thread(target=bind(_run_replay), name="readiness-replay", daemon=True)
+    replay_thread.start()
+
+    # Gate: spec fuzz stability, reusing the built checklist as baseline
+    def _fuzz():
+        generator = engine.checklist_gen
+        pool = _mutation_pool(generator)
         try:
-            from shieldcraft.services.governance.map import get_governance_for
-            gov = get_governance_for("tests_attached")
-        except Exception:
-            gov = None
-        from shieldcraft.services.guidance.readiness import is_blocking
-        b = is_blocking("tests_attached")
-        results["tests_attached"] = {"ok": False, "reason": f"gate_error:{e}", "governance": gov, "blocking": b}
-        overall_ok = False
-        if b:
-            blocking_count += 1
-        else:
-            non_blocking_count += 1
-
-    # Gate: persona veto absence
+            enforce_spec_fuzz_stability(spec, generator, max_variants=3, baseline=checklist_result,
+                                        executor=pool)
+        except BrokenProcessPool:
+            # A worker died; nothing was applied yet, so build in-process instead
+            _discard_pool(pool)
+            enforce_spec_fuzz_stability(spec, generator, max_variants=3, baseline=checklist_result)
     try:
-        try:
-            enforce_persona_veto(engine)
-            # If no veto, enforce_persona_veto returns None; we mark ok
-            gov = None
-            try:
-                from shieldcraft.services.governance.map import get_governance_for
-                gov = get_governance_for("persona_no_veto")
-            except Exception:
-                gov = None
-            from shieldcraft.services.guidance.readiness import is_blocking
-            results["persona_no_veto"] = {"ok": True, "governance": gov, "blocking": is_blocking("persona_no_veto")}
-        except RuntimeError as e:
+        outcomes["spec_fuzz_stability"] = _gate("spec_fuzz_stability", _fuzz, timings)
+    finally:
+        fuzz_done.set()
+
+    # Gate: tests attached
+    outcomes["tests_attached"] = _gate(
+        "tests_attached", lambda: enforce_tests_attached(checklist_result.get("items", [])), timings)
+
+    replay_thread.join()
+    if persona_events or replay_events:
+        ctx.record_events(persona_events)
+        ctx.record_events(replay_events)
+
+    results: Dict[str, Any] = {}
+    overall_ok = True
+    blocking_count = 0
+    non_blocking_count = 0
+    for gate in ("spec_fuzz_stability", "tests_attached", "persona_no_veto", "determinism_replay"):
+        ok, reason = outcomes[gate]
+        res: Dict[str, Any] = {"ok": ok}
+        if not ok:
+            res["reason"] = reason
+        if gate != "determinism_replay":
             gov = None
             try:
                 from shieldcraft.services.governance.map import get_governance_for
-                gov = get_governance_for("persona_no_veto")
+                gov = get_governance_for(gate)
             except Exception:
                 gov = None
-            from shieldcraft.services.guidance.readiness import is_blocking
-            b = is_blocking("persona_no_veto")
-            results["persona_no_veto"] = {"ok": False, "reason": str(e), "governance": gov, "blocking": b}
+            res["governance"] = gov
+        b = is_blocking(gate)
+        res["blocking"] = b
+        results[gate] = res
+        if not ok:
             overall_ok = False
             if b:
                 blocking_count += 1
             else:
                 non_blocking_count += 1
-    except Exception as e:
-        gov = None
-        try:
-            from shieldcraft.services.governance.map import get_governance_for
-            gov = get_governance_for("persona_no_veto")
-        except Exception:
-            gov = None
-        from shieldcraft.services.guidance.readiness import is_blocking
-        b = is_blocking("persona_no_veto")
-        results["persona_no_veto"] = {"ok": False, "reason": f"gate_error:{e}", "governance": gov, "blocking": b}
-        overall_ok = False
-        if b:
-            blocking_count += 1
-        else:
-            non_blocking_count += 1
-
-    # Gate: determinism replay (if snapshot exists)
-    try:
-        det = checklist_result.get("_determinism")
-        from shieldcraft.services.guidance.readiness import is_blocking
-        if det:
-            r = replay_and_compare(engine, det)
-            if r.get("match"):
-                results["determinism_replay"] = {"ok": True, "blocking": is_blocking("determinism_replay")}
-            else:
-                b = is_blocking("determinism_replay")
-                results["determinism_replay"] = {"ok": False, "reason": r.get("explanation"), "blocking": b}
-                overall_ok = False
-                if b:
-                    blocking_count += 1
-                else:
-                    non_blocking_count += 1
-        else:
-            # Missing determinism info is a failure
-            b = is_blocking("determinism_replay")
-            results["determinism_replay"] = {"ok": False, "reason": "missing_determinism_snapshot", "blocking": b}
-            overall_ok = False
-            if b:
-                blocking_count += 1
-            else:
-                non_blocking_count += 1
-    except Exception as e:
-        b = is_blocking("determinism_replay")
-        results["determinism_replay"] = {"ok": False, "reason": f"gate_error:{e}", "blocking": b}
-        overall_ok = False
-        if b:
-            blocking_count += 1
-        else:
-            non_blocking_count += 1
 
     # Compute readiness_summary and status
-    from shieldcraft.services.guidance.readiness import grade_from_counts
     grade = grade_from_counts(blocking_count, non_blocking_count)
     status = "pass" if overall_ok else "fail"
     readiness_summary = {"blocking_count": blocking_count, "non_blocking_count": non_blocking_count, "grade": grade}
 
-    return {"ok": overall_ok, "status": status, "results": results, "readiness_summary": readiness_summary}
+    return {"ok": overall_ok, "status": status, "results": results, "readiness_summary": readiness_summary,
+            "timings": {gate: round(timings[gate], 6) for gate in sorted(timings)}}
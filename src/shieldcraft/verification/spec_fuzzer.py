@@ -1,5 +1,4 @@
 """Deterministic spec mutation utilities for adversarial testing."""
-from copy import deepcopy
 from typing import Dict, List, Tuple
 from .failure_classes import SPEC_AMBIGUOUS, SPEC_CONTRADICTORY, SPEC_INCOMPLETE, SPEC_STABLE
 
@@ -7,6 +6,10 @@ from .failure_classes import SPEC_AMBIGUOUS, SPEC_CONTRADICTORY, SPEC_INCOMPLETE
 def generate_mutations(spec: Dict) -> List[Tuple[Dict, str, str]]:
     """Generate a deterministic set of spec mutations.
 
+    Mutations are copy-on-write: each copies only the containers it changes
+    and shares every other subtree with `spec`, so they must be treated as
+    read-only.
+
     Returns list of tuples: (mutated_spec, mutation_kind, description)
     """
     muts = []
@@ -15,31 +18,23 @@ def generate_mutations(spec: Dict) -> List[Tuple[Dict, str, str]]:
     sections = spec.get("sections")
     if isinstance(sections, dict):
         for k in sorted(sections.keys()):
-            s = deepcopy(spec)
-            s2 = s.get("sections", {})
-            if k in s2:
-                del s2[k]
-            muts.append((s, "omission", f"removed_section:{k}"))
+            s2 = {key: value for key, value in sections.items() if key != k}
+            muts.append(({**spec, "sections": s2}, "omission", f"removed_section:{k}"))
 
     # 2) contradiction: duplicate a section id with conflicting payload
     if isinstance(sections, dict) and sections:
         for k in sorted(sections.keys())[:1]:  # only create one conflicting variant for determinism
-            s = deepcopy(spec)
-            s2 = s.get("sections", {})
             # create conflicting copy
-            s2[f"conflict_{k}"] = {"id": sections[k].get("id", f"{k}"), "description": "conflict"}
-            muts.append((s, "contradiction", f"duplicate_conflicting_section:{k}"))
+            s2 = {**sections, f"conflict_{k}": {"id": sections[k].get("id", f"{k}"), "description": "conflict"}}
+            muts.append(({**spec, "sections": s2}, "contradiction", f"duplicate_conflicting_section:{k}"))
 
     # 3) reordering: if sections is a list, reverse it
     if isinstance(sections, list) and len(sections) > 1:
-        s = deepcopy(spec)
-        s["sections"] = list(reversed(s["sections"]))
-        muts.append((s, "reorder", "reversed_sections"))
+        muts.append(({**spec, "sections": list(reversed(sections))}, "reorder", "reversed_sections"))
 
     # 4) omission of metadata
     if "metadata" in spec:
-        s = deepcopy(spec)
-        s.pop("metadata", None)
+        s = {key: value for key, value in spec.items() if key != "metadata"}
         muts.append((s, "omission", "removed_metadata"))
 
     return muts
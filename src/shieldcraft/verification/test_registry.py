@@ -1,12 +1,25 @@
 import os
 import re
-from typing import Dict
+from typing import Dict, Optional
 
+from shieldcraft.util.run_scope import current_scope
 
-def discover_tests(root: str = "tests") -> Dict[str, str]:
-    """Discover tests by scanning files under `root` and return deterministic mapping
-    of stable id -> test reference string (`path::test_name`).
+
+def tests_root() -> str:
+    """Directory test discovery scans: the active run scope's, else ./tests."""
+    scope = current_scope()
+    if scope is not None and scope.tests_root:
+        return scope.tests_root
+    return "tests"
+
+
+def discover_tests(root: Optional[str] = None) -> Dict[str, str]:
+    """Discover tests by scanning files under `root` (default `tests_root()`) and
+    return deterministic mapping of stable id -> test reference string
+    (`path::test_name`).
     """
+    if root is None:
+        root = tests_root()
     results: Dict[str, str] = {}
     test_func_re = re.compile(r"^def\s+(test_[a-zA-Z0-9_]+)")
     for dirpath, _, filenames in os.walk(root):
@@ -1,3 +1,5 @@
+import pytest
+
 from shieldcraft.services.ast.builder import ASTBuilder
 from shieldcraft.services.ast.node import Node
 
@@ -83,3 +85,35 @@ def test_node_walk_order():
     ptrs2 = [n.ptr for n in ast.walk()]
 
     assert ptrs1 == ptrs2  # Deterministic
+
+
+def test_root_owns_pointer_index():
+    spec = {"metadata": {"id": "test"}, "sections": [{"id": "a", "body": {"x": 1}}]}
+    ast = ASTBuilder().build(spec)
+
+    assert ast.index is not None
+    assert "/sections/0/body/x" in ast.index
+    assert ast.find("/sections/0/body") is ast.index.get("/sections/0/body")
+    assert ast.find("/missing") is None
+    # Index covers the same nodes, in the same order, as a recursive tree walk
+    def _walk(node):
+        yield node
+        for child in node.children:
+            yield from _walk(child)
+    assert list(ast.index.nodes) == list(_walk(ast))
+
+
+def test_subtree_find_without_index_scans():
+    ast = ASTBuilder().build({"a": {"b": {"c": "value"}}})
+    sub = ast.find("/a")
+    assert sub.index is None
+    assert sub.find("/a/b/c") is ast.find("/a/b/c")
+
+
+def test_indexed_tree_is_frozen():
+    ast = ASTBuilder().build({"a": {"b": {"c": "value"}}})
+    with pytest.raises(ValueError):
+        ast.find("/a/b").add(Node("entry", ptr="/a/b/d"))
+    with pytest.raises(ValueError):
+        ast.add(Node("entry", ptr="/e"))
+    assert ast.find("/a/b/d") is None and ast.find("/a/b/c") is not None
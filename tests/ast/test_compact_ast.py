@@ -0,0 +1,62 @@
+import json
+import pathlib
+
+from shieldcraft.services.ast.builder import ASTBuilder
+from shieldcraft.services.ast.lineage import get_lineage_map, get_spec_id_map, build_lineage
+
+
+SPEC = {
+    "metadata": {"product_id": "compact", "version": "1.0"},
+    "sections": [
+        {"id": "auth", "rules": ["must hash passwords", "forbid plaintext"]},
+        {"id": "net", "forbidden_ports": [23], "nested": {"deep": {"x": [1, 2.5, None, True]}}},
+    ],
+    "invariants": [{"id": "inv1", "clause_type": "requirement", "expr": "x"}],
+    "empty": {},
+    "empty_list": [],
+}
+
+
+def _pairs(ast):
+    return [(n.ptr, n.type, n.parent_ptr, n.lineage_id, n.spec_id, n.clause_type, n.value)
+            for n in ast.walk()]
+
+
+def test_compact_matches_node_tree():
+    tree = ASTBuilder(compact=False).build(SPEC)
+    compact = ASTBuilder(compact=True).build(SPEC)
+
+    assert _pairs(compact) == _pairs(tree)
+    assert get_lineage_map(compact) == get_lineage_map(tree)
+    assert get_spec_id_map(compact) == get_spec_id_map(tree)
+    assert build_lineage(compact) == build_lineage(tree)
+
+
+def test_compact_matches_on_repo_spec():
+    spec_path = pathlib.Path("spec/se_dsl_v1.spec.json")
+    spec = json.loads(spec_path.read_text())
+    tree = ASTBuilder(compact=False).build(spec)
+    compact = ASTBuilder(compact=True).build(spec)
+
+    assert get_lineage_map(compact) == get_lineage_map(tree)
+    assert get_spec_id_map(compact) == get_spec_id_map(tree)
+    assert [n.clause_type for n in compact.walk()] == [n.clause_type for n in tree.walk()]
+
+
+def test_compact_find_and_children():
+    compact = ASTBuilder(compact=True).build(SPEC)
+
+    node = compact.find("/sections/1/nested")
+    assert node.type == "dict_entry"
+    assert node.value == {"key": "nested", "value": SPEC["sections"][1]["nested"]}
+    assert [c.ptr for c in node.children] == ["/sections/1/nested/deep"]
+    assert node.find("/sections/1/nested/deep/x/3") == compact.find("/sections/1/nested/deep/x/3")
+    assert compact.find("/nope") is None
+    assert "/empty" in compact.index
+
+
+def test_compact_env_toggle(monkeypatch):
+    monkeypatch.setenv("SHIELDCRAFT_COMPACT_AST", "1")
+    assert ASTBuilder().compact is True
+    monkeypatch.setenv("SHIELDCRAFT_COMPACT_AST", "0")
+    assert ASTBuilder().compact is False
@@ -0,0 +1,90 @@
+from shieldcraft.services.ast.builder import ASTBuilder
+from shieldcraft.services.checklist.fragments import FragmentCache
+from shieldcraft.services.checklist.generator import ChecklistGenerator
+from shieldcraft.verification.spec_fuzzer import generate_mutations
+from shieldcraft.verification.test_expander import expand_tests_for_item
+
+
+def _spec():
+    return {
+        "metadata": {"product_id": "frag", "version": "1.0"},
+        "sections": {
+            "a": {"id": "a", "description": "must forbid x", "fields": {"f": True}},
+            "b": {"id": "b", "items": [1, {"k": "v"}]},
+        },
+        "agents": [{"id": "agent-1"}],
+        "mode": "strict",
+    }
+
+
+def _shape(ast):
+    return [(n.ptr, n.type, n.value, n.lineage_id, n.spec_id, n.clause_type, n.parent_ptr) for n in ast.walk()]
+
+
+def test_fragment_build_matches_full_ast_and_items():
+    gen = ChecklistGenerator()
+    cache = FragmentCache()
+    for spec in [_spec()] + [m[0] for m in generate_mutations(_spec())]:
+        full = ASTBuilder(compact=False).build(spec)
+        ast, items = cache.build(spec, gen.render_task)
+        assert _shape(ast) == _shape(full)
+        assert items == gen._extract_from_ast(full)
+        assert ast.find("/agents/0/id").ptr == "/agents/0/id"
+
+
+def test_mutated_builds_only_rebuild_changed_sections():
+    gen = ChecklistGenerator()
+    cache = FragmentCache()
+    cache.build(_spec(), gen.render_task)
+    assert cache.stats()["misses"] == 5 and cache.stats()["hits"] == 0
+
+    removed_b = generate_mutations(_spec())[1][0]
+    _, items = cache.build(removed_b, gen.render_task)
+    # /sections/a, /metadata/* and /agents/0 are reused
+    assert cache.stats()["misses"] == 5
+    assert not any(it["ptr"].startswith("/sections/b") for it in items)
+
+
+def test_cached_items_are_copied_per_build():
+    gen = ChecklistGenerator()
+    cache = FragmentCache()
+    _, first = cache.build(_spec(), gen.render_task)
+    for it in first:
+        it["lineage_id"] = "mutated"
+    _, second = cache.build(_spec(), gen.render_task)
+    assert all("lineage_id" not in it for it in second)
+
+
+def test_expand_tests_matches_uncached_expansion():
+    cache = FragmentCache()
+    test_map = {"test::a.py::test_sections_a": "a.py::test_sections_a", "test::b.py::test_x": "b.py::test_x"}
+    items = [{"ptr": "/sections/a", "id": "i1"}, {"ptr": "/other", "id": "i2"}]
+    expected = [expand_tests_for_item(it, test_map)["candidates"] for it in items]
+    assert cache.expand_tests(items, test_map) == expected
+    assert cache.expand_tests(items, test_map) == expected
+    # A different test map invalidates memoised expansions
+    test_map2 = {"test::c.py::test_other": "c.py::test_other"}
+    assert cache.expand_tests(items, test_map2) == [expand_tests_for_item(it, test_map2)["candidates"] for it in items]
+
+
+def test_expand_tests_skips_items_that_fail(monkeypatch):
+    from shieldcraft.verification import test_expander
+
+    def flaky(item, test_map):
+        if item["ptr"] == "/bad":
+            raise ValueError("bad item")
+        return expand_tests_for_item(item, test_map)
+
+    monkeypatch.setattr(test_expander, "expand_tests_for_item", flaky)
+    cache = FragmentCache()
+    test_map = {"test::a.py::test_sections_a": "a.py::test_sections_a"}
+    items = [{"ptr": "/bad", "id": "i0"}, {"ptr": "/sections/a", "id": "i1"}]
+    assert cache.expand_tests(items, test_map) == [[], expand_tests_for_item(items[1], test_map)["candidates"]]
+
+
+def test_mutations_share_unchanged_subtrees():
+    spec = _spec()
+    for mutated, kind, desc in generate_mutations(spec):
+        assert mutated is not spec
+        assert mutated.get("agents") is spec["agents"]
+    assert spec == _spec()
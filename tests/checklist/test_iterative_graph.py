@@ -0,0 +1,112 @@
+"""The iterative graph core matches the recursive traversals it replaced."""
+import random
+import sys
+
+from shieldcraft.checklist.dependencies import build_sequence, detect_cycles
+from shieldcraft.checklist.execution_graph import build_execution_plan
+from shieldcraft.services.checklist.graph import build_graph as build_checklist_graph
+from shieldcraft.services.rules.graph import detect_cycles as detect_rule_cycles
+
+
+def _recursive_tarjan(graph):
+    index, lowlink, stack, onstack, cycles = {}, {}, [], set(), []
+    counter = [0]
+
+    def strongconnect(v):
+        index[v] = lowlink[v] = counter[0]
+        counter[0] += 1
+        stack.append(v)
+        onstack.add(v)
+        for w in graph.get(v, []):
+            if w not in index:
+                strongconnect(w)
+                lowlink[v] = min(lowlink[v], lowlink[w])
+            elif w in onstack:
+                lowlink[v] = min(lowlink[v], index[w])
+        if lowlink[v] == index[v]:
+            comp = []
+            while True:
+                w = stack.pop()
+                onstack.remove(w)
+                comp.append(w)
+                if w == v:
+                    break
+            if len(comp) > 1:
+                cycles.append(comp)
+
+    for v in graph:
+        if v not in index:
+            strongconnect(v)
+    return cycles
+
+
+def _recursive_rule_cycles(graph):
+    visited, stack, cycles = set(), set(), []
+
+    def dfs(node):
+        if node in stack:
+            cycles.append(node)
+            return
+        if node in visited:
+            return
+        visited.add(node)
+        stack.add(node)
+        for nxt in graph.get(node, []):
+            dfs(nxt)
+        stack.remove(node)
+
+    for n in graph:
+        dfs(n)
+    return cycles
+
+
+def _random_graph(rng, n=60, edges=150):
+    nodes = [f"n{i:02d}" for i in range(n)]
+    graph = {v: set() for v in nodes}
+    for _ in range(edges):
+        graph[rng.choice(nodes)].add(rng.choice(nodes + ["missing"]))
+    return graph
+
+
+def test_tarjan_matches_recursive_on_random_graphs():
+    rng = random.Random(11)
+    for _ in range(200):
+        graph = _random_graph(rng)
+        assert detect_cycles(graph) == _recursive_tarjan(graph)
+
+
+def test_rule_cycles_match_recursive_on_random_graphs():
+    rng = random.Random(5)
+    for _ in range(200):
+        graph = {k: sorted(v) for k, v in _random_graph(rng, edges=90).items()}
+        assert detect_rule_cycles(graph) == _recursive_rule_cycles(graph)
+
+
+def test_checklist_graph_cycles():
+    items = [{"id": "a", "depends_on": ["b"]}, {"id": "b", "depends_on": ["c", "zz"]},
+             {"id": "c", "depends_on": "a"}, {"id": "d", "depends_on": ["d"]}]
+    assert build_checklist_graph(items)["cycles"] == [["a", "b", "c", "a"], ["d", "d"]]
+
+
+def test_deep_chain_beyond_recursion_limit(tmp_path):
+    n = sys.getrecursionlimit() * 5
+    items = [{"id": f"i{k:06d}", "depends_on": [f"i{k + 1:06d}"] if k + 1 < n else []} for k in range(n)]
+    graph = {it["id"]: set(it["depends_on"]) for it in items}
+
+    assert detect_cycles(graph) == []
+    assert detect_rule_cycles({k: sorted(v) for k, v in graph.items()}) == []
+    assert build_checklist_graph(items)["cycles"] == []
+
+    plan = build_execution_plan(items, {}, outdir=str(tmp_path))
+    assert plan["ordered_item_ids"][0] == f"i{n - 1:06d}"
+    assert len(plan["parallelizable_groups"]) == n
+
+    seq = build_sequence(items, {}, outdir=str(tmp_path))
+    assert seq["cycle_groups"] == {}
+
+    # closing the chain makes one big cycle
+    items[-1]["depends_on"] = [items[0]["id"]]
+    graph[items[-1]["id"]] = {items[0]["id"]}
+    cycles = detect_cycles(graph)
+    assert len(cycles) == 1 and len(cycles[0]) == n
+    assert build_checklist_graph(items)["cycles"][0][0] == items[0]["id"]
@@ -0,0 +1,57 @@
+"""PointerIndex answers the prefix queries the invariant scans used to make."""
+import random
+
+from shieldcraft.services.checklist.invariants import evaluate_invariant
+from shieldcraft.services.checklist.pointer_index import PointerIndex
+
+
+def _items(n, seed=7):
+    rnd = random.Random(seed)
+    segs = ["sections", "0", "1", "rules", "r", "rules_x", "a~1b", "", "é"]
+    items = []
+    for i in range(n):
+        depth = rnd.randint(0, 4)
+        ptr = "".join("/" + rnd.choice(segs) for _ in range(depth))
+        items.append({"id": f"i{i % (n // 2 or 1)}", "ptr": ptr, "text": f"item {i}"})
+    return items
+
+
+def _probes(items):
+    probes = {"", "/", "/sections", "/sections/0", "/rules", "/rules/r/x", "/nope", "/é"}
+    probes.update(it["ptr"] for it in items[:50])
+    probes.update(it["ptr"][:-1] for it in items[:50] if it["ptr"])
+    return sorted(probes)
+
+
+def test_queries_match_linear_scans():
+    items = _items(400)
+    index = PointerIndex(items)
+    for ptr in _probes(items):
+        assert index.descendants(ptr) == [it for it in items if it["ptr"].startswith(ptr)]
+        assert index.ancestors(ptr) == [it for it in items if ptr.startswith(it["ptr"])]
+        assert index.related(ptr) == [
+            it for it in items if it["ptr"].startswith(ptr) or ptr.startswith(it["ptr"])]
+        assert index.count(ptr) == sum(1 for it in items if it["ptr"].startswith(ptr))
+        assert index.exists(ptr) == any(it["ptr"] == ptr for it in items)
+
+
+def test_add_keeps_index_in_sync():
+    items = _items(100)
+    index = PointerIndex(items[:60])
+    for it in items[60:]:
+        index.add(it)
+    assert len(index) == len(items)
+    for ptr in _probes(items):
+        assert index.related(ptr) == [
+            it for it in items if it["ptr"].startswith(ptr) or ptr.startswith(it["ptr"])]
+
+
+def test_evaluate_invariant_same_with_and_without_index():
+    items = _items(300)
+    ctx = {"items": items, "spec": {"sections": [{"id": "s"}]}}
+    indexed = dict(ctx, pointer_index=PointerIndex(items))
+    exprs = []
+    for ptr in _probes(items):
+        exprs += [f"exists('{ptr}')", f"count('{ptr}') > 3", f"count('{ptr}') == 0", f"unique('{ptr}')"]
+    for expr in exprs:
+        assert evaluate_invariant(expr, indexed) == evaluate_invariant(expr, ctx), expr
@@ -0,0 +1,113 @@
+"""Digest-based dedupe/collapse/sort/signature match the str(value) versions on the spec corpus."""
+import copy
+import hashlib
+import json
+import random
+
+import pytest
+
+from shieldcraft.checklist.equivalence import _artifact_signature, _norm_text
+from shieldcraft.services.ast.builder import ASTBuilder
+from shieldcraft.services.checklist.canonical import canonical_sort
+from shieldcraft.services.checklist.collapse import collapse_items
+from shieldcraft.services.checklist.dedupe import dedupe_items
+from shieldcraft.services.checklist.generator import ChecklistGenerator
+from shieldcraft.services.checklist.value_digest import ValueDigester
+
+CORPUS = [
+    "spec/se_dsl_v1.spec.json",
+    "spec/products/shieldcraft_engine/se_spec_v1.json",
+    "tests/fixtures/canonical/minimal_spec.json",
+]
+
+
+def _legacy_dedupe(items):
+    seen, out = set(), []
+    for it in items:
+        key = (it["ptr"], it["text"], str(it.get("value")))
+        if key not in seen:
+            seen.add(key)
+            out.append(it)
+    return out
+
+
+def _legacy_sort(items):
+    return sorted(items, key=lambda it: (it["ptr"], len(it["ptr"]), it["text"], str(it.get("value"))))
+
+
+def _legacy_collapse(items):
+    by_ptr = {}
+    for it in items:
+        by_ptr.setdefault(it["ptr"], []).append(it)
+    out = []
+    for group in by_ptr.values():
+        keep = []
+        for g in sorted(group, key=lambda x: len(x["text"])):
+            if not any(g["text"].startswith(k["text"]) for k in keep if k != g):
+                keep.append(g)
+        out.extend(keep)
+    return out
+
+
+def _legacy_signature_part(value):
+    return _norm_text(value)
+
+
+def _items(spec, seed):
+    ast = ASTBuilder().build(spec)
+    items = ChecklistGenerator()._extract_from_ast(ast)
+    rng = random.Random(seed)
+    extra = []
+    for it in rng.sample(items, min(len(items), 200)):
+        clone = dict(it)
+        clone["value"] = copy.deepcopy(it["value"])  # equal but not identical
+        extra.append(clone)
+        variant = dict(it)
+        variant["text"] = it["text"] + " (variant)"
+        extra.append(variant)
+    # same ptr/text, different values (including str-equal scalars)
+    extra += [
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": 1},
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": "1"},
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": {"b": 1, "a": 2}},
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": {"a": 2, "b": 1}},
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": [1.0, True, None, "x  Y"]},
+        {"ptr": "/zz", "key": "zz", "text": "t", "value": [1, 1, None, "x  y"]},
+    ]
+    merged = items + extra
+    rng.shuffle(merged)
+    return merged
+
+
+@pytest.mark.parametrize("path", CORPUS)
+def test_ordering_identical_on_corpus(path):
+    spec = json.load(open(path, encoding="utf-8"))
+    items = _items(spec, seed=len(path))
+    digester = ValueDigester()
+
+    assert dedupe_items(items, digester) == _legacy_dedupe(items)
+    deduped = _legacy_dedupe(items)
+    assert collapse_items(deduped, digester) == _legacy_collapse(deduped)
+    assert [id(i) for i in canonical_sort(items, digester)] == [id(i) for i in _legacy_sort(items)]
+
+
+@pytest.mark.parametrize("path", CORPUS)
+def test_signature_groups_identical_on_corpus(path):
+    spec = json.load(open(path, encoding="utf-8"))
+    items = _items(spec, seed=3)
+    digester = ValueDigester(normalized=True)
+    legacy, new = {}, {}
+    for idx, it in enumerate(items):
+        legacy.setdefault(_legacy_signature_part(it["value"]) if it["value"] else it["text"], []).append(idx)
+        new.setdefault(_artifact_signature(it, digester), []).append(idx)
+    assert sorted(legacy.values()) == sorted(new.values())
+
+
+def test_digest_is_fixed_size_and_memoised():
+    spec = json.load(open(CORPUS[0], encoding="utf-8"))
+    digester = ValueDigester()
+    d = digester.digest(spec)
+    assert len(d) == 32
+    assert digester.digest(spec["sections"]) == ValueDigester().digest(spec["sections"])
+    assert digester.digest(copy.deepcopy(spec)) == d
+    assert hashlib.sha256(b"").digest() != d
@@ -14,7 +14,7 @@ def test_cli_writes_refusal_report_when_engine_returns_refusal(monkeypatch):
 
     _cleanup()
 
-    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None):
+    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None, session=None):
         return {'checklist': {'items': [], 'refusal': True, 'refusal_reason': 'disallowed_selfhost_input'}}
 
     monkeypatch.setattr('shieldcraft.engine.Engine.run_self_host', fake_engine_runner)
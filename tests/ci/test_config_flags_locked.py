@@ -27,6 +27,11 @@ def test_config_flags_are_listed_and_locked():
         "SHIELDCRAFT_DETERMINISM_BASE",
         "SHIELDCRAFT_ALLOW_EXTERNAL_SYNC",
         "SHIELDCRAFT_SYNC_AUTHORITY",
+        "SHIELDCRAFT_COMPACT_AST",
+        "SHIELDCRAFT_HASH_CACHE",
+        "SHIELDCRAFT_API_WORKERS",
+        "SHIELDCRAFT_API_QUEUE_SIZE",
+        "SHIELDCRAFT_READINESS_WORKERS",
     }
     # All discovered flags should be in the allowed list (prevents accidental new flags)
     assert flags_used.issubset(allowed), f"New or unlisted config flags found: {flags_used - allowed}"
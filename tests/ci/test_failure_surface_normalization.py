@@ -15,7 +15,7 @@ def test_cli_writes_snapshot_error(monkeypatch):
 
     _cleanup()
 
-    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None):
+    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None, session=None):
         raise SnapshotError('snapshot_missing', 'snapshot file missing', {'path': 'artifacts/repo_snapshot.json'})
 
     monkeypatch.setattr('shieldcraft.engine.Engine.run_self_host', fake_engine_runner)
@@ -38,7 +38,7 @@ def test_cli_writes_sync_error(monkeypatch):
 
     _cleanup()
 
-    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None):
+    def fake_engine_runner(self, spec, dry_run=False, emit_preview=None, session=None):
         raise SyncError('sync_missing', 'repo_state_sync.json not found', '/repo_state_sync.json')
 
     monkeypatch.setattr('shieldcraft.engine.Engine.run_self_host', fake_engine_runner)
@@ -0,0 +1,78 @@
+import os
+
+from shieldcraft.services.codegen.generator import CodeGenerator
+from shieldcraft.services.codegen.template_registry import TemplateRegistry
+
+
+def test_template_compiled_once_and_recompiled_on_change(tmp_path):
+    tpl = tmp_path / "t.j2"
+    tpl.write_text("hello {{ name }}\n")
+    reg = TemplateRegistry()
+
+    t1 = reg.jinja(tpl)
+    t2 = reg.jinja(tpl)
+    assert t1 is t2
+    assert t1.render(name="a") == "hello a"
+
+    tpl.write_text("bye {{ name }}\n")
+    st = os.stat(tpl)
+    os.utime(tpl, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    t3 = reg.jinja(tpl)
+    assert t3 is not t1
+    assert t3.render(name="a") == "bye a"
+
+    stats = reg.stats()
+    assert stats["compiles"] == 2
+    assert stats["compile_hits"] == 1
+    assert stats["source_reads"] == 2
+
+
+def test_registry_render_matches_plain_jinja(tmp_path):
+    from jinja2 import Template
+    tpl = tmp_path / "t.j2"
+    source = "{% for c in items %}- {{ c }}\n{% endfor %}{{ missing | default('x') }}\n"
+    tpl.write_text(source)
+    ctx = {"items": ["a", "b"]}
+    assert TemplateRegistry().jinja(tpl).render(ctx) == Template(source).render(ctx)
+
+
+def test_codegen_reads_each_template_once():
+    gen = CodeGenerator()
+    gen.templates = TemplateRegistry()
+    items = [{"id": f"i{n}", "type": "integration", "ptr": f"/x/{n}", "lineage_id": f"l{n}"} for n in range(20)]
+
+    gen.run({"items": items}, dry_run=True)
+
+    stats = gen.templates.stats()
+    assert stats["source_reads"] == 1
+    assert stats["compiles"] == 1
+    assert stats["compile_hits"] == 19
+
+
+def test_compile_uses_source_read_even_if_file_changes(tmp_path):
+    tpl = tmp_path / "t.j2"
+    tpl.write_text("old {{ name }}\n")
+    reg = TemplateRegistry()
+    env = reg.environment()
+
+    def changed_environment():
+        # The file is re-read by another caller between lookup and compile
+        tpl.write_text("new content {{ name }}\n")
+        reg.read(tpl)
+        return env
+
+    reg.environment = changed_environment
+    assert reg.jinja(tpl).render(name="a") == "old a"
+
+
+def test_compiled_templates_are_bounded(tmp_path):
+    reg = TemplateRegistry(max_compiled=2)
+    paths = []
+    for n in range(3):
+        p = tmp_path / f"t{n}.j2"
+        p.write_text(f"t{n} {{{{ x }}}}\n")
+        paths.append(p)
+        reg.jinja(p)
+    assert reg.stats()["templates"] == 2
+    assert reg.jinja(paths[0]).render(x=1) == "t0 1"
+    assert reg.stats()["compiles"] == 4
@@ -13,6 +13,16 @@ if str(SRC) not in sys.path:
 os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
 
 
+def pytest_collection_modifyitems(config, items):
+    # Wall-clock benchmarks depend on the machine; run them only on request
+    if os.environ.get("SHIELDCRAFT_BENCH") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmark; set SHIELDCRAFT_BENCH=1 to run")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(autouse=True)
 def clear_persona_registry():
     # Ensure persona registry does not leak across tests
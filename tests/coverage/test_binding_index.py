@@ -0,0 +1,90 @@
+"""Indexed bind_units_to_items matches the per-pair scan it replaced."""
+import copy
+import hashlib
+import random
+
+from shieldcraft.coverage.evaluator import _tokenize, bind_units_to_items
+
+WORDS = ["the", "system", "must", "log", "audit", "events", "retain", "keys", "rotate",
+         "encrypt", "data", "at", "rest", "api", "tokens", "expire", "Daily", "v2", "MFA"]
+
+
+def legacy_bind_units_to_items(units, items):
+    for it in items:
+        it['covers_units'] = sorted(list(set(it.get('covers_units') or [])))
+    for u in units:
+        uid = u.get('id')
+        uptr = u.get('ptr') or ''
+        utext = (u.get('text') or '')
+        u_tokens = set(_tokenize(utext))
+        for it in items:
+            matched = False
+            iptr = it.get('ptr') or ''
+            if iptr and (iptr == uptr or iptr.startswith(uptr.rstrip('/') + '/')):
+                matched = True
+            ev = it.get('evidence') or {}
+            quote = ev.get('quote') or ''
+            if not matched and quote:
+                overlap = len(u_tokens & set(_tokenize(quote)))
+                if (u.get('kind') or '') == 'requirement':
+                    thresh = max(2, int(len(u_tokens) * 0.4))
+                else:
+                    thresh = 5
+                if overlap >= thresh:
+                    matched = True
+            if not matched and quote:
+                h = hashlib.sha256(utext.lower().encode()).hexdigest()[:12]
+                if h == (ev.get('source_excerpt_hash') or ''):
+                    matched = True
+            if matched:
+                lst = set(it.get('covers_units') or [])
+                lst.add(uid)
+                it['covers_units'] = sorted(lst)
+    return items
+
+
+def _sentence(rnd, lo, hi):
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(lo, hi)))
+
+
+def _excerpt_hash(text):
+    return hashlib.sha256(text.lower().encode()).hexdigest()[:12]
+
+
+def _corpus(seed, n_units, n_items):
+    rnd = random.Random(seed)
+    ptrs = ["", "/", "/sections", "/sections/0", "/sections/0/", "/sections/01", "/sections/1/rules", None]
+    units = []
+    for i in range(n_units):
+        u = {"id": f"U-{i:04d}", "text": _sentence(rnd, 0, 14),
+             "kind": rnd.choice(["requirement", "section", None])}
+        choice = rnd.choice(ptrs)
+        if choice is not None:
+            u["ptr"] = choice
+        units.append(u)
+    items = []
+    for i in range(n_items):
+        ev = {"quote": rnd.choice(["", _sentence(rnd, 0, 16)])}
+        if rnd.random() < 0.2:
+            ev["source_excerpt_hash"] = _excerpt_hash(rnd.choice(units)["text"])
+        it = {"id": f"item-{i}", "evidence": ev}
+        if rnd.random() < 0.7:
+            it["ptr"] = rnd.choice(ptrs[1:-1] + ["/sections/0/x", "/other"])
+        if rnd.random() < 0.2:
+            it["covers_units"] = ["U-9999", "U-0001", "U-9999"]
+        items.append(it)
+    return units, items
+
+
+def test_indexed_binding_matches_pairwise_scan():
+    for seed in range(5):
+        units, items = _corpus(seed, 150, 200)
+        expected = legacy_bind_units_to_items(units, copy.deepcopy(items))
+        assert bind_units_to_items(units, items) == expected
+
+
+def test_binding_item_listed_twice():
+    it = {"id": "i", "ptr": "/a/b"}
+    units = [{"id": "u2", "ptr": "/a"}, {"id": "u1", "ptr": "/a/b"}]
+    out = bind_units_to_items(units, [it, it])
+    assert out[0] is out[1] and it["covers_units"] == ["u1", "u2"]
@@ -0,0 +1,77 @@
+"""Pooled run_batch produces the same results and hash as serial mode."""
+import json
+import os
+
+import pytest
+
+from shieldcraft.engine import Engine
+from shieldcraft.engine_batch import _execute_one, run_batch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SCHEMA = os.path.join(ROOT, "src/shieldcraft/dsl/schema/se_dsl.schema.json")
+
+
+def _valid_spec(i):
+    return {"metadata": {"product_id": f"batch{i}", "version": "1.0", "spec_version": "1.0"},
+            "model": {"version": "1.0"},
+            "sections": [{"id": f"core{j}", "description": f"Service {i} must log request {j}."}
+                         for j in range(1 + i % 3)]}
+
+
+def _specs(tmp_path):
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"spec_{i}.json"
+        if i % 3 == 0:
+            spec = {"sections": []}  # no metadata: both load as product "unknown"
+        elif i % 3 == 1:
+            spec = _valid_spec(i)
+        else:
+            spec = {"metadata": {"product_id": f"batch{i}", "version": "1.0"},
+                    "sections": {"core": {"description": f"s{i}"}}}  # schema error
+        p.write_text(json.dumps(spec))
+        paths.append(str(p))
+    paths.append(str(tmp_path / "missing.json"))
+    return paths
+
+
+@pytest.fixture
+def verified_sync(monkeypatch):
+    # Nothing in the tree records a sync; treat every spec as preflight-verified
+    # so execute runs its pipeline (forked pool workers inherit the patch)
+    monkeypatch.setattr(Engine, "_validate_spec", lambda self, spec: None)
+
+
+def test_pooled_batch_matches_serial(tmp_path, monkeypatch, verified_sync):
+    paths = _specs(tmp_path)
+    # Each mode starts from an empty products/ tree
+    for mode in ("serial", "pooled"):
+        (tmp_path / mode).mkdir()
+    monkeypatch.chdir(tmp_path / "serial")
+    serial = run_batch(list(reversed(paths)), SCHEMA)
+    monkeypatch.chdir(tmp_path / "pooled")
+    streamed = []
+    pooled = run_batch(paths, SCHEMA, workers=3, on_result=streamed.append)
+
+    assert pooled == serial
+    valid = [r for r in pooled["results"] if r["success"]]
+    assert [os.path.basename(r["spec_path"]) for r in valid] == [
+        "spec_0.json", "spec_1.json", "spec_3.json", "spec_4.json"]
+    assert all(r["checklist_count"] > 0 for r in valid)
+    assert [r["spec_path"] for r in pooled["results"]] == sorted(paths)
+    assert sorted(r["spec_path"] for r in streamed) == sorted(paths)
+
+
+def test_summary_does_not_depend_on_earlier_specs(tmp_path, monkeypatch, verified_sync):
+    monkeypatch.chdir(tmp_path)
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    first.write_text(json.dumps(_valid_spec(2)))
+    second.write_text(json.dumps(_valid_spec(4)))
+
+    alone = _execute_one(Engine(SCHEMA), str(second))
+    engine = Engine(SCHEMA)
+    _execute_one(engine, str(first))
+    after_first = _execute_one(engine, str(second))
+
+    assert alone["success"] is True
+    assert after_first == alone
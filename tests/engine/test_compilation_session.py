@@ -0,0 +1,72 @@
+import json
+
+from shieldcraft.engine import Engine
+from shieldcraft.services.spec.session import CompilationSession
+
+SCHEMA = "src/shieldcraft/dsl/schema/se_dsl.schema.json"
+
+
+def _write_spec(tmp_path):
+    spec = {
+        "metadata": {"product_id": "test-session", "version": "1.0"},
+        "model": {"version": "1.0"},
+        "sections": [],
+    }
+    p = tmp_path / "spec.json"
+    p.write_text(json.dumps(spec))
+    return str(p)
+
+
+def test_session_stages_run_once(tmp_path, monkeypatch):
+    import shieldcraft.dsl.loader as loader
+    calls = []
+    real = loader.load_spec
+
+    def counting_load(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(loader, "load_spec", counting_load)
+
+    session = CompilationSession(_write_spec(tmp_path))
+    session.load()
+    ast = session.build()
+    session.load()
+    session.build()
+
+    assert len(calls) == 1
+    assert session.ast is ast
+    assert session.spec_model is not None
+    assert session.spec_model.fingerprint == session.fingerprint
+    assert {"load", "ast", "fingerprint"} <= set(session.timings)
+
+
+def test_run_reuses_session_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr('shieldcraft.engine.validate_spec_against_schema',
+                        lambda spec, schema_path: (True, []))
+    engine = Engine(SCHEMA)
+    session = engine.compile(_write_spec(tmp_path))
+    session.load()
+    ast = session.build()
+
+    def fail_build(spec):
+        raise AssertionError("AST rebuilt despite session")
+
+    monkeypatch.setattr(engine.ast, "build", fail_build)
+    engine._last_sync_verified = {"sha256": "test"}
+    engine._last_validated_spec_fp = session.fingerprint
+    monkeypatch.chdir(tmp_path)
+    engine.run(session.spec_path, session=session)
+
+    assert session.valid is True
+    assert engine.last_session is session
+    assert session.ast is ast
+    assert "checklist" in session.timings
+
+
+def test_timings_report_is_millisecond_summary():
+    session = CompilationSession.from_spec({"metadata": {}})
+    session.build()
+    report = session.timings_report()
+    assert set(report["stages"]) == {"ast", "fingerprint"}
+    assert report["total_ms"] >= 0
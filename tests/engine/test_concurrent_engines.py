@@ -0,0 +1,132 @@
+"""Engines running concurrently in one process keep their run state apart."""
+import asyncio
+import json
+import os
+import threading
+
+from shieldcraft.engine import Engine
+from shieldcraft.observability import emit_state, read_state
+from shieldcraft.persona import Persona
+from shieldcraft.persona.persona_registry import find_personas_for_phase, list_personas, register_persona
+from shieldcraft.services.checklist.context import get_global_context, record_event_global
+from shieldcraft.services.checklist.model import ChecklistModel
+from shieldcraft.services.spec.fingerprint import compute_spec_fingerprint
+from shieldcraft.verification.seed_manager import snapshot
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SCHEMA = os.path.join(ROOT, "src/shieldcraft/dsl/schema/se_dsl.schema.json")
+
+
+def test_threaded_engines_record_isolated_events(tmp_path):
+    n_engines, rounds = 8, 25
+    barrier = threading.Barrier(n_engines)
+    engines, errors = {}, []
+
+    def worker(i):
+        try:
+            spec = tmp_path / f"missing_{i}.json"
+            eng = Engine(SCHEMA, artifacts_dir=str(tmp_path / f"artifacts_{i}"))
+            engines[i] = eng
+            barrier.wait()
+            for r in range(rounds):
+                with eng.run_scope():
+                    assert get_global_context() is eng.checklist_context
+                    record_event_global("T_MARK", "test", "DIAGNOSTIC", evidence={"engine": i, "round": r})
+                    ChecklistModel().normalize_item({"text": f"engine {i}"})
+                    emit_state(eng, "test", f"engine-{i}", "ok")
+                    register_persona(Persona(name=f"p{i}", scope=["checklist"]))
+                    assert [p.name for p in find_personas_for_phase("checklist")] == [f"p{i}"]
+            assert isinstance(eng.run(str(spec)), dict)
+        except BaseException as e:  # surfaced in the main thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_engines)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+    for i, eng in engines.items():
+        events = eng.checklist_context.get_events()
+        marks = [e for e in events if e["gate_id"] == "T_MARK"]
+        assert [m["evidence"] for m in marks] == [{"engine": i, "round": r} for r in range(rounds)]
+        assert sum(1 for e in events if e["gate_id"] == "G21_CHECKLIST_MODEL_VALIDATION_ERRORS") == rounds
+        assert sum(1 for e in events if e["gate_id"] == "G4_SCHEMA_VALIDATION") == 1
+        with eng.run_scope():
+            gates = {entry["gate"] for entry in read_state()}
+        assert gates <= {f"engine-{i}", "readiness", "preflight"} and f"engine-{i}" in gates
+    # Scoped registrations never reach the process registry
+    assert not [p for p in list_personas() if p.name.startswith("p") and p.name[1:].isdigit()]
+
+
+def test_asyncio_tasks_get_separate_scopes():
+    async def one(i):
+        eng = Engine(SCHEMA)
+        with eng.run_scope():
+            for r in range(20):
+                record_event_global("T_ASYNC", "test", "DIAGNOSTIC", evidence={"engine": i})
+                await asyncio.sleep(0)
+        return i, eng
+
+    async def main():
+        return await asyncio.gather(*(one(i) for i in range(6)))
+
+    for i, eng in asyncio.run(main()):
+        events = eng.checklist_context.get_events()
+        assert len(events) == 20 and all(e["evidence"] == {"engine": i} for e in events)
+
+
+def _valid_spec(tmp_path, i):
+    spec = {"metadata": {"product_id": f"conc{i}", "version": "1.0", "spec_version": "1.0"},
+            "model": {"version": "1.0"},
+            "sections": [{"id": f"core{j}", "description": f"Service {i} must log request {j}."}
+                         for j in range(1 + i)]}
+    path = tmp_path / f"spec_{i}.json"
+    path.write_text(json.dumps(spec))
+    return path
+
+
+def _run_valid(path, artifacts_dir, i):
+    # Record a passed preflight; nothing in the tree performs the sync yet
+    eng = Engine(SCHEMA, artifacts_dir=str(artifacts_dir))
+    session = eng.compile(str(path))
+    eng._last_sync_verified = {"sha256": f"sync-{i}"}
+    eng._last_validated_spec_fp = compute_spec_fingerprint(session.load())
+    with eng.run_scope():
+        register_persona(Persona(name=f"valid{i}", scope=["checklist"]))
+        result = eng.run(str(path), session=session)
+        personas = [p.name for p in find_personas_for_phase("checklist")]
+        states = [(e["phase"], e["gate"], e["status"]) for e in read_state()]
+    return {"result": json.dumps(result, sort_keys=True, default=str),
+            "events": eng.checklist_context.get_events(),
+            "seeds": snapshot(eng), "personas": personas, "states": states}
+
+
+def test_concurrent_valid_runs_match_serial(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    n_engines = 4
+    paths = [_valid_spec(tmp_path, i) for i in range(n_engines)]
+    serial = [_run_valid(paths[i], tmp_path / f"serial_{i}", i) for i in range(n_engines)]
+
+    barrier = threading.Barrier(n_engines)
+    concurrent, errors = {}, []
+
+    def worker(i):
+        try:
+            barrier.wait()
+            concurrent[i] = _run_valid(paths[i], tmp_path / f"concurrent_{i}", i)
+        except BaseException as e:  # surfaced in the main thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_engines)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+    assert [concurrent[i] for i in range(n_engines)] == serial
+    assert len({s["seeds"]["run"] for s in serial}) == n_engines
+    assert [s["personas"] for s in serial] == [[f"valid{i}"] for i in range(n_engines)]
+    assert all(s["events"] for s in serial)
@@ -5,7 +5,7 @@ def test_generate_code_handles_codegen_exceptions(monkeypatch):
     engine = Engine('src/shieldcraft/dsl/schema/se_dsl.schema.json')
 
     # Make engine.run return a normal successful checklist result
-    def fake_run(self, spec_path):
+    def fake_run(self, spec_path, session=None):
         return {"checklist": {"items": []}}
 
     monkeypatch.setattr('shieldcraft.engine.Engine.run', fake_run)
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from shieldcraft.services.io import artifact_bus as ab
+
+
+def _obj():
+    return {"b": [1, 2, {"z": "é"}], "a": {"nested": True}}
+
+
+def _expected(obj):
+    return json.dumps(obj, indent=2, sort_keys=True)
+
+
+def test_write_without_bus_matches_json_dump(tmp_path):
+    p = tmp_path / "out" / "r.json"
+    ab.write_json(str(p), _obj())
+    assert p.read_text(encoding="utf8") == _expected(_obj())
+    assert ab.read_json(str(p)) == _obj()
+    assert ab.current_bus() is None
+
+
+def test_bus_serves_writes_from_memory_and_flushes_on_exit(tmp_path):
+    p = tmp_path / "r.json"
+    obj = _obj()
+    with ab.artifact_bus() as bus:
+        ab.write_json(str(p), obj)
+        assert ab.artifact_exists(str(p))
+        assert ab.read_json(str(p)) is obj
+        assert ab.artifact_sha256(str(p)) == hashlib.sha256(_expected(obj).encode("utf8")).hexdigest()
+        # Mutation after publish does not change the bytes written
+        obj["late"] = 1
+        assert ab.current_bus() is bus
+    assert ab.current_bus() is None
+    assert p.read_text(encoding="utf8") == _expected(_obj())
+
+
+def test_repeated_writes_leave_last_content(tmp_path):
+    p = tmp_path / "r.json"
+    with ab.artifact_bus():
+        for i in range(20):
+            ab.write_json(str(p), {"i": i})
+    assert json.loads(p.read_text()) == {"i": 19}
+    assert not (tmp_path / "r.json.tmp").exists()
+
+
+def test_copy_publishes_same_bytes(tmp_path):
+    src, dst = tmp_path / "a.json", tmp_path / "b.json"
+    with ab.artifact_bus():
+        ab.write_json(str(src), _obj())
+        ab.copy_artifact(str(src), str(dst))
+        assert ab.read_json(str(dst)) == _obj()
+        with pytest.raises(Exception):
+            ab.copy_artifact(str(src), str(src))
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_falls_back_to_file_copy(tmp_path):
+    src, dst = tmp_path / "a.json", tmp_path / "b.json"
+    src.write_text("{}")
+    with ab.artifact_bus():
+        ab.copy_artifact(str(src), str(dst))
+    assert dst.read_text() == "{}"
+
+
+def test_disk_reads_are_cached_until_file_changes(tmp_path):
+    p = tmp_path / "m.json"
+    p.write_text(json.dumps({"v": 1}))
+    with ab.artifact_bus():
+        first = ab.read_json(str(p))
+        assert ab.read_json(str(p)) is first
+        p.write_text(json.dumps({"v": 22}))
+        assert ab.read_json(str(p)) == {"v": 22}
+
+
+def test_nested_bus_joins_outer(tmp_path):
+    p = tmp_path / "r.json"
+    with ab.artifact_bus() as outer:
+        with ab.artifact_bus() as inner:
+            assert inner is outer
+            ab.write_json(str(p), {"x": 1})
+        assert ab.current_bus() is outer
+    assert json.loads(p.read_text()) == {"x": 1}
+
+
+def test_body_error_is_not_masked_by_write_error(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    with pytest.raises(RuntimeError, match="body"):
+        with ab.artifact_bus():
+            ab.write_json(os.path.join(str(blocker), "r.json"), {})
+            raise RuntimeError("body")
+    with pytest.raises(OSError):
+        with ab.artifact_bus():
+            ab.write_json(os.path.join(str(blocker), "r.json"), {})
+    assert ab.current_bus() is None
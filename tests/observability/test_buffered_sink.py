@@ -0,0 +1,74 @@
+import os
+
+from shieldcraft import observability
+from shieldcraft.observability import (
+    buffered,
+    emit_persona_annotation,
+    emit_persona_event,
+    emit_state,
+    flush,
+    read_persona_annotations,
+    read_persona_events,
+    read_persona_events_hash,
+    read_state,
+)
+
+
+class _Engine:
+    pass
+
+
+def _emit_all(engine, n):
+    emit_state(engine, "checklist", "build", "start")
+    for i in range(n):
+        emit_persona_annotation(engine, "p", "checklist", f"note {i}")
+        emit_persona_event(engine, "p", "decision", "checklist", f"ref-{i}")
+    emit_state(engine, "checklist", "build", "ok")
+
+
+def _snapshot():
+    return read_state(), read_persona_annotations(), read_persona_events(), read_persona_events_hash()
+
+
+def test_buffered_snapshot_matches_unbuffered(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _emit_all(_Engine(), 25)
+    expected = _snapshot()
+    for name in os.listdir("artifacts"):
+        os.remove(os.path.join("artifacts", name))
+
+    engine = _Engine()
+    with buffered(engine):
+        with buffered(engine):
+            _emit_all(engine, 25)
+        # inner scope exit is not a flush point
+        assert not os.path.exists(os.path.join("artifacts", observability.EVENTS_FILENAME))
+    assert _snapshot() == expected
+
+
+def test_flush_writes_pending_entries(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = _Engine()
+    with buffered(engine):
+        emit_persona_event(engine, "p", "annotate", "preflight", "x")
+        flush(engine)
+        assert [e["payload_ref"] for e in read_persona_events()] == ["x"]
+        assert len(read_persona_events_hash()) == 64
+
+
+def test_event_schema_loaded_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    observability._event_schema()
+    opened = []
+    real_open = open
+
+    def _spy(path, *a, **kw):
+        opened.append(str(path))
+        return real_open(path, *a, **kw)
+
+    monkeypatch.setattr("builtins.open", _spy)
+    engine = _Engine()
+    with buffered(engine):
+        for i in range(10):
+            emit_persona_event(engine, "p", "decision", "checklist", f"r{i}")
+    assert not any(p.endswith("persona_event_v1.schema.json") for p in opened)
@@ -0,0 +1,70 @@
+"""Persona rules evaluated through MatchIndex behave like a full item scan."""
+import random
+from types import SimpleNamespace
+
+import shieldcraft.persona.persona_evaluator as pe
+from shieldcraft.persona.persona_evaluator import MatchIndex, _matches, evaluate_personas
+
+
+def _items(n, seed=3):
+    rnd = random.Random(seed)
+    return [{"id": f"i{i}", "ptr": f"/sections/{i % 7}",
+             "type": rnd.choice(["task", "fix", None]),
+             "priority": rnd.choice(["P0", "P1", 1, True]),
+             "tags": rnd.choice([["a"], ["b"], None])} for i in range(n)]
+
+
+def _matches_for(rnd):
+    pool = [("type", "task"), ("type", None), ("priority", 1), ("priority", "P0"),
+            ("ptr", "/sections/3"), ("tags", ["a"]), ("missing", None), ("id", "i5")]
+    return dict(rnd.sample(pool, rnd.randint(0, 3)))
+
+
+def test_candidates_match_linear_scan_under_mutation():
+    rnd = random.Random(9)
+    items = _items(300)
+    index = MatchIndex(items)
+    for _ in range(200):
+        match = _matches_for(rnd)
+        assert index.candidates(match) == [i for i, it in enumerate(items) if _matches(it, match)]
+        pos = rnd.randrange(len(items))
+        key = rnd.choice(["type", "priority", "tags"])
+        items[pos][key] = rnd.choice(["task", "fix", None, ["a"], 1])
+        index.refresh(pos, key)
+
+
+def test_evaluate_personas_records_in_scan_order(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pe, "emit_veto", lambda engine, ctx, phase, code, expl, severity="high":
+                        calls.append(("veto", ctx.name, code)))
+    monkeypatch.setattr(pe, "record_decision", lambda engine, name, phase, decision:
+                        calls.append(("decision", name, decision["action"])))
+    rnd = random.Random(5)
+    personas = []
+    for name in ["zeta", "alpha", "mid"]:
+        personas.append(SimpleNamespace(
+            name=name, role=None, display_name=name, scope=["checklist"], allowed_actions=["veto"],
+            constraints={
+                "veto": [{"match": _matches_for(rnd), "code": f"{name}-v{k}"} for k in range(3)],
+                "constraint": [{"match": _matches_for(rnd), "set": rnd.choice([{"note": name}, {"id": "x"}])}
+                               for _ in range(3)]}))
+    items = _items(120)
+    res = evaluate_personas(None, personas, items)
+
+    expected_calls, expected_vetoes, expected_constraints = [], [], []
+    for p in sorted(personas, key=lambda x: x.name):
+        for rule in p.constraints["veto"]:
+            for it in items:
+                if _matches(it, rule["match"]):
+                    expected_calls.append(("veto", p.name, rule["code"]))
+                    expected_vetoes.append(it["id"])
+        for rule in p.constraints["constraint"]:
+            disallowed = "id" in rule["set"]
+            for it in items:
+                if _matches(it, rule["match"]):
+                    expected_calls.append(("decision", p.name, "constraint_disallowed" if disallowed else "constraint"))
+                    expected_constraints.append(it["id"])
+
+    assert calls == expected_calls
+    assert [v["item_id"] for v in res["vetoes"]] == expected_vetoes
+    assert [c["item_id"] for c in res["constraints"]] == expected_constraints
@@ -0,0 +1,72 @@
+"""Indexed compute_coverage matches the per-pair scan it replaced."""
+import random
+
+from shieldcraft.requirements.coverage import _min_overlap, _overlap_ratio, compute_coverage
+
+WORDS = ["the", "system", "must", "log", "audit", "events", "retain", "keys", "rotate",
+         "encrypt", "data", "at", "rest", "api", "tokens", "expire", "Daily", "v2", "MFA"]
+
+
+def legacy_compute_coverage(requirements, checklist_items):
+    res = []
+    for r in sorted(requirements, key=lambda x: x.get('id')):
+        req_ptr = r.get('ptr') or r.get('source_ptr') or r.get('ptr')
+        matched_ids, strong = [], False
+        for it in checklist_items:
+            ev = it.get('evidence') or {}
+            iptr = (ev.get('source') or {}).get('ptr') or ''
+            ihash = ev.get('source_excerpt_hash') or ''
+            quote = ev.get('quote') or ''
+            hit = bool(iptr and (iptr == req_ptr or iptr.startswith((req_ptr or '').rstrip('/') + '/')))
+            hit = hit or bool(ihash and ihash == r.get('hash'))
+            hit = hit or bool(quote and _overlap_ratio(r.get('text') or '', quote) >= 0.6)
+            if hit:
+                matched_ids.append(it.get('id'))
+                if (it.get('priority') in ('P0', 'P1')) and ((it.get('confidence') or '').lower() != 'low'):
+                    strong = True
+        status = 'MISSING' if not matched_ids else ('FULL' if strong else 'PARTIAL')
+        res.append((r.get('id'), sorted(set(matched_ids)), status))
+    return res
+
+
+def _sentence(rnd, lo, hi):
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(lo, hi)))
+
+
+def _corpus(seed, n_reqs, n_items):
+    rnd = random.Random(seed)
+    ptrs = ["", "/", "/sections", "/sections/0", "/sections/0/", "/sections/01", "/sections/1/rules", None]
+    reqs = []
+    for i in range(n_reqs):
+        r = {"id": f"REQ-{i:04d}", "text": _sentence(rnd, 0, 9)}
+        choice = rnd.choice(ptrs)
+        if choice is not None:
+            r[rnd.choice(["ptr", "source_ptr"])] = choice
+        if rnd.random() < 0.3:
+            r["hash"] = rnd.choice(["h1", "h2", ""])
+        reqs.append(r)
+    items = []
+    for i in range(n_items):
+        ev = {"quote": _sentence(rnd, 0, 12)}
+        if rnd.random() < 0.7:
+            ev["source"] = {"ptr": rnd.choice(ptrs[1:-1] + ["/sections/0/x", "/other"])}
+        if rnd.random() < 0.3:
+            ev["source_excerpt_hash"] = rnd.choice(["h1", "h2", "h3"])
+        items.append({"id": f"item-{i % (n_items - 5)}", "evidence": ev,
+                      "priority": rnd.choice(["P0", "P1", "P2", None]),
+                      "confidence": rnd.choice(["low", "High", None])})
+    return reqs, items
+
+
+def test_indexed_coverage_matches_pairwise_scan():
+    for seed in range(5):
+        reqs, items = _corpus(seed, 150, 200)
+        got = [(c.requirement_id, c.checklist_item_ids, c.coverage_status.value)
+               for c in compute_coverage(reqs, items)]
+        assert got == legacy_compute_coverage(reqs, items)
+
+
+def test_min_overlap_is_exact_threshold():
+    for n in range(1, 200):
+        k = _min_overlap(n)
+        assert k / n >= 0.6 and (k - 1) / n < 0.6
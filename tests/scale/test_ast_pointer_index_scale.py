@@ -0,0 +1,56 @@
+"""Pointer lookup on a ~50k-node AST, indexed vs depth-first scan."""
+import time
+
+import pytest
+
+from shieldcraft.services.ast.builder import ASTBuilder
+
+
+def _large_spec(sections=200, items=80):
+    return {
+        "metadata": {"product_id": "scale-ast"},
+        "sections": [
+            {"id": f"s{i}", "items": [{"id": f"i{i}_{j}", "text": "must do"} for j in range(items)]}
+            for i in range(sections)
+        ],
+    }
+
+
+def _scan_find(node, pointer):
+    # Legacy recursive DFS lookup used before the pointer index existed.
+    if node.ptr == pointer:
+        return node
+    for child in node.children:
+        found = _scan_find(child, pointer)
+        if found:
+            return found
+    return None
+
+
+def test_pointer_index_agrees_with_scan_on_large_ast():
+    ast = ASTBuilder().build(_large_spec(sections=40, items=20))
+    sample = [n.ptr for n in ast.walk()][::13] + ["/missing"]
+    assert [ast.find(p) for p in sample] == [_scan_find(ast, p) for p in sample]
+
+
+@pytest.mark.bench
+def test_pointer_index_lookup_on_50k_nodes():
+    ast = ASTBuilder().build(_large_spec())
+    assert len(ast.index) >= 48000
+
+    pointers = [n.ptr for n in ast.walk()]
+    sample = pointers[::97]
+
+    start = time.perf_counter()
+    indexed = [ast.find(p) for p in sample]
+    indexed_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [_scan_find(ast, p) for p in sample]
+    scan_s = time.perf_counter() - start
+
+    assert indexed == scanned
+    print(f"\n[bench] nodes={len(ast.index)} lookups={len(sample)} "
+          f"indexed={indexed_s * 1e6 / len(sample):.2f}us/lookup "
+          f"scan={scan_s * 1e6 / len(sample):.2f}us/lookup")
+    assert indexed_s < scan_s
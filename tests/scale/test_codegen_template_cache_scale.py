@@ -0,0 +1,69 @@
+"""CodeGenerator throughput with and without the template registry."""
+import pathlib
+import time
+
+import pytest
+
+from shieldcraft.services.codegen.generator import CodeGenerator
+from shieldcraft.services.codegen.template_registry import TemplateRegistry
+
+TYPES = ("module", "integration", "resolve-cycle", "fix-dependency", "task")
+
+
+def _checklist(n):
+    return {"items": [
+        {"id": f"item-{i}", "type": TYPES[i % len(TYPES)], "name": f"mod{i}", "ptr": f"/sections/{i}",
+         "lineage_id": f"lin-{i}", "cycle_items": ["a", "b"], "text": "must do"}
+        for i in range(n)
+    ]}
+
+
+class _UncachedTemplates:
+    """Pre-registry behaviour: re-read and re-compile per item."""
+
+    def read(self, path):
+        return pathlib.Path(path).read_text()
+
+    def jinja(self, path):
+        from jinja2 import Template
+        return Template(pathlib.Path(path).read_text())
+
+
+def _throughput(gen, checklist):
+    start = time.perf_counter()
+    result = gen.run(checklist, dry_run=True)
+    return result, len(checklist["items"]) / (time.perf_counter() - start)
+
+
+def test_template_registry_output_matches_uncached():
+    checklist = _checklist(50)
+    before = CodeGenerator()
+    before.templates = _UncachedTemplates()
+    after = CodeGenerator()
+    after.templates = TemplateRegistry()
+
+    res_before = before.run(checklist, dry_run=True)
+    res_after = after.run(checklist, dry_run=True)
+
+    assert res_after["codegen_bundle_hash"] == res_before["codegen_bundle_hash"]
+    assert res_after["outputs"] == res_before["outputs"]
+    assert after.templates.stats()["compiles"] <= len(TYPES)
+
+
+@pytest.mark.bench
+def test_codegen_throughput_with_template_registry():
+    checklist = _checklist(2000)
+
+    before = CodeGenerator()
+    before.templates = _UncachedTemplates()
+    res_before, ips_before = _throughput(before, checklist)
+
+    after = CodeGenerator()
+    after.templates = TemplateRegistry()
+    res_after, ips_after = _throughput(after, checklist)
+
+    assert res_after["codegen_bundle_hash"] == res_before["codegen_bundle_hash"]
+    assert res_after["outputs"] == res_before["outputs"]
+    print(f"\n[bench] items={len(checklist['items'])} uncached={ips_before:.0f} items/s "
+          f"cached={ips_after:.0f} items/s speedup={ips_after / ips_before:.1f}x")
+    assert ips_after > ips_before
@@ -0,0 +1,132 @@
+"""build_sequence on large checklists (reverse index + deque Kahn)."""
+import json
+import random
+import time
+
+import pytest
+
+from shieldcraft.checklist.dependencies import build_graph, build_sequence, detect_cycles
+
+
+def _layered_items(n_items, fanout, layers=50, seed=7):
+    # Items in layer L depend on `fanout` items from layer L-1, giving an
+    # acyclic graph with n_items * fanout edges and bounded chain depth.
+    rng = random.Random(seed)
+    per_layer = n_items // layers
+    items = []
+    for i in range(n_items):
+        layer = i // per_layer
+        item = {"id": f"item-{i:06d}"}
+        if layer > 0:
+            lo = (layer - 1) * per_layer
+            item["depends_on"] = [f"item-{rng.randrange(lo, lo + per_layer):06d}" for _ in range(fanout)]
+        if i % 3 == 0:
+            item["requirement_refs"] = ["REQ-1"]
+        items.append(item)
+    # a small cycle and a few orphans
+    items[1]["depends_on"] = ["item-000002"]
+    items[2]["depends_on"] = ["item-000001"]
+    return items
+
+
+def _legacy_build_sequence(items, inferred_deps, outdir):
+    """Pre-index implementation: per-item graph scans, list.pop(0), double topo sort."""
+    def topological_sort(graph):
+        indeg = {n: 0 for n in graph}
+        for n in graph:
+            for d in graph[n]:
+                indeg[d] = indeg.get(d, 0) + 1
+        q = [n for n, d in sorted(indeg.items()) if d == 0]
+        order = []
+        while q:
+            n = q.pop(0)
+            order.append(n)
+            for m in sorted(graph.get(n, [])):
+                indeg[m] -= 1
+                if indeg[m] == 0:
+                    q.append(m)
+        return order
+
+    graph = build_graph(items, inferred_deps)
+    cycles = detect_cycles(graph)
+    cycle_groups = {f"cycle_{i}": sorted(g) for i, g in enumerate(sorted(cycles, key=lambda g: sorted(g)))}
+    cyclic = {n for grp in cycles for n in grp}
+    contracted = {n: {d for d in deps if d not in cyclic} for n, deps in graph.items() if n not in cyclic}
+    order = topological_sort(contracted)
+    execution_order = {nid: idx + 1 for idx, nid in enumerate(order)}
+    sequence = []
+    for it in sorted(items, key=lambda x: x.get('id') or ''):
+        iid = it.get('id')
+        entry = {'id': iid, 'depends_on': sorted(graph.get(iid) or []),
+                 'blocks': sorted([n for n, deps in graph.items() if iid in deps]),
+                 'execution_order': execution_order.get(iid), 'in_cycle': None}
+        for gid, grp in cycle_groups.items():
+            if iid in grp:
+                entry['in_cycle'] = gid
+        sequence.append(entry)
+    depth = {n: 1 for n in contracted}
+    for n in topological_sort(contracted):
+        for d in contracted.get(n, []):
+            depth[n] = max(depth[n], 1 + depth.get(d, 1))
+    orphan_count = 0
+    for s in sequence:
+        if not s['depends_on'] and not s['blocks']:
+            orig = next((it for it in items if it.get('id') == s['id']), {})
+            if not orig.get('requirement_refs') and not (
+                    (orig.get('evidence') or {}).get('source_excerpt_hash')
+                    or (orig.get('evidence') or {}).get('source', {}).get('ptr')):
+                orphan_count += 1
+    return {'sequence': sequence, 'cycle_groups': cycle_groups,
+            'longest_chain': max(depth.values()) if depth else 0, 'orphan_count': orphan_count}
+
+
+def _with_orphans(items):
+    items.append({"id": "orphan-a"})
+    items.append({"id": "orphan-b", "evidence": {"source": {"ptr": "/x"}}})
+    return items
+
+
+def test_build_sequence_matches_legacy(tmp_path):
+    items = _with_orphans(_layered_items(600, fanout=4, layers=30))
+    inferred = {"item-000100": ["item-000005", "item-000006"]}
+
+    legacy = _legacy_build_sequence(items, inferred, str(tmp_path / "legacy"))
+    result = build_sequence(items, inferred, outdir=str(tmp_path / "new"))
+
+    assert result == legacy
+    assert result['cycle_groups'] == {"cycle_0": ["item-000001", "item-000002"]}
+
+
+@pytest.mark.bench
+def test_build_sequence_faster_than_legacy(tmp_path):
+    items = _with_orphans(_layered_items(3000, fanout=4, layers=30))
+    inferred = {"item-000100": ["item-000005", "item-000006"]}
+
+    start = time.perf_counter()
+    legacy = _legacy_build_sequence(items, inferred, str(tmp_path / "legacy"))
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = build_sequence(items, inferred, outdir=str(tmp_path / "new"))
+    new_s = time.perf_counter() - start
+
+    assert result == legacy
+    print(f"\n[bench] items={len(items)} legacy={legacy_s:.2f}s indexed={new_s:.3f}s")
+    assert new_s < legacy_s
+
+
+@pytest.mark.bench
+def test_build_sequence_100k_items_1m_edges(tmp_path):
+    items = _layered_items(100_000, fanout=10)
+    edges = sum(len(it.get("depends_on", [])) for it in items)
+    assert edges >= 980_000
+
+    start = time.perf_counter()
+    result = build_sequence(items, {}, outdir=str(tmp_path))
+    elapsed = time.perf_counter() - start
+
+    assert len(result['sequence']) == len(items)
+    on_disk = json.loads((tmp_path / "checklist_sequence.json").read_text())
+    assert on_disk['orphan_count'] == result['orphan_count']
+    print(f"\n[bench] items={len(items)} edges={edges} build_sequence={elapsed:.2f}s")
+    assert elapsed < 60
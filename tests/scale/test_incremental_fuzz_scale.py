@@ -0,0 +1,93 @@
+"""Per-mutation AST, extraction and test expansion, full vs fragment-cached."""
+import json
+import time
+
+import pytest
+
+from shieldcraft.services.ast.builder import ASTBuilder
+from shieldcraft.services.checklist.fragments import FragmentCache
+from shieldcraft.services.checklist.generator import ChecklistGenerator
+from shieldcraft.verification.spec_fuzzer import generate_mutations
+from shieldcraft.verification.test_expander import expand_tests_for_item
+
+
+def _large_spec(sections=150, fields=20):
+    return {
+        "metadata": {"product_id": "scale-fuzz", "version": "1.0"},
+        "sections": {
+            f"s{i:03d}": {"id": f"s{i}", "fields": {f"f{j}": {"type": "string", "required": j % 2 == 0}
+                                                     for j in range(fields)}}
+            for i in range(sections)
+        },
+    }
+
+
+def _test_map(n=200):
+    return {f"test::t{i}.py::test_case_{i}": f"t{i}.py::test_case_{i}" for i in range(n)}
+
+
+def _variants(spec, n=10):
+    return [spec] + [m[0] for m in generate_mutations(spec)[:n]]
+
+
+def _full(gen, variants, test_map):
+    out = []
+    for s in variants:
+        items = gen._extract_from_ast(ASTBuilder(compact=False).build(s))
+        out.append([expand_tests_for_item(it, test_map)["candidates"] for it in items])
+    return out
+
+
+def _incremental(cache, gen, variants, test_map):
+    out = []
+    for s in variants:
+        _, items = cache.build(s, gen.render_task)
+        out.append(cache.expand_tests(items, test_map))
+    return out
+
+
+def _second_level(variants):
+    """(entry, content) of every second-level entry built, one per variant."""
+    for s in variants:
+        for key, value in s.items():
+            if isinstance(value, (dict, list)):
+                keys = sorted(value) if isinstance(value, dict) else range(len(value))
+                for k in keys:
+                    yield (type(value).__name__, key, k), json.dumps(value[k], sort_keys=True)
+
+
+def test_fragment_cache_matches_full_build_and_reuses_fragments():
+    gen = ChecklistGenerator()
+    test_map = _test_map(20)
+    variants = _variants(_large_spec(sections=12, fields=4))
+
+    cache = FragmentCache()
+    assert _incremental(cache, gen, variants, test_map) == _full(gen, variants, test_map)
+
+    entries = list(_second_level(variants))
+    stats = cache.stats()
+    assert stats["misses"] == len(set(entries))
+    assert stats["hits"] == len(entries) - len(set(entries))
+    assert stats["hits"] > stats["misses"]
+
+
+@pytest.mark.bench
+def test_fragment_cache_speeds_up_mutation_builds():
+    gen = ChecklistGenerator()
+    test_map = _test_map()
+    variants = _variants(_large_spec())
+
+    start = time.perf_counter()
+    full = _full(gen, variants, test_map)
+    full_s = time.perf_counter() - start
+
+    cache = FragmentCache()
+    start = time.perf_counter()
+    incremental = _incremental(cache, gen, variants, test_map)
+    incremental_s = time.perf_counter() - start
+
+    assert incremental == full
+    stats = cache.stats()
+    print(f"\n[bench] variants={len(variants)} items/variant~{len(full[0])} "
+          f"full={full_s:.2f}s incremental={incremental_s:.2f}s hits={stats['hits']} misses={stats['misses']}")
+    assert incremental_s < full_s
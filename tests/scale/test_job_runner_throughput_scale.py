@@ -0,0 +1,83 @@
+"""Sustained run submissions and status-read latency on LocalJobRunner."""
+import json
+import time
+
+import pytest
+
+from shieldcraft.services.artifact_store import LocalArtifactStore
+from shieldcraft.services.job_runner import LocalJobRunner, QueueFullError
+from shieldcraft.services.state_store import LocalStateStore
+
+
+def _spec(i):
+    # Schema-valid, so each dry run compiles the spec through the engine
+    return {"metadata": {"product_id": f"bench{i % 4}", "version": "1.0", "spec_version": "1.0"},
+            "model": {"version": "1.0"},
+            "sections": [{"id": "core", "description": f"Run {i} must log every request."}]}
+
+
+def _runner(tmp_path):
+    return LocalJobRunner(state_store=LocalStateStore(str(tmp_path / "state")),
+                          artifact_store=LocalArtifactStore(str(tmp_path / "artifacts")),
+                          workers=4, max_queue=8)
+
+
+def _submit_all(runner, total, on_status=None):
+    """Submit `total` dry runs, backing off on QueueFullError; return (run_ids, rejected)."""
+    run_ids, rejected = [], 0
+    i = 0
+    while i < total:
+        try:
+            run_ids.append(runner.submit({"spec_source": _spec(i), "run_options": {"dry_run": True}}))
+            i += 1
+        except QueueFullError as e:
+            assert e.retry_after >= 1
+            rejected += 1
+            time.sleep(0.005)
+        for run_id in run_ids[-4:]:
+            t0 = time.perf_counter()
+            state = runner.get_run(run_id)
+            if on_status is not None:
+                on_status(state, time.perf_counter() - t0)
+    return run_ids, rejected
+
+
+def test_sustained_submissions_complete_with_backpressure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = _runner(tmp_path)
+    total = 40
+    seen = set()
+    try:
+        run_ids, _ = _submit_all(runner, total, on_status=lambda state, _: seen.add(state["status"]))
+        finished = [runner.wait(r, timeout=120) for r in run_ids]
+    finally:
+        runner.shutdown()
+
+    assert seen <= {"accepted", "running", "completed"}
+    assert len(set(run_ids)) == total
+    assert all(s["status"] == "completed" for s in finished)
+    assert sorted(r["run_id"] for r in runner.state_store.list_runs()) == sorted(run_ids)
+    preview = json.loads(runner.artifact_store.retrieve_artifact(run_ids[-1], "preview.json"))
+    assert preview["primary_outcome"] == finished[-1]["result"]["primary_outcome"]
+
+
+@pytest.mark.bench
+def test_sustained_submissions_and_status_latency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = _runner(tmp_path)
+    total = 60
+    status_lat = []
+    start = time.perf_counter()
+    try:
+        run_ids, rejected = _submit_all(runner, total, on_status=lambda _, lat: status_lat.append(lat))
+        finished = [runner.wait(r, timeout=120) for r in run_ids]
+        elapsed = time.perf_counter() - start
+    finally:
+        runner.shutdown()
+
+    assert all(s["status"] == "completed" for s in finished)
+    status_lat.sort()
+    p99 = status_lat[max(0, int(len(status_lat) * 0.99) - 1)]
+    print(f"\n[bench] runs={total} rejected_429={rejected} "
+          f"sustained={total / elapsed:.1f} runs/s p99_status={p99 * 1e6:.0f}us")
+    assert p99 < 0.01
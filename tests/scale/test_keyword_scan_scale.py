@@ -0,0 +1,63 @@
+"""One-pass keyword scanning vs. per-keyword substring checks on large prose."""
+import random
+import time
+
+import pytest
+
+from shieldcraft.interpreter.interpreter import CLAIM_SCANNER
+from shieldcraft.requirements.extractor import extract_requirements
+
+CLAIM_CLASSES = {
+    "high": ("must", "must not", "never", "always", "refuse", "unsafe"),
+    "low": ("may", "might", "could", "possibly"),
+    "unsafe": ("refuse", "no-touch", "no touch", "unsafe", "no safe"),
+}
+
+
+# Per-keyword substring checks the scanner replaced
+def legacy_classes(classes, text):
+    low = text.lower()
+    return {cls for cls, words in classes.items() if any(w in low for w in words)}
+
+
+def _prose(rnd, n_lines):
+    vocab = ["the", "system", "operator", "logs", "every", "event", "keys", "rotate", "daily", "data",
+             "retention", "policy", "applies", "to", "all", "regions", "and", "tenants", "reviewed"]
+    normative = ["must", "must not", "shall", "should", "may", "never", "could", "refuse", "unsafe"]
+    lines = []
+    for i in range(n_lines):
+        words = [rnd.choice(vocab) for _ in range(rnd.randint(8, 24))]
+        if rnd.random() < 0.3:
+            words.insert(rnd.randrange(len(words)), rnd.choice(normative))
+        if i % 200 == 0:
+            lines.append(f"{i // 200}.1 Section heading")
+        lines.append(" ".join(words).capitalize() + ".")
+    return "\n".join(lines)
+
+
+def test_claim_scanner_matches_substring_checks_on_prose():
+    text = _prose(random.Random(5), 2000)
+    lines = text.splitlines()
+
+    assert [set(CLAIM_SCANNER.classes(line)) for line in lines] == \
+        [legacy_classes(CLAIM_CLASSES, line) for line in lines]
+    assert CLAIM_SCANNER.scan(text)
+    assert extract_requirements(text)
+
+
+@pytest.mark.bench
+def test_keyword_scan_throughput_multi_megabyte_prose():
+    lines = _prose(random.Random(5), 40000).splitlines()
+
+    legacy_s = scanner_s = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        legacy = [legacy_classes(CLAIM_CLASSES, line) for line in lines]
+        legacy_s = min(legacy_s, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        scanned = [CLAIM_SCANNER.classes(line) for line in lines]
+        scanner_s = min(scanner_s, time.perf_counter() - start)
+
+    assert [set(s) for s in scanned] == legacy
+    assert scanner_s < legacy_s
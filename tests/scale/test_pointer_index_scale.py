@@ -0,0 +1,66 @@
+"""Invariant attachment via PointerIndex vs. per-item prefix scans."""
+import time
+
+import pytest
+
+from shieldcraft.services.checklist.pointer_index import PointerIndex
+
+
+def _items(n_sections, per_section):
+    items = [{"id": "root", "ptr": "/"}, {"id": "sections", "ptr": "/sections"}]
+    for s in range(n_sections):
+        items.append({"id": f"s{s}", "ptr": f"/sections/{s}"})
+        for r in range(per_section):
+            items.append({"id": f"s{s}r{r}", "ptr": f"/sections/{s}/rules/{r}"})
+    return items
+
+
+def _legacy_attach(items, invariants):
+    out = {}
+    for item in items:
+        item_ptr = item.get("ptr", "")
+        for inv in invariants:
+            inv_ptr = inv.get("spec_ptr", "")
+            if item_ptr.startswith(inv_ptr) or inv_ptr.startswith(item_ptr):
+                out.setdefault(item["id"], []).append(inv["id"])
+    return out
+
+
+def _indexed_attach(items, invariants):
+    index = PointerIndex(items)
+    out = {}
+    for inv in invariants:
+        for item in index.related(inv.get("spec_ptr", "")):
+            out.setdefault(item["id"], []).append(inv["id"])
+    return out
+
+
+def _invariants(n, n_sections, per_section):
+    return [{"id": f"inv{i}", "spec_ptr": f"/sections/{(i * 7) % n_sections}/rules/{i % per_section}"}
+            for i in range(n)]
+
+
+def test_indexed_attachment_matches_prefix_scan():
+    items = _items(40, 10)
+    invariants = _invariants(100, 40, 10) + [{"id": "top", "spec_ptr": "/sections"},
+                                              {"id": "all", "spec_ptr": ""}]
+    assert _indexed_attach(items, invariants) == _legacy_attach(items, invariants)
+
+
+@pytest.mark.bench
+def test_invariant_attachment_20k_items_1k_invariants():
+    items = _items(400, 50)
+    invariants = _invariants(1000, 400, 50)
+
+    start = time.perf_counter()
+    legacy = _legacy_attach(items, invariants)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = _indexed_attach(items, invariants)
+    indexed_s = time.perf_counter() - start
+
+    assert indexed == legacy
+    print(f"\n[bench] items={len(items)} invariants={len(invariants)} "
+          f"legacy={legacy_s:.2f}s indexed={indexed_s:.3f}s")
+    assert indexed_s < legacy_s
@@ -0,0 +1,70 @@
+"""compute_coverage with per-run indexes vs. requirement x item scans."""
+import random
+import time
+
+import pytest
+
+from shieldcraft.requirements.coverage import _overlap_ratio, compute_coverage
+
+
+# Requirement x item scan that compute_coverage replaced
+def legacy_compute_coverage(requirements, checklist_items):
+    res = []
+    for r in sorted(requirements, key=lambda x: x.get('id')):
+        req_ptr = r.get('ptr') or r.get('source_ptr') or r.get('ptr')
+        matched_ids, strong = [], False
+        for it in checklist_items:
+            ev = it.get('evidence') or {}
+            iptr = (ev.get('source') or {}).get('ptr') or ''
+            ihash = ev.get('source_excerpt_hash') or ''
+            quote = ev.get('quote') or ''
+            hit = bool(iptr and (iptr == req_ptr or iptr.startswith((req_ptr or '').rstrip('/') + '/')))
+            hit = hit or bool(ihash and ihash == r.get('hash'))
+            hit = hit or bool(quote and _overlap_ratio(r.get('text') or '', quote) >= 0.6)
+            if hit:
+                matched_ids.append(it.get('id'))
+                if (it.get('priority') in ('P0', 'P1')) and ((it.get('confidence') or '').lower() != 'low'):
+                    strong = True
+        status = 'MISSING' if not matched_ids else ('FULL' if strong else 'PARTIAL')
+        res.append((r.get('id'), sorted(set(matched_ids)), status))
+    return res
+
+
+def _corpus(n_reqs, n_items, vocab_size, seed=11):
+    rnd = random.Random(seed)
+    vocab = [f"w{i}" for i in range(vocab_size)] + ["the", "system", "must", "shall"] * 50
+    reqs = [{"id": f"REQ-{i:05d}", "ptr": f"/requirements/{i}",
+             "text": " ".join(rnd.choice(vocab) for _ in range(rnd.randint(6, 20)))}
+            for i in range(n_reqs)]
+    items = [{"id": f"item-{i:05d}", "priority": "P1",
+              "evidence": {"source": {"ptr": f"/requirements/{rnd.randrange(2 * n_reqs)}"},
+                           "quote": " ".join(rnd.choice(vocab) for _ in range(rnd.randint(6, 30)))}}
+             for i in range(n_items)]
+    return reqs, items
+
+
+def _rows(covers):
+    return [(c.requirement_id, c.checklist_item_ids, c.coverage_status.value) for c in covers]
+
+
+def test_coverage_matches_legacy_on_large_corpus():
+    reqs, items = _corpus(300, 1000, vocab_size=300)
+    assert _rows(compute_coverage(reqs, items)) == legacy_compute_coverage(reqs, items)
+
+
+@pytest.mark.bench
+def test_coverage_3k_requirements_10k_items():
+    reqs, items = _corpus(3000, 10000, vocab_size=3000)
+
+    start = time.perf_counter()
+    covers = compute_coverage(reqs, items)
+    indexed_s = time.perf_counter() - start
+
+    sample = reqs[:30]
+    start = time.perf_counter()
+    legacy = legacy_compute_coverage(sample, items)
+    legacy_s = (time.perf_counter() - start) * len(reqs) / len(sample)
+
+    assert _rows(covers[:30]) == legacy
+    print(f"\n[bench] reqs={len(reqs)} items={len(items)} legacy~{legacy_s:.1f}s indexed={indexed_s:.2f}s")
+    assert indexed_s < legacy_s
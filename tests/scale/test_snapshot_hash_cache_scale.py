@@ -0,0 +1,60 @@
+"""Repeated repo snapshots with the stat-keyed hash cache."""
+import os
+import time
+
+import pytest
+
+from shieldcraft.snapshot import generate_snapshot
+from shieldcraft.snapshot import hash_cache
+from shieldcraft.snapshot.hash_cache import FileHashCache
+
+
+def _make_repo(root, dirs=40, files=50, size=16 * 1024):
+    old = time.time_ns() - 3600 * 1_000_000_000
+    for d in range(dirs):
+        sub = root / f"pkg{d}"
+        sub.mkdir()
+        for f in range(files):
+            p = sub / f"m{f}.py"
+            p.write_bytes(os.urandom(size))
+            os.utime(p, ns=(old, old))
+
+
+def _snapshots(tmp_path, monkeypatch, **repo):
+    """Cold (parallel), warm and serial-cold snapshots of one repo, with timings."""
+    _make_repo(tmp_path, **repo)
+    cache = FileHashCache()
+    monkeypatch.setattr(hash_cache, "get_hash_cache", lambda: cache)
+    monkeypatch.setattr("shieldcraft.snapshot.get_hash_cache", lambda: cache)
+
+    start = time.perf_counter()
+    cold = generate_snapshot(str(tmp_path))
+    cold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = generate_snapshot(str(tmp_path))
+    warm_s = time.perf_counter() - start
+
+    monkeypatch.setattr("shieldcraft.snapshot.get_hash_cache", lambda: FileHashCache(workers=1))
+    start = time.perf_counter()
+    serial = generate_snapshot(str(tmp_path))
+    serial_s = time.perf_counter() - start
+    return cache, (cold, warm, serial), (cold_s, warm_s, serial_s)
+
+
+def test_warm_snapshot_served_from_cache(tmp_path, monkeypatch):
+    cache, (cold, warm, serial), _ = _snapshots(tmp_path, monkeypatch, dirs=5, files=10, size=1024)
+
+    assert warm == cold == serial
+    assert cache.stats()["hits"] == len(cold["files"])
+
+
+@pytest.mark.bench
+def test_warm_snapshot_faster_than_cold(tmp_path, monkeypatch):
+    cache, (cold, warm, serial), (cold_s, warm_s, serial_s) = _snapshots(tmp_path, monkeypatch)
+
+    assert warm == cold == serial
+    assert cache.stats()["hits"] == len(cold["files"])
+    print(f"\n[bench] files={len(cold['files'])} serial_cold={serial_s:.3f}s "
+          f"parallel_cold={cold_s:.3f}s warm={warm_s:.3f}s")
+    assert warm_s < serial_s
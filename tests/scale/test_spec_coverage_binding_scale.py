@@ -0,0 +1,62 @@
+"""bind_units_to_items with per-run indexes vs. unit x item scans.
+
+Equivalence with the scan is checked in tests/coverage/test_binding_index.py;
+this module only times the two.
+"""
+import copy
+import hashlib
+import random
+import time
+
+import pytest
+
+from shieldcraft.coverage.evaluator import _tokenize, bind_units_to_items
+
+
+# Unit x item scan that bind_units_to_items replaced
+def legacy_bind_units_to_items(units, items):
+    for it in items:
+        it['covers_units'] = sorted(set(it.get('covers_units') or []))
+    for u in units:
+        uptr = u.get('ptr') or ''
+        utext = u.get('text') or ''
+        u_tokens = set(_tokenize(utext))
+        thresh = max(2, int(len(u_tokens) * 0.4)) if (u.get('kind') or '') == 'requirement' else 5
+        for it in items:
+            iptr = it.get('ptr') or ''
+            ev = it.get('evidence') or {}
+            quote = ev.get('quote') or ''
+            matched = bool(iptr and (iptr == uptr or iptr.startswith(uptr.rstrip('/') + '/')))
+            matched = matched or bool(quote and len(u_tokens & set(_tokenize(quote))) >= thresh)
+            matched = matched or bool(quote and hashlib.sha256(utext.lower().encode()).hexdigest()[:12]
+                                      == (ev.get('source_excerpt_hash') or ''))
+            if matched:
+                it['covers_units'] = sorted(set(it['covers_units']) | {u.get('id')})
+    return items
+
+
+@pytest.mark.bench
+def test_binding_20k_units_5k_items():
+    rnd = random.Random(7)
+    vocab = [f"w{i}" for i in range(4000)] + ["the", "system", "must", "shall"] * 50
+    units = [{"id": f"unit-{i:05d}", "ptr": f"/sections/{i % 400}/rules/{i}",
+              "kind": rnd.choice(["requirement", "section"]),
+              "text": " ".join(rnd.choice(vocab) for _ in range(rnd.randint(4, 20)))}
+             for i in range(20000)]
+    items = [{"id": f"item-{i:05d}", "ptr": f"/sections/{rnd.randrange(800)}",
+              "evidence": {"quote": " ".join(rnd.choice(vocab) for _ in range(rnd.randint(6, 30)))}}
+             for i in range(5000)]
+
+    start = time.perf_counter()
+    got = bind_units_to_items(units, copy.deepcopy(items))
+    indexed_s = time.perf_counter() - start
+
+    sample = units[:40]
+    start = time.perf_counter()
+    legacy = legacy_bind_units_to_items(sample, copy.deepcopy(items))
+    legacy_s = (time.perf_counter() - start) * len(units) / len(sample)
+
+    assert bind_units_to_items(sample, copy.deepcopy(items)) == legacy
+    assert sum(len(it["covers_units"]) for it in got) > 0
+    print(f"\n[bench] units={len(units)} items={len(items)} legacy~{legacy_s:.1f}s indexed={indexed_s:.2f}s")
+    assert indexed_s < legacy_s
@@ -0,0 +1,21 @@
+"""Indexed run listing on the SQLite LocalStateStore."""
+import pytest
+
+from scripts.bench_state_store import run
+
+
+def _check_counts(report, runs):
+    assert report["list_product"] == sum(1 for i in range(runs) if i % 500 == 7)
+    assert report["list_running"] == sum(1 for i in range(runs) if i % 6 == 4)
+
+
+def test_indexed_listing_returns_filtered_runs(tmp_path):
+    _check_counts(run(1_200, str(tmp_path)), 1_200)
+
+
+@pytest.mark.bench
+def test_indexed_listing_at_scale(tmp_path):
+    report = run(50_000, str(tmp_path))
+    print(f"\n[bench] {report}")
+    _check_counts(report, 50_000)
+    assert report["list_product_ms"] < 50
@@ -0,0 +1,49 @@
+"""LocalArtifactStore deduplicates content into shared blobs and collects unreferenced ones."""
+import io
+
+from shieldcraft.services.artifact_store import LocalArtifactStore
+
+
+def _blobs(store):
+    return sorted(p for p in store.blob_dir.rglob("*") if p.is_file() and p.parent != store.tmp_dir)
+
+
+def test_identical_content_shares_one_blob(tmp_path):
+    store = LocalArtifactStore(str(tmp_path))
+    for run_id in ("r1", "r2", "r3"):
+        assert store.store_artifact(run_id, "out.json", b'{"same": true}', {"type": "application/json"})
+    assert store.store_artifact("r3", "other.txt", b"different", {})
+
+    blobs = _blobs(store)
+    assert len(blobs) == 2
+    meta = store.get_artifact_metadata("r2", "out.json")
+    assert store.blob_path(meta["sha256_hash"]) in blobs
+    assert store.retrieve_artifact("r1", "out.json") == b'{"same": true}'
+
+
+def test_streaming_store_and_open(tmp_path):
+    store = LocalArtifactStore(str(tmp_path))
+    payload = bytes(range(256)) * 4096
+    assert store.store_artifact_stream("r", "big.bin", io.BytesIO(payload), {}, chunk_size=1000)
+    with store.open_artifact("r", "big.bin") as f:
+        assert f.read() == payload
+    assert store.get_artifact_metadata("r", "big.bin")["size_bytes"] == len(payload)
+    assert store.open_artifact("r", "missing") is None
+
+
+def test_garbage_collection_respects_references(tmp_path):
+    store = LocalArtifactStore(str(tmp_path))
+    store.store_artifact("r1", "a", b"shared", {})
+    store.store_artifact("r2", "a", b"shared", {})
+    store.store_artifact("r1", "b", b"v1", {})
+    store.store_artifact("r1", "b", b"v2", {})  # overwrite releases the v1 blob
+
+    assert store.collect_garbage() == 1
+    store.delete_artifact("r1", "a")
+    assert store.collect_garbage() == 0
+    assert store.retrieve_artifact("r2", "a") == b"shared"
+
+    store.delete_artifact("r2", "a")
+    assert store.collect_garbage() == 1
+    assert len(_blobs(store)) == 1
+    assert store.retrieve_artifact("r1", "b") == b"v2"
@@ -0,0 +1,122 @@
+"""LocalJobRunner executes queued runs, persists transitions and applies backpressure."""
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from shieldcraft.services.artifact_store import LocalArtifactStore
+from shieldcraft.services.job_runner import LocalJobRunner, QueueFullError
+from shieldcraft.services.state_store import LocalStateStore
+
+SPEC = {"metadata": {"product_id": "api_job", "version": "1.0"}, "sections": {"core": {"description": "s"}}}
+# Passes schema validation, so runs go through the engine pipeline
+VALID_SPEC = {"metadata": {"product_id": "api_job", "version": "1.0", "spec_version": "1.0"},
+              "model": {"version": "1.0"},
+              "sections": [{"id": "core", "description": "The service must log every request."}]}
+
+
+def _runner(tmp_path, **kwargs):
+    return LocalJobRunner(state_store=LocalStateStore(str(tmp_path / "state")),
+                          artifact_store=LocalArtifactStore(str(tmp_path / "artifacts")), **kwargs)
+
+
+def test_run_executes_and_persists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = _runner(tmp_path)
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(VALID_SPEC))
+    try:
+        inline = runner.submit({"spec_source": VALID_SPEC, "run_options": {"dry_run": True}})
+        by_path = runner.submit({"spec_source": str(spec_path)})
+        invalid = runner.submit({"spec_source": SPEC})
+        missing = runner.submit({"spec_source": SPEC, "run_options": {"mode": "bogus"}})
+        done = {r: runner.wait(r, timeout=60) for r in (inline, by_path, invalid, missing)}
+    finally:
+        runner.shutdown()
+
+    assert done[inline]["status"] == "completed"
+    assert "preview.json" in done[inline]["result"]["artifacts"]
+    # No sync has been verified on the worker engines, so execute stops at preflight
+    assert done[by_path]["status"] == "failed"
+    assert done[by_path]["error"] == "sync_not_performed"
+    assert done[invalid]["status"] == "completed"
+    assert "result.json" in done[invalid]["result"]["artifacts"]
+    assert done[missing]["status"] == "failed"
+    assert "bogus" in done[missing]["error"]
+
+    # Transitions are on disk and artifacts are retrievable
+    assert runner.state_store.load_run_state(inline)["status"] == "completed"
+    preview = json.loads(runner.artifact_store.retrieve_artifact(inline, "preview.json"))
+    assert preview["primary_outcome"] == done[inline]["result"]["primary_outcome"]
+    # The valid spec was compiled, not rejected by the schema gate
+    phases = {(it.get("meta") or {}).get("phase") for it in preview["checklist"]}
+    assert "compilation" in phases
+    result = json.loads(runner.artifact_store.retrieve_artifact(invalid, "result.json"))
+    assert result["type"] == "schema_error"
+
+
+def test_full_queue_raises_with_retry_after(tmp_path, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def _blocking(self, engine, req):
+        started.set()
+        release.wait(30)
+        return {}
+
+    monkeypatch.setattr(LocalJobRunner, "_execute", _blocking)
+    runner = _runner(tmp_path, workers=1, max_queue=2)
+    try:
+        accepted = [runner.submit({"spec_source": SPEC})]
+        assert started.wait(30)
+        accepted += [runner.submit({"spec_source": SPEC}) for _ in range(2)]
+        with pytest.raises(QueueFullError) as exc:
+            runner.submit({"spec_source": SPEC})
+        assert exc.value.retry_after >= 1
+        assert len(runner.state_store.list_runs()) == 3
+    finally:
+        release.set()
+        runner.shutdown()
+    assert all(runner.get_run(r)["status"] == "completed" for r in accepted)
+
+
+def test_runs_of_one_product_are_serialised(tmp_path, monkeypatch):
+    import time
+    from shieldcraft.engine import Engine
+
+    active, peak, lock = {}, {}, threading.Lock()
+
+    def _fake_execute(self, spec_path, session=None):
+        pid = session.load()["metadata"]["product_id"]
+        with lock:
+            active[pid] = active.get(pid, 0) + 1
+            peak[pid] = max(peak.get(pid, 0), active[pid])
+        time.sleep(0.05)
+        with lock:
+            active[pid] -= 1
+        return {}
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Engine, "execute", _fake_execute)
+    runner = _runner(tmp_path, workers=4, max_queue=8)
+    specs = [dict(VALID_SPEC, metadata={"product_id": f"p{i % 2}", "version": "1.0", "spec_version": "1.0"})
+             for i in range(6)]
+    try:
+        run_ids = [runner.submit({"spec_source": s}) for s in specs]
+        done = [runner.wait(r, timeout=60) for r in run_ids]
+    finally:
+        runner.shutdown()
+
+    assert all(d["status"] == "completed" for d in done)
+    assert peak == {"p0": 1, "p1": 1}
+
+
+def test_importing_api_server_creates_no_files(tmp_path):
+    import subprocess
+    import sys
+
+    src = str(Path(__file__).resolve().parents[2] / "src")
+    subprocess.run([sys.executable, "-c", "import shieldcraft.api_server"], cwd=tmp_path, check=True,
+                   env={**os.environ, "PYTHONPATH": src})
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,117 @@
+"""SQLite-backed LocalStateStore / LocalArtifactStore keep their APIs and migrate legacy files."""
+import json
+import threading
+
+from shieldcraft.services.artifact_store import LocalArtifactStore
+from shieldcraft.services.state_store import LocalStateStore
+
+
+def _state(status, created, product="p1"):
+    return {"status": status, "created_at": created, "spec": {"metadata": {"product_id": product}}}
+
+
+def test_state_store_filters_and_upserts(tmp_path):
+    store = LocalStateStore(str(tmp_path))
+    assert store.save_run_states([("b", _state("running", "2")), ("a", _state("completed", "1", "p2"))]) == 2
+    assert store.save_run_state("b", _state("completed", "2"))
+
+    assert [r["run_id"] for r in store.list_runs()] == ["a", "b"]
+    assert [r["run_id"] for r in store.list_runs("completed", product_id="p1")] == ["b"]
+    assert store.list_runs("running") == []
+    assert store.load_run_state("b")["status"] == "completed"
+    assert store.delete_run_state("b") and store.load_run_state("b") is None
+
+
+def test_state_store_concurrent_writers(tmp_path):
+    store = LocalStateStore(str(tmp_path))
+
+    def _write(t):
+        for i in range(50):
+            assert store.save_run_state(f"{t}-{i}", _state("accepted", f"{t}{i:03d}"))
+
+    threads = [threading.Thread(target=_write, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store.list_runs("accepted")) == 200
+
+
+def test_migrate_legacy_directories(tmp_path):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    (state_dir / "r1.json").write_text(json.dumps(_state("failed", "1")))
+    art_dir = tmp_path / "artifacts"
+    (art_dir / "metadata").mkdir(parents=True)
+    (art_dir / "r1").mkdir()
+    (art_dir / "r1" / "out.json.bin").write_bytes(b"{}")
+    (art_dir / "metadata" / "r1_out.json.json").write_text(json.dumps({
+        "run_id": "r1", "artifact_id": "out.json", "size_bytes": 2,
+        "sha256_hash": "h", "stored_at": "t"}))
+
+    states = LocalStateStore(str(state_dir))
+    artifacts = LocalArtifactStore(str(art_dir))
+    assert states.migrate_legacy_files(remove=True) == 1
+    assert artifacts.migrate_legacy_files() == 1
+
+    assert states.list_runs("failed")[0]["run_id"] == "r1"
+    assert not (state_dir / "r1.json").exists()
+    assert [a["artifact_id"] for a in artifacts.list_run_artifacts("r1")] == ["out.json"]
+    assert artifacts.retrieve_artifact("r1", "out.json") == b"{}"
+
+
+def test_malformed_states_do_not_abort_batches(tmp_path):
+    store = LocalStateStore(str(tmp_path))
+    assert store.save_run_states([("a", _state("completed", "1")),
+                                  ("b", {"status": "failed", "created_at": "2", "spec": "legacy.json"})]) == 2
+    assert [(r["run_id"], r["spec_id"]) for r in store.list_runs()] == [("a", "p1"), ("b", None)]
+
+    (tmp_path / "r1.json").write_text(json.dumps({"status": "failed", "created_at": "3", "spec": ["x"]}))
+    (tmp_path / "r2.json").write_text(json.dumps(["not", "a", "state"]))
+    (tmp_path / "r3.json").write_text(json.dumps(_state("completed", "4")))
+    assert store.migrate_legacy_files(remove=True) == 2
+    assert [r["run_id"] for r in store.list_runs()] == ["a", "b", "r1", "r3"]
+    assert [p.name for p in tmp_path.glob("*.json")] == ["r2.json"]
+
+
+def test_artifact_store_round_trip(tmp_path):
+    store = LocalArtifactStore(str(tmp_path))
+    assert store.store_artifact("r", "b.json", b"2", {"type": "application/json"})
+    assert store.store_artifact("r", "a.json", b"1", {})
+    assert [a["artifact_id"] for a in store.list_run_artifacts("r")] == ["a.json", "b.json"]
+    assert store.get_artifact_metadata("r", "b.json")["type"] == "application/json"
+    assert store.delete_artifact("r", "a.json")
+    assert store.retrieve_artifact("r", "a.json") is None
+    assert [a["artifact_id"] for a in store.list_run_artifacts("r")] == ["b.json"]
+
+
+def test_artifact_store_upgrades_pre_blob_database(tmp_path):
+    import sqlite3
+
+    (tmp_path / "metadata").mkdir()
+    (tmp_path / "r1").mkdir()
+    (tmp_path / "r1" / "out.json.bin").write_bytes(b'{"v": 1}')
+    conn = sqlite3.connect(tmp_path / "metadata" / "artifacts.db")
+    conn.execute("CREATE TABLE artifacts (run_id TEXT NOT NULL, artifact_id TEXT NOT NULL, "
+                 "metadata TEXT NOT NULL, PRIMARY KEY (run_id, artifact_id))")
+    for artifact_id in ("out.json", "lost.bin"):
+        conn.execute("INSERT INTO artifacts VALUES (?, ?, ?)", ("r1", artifact_id, json.dumps({
+            "run_id": "r1", "artifact_id": artifact_id, "type": "application/json", "size_bytes": 8,
+            "sha256_hash": "h", "stored_at": "t", "storage_type": "local_file"})))
+    conn.commit()
+    conn.close()
+
+    store = LocalArtifactStore(str(tmp_path))
+    assert store.retrieve_artifact("r1", "out.json") == b'{"v": 1}'
+    assert store.get_artifact_metadata("r1", "out.json")["type"] == "application/json"
+    assert store.store_artifact("r1", "new.txt", b"new", {})
+    assert store.db.connection().execute("PRAGMA user_version").fetchone()[0] == 1
+
+    # Reopening does not re-import; removal drops the imported rows and content files
+    store = LocalArtifactStore(str(tmp_path))
+    assert store.store_artifact("r1", "out.json", b"newer", {})
+    assert store.migrate_legacy_files(remove=True) == 1
+    assert not (tmp_path / "r1").exists()
+    assert store.retrieve_artifact("r1", "out.json") == b"newer"
+    legacy = store.db.connection().execute("SELECT artifact_id FROM legacy_artifacts").fetchall()
+    assert [row["artifact_id"] for row in legacy] == ["lost.bin"]
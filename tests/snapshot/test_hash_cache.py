@@ -0,0 +1,73 @@
+import hashlib
+import os
+
+from shieldcraft.snapshot import generate_snapshot
+from shieldcraft.snapshot.hash_cache import FileHashCache, get_hash_cache
+
+
+def _age(path, seconds=60):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_hits_after_first_hash_and_rehash_on_change(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("one")
+    _age(f)
+    cache = FileHashCache()
+
+    assert cache.sha256(str(f)) == hashlib.sha256(b"one").hexdigest()
+    assert cache.sha256(str(f)) == hashlib.sha256(b"one").hexdigest()
+    assert cache.stats()["hits"] == 1
+
+    f.write_text("two")
+    assert cache.sha256(str(f)) == hashlib.sha256(b"two").hexdigest()
+    assert cache.stats()["misses"] == 2
+
+
+def test_recently_modified_files_are_not_trusted(tmp_path):
+    f = tmp_path / "racy.txt"
+    f.write_text("x")
+    cache = FileHashCache()
+    cache.sha256(str(f))
+    cache.sha256(str(f))
+    assert cache.stats()["hits"] == 0
+
+
+def test_persisted_cache_round_trip(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("data")
+    _age(f)
+    store = str(tmp_path / "cache" / "hashes.json")
+
+    first = FileHashCache(store)
+    first.hash_files([str(f)])
+    first.save()
+
+    second = FileHashCache(store)
+    assert second.hash_files([str(f)]) == [(hashlib.sha256(b"data").hexdigest(), 4)]
+    assert second.stats()["hits"] == 1
+
+
+def test_parallel_cold_start_matches_serial(tmp_path):
+    paths = []
+    for i in range(150):
+        p = tmp_path / f"f{i}.bin"
+        p.write_bytes(os.urandom(64) * (i + 1))
+        paths.append(str(p))
+    parallel = FileHashCache(workers=8).hash_files(paths)
+    serial = FileHashCache(workers=1).hash_files(paths)
+    assert parallel == serial
+
+
+def test_snapshot_uses_env_cache(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.txt").write_text("1")
+    store = tmp_path / "hashes.json"
+    monkeypatch.setenv("SHIELDCRAFT_HASH_CACHE", str(store))
+
+    manifest = generate_snapshot(str(repo))
+    assert store.exists()
+    assert get_hash_cache().path == str(store)
+    assert manifest["files"][0]["sha256"] == hashlib.sha256(b"1").hexdigest()
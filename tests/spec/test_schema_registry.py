@@ -0,0 +1,88 @@
+import json
+import os
+
+import jsonschema
+import pytest
+
+from shieldcraft.services.spec.schema_registry import (
+    SchemaValidatorRegistry, clear_validator_cache, get_validator, validator_cache_stats)
+from shieldcraft.services.spec.schema_validator import validate_spec_against_schema
+
+
+def _write_schema(path, required):
+    path.write_text(json.dumps({
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": required,
+    }))
+
+
+def test_validator_compiled_once_per_path(tmp_path):
+    schema = tmp_path / "s.schema.json"
+    _write_schema(schema, ["metadata"])
+    reg = SchemaValidatorRegistry()
+
+    v1 = reg.get_validator(str(schema))
+    v2 = reg.get_validator(str(schema))
+
+    assert v1 is v2
+    stats = reg.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+def test_validator_invalidated_on_content_change(tmp_path):
+    schema = tmp_path / "s.schema.json"
+    _write_schema(schema, ["metadata"])
+    reg = SchemaValidatorRegistry()
+    v1 = reg.get_validator(str(schema))
+
+    _write_schema(schema, ["metadata", "sections"])
+    st = os.stat(schema)
+    os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    v2 = reg.get_validator(str(schema))
+
+    assert v1 is not v2
+    assert not v2.is_valid({"metadata": {}})
+    assert reg.stats()["invalidations"] == 1
+
+
+def test_touched_but_unchanged_schema_is_reused(tmp_path):
+    schema = tmp_path / "s.schema.json"
+    _write_schema(schema, ["metadata"])
+    reg = SchemaValidatorRegistry()
+    v1 = reg.get_validator(str(schema))
+
+    st = os.stat(schema)
+    os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert reg.get_validator(str(schema)) is v1
+    assert reg.stats()["misses"] == 1
+
+
+def test_check_schema_raises_for_invalid_schema(tmp_path):
+    schema = tmp_path / "bad.schema.json"
+    schema.write_text(json.dumps({"type": 12}))
+    reg = SchemaValidatorRegistry()
+    with pytest.raises(jsonschema.SchemaError):
+        reg.get_validator(str(schema), check_schema=True)
+
+
+def test_missing_schema_path_raises():
+    with pytest.raises(FileNotFoundError):
+        get_validator("does/not/exist.schema.json")
+
+
+def test_validate_spec_against_schema_uses_shared_registry(tmp_path):
+    schema = tmp_path / "s.schema.json"
+    _write_schema(schema, ["metadata"])
+    clear_validator_cache()
+
+    assert validate_spec_against_schema({"metadata": {}}, str(schema)) == (True, [])
+    valid, errors = validate_spec_against_schema({}, str(schema))
+
+    assert not valid and errors
+    stats = validator_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
@@ -10,3 +10,45 @@ def test_recursive_extraction():
     assert "/a/b" in ptrs
     assert "/c/0" in ptrs
     assert "/c/1" in ptrs
+
+
+def _legacy_extract(ex, node, base_ptr="", line_map=None):
+    # Recursive reference implementation (pre-streaming behaviour)
+    line_map = line_map or {}
+    items = []
+    if isinstance(node, dict):
+        children = [((f"{base_ptr}/{k}" if base_ptr else f"/{k}"), k, v) for k, v in sorted(node.items())]
+    elif isinstance(node, list):
+        children = [(f"{base_ptr}/{i}", ex._generate_semantic_key(v, f"item_{i}"), v) for i, v in enumerate(node)]
+    else:
+        if base_ptr:
+            items.append(ex._make_item(base_ptr, base_ptr.split("/")[-1], node, line_map))
+        return items
+    for ptr, key, v in children:
+        items.append(ex._make_item(ptr, key, v, line_map))
+        items.extend(_legacy_extract(ex, v, ptr, line_map))
+    return items
+
+
+def test_streaming_matches_recursive_order():
+    import json
+    spec = json.load(open("spec/se_dsl_v1.spec.json", encoding="utf-8"))
+    ex = SpecExtractor()
+    stream = ex.iter_items(spec, line_map={"/metadata": 7})
+    assert not ex.reverse_index  # lazy: nothing extracted yet
+    items = list(stream)
+    assert items == _legacy_extract(SpecExtractor(), spec, line_map={"/metadata": 7})
+    assert ex.get_reverse_index() == {p: [p] for p in sorted({i["ptr"] for i in items})}
+
+
+def test_deep_spec_does_not_recurse():
+    import sys
+    depth = sys.getrecursionlimit() * 2
+    spec = leaf = {}
+    for _ in range(depth):
+        leaf["n"] = {}
+        leaf = leaf["n"]
+    leaf["v"] = 1
+    items = SpecExtractor().extract(spec)
+    assert len(items) == depth + 2
+    assert items[-1]["key"] == "v" and items[-1]["value"] == 1
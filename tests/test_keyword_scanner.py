@@ -0,0 +1,64 @@
+"""KeywordScanner agrees with the per-keyword substring checks it replaced."""
+import random
+
+import pytest
+
+from shieldcraft.interpreter.interpreter import CLAIM_SCANNER
+from shieldcraft.requirements.completion import _infer_item_dimensions
+from shieldcraft.util.keywords import OBLIGATION_SCANNER, KeywordScanner
+
+CLASSES = {
+    "high": ("must", "must not", "never", "always", "refuse", "unsafe"),
+    "low": ("may", "might", "could", "possibly"),
+    "unsafe": ("refuse", "no-touch", "no touch", "unsafe", "no safe"),
+    "overlap": ("ab", "bc", "abcd", "cde"),
+}
+PIECES = ["must", "MUST not", "never", "refuse", "efuse", "unsafe", "mayor", "might", "no-touch",
+          "no touch", "no safe", "a", "b", "c", "d", "e", "ab", "bc", " ", "x", "ne", "ver", "ALWAYS"]
+
+
+def legacy_classes(classes, text):
+    low = text.lower()
+    return {cls for cls, words in classes.items() if any(w in low for w in words)}
+
+
+def legacy_hits(classes, text):
+    low = text.lower()
+    words = {w for ws in classes.values() for w in ws}
+    return sorted((i, w) for w in words for i in range(len(low)) if low.startswith(w, i))
+
+
+def _texts(seed, n):
+    rnd = random.Random(seed)
+    return ["".join(rnd.choice(PIECES) for _ in range(rnd.randint(0, 12))) for _ in range(n)]
+
+
+def test_classes_and_hits_match_substring_checks():
+    scanner = KeywordScanner(CLASSES)
+    for text in _texts(3, 2000) + ["neverefuse", "abcde", "mustnot", ""]:
+        assert set(scanner.classes(text)) == legacy_classes(CLASSES, text), text
+        assert [(h.start, h.keyword) for h in scanner.scan(text)] == legacy_hits(CLASSES, text), text
+        assert scanner.matches(text) == bool(legacy_classes(CLASSES, text))
+
+
+def test_hit_reports_every_class_of_keyword():
+    hits = CLAIM_SCANNER.scan("We REFUSE.")
+    assert [(h.start, h.keyword, sorted(h.classes)) for h in hits] == [(3, "refuse", ["high", "unsafe"])]
+
+
+def test_straddling_keyword_is_found():
+    # "never" matches first and hides the "refuse" starting at its last letter
+    assert CLAIM_SCANNER.classes("neverefuse") == {"high", "unsafe"}
+    assert OBLIGATION_SCANNER.matches("Operators Must rotate keys")
+
+
+def test_empty_keyword_rejected():
+    with pytest.raises(ValueError):
+        KeywordScanner({"x": ("",)})
+
+
+def test_item_dimensions_use_intent_and_claim_vocabularies():
+    assert _infer_item_dimensions({"intent_category": "refusal", "claim": "x"}) == []
+    assert _infer_item_dimensions({"intent_category": "output_contract",
+                                   "claim": "Ensure it will refuse to produce limits"}) == \
+        ["artifacts", "behavior", "constraints", "refusal"]
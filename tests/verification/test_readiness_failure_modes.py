@@ -7,7 +7,7 @@ def test_readiness_fails_on_missing_tests(monkeypatch):
         "shieldcraft.verification.readiness_evaluator.enforce_spec_fuzz_stability",
         lambda s,
         g,
-        max_variants=3: None)
+        max_variants=3, **kwargs: None)
     # Make tests attached raise
 
     def _fail(items):
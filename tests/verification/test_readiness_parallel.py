@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shieldcraft.services.validator import spec_gate
+from shieldcraft.util import side_effects
+from shieldcraft.verification.readiness_evaluator import evaluate_readiness
+
+
+class CountingGen:
+    def __init__(self, shape=None):
+        self.calls = 0
+        self.shape = shape
+
+    def build(self, s, **kwargs):
+        self.calls += 1
+        ptrs = self.shape(s) if self.shape else ["/sections"]
+        return {"items": [{"ptr": p} for p in ptrs]}
+
+
+def _spec():
+    return {"metadata": {"product_id": "p"}, "sections": [{"id": "a"}, {"id": "b"}]}
+
+
+def test_fuzz_reuses_baseline_and_skips_mutations_after_critical():
+    gen = CountingGen()
+    with pytest.raises(RuntimeError, match="SPEC_INCOMPLETE"):
+        spec_gate.enforce_spec_fuzz_stability(_spec(), gen, max_variants=3,
+                                              baseline={"items": [{"ptr": "/sections"}]})
+    # Only the reorder mutation is built; the baseline is not rebuilt
+    assert gen.calls == 1
+
+
+@pytest.mark.parametrize("executor", [None, "threads"])
+def test_fuzz_drift_verdict_same_with_executor(executor):
+    gen = CountingGen(shape=lambda s: [f"/sections/{sec['id']}" for sec in s["sections"]][:1])
+    base = gen.build(_spec())
+    pool = ThreadPoolExecutor(max_workers=2) if executor else None
+    try:
+        with pytest.raises(RuntimeError) as exc:
+            spec_gate.enforce_spec_fuzz_stability(_spec(), gen, max_variants=3, baseline=base, executor=pool)
+    finally:
+        if pool:
+            pool.shutdown()
+    assert str(exc.value) == "SPEC_DRIFT:reorder:reversed_sections"
+
+
+def test_deferred_side_effects_applied_in_order(tmp_path):
+    from shieldcraft.services.checklist.warnings import write_warnings
+
+    with side_effects.deferred() as calls:
+        write_warnings("p", ["w1"])
+        write_warnings("p", ["w2"])
+    assert [c[1] for c in calls] == ["write_warnings", "write_warnings"]
+
+    import os
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        side_effects.apply(calls)
+        content = (tmp_path / "products/p/checklist/warnings.json").read_text()
+    finally:
+        os.chdir(cwd)
+    assert "w2" in content and "w1" not in content
+
+
+def test_readiness_reports_gate_timings(monkeypatch):
+    seen = {}
+
+    def fake_fuzz(s, g, max_variants=3, baseline=None, executor=None):
+        seen["baseline"] = baseline
+
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_spec_fuzz_stability", fake_fuzz)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_tests_attached", lambda items: None)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_persona_veto", lambda engine: None)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.replay_and_compare",
+                        lambda engine, rec: {"match": True})
+
+    class DummyEngine:
+        pass
+
+    engine = DummyEngine()
+    engine.checklist_gen = CountingGen()
+    spec = _spec()
+    checklist = {"items": [], "_determinism": {"spec": spec, "checklist": {}, "seeds": {}}}
+
+    res = evaluate_readiness(engine, spec, checklist)
+    assert res["ok"] is True
+    assert list(res["results"]) == ["spec_fuzz_stability", "tests_attached", "persona_no_veto", "determinism_replay"]
+    assert set(res["timings"]) == set(res["results"])
+    assert seen["baseline"] is checklist
+    assert engine.checklist_gen.calls == 0
+
+
+class BrokenPool:
+    def __init__(self):
+        self.shut = False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+        fut = Future()
+        fut.set_exception(BrokenProcessPool("worker died"))
+        return fut
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut = True
+
+
+def test_broken_pool_raises_before_applying_anything():
+    from concurrent.futures.process import BrokenProcessPool
+
+    gen = CountingGen()
+    with pytest.raises(BrokenProcessPool):
+        spec_gate.enforce_spec_fuzz_stability(_spec(), gen, max_variants=3,
+                                              baseline={"items": [{"ptr": "/sections"}]}, executor=BrokenPool())
+    assert gen.calls == 0
+
+
+def test_readiness_falls_back_in_process_when_pool_breaks(monkeypatch):
+    from shieldcraft.verification import readiness_evaluator
+
+    pool = BrokenPool()
+    monkeypatch.setattr(readiness_evaluator, "_POOL", pool)
+    monkeypatch.setattr(readiness_evaluator, "_mutation_pool", lambda generator: pool)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_tests_attached", lambda items: None)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_persona_veto", lambda engine: None)
+    monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.replay_and_compare",
+                        lambda engine, rec: {"match": True})
+
+    class DummyEngine:
+        pass
+
+    engine = DummyEngine()
+    engine.checklist_gen = CountingGen()
+    spec = _spec()
+    checklist = {"items": [{"ptr": "/sections"}], "_determinism": {"spec": spec, "checklist": {}, "seeds": {}}}
+
+    res = evaluate_readiness(engine, spec, checklist)
+    # Same verdict as a serial run: the reorder mutation is built, then the omission is critical
+    assert res["results"]["spec_fuzz_stability"]["reason"].startswith("SPEC_INCOMPLETE")
+    assert engine.checklist_gen.calls == 1
+    assert pool.shut and readiness_evaluator._POOL is None
+
+
+def test_mutation_build_discovers_tests_under_given_root(tmp_path, monkeypatch):
+    from shieldcraft.verification.test_registry import discover_tests
+
+    root = tmp_path / "suite"
+    root.mkdir()
+    (root / "test_x.py").write_text("def test_one():\n    pass\n")
+    monkeypatch.chdir(tmp_path)
+
+    class DiscoveringGen:
+        def build(self, s, **kwargs):
+            return {"items": [{"ptr": ref} for ref in discover_tests().values()]}
+
+    shape, _, _ = spec_gate.build_mutation_shape(DiscoveringGen(), _spec(), str(root))
+    assert shape == {"test_x.py::test_one"}
+    assert discover_tests() == {}
@@ -7,7 +7,7 @@ def test_readiness_summary_on_success(monkeypatch):
         "shieldcraft.verification.readiness_evaluator.enforce_spec_fuzz_stability",
         lambda s,
         g,
-        max_variants=3: None)
+        max_variants=3, **kwargs: None)
     monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_tests_attached", lambda items: None)
     monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_persona_veto", lambda engine: None)
     monkeypatch.setattr(
@@ -42,7 +42,7 @@ def test_readiness_summary_blocking_failure(monkeypatch):
         "shieldcraft.verification.readiness_evaluator.enforce_spec_fuzz_stability",
         lambda s,
         g,
-        max_variants=3: None)
+        max_variants=3, **kwargs: None)
     monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_tests_attached", lambda items: None)
     monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.enforce_persona_veto", lambda engine: None)
     monkeypatch.setattr("shieldcraft.verification.readiness_evaluator.replay_and_compare",